@@ -1,52 +1,40 @@
-import json
+import itertools
 import os
 import random
+import sys
+import threading
+import time
 
 import appdirs
 import PySimpleGUI as sg
 
+import constants
 from constants import *
-from exercise import Exercise
-from syntax import Connective, Formula, prop_letters
+from exercise import Exercise, ExercisePool
+from semantics import Cancelled
+from store import ExerciseStore, open_store
+from syntax import Connective, prop_letters
 
 
-def load_saved_exercises() -> list[dict[str, str]]:
-    """ Read the saved exercises file in the user's (OS-dependent) app data directory.
+def open_saved_exercises() -> ExerciseStore:
+    """ Open the saved exercise bank in the user's (OS-dependent) app data directory.
 
-    If the file does not exist, create it.
-
-    Return a List of Dicts of the form {"english": ..., "formula": ...}
+    If the bank does not exist, create it. A saved exercises JSON file from an older
+    version is imported once, skipping exercises that cannot be parsed; if the file
+    cannot be read at all, it is moved aside instead.
     """
     p = appdirs.user_data_dir('English_2_Prop_App')
     print(p)
-    if (not os.path.exists(p)):
-        os.makedirs(p)
-    exercises = []
-    exercise_fp = os.path.join(p, SAVED_EX_FILE)
-    if (not os.path.exists(exercise_fp)):
-        with open(exercise_fp, 'w+') as outfile:
-            json.dump(exercises, outfile)
-            outfile.close()
-    else:
-        with open(exercise_fp, 'r') as json_file:
-            try:
-                exercises = json.load(json_file)
-            except Exception as e:
-                print(e)
-                sg.popup("Error Loading saved exercises",
-                         "Deleting saved exercises file...")
-            finally:
-                json_file.close()
-                os.remove(exercise_fp)
-    return exercises
-
-
-def save_exercises_to_json(exercises: list):
-    """Write a list of exercises to a JSON file in the user's AppData directory  """
-    p = appdirs.user_data_dir('English_2_Prop_App')
-    with open(os.path.join(p, SAVED_EX_FILE), 'w+') as outfile:
-        json.dump(exercises, outfile, indent=4)
-        outfile.close()
+    try:
+        return open_store(p, SAVED_EX_DB, legacy_json=SAVED_EX_FILE)
+    except Exception as e:
+        print(e)
+        sg.popup("Error Loading saved exercises",
+                 "Moving the old saved exercises file aside...")
+        exercise_fp = os.path.join(p, SAVED_EX_FILE)
+        if (os.path.exists(exercise_fp)):
+            os.replace(exercise_fp, exercise_fp + '.corrupt')
+        return open_store(p, SAVED_EX_DB)
 
 
 def insert_string(tk_text, string):
@@ -122,34 +110,35 @@ def create_layout_add_exercise():
 
 def add_exercise_loop(win: sg.Window):
     """ Event Handler for the exercise editor """
-    exercises = load_saved_exercises()
-    print(exercises)
+    store = open_saved_exercises()
+    exercise_ids = store.ids()
+    print(exercise_ids)
 
     def update_saved_ex_view(index: int):
+        exercise = store.get(exercise_ids[index]) if len(exercise_ids) > 0 else None
         win['-DEL_EXERCISE-'].update(visible=False if len(
-            exercises) == 0 else True)
+            exercise_ids) == 0 else True)
         win['-PREV_EXERCISE-'].update(visible=False if index <=
                                       0 else True)
-        win['-NEXT_EXERCISE-'].update(visible=False if index >= len(exercises)-1
+        win['-NEXT_EXERCISE-'].update(visible=False if index >= len(exercise_ids)-1
                                       else True)
-        win['-SAVED_ENGLISH-'].update('' if len(exercises) == 0 else
-                                      exercises[index]['english'])
-        win['-SAVED_FORMULA-'].update('' if len(exercises) == 0 else
-                                      exercises[index]['formula'])
+        win['-SAVED_ENGLISH-'].update('' if exercise is None else
+                                      exercise['english'])
+        win['-SAVED_FORMULA-'].update('' if exercise is None else
+                                      exercise['formula'])
         win['ex_frame'].update(
-            "No Saved Exercises" if len(exercises) == 0 else
-            f"Saved Exercises ({index+1} of {len(exercises)})")
+            "No Saved Exercises" if len(exercise_ids) == 0 else
+            f"Saved Exercises ({index+1} of {len(exercise_ids)})")
 
     saved_ex_index = 0
     update_saved_ex_view(saved_ex_index)
 
-    print(exercises)
     while True:
         print(saved_ex_index)
         ev, vals = win.read()
         print(ev, vals)
         if ev in [sg.WIN_CLOSED, 'Exit', ]:
-            save_exercises_to_json(exercises)
+            store.close()
             win.close()
             return
         elif ev == '-ADD_EXERCISE-':
@@ -157,24 +146,27 @@ def add_exercise_loop(win: sg.Window):
                 sg.popup("Inputted sentence or formula is empty.")
                 continue
             try:
-                formula = Formula.parse(
-                    "".join(vals['-INPUT_FORMULA-'].split()))
                 sentence = vals['-INPUT_ENGLISH-']
-                exercises.append(
-                    {"english": sentence, "formula": str(formula)})
+                duplicates = store.duplicates(vals['-INPUT_FORMULA-'])
+                if (duplicates):
+                    saved = store.get(duplicates[0])
+                    if (sg.popup_yes_no("An equivalent exercise is already saved:",
+                                        saved['english'], saved['formula'], "Save anyway?") != 'Yes'):
+                        continue
+                exercise_ids.append(store.add(sentence, vals['-INPUT_FORMULA-']))
                 win['-INPUT_ENGLISH-'].update("")
                 win['-INPUT_FORMULA-'].update("")
                 sg.popup("Exercise saved successfully!")
             except Exception as e:
                 sg.popup(str(e), 'Error parsing')
                 continue
-            print(exercises)
+            print(exercise_ids)
         elif ev == '-NEXT_EXERCISE-':
             saved_ex_index += 1
         elif ev == '-PREV_EXERCISE-':
             saved_ex_index -= 1
         elif ev == '-DEL_EXERCISE-':
-            exercises.pop(saved_ex_index)
+            store.delete(exercise_ids.pop(saved_ex_index))
             saved_ex_index = 0
             sg.popup("Deleted")
         elif ev == '-HELP_BUTTON-':
@@ -223,24 +215,43 @@ def create_layout_game():
     return [[sg.Column([[info_top]]+game_layout, element_justification='c')]]
 
 
-def game_loop(win: sg.Window, difficulty_str: str, num_questions: int, use_saved: bool):
+def check_in_background(exercise: Exercise, answer: str, cancel: threading.Event, check_id: int):
+    """ Check an answer on a worker thread. Return (check_id, status, feedback) where status is
+    'done', 'cancelled' or the error raised by the check, and feedback explains a wrong
+    answer (None if it is correct).
+    """
+    try:
+        counterexample = exercise.counterexample(answer, cancel)
+        return check_id, 'done', None if counterexample is None else exercise.explain(answer, counterexample)
+    except Cancelled:
+        return check_id, 'cancelled', None
+    except Exception as e:
+        return check_id, e, None
+
+
+def game_loop(win: sg.Window, difficulty_str: str, num_questions: int, use_saved: bool,
+              pool: ExercisePool = None):
     """ Event Handler for the game section """
     difficulty = {'Easy': 1, 'Normal': 2, 'Hard': 3}[difficulty_str]
     exercises = []
 
-    # Load saved exercises from saved exercises file.
-    # If not enough saved exercises or {use_saved} is false, generate random exercises of specified difficulty
-    # to make the difference.
+    # Sample saved exercises from the exercise bank, preferring ones of the chosen difficulty.
+    # If not enough saved exercises or {use_saved} is false, random exercises of specified difficulty
+    # are taken from the prefetch pool as each question is shown to make the difference.
     if (use_saved):
-        saved_exercises = load_saved_exercises()
-        for saved_exercise in random.sample(saved_exercises,
-                                            min(num_questions, len(saved_exercises))):
+        store = open_saved_exercises()
+        saved_exercises = store.sample(num_questions, difficulty=difficulty)
+        saved_exercises += store.sample(num_questions - len(saved_exercises),
+                                        exclude=tuple(ex['id'] for ex in saved_exercises))
+        store.close()
+        for saved_exercise in saved_exercises:
             exercises.append(
                 Exercise(formula_str=saved_exercise['formula'], english_repr=saved_exercise['english']))
-    for _ in range(num_questions-len(exercises)):
-        exercises.append(Exercise(difficulty))
+        random.shuffle(exercises)
     """ Get the next exercise and update the display elements accordingly """
     def load_next_exercise(qn_num):
+        if (qn_num > len(exercises)):
+            exercises.append(Exercise(difficulty).prepare() if pool is None else pool.get(difficulty))
         exercise: Exercise = exercises[qn_num-1]
         win['-QUESTION_NUMBER-'].update(
             f"Question {qn_num} of {num_questions}")
@@ -259,11 +270,29 @@ def game_loop(win: sg.Window, difficulty_str: str, num_questions: int, use_saved
     qn_num = 1
     curr_score = 0
     curr_question = load_next_exercise(qn_num)
+    # The answer check in progress on a worker thread, if any: its id, cancel event and deadline
+    check_ids = itertools.count(1)
+    check_id, cancel, deadline = None, None, None
+
+    def cancel_check():
+        nonlocal check_id
+        if (cancel is not None):
+            cancel.set()
+        check_id = None
+        win['-CHECK_ANSWER-'].update(disabled=False)
+        win['-ANSWER-'].update(disabled=False)
 
     while True:
-        ev, vals = win.read()
+        ev, vals = win.read(timeout=None if check_id is None else 100)
+        if ev == sg.TIMEOUT_EVENT:
+            if (check_id is not None and time.perf_counter() > deadline):
+                cancel_check()
+                win['-SOLUTION-'].update(value="Checking took too long, please try again", visible=True)
+            continue
         print(ev, vals)
         if ev in [sg.WIN_CLOSED, '-QUIT-', 'Exit']:
+            if (cancel is not None):
+                cancel.set()
             win.close()
             return
         # Handle input if user clicks an input button
@@ -277,39 +306,54 @@ def game_loop(win: sg.Window, difficulty_str: str, num_questions: int, use_saved
             else:
                 start, end = tk_text.tag_ranges('sel')
                 tk_text.delete(start, end)
-        # Validate the user's input is non-empty and well-formed
-        # If so, check that is logically equivalent to the canonical formula and show the corresponding result
+        # Validate the user's input is non-empty, then check on a worker thread that it is
+        # logically equivalent to the canonical formula, so the window stays responsive
         elif ev == '-CHECK_ANSWER-':
             if (vals['-ANSWER-'] == ''):
                 sg.popup("Answer is empty.")
                 continue
-            try:
-                input_str: str = vals['-ANSWER-']
-                # Replace any whitespace in the string
-                is_correct = curr_question.check_answer(
-                    "".join(input_str.split()))
-
-                if (is_correct):
-                    print("Correct!")
-                    curr_score += 10
-                    win['-SCORE-'].update(f"Score: {curr_score}")
-                    win['-ANSWER_FEEDBACK-'].update(
-                        data=CHECK, subsample=12)
-                else:
-                    win['-ANSWER_FEEDBACK-'].update(
-                        data=sg.RED_X_BASE64, subsample=2)
-                    print("wrong")
-
-                win['-SOLUTION-'].update(value=f'Solution: {str(curr_question.formula)}',
-                                         visible=True)
-
-                win['-ANSWER-'].update(disabled=True)
-                win['-CHECK_ANSWER-'].update(disabled=True)
-                win['-NEXT_QUESTION-'].update(visible=True)
-
-            except Exception as e:
-                print(e)
+            input_str: str = vals['-ANSWER-']
+            check_id, cancel = next(check_ids), threading.Event()
+            deadline = time.perf_counter() + CHECK_TIME_LIMIT
+            win['-ANSWER-'].update(disabled=True)
+            win['-CHECK_ANSWER-'].update(disabled=True)
+            win['-SOLUTION-'].update(value="Checking...", visible=True)
+            win.perform_long_operation(
+                lambda args=(curr_question, input_str, cancel, check_id): check_in_background(*args),
+                '-CHECK_DONE-')
+        elif ev == '-CHECK_DONE-':
+            done_id, status, feedback = vals[ev]
+            # Results of checks that were cancelled or timed out are stale
+            if (done_id != check_id):
+                continue
+            check_id = None
+            if (status == 'cancelled'):
+                continue
+            if (status != 'done'):
+                print(status)
+                cancel_check()
+                win['-SOLUTION-'].update(visible=False)
                 show_instructions("Answer is not well-formed")
+                continue
+
+            if (feedback is None):
+                print("Correct!")
+                curr_score += 10
+                win['-SCORE-'].update(f"Score: {curr_score}")
+                win['-ANSWER_FEEDBACK-'].update(
+                    data=constants.CHECK, subsample=12)
+            else:
+                win['-ANSWER_FEEDBACK-'].update(
+                    data=sg.RED_X_BASE64, subsample=2)
+                print("wrong")
+
+            solution = f'Solution: {str(curr_question.formula)}'
+            short = curr_question.short_solution()
+            if (short is not None):
+                solution += f'\nShortest form: {short}'
+            win['-SOLUTION-'].update(value=solution if feedback is None else f'{feedback}.\n{solution}',
+                                     visible=True)
+            win['-NEXT_QUESTION-'].update(visible=True)
         elif ev == '-NEXT_QUESTION-':
             qn_num += 1
             if (qn_num > num_questions):
@@ -327,7 +371,7 @@ if __name__ == '__main__':
     # Layout for the main menu
     layout_menu = [[sg.Column(
         [[sg.Text(APP_TITLE, key='-TITLE-', font=('Cambria', 40), text_color='Yellow')],
-         [sg.Image(data=MAIN_MENU_ICON_B64, subsample=12)],
+         [sg.Image(data=constants.MAIN_MENU_ICON_B64, subsample=12)],
          [sg.Button("Play Game", key='-PLAY-',
                     font=MENU_FONT, auto_size_button=True, pad=((0, 0), (5, 15)))],
          [sg.Button("Exercise Editor", key='-CREATE-', font=MENU_FONT, auto_size_button=True)]],
@@ -335,6 +379,12 @@ if __name__ == '__main__':
     layout = [[sg.Column(layout_menu, key='-COL1-')]]
 
     window = sg.Window(MENU_TITLE, layout, finalize=True)
+    if ('--exit-on-start' in sys.argv[1:]):
+        # Cold start up to the first window, timed by benchmark.py
+        window.close()
+        sys.exit()
+    # Generate exercises in the background so games start without waiting
+    exercise_pool = ExercisePool()
 
     while True:
         # Event Handler for the main menu
@@ -356,7 +406,7 @@ if __name__ == '__main__':
             window.hide()
             win2 = sg.Window(
                 'Game', layout=create_layout_game(), finalize=True)
-            game_loop(win2, *(vals_settings[k] for k in vals_settings))
+            game_loop(win2, *(vals_settings[k] for k in vals_settings), pool=exercise_pool)
             print('back to main from play')
             window.UnHide()
         elif event == '-INFO-':
@@ -368,4 +418,5 @@ if __name__ == '__main__':
             add_exercise_loop(win2)
             print('back to main from create')
             window.UnHide()
+    exercise_pool.close()
     window.close()
@@ -0,0 +1,237 @@
+""" Reduced ordered binary decision diagrams (ROBDDs) over formula variables
+
+Within one BDD manager every Boolean function has exactly one node, so two formulas are
+equivalent iff they build to the same node id.
+"""
+from typing import Iterable, Iterator, Optional, Sequence
+
+from syntax import Connective, Formula
+
+FALSE = 0
+TRUE = 1
+
+
+class BDD:
+    """ BDD manager holding the unique table and the ITE computed table.
+
+    Nodes are ints: 0 and 1 are the terminals, other ids index the level/low/high lists.
+    Variables are ordered by @order; variables not listed there are appended in the order
+    they are first used.
+    """
+
+    def __init__(self, order: Sequence[str] = (), cache_size: int = 1 << 16) -> None:
+        self.order: list[str] = []
+        self.levels: dict[str, int] = {}
+        # Terminal entries are placeholders; level() puts terminals below every variable
+        self._level = [-1, -1]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._unique: dict[tuple[int, int, int], int] = {}
+        self._ite_cache: dict[tuple[int, int, int], int] = {}
+        self.cache_size = cache_size
+        for var in order:
+            self.add_var(var)
+
+    def __len__(self) -> int:
+        """ Return the number of nodes, including the two terminals """
+        return len(self._level)
+
+    def add_var(self, name: str) -> int:
+        """ Add a variable at the bottom of the order (if new) and return its level """
+        if (name not in self.levels):
+            self.levels[name] = len(self.order)
+            self.order.append(name)
+        return self.levels[name]
+
+    def var(self, name: str) -> int:
+        """ Return the node of the function that is true iff @name is true """
+        return self._node(self.add_var(name), FALSE, TRUE)
+
+    def level(self, node: int) -> int:
+        """ Return the level of a node; terminals are below every variable """
+        return len(self.order) if node <= TRUE else self._level[node]
+
+    def _node(self, level: int, low: int, high: int) -> int:
+        if (low == high):
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if (node is None):
+            node = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+        return node
+
+    def _cofactors(self, node: int, level: int) -> tuple[int, int]:
+        if (node > TRUE and self._level[node] == level):
+            return self._low[node], self._high[node]
+        return node, node
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """ Return the node of (if f then g else h) """
+        if (f == TRUE or g == h):
+            return g
+        if (f == FALSE):
+            return h
+        if (g == TRUE and h == FALSE):
+            return f
+        key = (f, g, h)
+        result = self._ite_cache.get(key)
+        if (result is not None):
+            return result
+        level = min(self.level(f), self.level(g), self.level(h))
+        f0, f1 = self._cofactors(f, level)
+        g0, g1 = self._cofactors(g, level)
+        h0, h1 = self._cofactors(h, level)
+        result = self._node(level, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        if (len(self._ite_cache) >= self.cache_size):
+            # Evict the oldest entry; dicts iterate in insertion order
+            del self._ite_cache[next(iter(self._ite_cache))]
+        self._ite_cache[key] = result
+        return result
+
+    def negate(self, f: int) -> int:
+        return self.ite(f, FALSE, TRUE)
+
+    def apply(self, connective: Connective, f: int, g: Optional[int] = None) -> int:
+        """ Return the node of the connective applied to f (and g) """
+        match connective:
+            case Connective.NOT:
+                return self.negate(f)
+            case Connective.AND:
+                return self.ite(f, g, FALSE)
+            case Connective.OR:
+                return self.ite(f, TRUE, g)
+            case Connective.IMPLIES:
+                return self.ite(f, g, TRUE)
+            case Connective.IFF:
+                return self.ite(f, g, self.negate(g))
+
+    def from_formula(self, formula: Formula) -> int:
+        """ Build the node of a formula, visiting each distinct subformula once """
+        def build(current: Formula, f: int, g: int) -> int:
+            if (isinstance(current.val, Connective)):
+                return self.apply(current.val, f, g)
+            if (current.val in ['T', 'F']):
+                return TRUE if current.val == 'T' else FALSE
+            return self.var(current.val)
+
+        return formula.fold(build)
+
+    def support(self, node: int) -> set[str]:
+        """ Return the variables the function depends on """
+        levels, seen, stack = set(), set(), [node]
+        while stack:
+            u = stack.pop()
+            if (u <= TRUE or u in seen):
+                continue
+            seen.add(u)
+            levels.add(self._level[u])
+            stack.extend((self._low[u], self._high[u]))
+        return {self.order[level] for level in levels}
+
+    def count(self, node: int, vars: Optional[Iterable[str]] = None) -> int:
+        """ Return the number of satisfying valuations of @vars (by default every variable
+        in the manager). @vars must contain every variable the function depends on.
+        """
+        vars = set(self.order if vars is None else vars)
+        if (not self.support(node) <= vars):
+            raise Exception(f"Variables {sorted(self.support(node) - vars)} are not counted")
+        counts = {FALSE: 0, TRUE: 1}
+        stack = [node]
+        while stack:
+            u = stack[-1]
+            if (u in counts):
+                stack.pop()
+                continue
+            low, high = self._low[u], self._high[u]
+            pending = [c for c in (low, high) if c not in counts]
+            if (pending):
+                stack.extend(pending)
+                continue
+            stack.pop()
+            level = self._level[u]
+            counts[u] = (counts[low] << (self.level(low) - level - 1)) + \
+                (counts[high] << (self.level(high) - level - 1))
+        # Manager variables outside @vars were counted both ways
+        missing = len(set(self.order) - vars)
+        extra = len(vars - set(self.order))
+        return (counts[node] << self.level(node)) >> missing << extra
+
+    def satisfying(self, node: int, vars: Optional[Sequence[str]] = None) -> Iterator[dict[str, bool]]:
+        """ Yield every satisfying valuation of @vars (by default every variable in the manager) """
+        vars = list(self.order if vars is None else vars)
+        if (not self.support(node) <= set(vars)):
+            raise Exception(f"Variables {sorted(self.support(node) - set(vars))} are not enumerated")
+        for path in self._paths(node):
+            free = [var for var in vars if var not in path]
+            for bits in range(1 << len(free)):
+                valuation = dict(path)
+                for i, var in enumerate(free):
+                    valuation[var] = bool((bits >> i) & 1)
+                yield {var: valuation[var] for var in vars}
+
+    def _paths(self, node: int) -> Iterator[dict[str, bool]]:
+        """ Yield the partial valuations along each path from @node to the TRUE terminal """
+        stack = [(node, {})]
+        while stack:
+            u, path = stack.pop()
+            if (u == TRUE):
+                yield path
+            elif (u != FALSE):
+                var = self.order[self._level[u]]
+                stack.append((self._high[u], {**path, var: True}))
+                stack.append((self._low[u], {**path, var: False}))
+
+    def to_formula(self, node: int) -> Formula:
+        """ Return a Formula for the node by Shannon expansion on each variable """
+        formulas = {FALSE: Formula('F'), TRUE: Formula('T')}
+        stack = [node]
+        while stack:
+            u = stack[-1]
+            if (u in formulas):
+                stack.pop()
+                continue
+            low, high = self._low[u], self._high[u]
+            pending = [c for c in (low, high) if c not in formulas]
+            if (pending):
+                stack.extend(pending)
+                continue
+            stack.pop()
+            var = Formula(self.order[self._level[u]])
+            if (low == FALSE and high == TRUE):
+                formulas[u] = var
+            elif (low == TRUE and high == FALSE):
+                formulas[u] = Formula(Connective.NOT, var)
+            elif (low == FALSE):
+                formulas[u] = Formula(Connective.AND, var, formulas[high])
+            elif (high == TRUE):
+                formulas[u] = Formula(Connective.OR, var, formulas[low])
+            elif (high == FALSE):
+                formulas[u] = Formula(Connective.AND, Formula(Connective.NOT, var), formulas[low])
+            elif (low == TRUE):
+                formulas[u] = Formula(Connective.IMPLIES, var, formulas[high])
+            else:
+                formulas[u] = Formula(Connective.OR, Formula(Connective.AND, var, formulas[high]),
+                                      Formula(Connective.AND, Formula(Connective.NOT, var), formulas[low]))
+        return formulas[node]
+
+
+def equivalent(first: Formula, second: Formula) -> bool:
+    """ Return True iff the formulas are logically equivalent """
+    manager = BDD(sorted(first.variables() | second.variables()))
+    return manager.from_formula(first) == manager.from_formula(second)
+
+
+def dedupe(formulas: Iterable[Formula], manager: Optional[BDD] = None) -> list[Formula]:
+    """ Return the first formula of each logical equivalence class, in input order """
+    manager = BDD() if manager is None else manager
+    seen, unique = set(), []
+    for formula in formulas:
+        node = manager.from_formula(formula)
+        if (node not in seen):
+            seen.add(node)
+            unique.append(formula)
+    return unique
@@ -0,0 +1,299 @@
+""" Benchmarks for the propositional logic core.
+
+Usage: python benchmark.py [--output results.json] [--baseline FILE] [--save-baseline]
+                           [--threshold 0.25] [--parse-report] [--memory]
+
+Runs a fixed, seeded set of workloads and times the cold start of the core, the CLI and
+the GUI up to its first window. Writes the timings as JSON and compares them with a stored
+baseline, exiting with status 1 if any of them is slower than the baseline by more than
+the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from exercise import Exercise
+from normal_forms import CNF, minimal_cover, minimal_dnf, nnf, prime_implicants
+from semantics import all_valuations, truth_table, truth_values
+from syntax import Connective, Formula, prop_letters
+
+SEED = 12
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+
+
+def random_formula_string(leaves: int, rng: random.Random) -> str:
+    """ Return a random balanced formula string with @leaves propositions """
+    if (leaves == 1):
+        return rng.choice(prop_letters)
+    num_left = leaves // 2
+    op = rng.choice(Connective.get_binary()).value
+    return f"({random_formula_string(num_left, rng)}{op}{random_formula_string(leaves-num_left, rng)})"
+
+
+def nested_formula_string(leaves: int) -> str:
+    """ Return a left-nested formula string (((p&q)&q)...&q) with @leaves propositions """
+    return '(' * (leaves-1) + 'p' + '&q)' * (leaves-1)
+
+
+def best_time(func, *args, repeat: int = 3) -> float:
+    """ Return the best wall-clock time of @repeat calls of func(*args), in seconds """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_parse(string: str) -> Formula:
+    prefix, remainder = Formula._parse_prefix(string)
+    if (prefix is None or len(remainder) != 0):
+        raise Exception("Invalid String")
+    return prefix
+
+
+def bench_parse() -> None:
+    """ Compare Formula.parse with the legacy recursive parser across input lengths """
+    rng = random.Random(0)
+    print(f"{'input':>8} {'symbols':>8} {'legacy (s)':>12} {'parse (s)':>12}")
+    for shape, make in [('balanced', lambda n: random_formula_string(n, rng)),
+                        ('nested', nested_formula_string)]:
+        for leaves in [50, 500, 5000, 50000]:
+            string = make(leaves)
+            try:
+                legacy = f"{best_time(legacy_parse, string):12.4f}"
+            except RecursionError:
+                legacy = f"{'RecursionError':>12}"
+            print(f"{shape:>8} {len(string):>8} {legacy} {best_time(Formula.parse, string):12.4f}")
+
+
+class _TreeNode:
+    """ A parse tree node as Formula was before hash-consing: attributes in a __dict__ and
+    one object per position in the tree
+    """
+
+    def __init__(self, val, left=None, right=None) -> None:
+        self.left = left
+        self.right = right
+        self.val = val
+
+
+def _tree_copy(formula: Formula) -> _TreeNode:
+    """ Return the formula as a tree of _TreeNodes, copying shared subformulas """
+    results = []
+    stack = [(formula, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if (expanded):
+            right = results.pop() if node.right is not None else None
+            left = results.pop() if node.left is not None else None
+            results.append(_TreeNode(node.val, left, right))
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in (node.right, node.left) if child is not None)
+    return results[0]
+
+
+def _traced(build) -> tuple[object, int]:
+    """ Return build() and the memory it still holds, in bytes """
+    tracemalloc.start()
+    result = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, allocated
+
+
+def bench_corpus_memory(size: int = 20000) -> None:
+    """ Report node count and memory for a generated corpus of exercises and re-parsed
+    answers, as hash-consed Formulas and as the unshared trees used before
+    """
+    rng = random.Random(0)
+    random.seed(0)
+
+    def generate() -> list[Formula]:
+        corpus = []
+        for _ in range(size):
+            formula = Formula.generate_formula(rng.randint(1, 4))
+            corpus.append(formula)
+            corpus.append(Formula.parse(str(formula)))
+        return corpus
+
+    corpus, shared_bytes = _traced(generate)
+    trees, tree_bytes = _traced(lambda: [_tree_copy(formula) for formula in corpus])
+    tree_nodes = sum(formula.size for formula in corpus)
+    shared_nodes = len({id(node) for formula in corpus for node in formula.postorder()})
+    print(f"{len(corpus)} formulas, {tree_nodes} tree positions")
+    print(f"{'':>12} {'nodes':>8} {'bytes/node':>11} {'MiB':>7}")
+    for name, nodes, allocated in [('before', tree_nodes, tree_bytes), ('after', shared_nodes, shared_bytes)]:
+        print(f"{name:>12} {nodes:>8} {allocated / nodes:>11.0f} {allocated / 2**20:>7.1f}")
+
+
+def bench_startup(runs: int = 5) -> dict[str, float]:
+    """ Return the median cold-start time of the core, the CLI and the GUI up to its first
+    window, as {'startup/name': seconds}. Commands that fail are reported and left out
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    commands = {
+        'import core': [sys.executable, '-c', 'import syntax, semantics, exercise'],
+        'cli parse': [sys.executable, 'cli.py', 'parse', '(p->q)'],
+        'app first window': [sys.executable, 'app.py', '--exit-on-start'],
+    }
+    results = {}
+    for name, command in commands.items():
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = subprocess.run(command, cwd=here, capture_output=True)
+            times.append(time.perf_counter() - start)
+            if (result.returncode != 0):
+                break
+        if (result.returncode != 0):
+            print(f"{'startup/' + name:>28}: failed ({result.stderr.decode().strip().splitlines()[-1]})",
+                  file=sys.stderr)
+        else:
+            results[f"startup/{name}"] = statistics.median(times)
+    return results
+
+
+def _seeded_formula(number: int) -> Formula:
+    """ Return Formula.generate_formula(number) for a fixed seed """
+    random.seed(SEED + number)
+    return Formula.generate_formula(number)
+
+
+def workloads() -> dict:
+    """ Return the benchmark workloads as {name: zero-argument callable}.
+
+    Inputs are built here with fixed seeds so every run times the same work.
+    """
+    rng = random.Random(SEED)
+    suite = {}
+    for leaves in [50, 500, 5000, 50000]:
+        string = random_formula_string(leaves, rng)
+        suite[f"parse/{len(string)}"] = lambda string=string: Formula.parse(string)
+
+    for number in [2, 4, 6, 8, 10]:
+        # Fresh parse so no compiled function is cached on the formula
+        string = str(_seeded_formula(number))
+        vars = Formula.parse(string).sorted_variables()
+        valuations = list(all_valuations(vars))
+        suite[f"truth_values/{len(vars)}"] = \
+            lambda string=string, valuations=valuations: truth_values(Formula.parse(string), valuations)
+        suite[f"truth_table/{len(vars)}"] = \
+            lambda string=string, vars=vars: truth_table(Formula.parse(string), vars)
+
+    for difficulty in [1, 3, 6, 9]:
+        solution = str(_seeded_formula(difficulty))
+        random.seed(SEED)
+        wrong = [str(Formula.generate_formula(difficulty)) for _ in range(50)]
+        wrong = [answer for answer in wrong if not Exercise(formula_str=solution, english_repr='').check_answer(answer)]
+
+        def check(answers, solution=solution):
+            exercise = Exercise(formula_str=solution, english_repr='')
+            for answer in answers:
+                exercise.check_answer(answer)
+        suite[f"check_answer/equal/{difficulty}"] = lambda check=check, solution=solution: check([solution] * 50)
+        suite[f"check_answer/unequal/{difficulty}"] = lambda check=check, wrong=wrong: check(wrong)
+
+    # Normal forms of a large formula, and minimal DNFs with cold caches
+    big = Formula.parse(random_formula_string(20000, rng))
+    suite[f"nnf/{big.size}"] = lambda big=big: nnf(big)
+    suite[f"cnf/{big.size}"] = lambda big=big: sum(1 for _ in CNF(big).clauses())
+    for number in [3, 5, 7]:
+        formula = _seeded_formula(number)
+
+        def dnf(formula=formula):
+            prime_implicants.cache_clear()
+            minimal_cover.cache_clear()
+            minimal_dnf(formula)
+        suite[f"minimal_dnf/{number + 1}"] = dnf
+
+    for difficulty in [1, 2, 3, 6, 10]:
+        def generate(difficulty=difficulty):
+            random.seed(SEED)
+            for _ in range(200):
+                Formula.generate_formula(difficulty)
+        suite[f"generate_formula/{difficulty}"] = generate
+    return suite
+
+
+def run_suite(repeat: int = 5) -> dict:
+    """ Time every workload (best of @repeat) and the cold starts (median of @repeat) and
+    return the results document
+    """
+    results = {}
+    for name, workload in workloads().items():
+        results[name] = best_time(workload, repeat=repeat)
+        print(f"{name:>28}: {results[name] * 1000:9.3f} ms", file=sys.stderr)
+    for name, seconds in bench_startup(repeat).items():
+        results[name] = seconds
+        print(f"{name:>28}: {seconds * 1000:9.3f} ms", file=sys.stderr)
+    return {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeat': repeat},
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """ Return the names of workloads slower than the baseline by more than @threshold (a fraction) """
+    regressions = []
+    for name, seconds in current['results'].items():
+        before = baseline['results'].get(name)
+        if (before is None):
+            continue
+        change = seconds / before - 1
+        flag = "REGRESSION" if change > threshold else ""
+        print(f"{name:>28}: {before * 1000:9.3f} -> {seconds * 1000:9.3f} ms ({change:+.1%}) {flag}",
+              file=sys.stderr)
+        if (change > threshold):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the propositional logic core")
+    parser.add_argument('--output', '-o', help="Write the results JSON here (default stdout)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline results JSON")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown before a workload is flagged (fraction)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--parse-report', action='store_true', help="Compare with the legacy parser")
+    parser.add_argument('--memory', action='store_true', help="Report corpus memory use")
+    args = parser.parse_args(argv)
+
+    if (args.parse_report):
+        bench_parse()
+    if (args.memory):
+        bench_corpus_memory()
+
+    current = run_suite(args.repeat)
+    document = json.dumps(current, indent=2)
+    if (args.output):
+        with open(args.output, 'w') as outfile:
+            outfile.write(document)
+    else:
+        print(document)
+    if (args.save_baseline):
+        with open(args.baseline, 'w') as outfile:
+            outfile.write(document)
+        return 0
+    if (os.path.exists(args.baseline)):
+        with open(args.baseline) as infile:
+            regressions = compare(current, json.load(infile), args.threshold)
+        if (regressions):
+            print(f"{len(regressions)} workloads regressed: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
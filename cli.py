@@ -0,0 +1,140 @@
+""" Command-line interface to the propositional logic core, with no GUI dependencies.
+
+Usage:
+    python cli.py parse FORMULA
+    python cli.py eval FORMULA p=T q=F ...
+    python cli.py table FORMULA [--format text|csv|markdown|binary] [-o FILE]
+    python cli.py check FORMULA ANSWER
+    python cli.py cnf FORMULA [-o FILE]
+    python cli.py generate [--difficulty N] [--count N] [--seed N]
+"""
+import argparse
+import random
+import sys
+
+from exercise import Exercise
+from normal_forms import CNF, minimal_dnf, nnf
+from semantics import evaluate, write_truth_table
+from syntax import Formula, ParseError
+
+
+def parse_formula(string: str) -> Formula:
+    """ Parse a formula, exiting with the error position marked if it is malformed """
+    try:
+        return Formula.parse(string)
+    except ParseError as e:
+        sys.exit(f"{e.message}:\n  {string}\n  {' ' * e.offset}^")
+
+
+def cmd_parse(args) -> None:
+    formula = parse_formula(args.formula)
+    print(formula)
+    print(f"variables: {', '.join(formula.sorted_variables())}")
+    print(f"size: {formula.size}, depth: {formula.depth}")
+    print(f"NNF: {nnf(formula)}")
+    if (len(formula.variables()) <= 8):
+        print(f"minimal DNF: {minimal_dnf(formula)}")
+
+
+def cmd_eval(args) -> None:
+    formula = parse_formula(args.formula)
+    valuation = {}
+    for assignment in args.valuation:
+        var, _, value = assignment.partition('=')
+        if (value not in ['T', 'F']):
+            sys.exit(f"Expected VAR=T or VAR=F, got {assignment!r}")
+        valuation[var] = value == 'T'
+    try:
+        print('T' if evaluate(formula, valuation) else 'F')
+    except Exception as e:
+        sys.exit(str(e))
+
+
+def cmd_table(args) -> None:
+    formula = parse_formula(args.formula)
+    only = {'true': True, 'false': False, None: None}[args.only]
+    binary = args.format == 'binary'
+    if (args.output == '-'):
+        sink = sys.stdout.buffer if binary else sys.stdout
+        write_truth_table(formula, sink, args.format, start=args.start, stop=args.stop, only=only)
+    else:
+        with open(args.output, 'wb' if binary else 'w', newline=None if binary else '') as sink:
+            write_truth_table(formula, sink, args.format, start=args.start, stop=args.stop, only=only)
+
+
+def cmd_check(args) -> None:
+    parse_formula(args.formula)
+    parse_formula(args.answer)
+    exercise = Exercise(formula_str=args.formula, english_repr=args.formula)
+    try:
+        counterexample = exercise.counterexample(args.answer)
+    except Exception as e:
+        sys.exit(str(e))
+    if (counterexample is None):
+        print("Correct")
+    else:
+        print(f"Incorrect: {exercise.explain(args.answer, counterexample)}")
+        sys.exit(1)
+
+
+def cmd_cnf(args) -> None:
+    cnf = CNF(parse_formula(args.formula))
+    if (args.output == '-'):
+        cnf.write_dimacs(sys.stdout)
+    else:
+        with open(args.output, 'w') as sink:
+            cnf.write_dimacs(sink)
+
+
+def cmd_generate(args) -> None:
+    if (args.seed is not None):
+        random.seed(args.seed)
+    for _ in range(args.count):
+        exercise = Exercise(args.difficulty)
+        print(f"{exercise.formula}\t{exercise}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Propositional logic tools")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('parse', help="Parse a formula and show its structure")
+    p.add_argument('formula')
+    p.set_defaults(func=cmd_parse)
+
+    p = commands.add_parser('eval', help="Evaluate a formula under a valuation")
+    p.add_argument('formula')
+    p.add_argument('valuation', nargs='*', help="Assignments of the form p=T or q=F")
+    p.set_defaults(func=cmd_eval)
+
+    p = commands.add_parser('table', help="Write the truth table of a formula")
+    p.add_argument('formula')
+    p.add_argument('--format', default='text', choices=['text', 'csv', 'markdown', 'binary'])
+    p.add_argument('-o', '--output', default='-', help="Output file, stdout by default")
+    p.add_argument('--start', type=int, default=0, help="First row to write")
+    p.add_argument('--stop', type=int, default=None, help="Row to stop before")
+    p.add_argument('--only', choices=['true', 'false'], help="Only rows with this value")
+    p.set_defaults(func=cmd_table)
+
+    p = commands.add_parser('check', help="Check that an answer is equivalent to a formula")
+    p.add_argument('formula')
+    p.add_argument('answer')
+    p.set_defaults(func=cmd_check)
+
+    p = commands.add_parser('cnf', help="Write a linear-size CNF of a formula in DIMACS format")
+    p.add_argument('formula')
+    p.add_argument('-o', '--output', default='-', help="Output file, stdout by default")
+    p.set_defaults(func=cmd_cnf)
+
+    p = commands.add_parser('generate', help="Generate random exercises")
+    p.add_argument('--difficulty', type=int, default=2)
+    p.add_argument('--count', type=int, default=1)
+    p.add_argument('--seed', type=int, default=None)
+    p.set_defaults(func=cmd_generate)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
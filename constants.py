@@ -3,10 +3,19 @@ APP_TITLE = MENU_TITLE
 MENU_FONT = 'Verdana 22'
 MAX_PROPOSITIONS = 4
 SAVED_EX_FILE = 'saved_exercises.json'
+SAVED_EX_DB = 'saved_exercises.sqlite3'
 PROP_FONT = ''
 PROP_FONT_COLORS = ['#fafa6e', '#c4ec74', '#92dc7e', '#64c987', '#39b48e']
 PHI = '\u03A6'
+# Seconds an answer check may run before it is cancelled
+CHECK_TIME_LIMIT = 5
 
-MAIN_MENU_ICON_B64 = b"iVBORw0KGgoAAAANSUhEUgAABmYAAAf/CAQAAACErZ+vAAAabXpUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjarZtnkhw5tqX/YxWzBGixHIgLs7eDWf58B5HJIlmiu6cfacyIigyHA1ccAXg5+7//c93/4U+tObpcWq+jVs+fPPKIkzfdf/7M9zP4/H6+P3yzfn36y+fuXt/eu8hHidf0+UX/fN2H78+/Lvh+DZN35aeB+v76xfr1FyN/XmP/baD4eUmakd6fr4HG10Apfn4RvgaY82spo7efl7Ds8/p1/ScM/HP6kfuv0/7Tfzeidwr3STFaCsnzM6b8mUDSv+TS5E3iJ//BFwOvM+XU+FnS91IJyF/Fyf80K/d7Vvb+8eVfPv/x7rekpPr53PHBr8GsP17/8vNQfvv8a0D3QvzTndP+cedfPp839N+X8/3v3tOpI/usbuZKSOvXor6X8t7xxUXI07tMBdn4V3jf3t/B3+6o3k3Kj99+8XeHESJpuSGHE2a4wd7rDpsp5mix8Rrjjul91lOLI+7kHXnK+htubGmkkzp526Q38Wn8MZfw7jve7TaLPP4EvhkDgynT0enH/8bfvx3oXtVBCL5/4kRZMK+opmAaypx+8i0SEu53HZUX4O+/v/9RXhMZLC/MnQVOvz5DrBK+akt1lF6iE18svH56LbTzNQAh4t6FyYREBnwNqYQafIuxhUAcO/mZDNRpmrhIQSglHmYZc0qV5PSoe3NNC++7scTPx2AWiSip0kidBE1ylQE26qflTg1NmiuXUmpppZdRZk0111JrbVXgN1tquZVWW2u9jTZ76rmXXnvr3fXR54gjAY5l1NFGH2PMyU0nI0+unnxhzhVXWnmVVVdbfY01N+Wz8y677ra722PPE0864MSpp51+xpkWjFKybMWqNes2jB658aabb7n1ttvvuPNH1oJ7bRf+9Pffz1r4zlp8mdIX24+scWlr30MEwUlRzshYzIGMN2WAgo7Kme8hwyJKnXLmB8iWSmSWRck5QRkjg9lCLDf8yN0fmfslby7n/ypv8TtzTqn738icU+r+JnN/zttfZO2IbehD9zKkNlRQfaL9+IL1GfsUqf3br+4/veDfHkihbhV+nGX0Sy0AwNNO2qldP9cuw2I9KxKoMa8va7W7CZpjqWTWzrCVfdilhHJzsj7uSo0LfGmn3kKOqJKbcql7dXDI+3b0Ms1attuBWuOjdAokmQldIanpbFXDPeAG9R/uyYKC3DcJ3v3elsnIYqCegeVbWxgOEAGoqXSRSKNILV2wZ/V8g6cN8vVkbHHprNTOzWGR18Z9yeFIhIF8ljnczbXtmlarG13Q9op7bnTDnvBBC1QWCa/9WNrX8x/F+klJoQplleMbkEc3FXfKiqGfZf2uXJnNtF3tWlgNyCushbI/3vY51G8pFva8VihoknM7hDTv7K24dhXnnUKb4ax8qde1wvA3W06z380Vl4zRqVvxSjZqsEI0ILw8oSOjSVdxhJIgKbXcIFb64tgMs5xrIzVPxmYvM1PwcY4daEDfE6AMU89XNV+v7vcPfnttuxCntOcAK/q+MY0d56SrYoWoRjmkPiYLLtm6qKZWxqiRJMxGZ9U1kAHQG+sOx9aJzcK4gE23mIlIh9JzW5bBK0ort+n8bVXlhdwAKpiEeeIb+wg19QOUlSJlEYyw+tQ7qWs7Eop9O0UTDDwoay9H4w4ggWl2o+0bCHi+9SHRPUAORTlI8ae28t2lHtQPeEatUzbtCMXcNl/GGRTK9prZYpoRpJiqqpY38c3MkDkdmg4Y4TshMRqF3ZhLr0cYld1IjFMALO4zTzL6lYQdkDBcwMzAw6wuocjhVlrDLuVDhZdmmRwu2gDQvI6YngwApTMFfqVef4gqZb7zel0hhJumMBeCzIoMFCSA90Ut+dZz281xN39YvMVzmGnuJ4YFyDM/yqbSIO9OvpHcUrzNQXjhdYaZoECmccwGwW6NBfSd6g6HIK0WaTHbEMqOb01UEh0T/V2UIsPTYVWZ6hEdx01AbrPb3D1xnV5ohTEDF8FHd4LKC813Fw1Kd+9G0UdohXlRfTTOS0W8M7WdCUa92+XbEX/9NREFRDAt+Ul/WonqwxYAIHqGoN5O29fBnQot3LposLJsOu6i/OsYcBXo2sBE3Z3aLuBDxH7dzNV0AQtcdtCWCWSZ45zoYReMwVEgImMF8Ah1YBAH34GqmGq6FVtB3EvtvdWxgO3UdwOdy77EHONEodP99fa1ZqqrNO/WbHWeAB6Rf0850f22Ouyq0qtlMW+FEVBDxYJIke4/HmyJVBs3TvA5a3IQfiUE/mwSsjuaF12sMqBc5kUFQ9+XfyA1fZvGSHlSzhSNkbdGkGrl0+oYUHeGP6nkh3olnbqUxAybz8MUbynLK/y+71rIR30gJhdbLugK+l83JpQBlVuA8vdm+hsMK+mi/mGL2+ZVtSt4S70KMdmmd/kWSWMWqIXS0nXAC0hCrkgyMqOIf3w6RhttcsBQIg18s88mTuhUB/oF9kOiABj2wmvJtRUrsJ/z8gVtdEFs+ANr3M7V5MFGeo0WqRMXuk8ZczeQFi1DnUFLXBNZiDtZ9tAkXP6R3ml96tYmYQNMgb8vXKGvTcTgqLuV06p9FTsVsmoHaYX5DJBqRdPBDLbKJkgIR+pqoQogCzrxTJTamgfjtYuDzGCc1i6Nd0T0z/SC+EV0DXrfAAQZtbQTBBfmnlDrQdIJ2nzm80roAH/F0d8KPSHFMmCcxKu+gDlwOFkOnbneGeG5tPzFp93XYPRLR4pcySuAzb+3INJmUvgw+hEKBz+2LaLLhI4NMACSQ8mktkBfOoBKoRhDp/xsmUUcZBKkG2VCdcCgNqkQcTarwChWAwpWhsCoE6OCgUf0EO10yn3dBlIS7+jySZcKg66OuAJFBawWy9vDxJ06ignsnTQweANelSnkD0hOgsorxhVIXt411NWeXv3IyHTPRIIuSadRQiNaBLgrSQERtSLiZt+B6AcsoIO7YpuoH9+cqZZXmE3iA8s7q62AnOYKrYT2hEwyFUeclyddguwgKcSLr0AFCBHGhNdYExhOCEpbtRKWHAynXO1sv6mqw6RpBEKwm2htZMRJTdMmam/OjwxcLoa4/SBOB6kQglCUi0uFC88S0yQgb8BUeHXKCcG04aLDb78QTiJ1rO3AYGbYFuKfrC+URwHxoXvxCI6jclsAFamhDqX86e/xHQZEPJBDGMAjxYGyOpmC8wrthqAKmEumUQtpiFYpoyrddw49uobG7qYllXlHI+qnOuY2cHm0MRSjNqP6KU2bGK5h3IGbQ6hQjEAP5ULTWoyCV5GDwRi3V7i/0shHWw9MR2oHZX2r/NtnLQMrgoCG7kERYB63Eipat1AjK0BjSO9AM20Hc6RNUlZr5qUDQURNuiOeGWpGuphyZQn1nLlB1d3x6Zf2QYZN8QDexpZjcnRhx4ADv6iZimLAok8sX2SZiFPGxGpmJhLSIGFQJignGyoi720hg/oGRigkIs2rCOLI1Y2O2gaKNrah0S5SBzRWqMybdiAm9cbTiodOUMFkOV5XqRDg4dLjSIwsUYfuHwQ1Kw+oWpp4ogWu5AzSfKPi/aAZQ6CkchvxiJ7dwIpEcaV9AGWjiAgsjZxwNTeWx1AFr3iDFp+EEhjBE0EXZEycm140cwzd9pEWjJAh4PFsDO261xbTPa2Alsho2wxNJeqggD14KjrUgF7bdHh3gGFbsC7t0GTCSD12B3dlYl7UEk1mhIJlLltxUDoLrN1UWhJY+jVQfum4rkKbVxBdtC/69YqqhAhQMFQ63g12rNL/jIT33VRoUNFeunigu4B6B2qtNFn8jtIPwBC8cq3RrEiAQUN5yojOn1x9VpI2NEyLMJ0X4xM/0C6OTn10MQBZReinaWHsJYOVgsGk+5PGpua/eFRMPBO90k9E9IrXmCNT2TAlapcr0fOLCUPZbcB/b6zvkb7G8V4j0aIGEq6LbnFQGugF55mIQli6N2EYkXwBK1iGDG5LCKuAM7RKvS9hSFYYkEfAIZbVzWyWK24OcXqEjgg43DPDF3lSsj8OFQpgwUfYnoms3yEC0N9yCChBJzhKDAhc63UcGmYIBCXmIXITtOF1oRjKI2J3KVx4DjWDxJ65rlOxSiS3YPwIQYG+EHas5XlS6koo7HlPQpsk8qa5GI6JsVrEA2AVTyeUkBcWG5/mmDul0BSqwqpbEOqcxUr4T9I4WpkLn8CEyBMUKrii/9G0E5Te2HjABePX6GUDRukUkKRloDuhymNqNBGJksVYOyOG0De0DTBSGlRF81UKkyYfMLpPTp3Zrb6PICScxWIdFSSGa9AwHR6lv0dag44cACJIErQ5QIwLEa0ogYnLhu4FYQvFiaqfmNiNw8MI3fpW33wLRd1CuAEy9CnicYvoSQ3OHZV0OnF3MMYeRAmmGoAosARbchto+ABgSzDGCFBuLBVHDLkgL2UVqMyHMaAaqsRtliObsbl75Fv5jNMH5n5Vg+Llj+dPEgToARvBZKYcKsm3gF28eTjKMmWAGb2D54+0QMJbkJO+ZKxJ8eT7C1ehS/FNWVu3lahSLiU/oqDVmqOeuQlX3EmY/RKhoPAJKWlSYFWW+caAw5YCV+qbyBrY6LQdM7gdMeHIkADcAtr6oN19BqGSzGKSk7GKLG7yzaIo8Am1Cmk24N9wroxCLEFUgn2ksYQIjV5fmG2IA1VDtVKWW1sdg0Dk5+PT3w6ZHVCEK/7GxQvGGeIWaU7nrNUfrzeIjhxRKZtaP1o8AjtiBrEUuEIsV3RJu1vYo4rpYQbWOxK2VslNddzGtxd6DD8CgjKSdlv6zgOyBDTMPCysMzn3J2U/sTXazyVmuEYZaut7ALgwdR7aRMMMvqEhbiybpwytadtHJYcS+TA+kmovSIFaH+QW9YMZJ/Ios+z3O+BhovF8BP0fwr64t0Xx3CJiBGWgd4jFgc44GAlQCQCVYPCmnqR4j8yjlPCkl71R4URdBQkMIkWC0EBzkpiXlBfx/qTjrS1MFLqCMKGULeVB1RS4u6NqyNqekgoBq2ooRE1TRCBhiCwhe1lbc0gRDBdwCWPerSIcQqoKCMgLNmjCUcn0nOxCwOnI/QcYH5mOhOkdZ87vD00M2171dMrC/nzUYyRntRTP1mnWAMTIzk4J3ttIDqaLsmZS3DmJYtfbJdB2HuhL/b48RW3AaFYPlsEtZwhhCwfIQqtA4xTXwj2CWES1h0nqcKG050BFLLoKnXrUkv4wZeR7kwDPWtrFn6A2rvZ5dtzayvYU1GxLVh0EPohz0MyIQE9vkyAxZoHER5643ALYNEen4wuIrtR6QE9TC9xmYVuAKfJNngdX0tHdQOuGF8mfrSMtOB9WwkfbMeXU19SGAMJuyrv0OHvB02CXu0cnI2IISdJ2qsqJGD5gw1fo5KMT/j2TS9om7KiipSBcGFAOrL2thmlCOIgsbBASK2qqnxqEmJjsbA14bgVxuJajh0KZCH4c79vnQKJgbErB9pgHzFbfmN8NRIKowugAgyTRZkEQN8iYusTU3AY9plGgIpMLsa4NTvlwqgLEhpsL6H5kdBXB5eNQLhHHFVOByzRQGhgBzSjTuD7bxbzsMqJ20oAbipBpHaQC3gqp5QVCqDRWgIWA/7DuwluE6nQoM8TjBC+ODjwCJTRY2JlIM0hDuwt0KQK1+6Zd8khHEMGKUaRDShxTVBC6o8Z7IGQB1EQmx7+XyUaQkF2UEM1BDgQE+4gaZEIcQiojM0foAs6liVPWn13S+2do/gWZvyXiBhlc0I6G7otWhpRnX7AIZA2fB1U1lHul+JVGqiMPnOJ69vqWd6I2UwUOD54WiUuZ4zrPHzfBFnZdWeldnBwoBOPC8VaCJG+RjV++Fr9ni75rt0Z7PRE8qvrMQ3+dYmpC6GlWlqHGyHxLifCwhJIPTMU3EzR81Cifzevp/tjYMSxGVDKwPQflN1ZcC7dWxdcTkUsnQQ24+KgjfEIXsb2HKIJUxQHJHrNGzS0VGK5jgh5YkyJhjsfV5od2fiS35A25chfNst65CmScam4hupq8dkn0sAQFDk1JQ2M+KfJbMG750q98GQsLoAXMXAWEiJSEK/5uysIDQa5OiJ9qQJAlw81QEjTxxpyhAGkUvMxOQghtQqEE1P6mkzqWO/ZgorNi9iJNq92CnGTm5Tr6DG8uSzVxjmaCHGfSABm9rZkQTqQqyAOkwpzkG/XppLDDrhX9BPyeRfJQrqmGPgf6Xw8AzP02DvHs8IO2h1kLNQdIwWIQNljYupuI05kAy4VfqYJCOoGyKhg1VtNm0bHko3762o+DSKwew+cBpqG+j4vCMecXUGTqCrgaNL4UTC9hcw3GYhSv460Ozj+TBawbxtDryBhhh3OOqCNqaztQiPI/I5ABUQsgegsR0PMQ5JZPm85BsN9bGiHdGHXEBN9lmp72iDuojB1ObZOdz8ZDOozN3Ib4Gz6ZQF1NCD8Ia+fO7HTWwdhyX6L1RXIrrIyGBCVRKlBoZllE0LT3lXz172jmbUe8Bkdq4gMn6DJlLqBT5PzAL99aBESOwOjpBxjLxhO91JCeQbn9ANHaQsPacFsKofagHcUAKzdBOdoDG+9hYPPBcUOts0HNVSaGCzoZQRGJzrAirBd2OkIdHWkXHZfcchb6+PnsTktSp9h1SkMWbuB+/RBqEEM90EAwKDakH0w76gQhKS47xFgdiFItj+cALGY4oGzEwkEGCYhILioIZSAHQ1xX0nEATUajct8EX2kHmf6N2r/yKjAmlbGTbkwkjPoc80DT/GT9v4G0S+iGi7JRhUkadgIQcXQqPjQ7WdzHEd4CEOmoyIsj3l59iwRnoiDW+hKKeuqrycMKJTLzouOXNhdQwjprng6XizCgh+p4hjCK7Q++G3ldR9CxP3ptoN8wS/6VVUALstqJd5PUNY9MDg5dhAnAalsULetRAHAJ1511bGc6SDh5/tNJpWmzIEFHn+0AABMVT2iB4NHUiBiNol343g6GCH/4dnLoPKPYrqgZnyfCpR5ASOpb5+M6THqbFysVUUh7j0fIxyETlg4/kKJpseioI2KwpNM4sBKO8h13ovwhk02WC1zcwQO0aH+7HhGwT5gm1BvFgpyNOkAeHuRI7ygeaI3M9mPOHK4ZsakJaPoV1d/9ojRmQgN7IFZPbQhfLGkrRw9B6VCwQoMXqRJi/Gy9uMXipcDeJneTwk64n6qtVq8jQDwpGUY0Yu4b3aet4PcI2dZZsxWkCH7lJgdXmxaM9aanMLUIenQN3UOpYq20k0BD/LpN9aeabdfp2IwKS9kfIEunnJBTGAMzrlMhISmWfeK8cMlR0hEhBHP6Q5EI5arHxS1ztrWBhf5K7xijAYxbW9QFjQvtEm/mRxOd2UrHtkNB4AgGC1xD0zZJ+wC4uICpTqBOG6RSx91hRHSsxJtsb4UzqRqZeUwT+qlyB0oBDTeJggC4MtQscD8IjhsrOap+vZ6fa3WW//R5D/cvvoCSSHPDTRiYpockkWO0GlJHJ9sdTR170AaBww2epeMP5UanqCGcG3V4q2daOhoDmNAufENjA1j3qMbyLihelsmvJXpKJkZDD9TVJ2y0+YhqJjtwxsGrSaXR35TvbZC8npW4p+lwbQBCZEQoErU77NBYICZI5yWzXppfG4NQyBa+PwFr6WDeMtcklZ+zCeiSDqfbfTst4JGJ1cJ79oQSuYoAWFBHBD6WTmiZGsuiuu3OiY5BSEHjYyL5smVtjQgkX9bG31Tsf/Lq9OY9bTrecyRtCygn4X/2HVrRMfCEH8FN4BHhgATzEoiYlYWWx1FC0gPppwcntNNHQNDqEANkSfszU+DmYCSQxBWlj+nIYjqAiaSqD8bvMyILwBgO722eYp/AwDvRk+ltrQ6dY07pS/qfYc9+EFh0AoWzF2yu4v7b8BTchE6FHRolnmCMmXCQHteo+Jw+pAUQs/sBF+IedMWA2MDokssOE9P2ATlV9VCpdzK8VMdDFUh1i6ZaUwQpcXgF24yA3npisQ0LiD+PcPhzQ7n3hhC8h3W6jo1F4k0byc8TESH9uuvXnx2UgeykvI1I7Y+SUy3+lw97LR3bIYTmckOHkiSKMhmYjWooggHIeDSpNn0QFcRraz+F0oJGwXZ5IBlv8Dusd/CHy8ZAoXLHaEmP6Bxcm+Kl7Ypfdoj+eJWpuKg85CjV+kyiKsVRKpFGRjuZ7p6s9U1DbT17AO0c2xNNR3ysnqUHd/TEmer5442Izoe73T8/fvQPr1HnRhGPPnWQ0Z1Owp+HBZ8g3Mzv+K08G2qo76rtuskbTQEY0YmEAtR+X7X7+YOk3dqsrWNy3iDJAAOCDaghMHG+/ZCiZz60nUatFnwoKIg+P9EBZszUkwTS5mVadEBQ3zbZTvTrKjoFietV+AJ5UPvl0SLq9f74ipOked/Sd3K7/+pibRFBqqhklSX6xHcNeFwCDEx4ed9pwges264naLtmgPKQU0KWH2QOKDlMR1Zo6tke9mgH62qTBVkMLuvhyphD9HrGjkqDLu/QDM5pevbzpCqHgpWDo/Ucjp7UQD3Q7ZH5ErJ/BSOYC9j8Ig+AQwS5nFv/7FTA11vnzvVoKxo6UqskRJBGx55PWasRoAvcZtTMtB+ko1zt7ujcD5xDtEMmE0mEZVt62hWb1d+OQf7bnvjnV3jJqwCdHo3RQ1oBTdALqhCHUhJe1LDJaLUFAM+XvaGnLd8DlTrZinryBA3WVDXMzOmgqZw5YtDDNeUVm1wG0uZdRl+9EtiH/tIEUEHyF3ffnImZYTeNhLxN33SwMUTn7dBCJDrKf59fhBz/8El3V2QU8oBSEwXowb6rpxK7rIAeidFovwwGov5xQ/3fGAIfugximp98UX4HQNXeIhSY7lvAmxFr0Ar+dv6f4cLnnn89/fQGap/Tjb9dAfP9Yw2/Dfe9APcjZD/P/7XsH/PX/+fxtYK/TYH7Uw7a7trTu3mHWbV7jBNBuZeIrgSVgjYBq1zYe3anfC/OfWj6l8VNhGZDa+qpOlzNEFfgYITn8AHYmP4CNN3/D8r6/3QgJgs/eO/+H33i/Oqz+Z4OAAABI2lDQ1BJQ0MgcHJvZmlsZQAAeJydkL9Kw1AUxn9pRUXqVFEQhwyuRRc7ufgHQ4dCbStYndKbFItJDElK8Q18E32YDoLgK7grOPvd6OBgFi8cvh+Hc77v3gs1NzJxvrQPcVJkXv9odDm6clfeqLNFgz2avsnT7uBsSOX5fMWx+tKyXtVzf57lIMyNdKFKTJoV4ByK2/Mitaxi43bYPxE/iN0gTgLxk3g3iAPLdrcfRzPz42lv0wiTi4Htq3bw6NClh8uYGVMiClrSRJ1T2hxIPTJ87skx0ohQvblmCm5EuZw8jkVDkW5Tkbdd5vWUMpbHVF424Y5YnjYP+7/fax/n5aazuUj9zC9bdVVtMoH3R1gfQfMZ1q4rslZ/v61ipl3O/PONXxZyUHyhdR2zAAANGGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iCiAgICB4bWxuczpzdEV2dD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIgogICAgeG1sbnM6ZGM9Imh0dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvIgogICAgeG1sbnM6R0lNUD0iaHR0cDovL3d3dy5naW1wLm9yZy94bXAvIgogICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iCiAgICB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iCiAgIHhtcE1NOkRvY3VtZW50SUQ9ImdpbXA6ZG9jaWQ6Z2ltcDo0OTVmNDZkMS1iOWI0LTQ5MTMtOGVkYS05MThiODhlODc3MDQiCiAgIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6MmZiYmI2OGUtMjM1MC00NjcyLWFiOGYtMTIzMGFmZDc0Y2FhIgogICB4bXBNTTpPcmlnaW5hbERvY3VtZW50SUQ9InhtcC5kaWQ6YmFkNGMyNzktODBhOS00ZDFhLTlhN2UtNDAwY2Y1MjAzYzlkIgogICBkYzpGb3JtYXQ9ImltYWdlL3BuZyIKICAgR0lNUDpBUEk9IjIuMCIKICAgR0lNUDpQbGF0Zm9ybT0iV2luZG93cyIKICAgR0lNUDpUaW1lU3RhbXA9IjE2Nzk1NzU2NzU4MTQ3OTIiCiAgIEdJTVA6VmVyc2lvbj0iMi4xMC4yNCIKICAgdGlmZjpPcmllbnRhdGlvbj0iMSIKICAgeG1wOkNyZWF0b3JUb29sPSJHSU1QIDIuMTAiPgogICA8eG1wTU06SGlzdG9yeT4KICAgIDxyZGY6U2VxPgogICAgIDxyZGY6bGkKICAgICAgc3RFdnQ6YWN0aW9uPSJzYXZlZCIKICAgICAgc3RFdnQ6Y2hhbmdlZD0iLyIKICAgICAgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDplYzkxMzRlMi1iZmQxLTQ5OTYtODcwOS1mMDU5YjdlMzQ0M2QiCiAgICAgIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9IkdpbXAgMi4xMCAoV2luZG93cykiCiAgICAgIHN0RXZ0OndoZW49IjIwMjMtMDMtMjNUMTI6NDc6NTUiLz4KICAgIDwvcmRmOlNlcT4KICAgPC94bXBNTTpIaXN0b3J5PgogIDwvcmRmOkRlc2NyaXB0aW9uPgogPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgIAo8P3hwYWNrZXQgZW5kPSJ3Ij8+oNKk7gAAAAJiS0dEAP+Hj8y/AAAACXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH5wMXDC837kDwagAAIABJREFUeNrs3XeYVsXZx/HfrCwoVYooioJiAQFL7IqVNWqUWGA1Go01a6xYgKUtdYEFsaBYsGLnpRgTMBaIvaBiV5BiA6wUpUrd+/1D4/saQdnd5zn3Oef5frySK+WCM+eemTNzP+fMjAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADkikAIAABpYfWUt+H/I3xHdACAZAYAgGykIXmqpy21hbZQPVVXHdVUDdVXddVSHVVXPUl1VE15qiephmpKqq18SfUrdbk1WiFpqdZrrZZLWqZ1WqdlklZojZZrlZZqhVZpiVZqlb7T91qlb7UqfE9NAQDJDAAg15KVzdRADdVQDdRQ9VRXdVVPW6qe6v74r9qJuI11WqLvfvxnyY//+s9/WqhFJDsAQDIDAEhu0lJb26qxGqvJj4nLDylMw0q+QUmaFVqoBVqohVqkhVqob7RIC7VIXwejbQAAyQwAIC5pS76aaHs11rbaSttoGzXWNtpGWxCZDVinb/SlvtRX+kJf63N9o8/1dVhNYACAZAYAkP3UpZZ20LbaTk21rbbXdtpOWzOGVNEifaX5mq95mqt5mq+5YSVBAQCSGQBAVZOXrdRMzdVMzdVczbW96hGTSNKb+ZqruZqv+fpUn+gLPk8DAJIZAMBvJS/11EItfkxgdlRz1SImMbBan+hjfaKPf/j3sIyQAADJDABA1lAttPNP/2xFRBJgwY+pzWzN1KywiIAAIJkBAORK+lJLu2k37a6d1UI758j+Ymm2WLM0U7M0S7M0m22hAZDMAADSlsBsrVZqqZZqpd20A0/99Fa05mqWZmu6Zuj98A0BAUAyAwBI5rx2W7XRHmql3bUb719y0kK9rxl6XzP0XlhIOACQzAAA4p3A1FMbtVFbtVFbNSAe+MmCHxOb9/VuWEI4AJDMAADikcBsppbaS23VVq3VjHjgtxqMPtE7P/wTPiEcAEhmAADRz0jztav20T7aR3uxgTIqaane0wearjf0Jkd1AiCZAQBkN4Wpp720t/bW3mqlasQDGbNOMzRN0zRN74TVhAMAyQwAIFMpTL521SFqp33UUnnEA1lOa2bpDb2hNzQtrCIcAEhmAACVSWGqqbX20/7aT214CwMHq/SOpmmaXteMUE44AJDMAAB+O4nZQYdof+2nvVWTaCAWlmjqD/+E7wgGAJIZAMB/pzDVtJsOUTu1045EA7H1sV7SG3pRb/GuBgDJDACQxDTWQTpYB2tfbU40kBhL9aqm6mW9FJYRDAAkMwCQa0nMLjpMh+lg7UwsnC3TPC3WKq1VvmqovpqoIUHZZOv1tl7Q83oxLCAYAEhmACDdKUxQax2mw3SYmhANVx/pGb2ptzU9LPlFLdVUW/1O++h3asvWC5tshl7QC3o+zCUUAEhmACBdScxm2kuH6nAdyq/+7qbqYT0eZm9SvdXX8TpJx3IsaQXM1fN6Qc+GWYQCAMkMACQ7icnTnjpKR6md6hINd4t1h0aHDytci5uroy7SIQSwQj7X0/q3ng7zCAUAkhkASFoas4vaq72OUCNiEQtf6zrdWpXF6raHuulP2oxQVtAcPa2n9Uz4hlAAIJkBgLgnMduqvY5Se21PLGJjgcp0a/g+A7XbUv1VyKhZmdDpfT2tp/U8J9UAIJkBgPjN1WrrSP1e7dWKWMTKt7pWI8LyDNb0vipTewJbSev1mp7Uk3o9rCcYAEhmAMA/jdlJHXSCDlUNYhEzKzRSQ8O3WajzApVpHwJcBcv1rCbqCfY+A0AyAwA+SUwjHakCHa/tiEUMrdFo9Q1fZa32gzppkHYh0FX0saZoip7g6E0AJDMAEE0SU02H6Bgdo715esY2kblLg8LnWW8J+SpSibYm4FX2vZ7XE5oU5hAKACQzAJCtyWsDtVcHnaD6xCK2yjVBPaObFFstXaoeqkfgM+JjTdEkPRnWEAoAJDMAkLkp6w/rYg5XPrGIczXpMfUK70Z+2Ybqqs7anArIkBV6RhM1MXxJKACQzABAVaapm6udCnSSdiMWsTdFxeFNt5ayvXrrfE6hyaByvaVJmqg3gxEMACQzAFCxyWlDddCJOlq1iEUCTFZJeNW9zeyhIfoDlZFh8/RP/V3PhXWEAgDJDAD89pR0Bx2rDjqGT8oS4hX1Dk/HpvUcpKE6lErJuG81RZP0d3Y9A0AyAwAbm4i21gnqoIN5KibGexoYxsWuHRXoWu1B5WTBKk3RRP0jfE0oAJDMAMB/Jp952lsddJpaEosEma5+Gh/P9RSWp44apuZUUlas11RN1AQ2cgZAMgMg19OYzXSoCnWKtiEWiTJb/fVwKI9129pCl6uYbbyzF2C9rnEaFz4jFABIZgDk3kwoTwerUIVqQiwSZp5KdXcyloNbfRXrcm1BpWXRdI3TA7ylAUhmAIA0BnG3QNdqRFiVqPa2nfroPFWj8khpAJDMAEBVppWb6XAV6mRtTSwSaJGG6uawMpEtr5UG6ySqMNth1qsap/FhLqEASGYAIG3znAN0uk7lbUxCLdH1uj4sTXQLPEhlOoyqjCClmaqH9T/hG0IBkMwAQBrmNq10mk7XrkQioVbqTg1Kx9TUCjRMe1OlEVivqbpPD3MuDUAyAwDJnTo2VUcV6hAikVhrNFr9wpcpapN56qghakHVRmKVpug+/SOsIRQAyQwAJGnK2Ein6nQdwvMtwdZqtAaGeSlsnTV0kXqpEVUckUUap4f0YjzPJAJAMgMAP58oHq+zdZzyiUWCletB9Q8fpbid1lVXXalaVHVkPtPDui/MIBAAyQwAxHWC2Fpn6TxtRSSSXY16TL3DOzlwo43URVeoBlUeoTd0vx4KCwgEQDIDAHGaFm6nTjpXexKJxJuiHmFaDrXcZuqpC5RHxUdotSbrPj0a1hIKgGQGALwng5urg/6iYzmUMAVeUq/wXA624Tbqo0KqP2JfaaxGh7cIBEAyAwBek8CDdb5OVW0ikQKvqCT8O4fb8tEaon1oBpGbpvv0UFhEIACSGQCIcurXWGfpfLUiEqnwtkrCJMfWtLkOUCvV01p9rrfDTKdSBJ2qUu1Mc4jcGj2qO/R0KCcUAMkMAGR7yreZfq/z1UHViUUqzFBfjffbNNfa6ir9SZv/v//pU92p232WiFu+/qoSbUOzcPCx7tLo8AWBAEhmACBbU70dda7OVVMikZrpY389GNa7tafdNUCnbHAMXKkbNCwscSlVLV2prqpL83CwTv/SHXrcr00CIJkBkM40prpO1gU6il2fUmO+SnW3335S1kL9dMavtqeFGqRbw2qX0jVUT138s/dFiM7nult3h08JBEAyAwCZmNg1V5HO09ZEIjW+0RDdFla5tajtVaJzNulY1U9Vood81lLY9uqrc7QZzcVFuSbrTv2D7ZsBkhkAqPx0Lk9HqUgns+1yiizTLRoclrq1qUbqos4VeucxXf3COKfS7qaB6sQo7eYr3atbw2cEAiCZAYCKTuO20dn6m5oTiRRZoZEqC9+5takGulxXVmo1yssqDi86lXo/DVF7Go+bcj2tGzXJb5MKACQzAJKWyOyjzvrTJn0GhKRYo9HqE752a1O1dYm6a8sq/BWTdFWY7VT6Ag3RvjQiR7N1l+7kPBqAZAYAfn3SVkdn61LtRiRSlsjcocF+m95aTV2qbmpY5b9ore7QAJ+EzII6aSA9w9UKPaRbw1sEAiCZAYANTdd20yU6my1pU2ad7tMAv1UHVkNF6pnBk1uW6zoND8tc7qWazlUftiZ39opu0diwhkAAJDMA8J9JWp6OUmcdz9MobRWr8SoJMx3bVUeVaaeM/8WLdI1ucNq0ubrO0UA1pnG5+lqjdVP4nEAAJDMAmO/W1Z90hVoRidSZom5+n+RYnjqqVLtm7QJzNUh3Om3aXFuXqCfvMJ2t0T90XZhKIACSGQC5m8jsrst0pmoTidR5UiXhdbd2FXSyBqh11i/0prqHyU73uI16q4hNMtw9pxv1j7CeQAAkMwByLZFpp2I+LEull9U7POPYsqLd+WuKuoc3nO50B/XS+Ryr6e4L3aEbw2ICAZDMAMiNNKaGztCVakskUuh19Q5PObatI1SqQ6K+qMaod/jY6Y731CAdT8Nzt1z3aUSYRSAAkhkA6U5k6ukcdWE/plSarn4a73e0oB2g3jrB6eJrdY/6hq+c7vxAlelwGqC7cv1LI8IUAgGQzABIZyLTQpfrfNUiEin0icp0l9/KAWutvurkPJqt0EgNDkudIlCga7QXDTEG3tCNepBVNADJDIB0JTJH6CodrzwikUKfaoDuD+vc2lZL9VdhTEayrzRAd4a1LnHI05/VXzvSIGNgtq7TveF7AgGQzABIfhqTp+PVQwcRiVRaoGs1Iqxya107qJfOU7VYxeQz9dH9Pp/bWb7OVT81oWHGom/crRHhSwIBkMwASG4iU11/UnfOkEmpRbpGN/r9+mxN1VUXqkYsYzNNxeFpp7jU0qXqri1poDGwWmM1OHxIIACSGQDJS2Rq63yW+qfWct2sIWGJW+tqpC66XFvEOkaOh4ZaA3WLfXxyRbn+pf5hGoEASGYAJCeR2UqX6DI1IBKptEIjNTR869a66uhi9VTdJHQEjVeP8JHTxZuqJHaf4OWuKeobXiYMAMkMgPjP31qoi87R5kQilVbpNg0J3zgmMp11daI+oVqtWzQ4LHSKV0uV6hRG+Zh4VoPDZMIAkMwAiG8is5OK+S04tdZqjPqGT9xaV3Wdo/7aJoGRW66bNSgsc4rbfhqi9jTfmHhb17NxM0AyAyCOicwe6qVObL6cUuv1oPp7nXIvWXX9VT21bYIj+IX6626vDaztaA3SfjTjmPhAZRrjt5k5QDIDAP89VdpHvXUiz5K0Vq/Gq2+Y4Xb5ajpLfdQ8BZH8UL30d6dNm4NOUala0pxj4hOVaXRYQyAAkhkA3jPdg9RTx/McSa0p6h7ecGtdQZ00ULulKJ6vqXt4ximaeeqoMu1Eo46JubpOo/xOaQJIZgCQyLRTsU4gDqn1knqF5xzbV4GGae9UJohdw9tOMU3uyqN0mqdrSWgAkhkAHpOiwzVAhxGH1HpZvb3eIEiS/V6lKV7lsV73q0+Y5xTbOrpKVyVic+tcSWiG6O6wmkAAJDMAopoMHaSevJFJsfc0MIxzbV+lOir1UV6j0Srx2ubaGqorx2rGKqHhDQ1AMgMgkknQgeqv3xOH1JquPnrEZ5G6JNl+GqhjHC68Vg+rXeTrSb7VUN0YvneK9fbqq7PZSj025qtMd/KGBqgMtlIFsIkTTXtMr5DKpNYcnaW2YYJXKmNt7VG96pDKrNe92i2crVa6XAsivXJ9lWmWnW+becQ7zAsXqI3GyWj6sdBUIzXHiiyfUAAVfp4RAgC/PdFUiTrxvEit+Rqu2/x+Fbbm6qHzFf2k3vSYeoV3f/qvtXSpeka+nuRD9dF4vyRSJSqkC8TGZxqsuzhYEyCZAZC5yU4bDdBJPCtS6ysN0SjXRKaPznL53GmSSn65r5htrT76q6L+ffwldQsvu9XBkRqsA+kKsfG+SvSPwDszgGQGQJUnOTuol8sv5ojGYt2k68JSt/a1la5WZ23ucOmX1DM8v9FyNVNPXRD5Z9hTdPX/vSWKvC4KdI32okvExusaGCYSBoBkBkDlJzeN1MVpookoLNfNKgvfubWvhuqqy1TT4dJT1Tv8+zfLt6+GRr6rWrkmqFv41KlG8tRRQ9SCrhEbL6tXeJYwACQzACo+ramnrrpCtYhESq3USA0Li9za15a6SleojsOl31RJ+Ncml/NYlWnPiEv4vUZoqFeSadVVpN7ami4SG4+pJLxFGACSGQAVmc6co4FqTCRSao1Gq3/4wq191dKlKlZ9h0vPUJkeCOUVKm1QJ4e3FYs1zHHT5lq6VN21JV0lLo9kjVeP8BGBAEhmAPz2qFlNZ6i/mhOJlCrXBHUPH7smyv3UxOHSVdgjyvJ1rgZE/rZivgb67WplDdSNYzVjZK3uUZ/wNYEASGYA/NoE5hQN0a7EIbWJzMPqF+a4ta58nafeaupw6Xkq1T1hbZVKX09ddWXkK3zeU4/wmFuNbacSnSfOPYmLJRqqEWElgQBIZgBsaOKyv67RYcQhtaao6y+3IY6sdeWpowZrZ4dLL9TwTH2wZVvpal2p6hHfwSsqDi+41Vwz9WQ/wxj5XAN0d1hHIACSGQA/n7AM1Jk8DVKcyPQI09xaV9AJKtUeDpfOwsbTtqtKHY6PnaKrwntuNdhafTlWM0Y+VJ8wjjAAJDMAfpioNFKJ/hb5r82IynPqHV50bF8dNMDl9JJlul7XhSVZuacDNTTyt5jrdJf6hy/d6vFQDdEhdKfYeF7dwquEASCZAXI9kamui9SPXYtS6zWVeh67Z+00yOXTxdW6N9uLpV2OmFypm1xPBirQMO1Nt4qNSbo8fEIYAJIZIFcTmTz9WaXagUik1DsqcU1kDlGpjnC48BrdrsFRvMGwPJ2lAZH3oIUapFvDarenxp80gGM1Y+N7Xa8hYTmBAMkMgNxLZfbXDTqIOKTUhxqiB7029ZWsrUpc1liUa0K053E4nck0T6WOmzbn61z11bZ0s5hYqFKN9OvtAMkMgOgnI001mOX+qTVXgzx3O7JW6u+wQP6HgwV7h1kOd1xbXdQt8hNZPlB/v0XgVlN/VS9tRXeLiem6OjxBGEAyAyAXEpmauky9VZtIpNI3uk43eH2CJFlz9XDaxneKuoW3HPvVduqj81Qt4su+rGK/zR2sji5WT9Wl28XEFHUO0wkDSGYApDmRCeqka9SMSKRSBs9TqVTr2l5ddKFquEzieobXY9C/WmpA5O+kTOPVK8x2u+dG6qIrXGodv7RW96hXWEggQDIDIJ2pzIG6QQcQh1T6VtdqhN8yYNtGPZwSmRfUy+9AyQ1E4hANjXwD47W6QwOyu3fbr97zTuqvM5RHN4yFheqlO0M5gQDJDIB0JTJNVaYz6O2ptFw36FrH7XobqpsuVU2HS7+u3uGpGPa2EzVYu0feCq7T8LDM7Z7bapA60Blj4g1dFl4hDCCZAZCWRCZfF2ug6hCJFFqj0eobvnJrW7V1ibq7nFM0Xf00PlhM+1yeOmqYmkd82UW6xnXF1AEarKPolPFognpA3fyeDADJDIDMjWlH6abIfyVGFNbqHg0In7u1rJr6q3poa4dLf6ohfhsTb3J8qusi9VX9iC87V4M8PzKyApVpHzpnLKzQcA0OawgESGYAJDeRaarBOos4pFC5JqhnmOM4UT9H/dTE4dLzVOq58XQF41Rfxbo88k2b31ePMMntnoM6qVS70kljYZY6s2UzSGYAJDOR2UKXswVzOqtW41USZrpdPl+nq692crj0Al2rEWFV4n5SKHHYrnqKisObbvecp44aqh3prLEwSZeHTwgDSGYAJGsCdaKuZyqRSv9USXjXcZJ6hvpqZ4dLL9RQ3RJWJrQ/ttEQnRDxRcs1RiXhY7d73kIXq4ca0mVjYKXKNMxvNRVAMgOgYpOIXTRCxxGHFJqs3uE1t3YVdIr6q7XDpZfoOl3vt1NXhuJ3mIbqwIgvuka3qTQscLvnuuqiK3k/HAuzdHH4N2EAyQyAuE+Y8nWV+mlzIpE6r6h3eNqxZRVoiPZ1uPAK3aVB4ZuU9M8CXae2kUdwpAaHpW733Ehd1JlnUixM0kVhPmEAyQyA+E6V2usWFt6m0DSVeC7itSNVqoMdLrxKozTE7zDIrMSyms5TX20b8WW/0gDdGda63XUz9ddZHKsZA9+pt27lSE2QzACI4yRpa12jM+nPqeN8noodoN6Rr/aQpLUao77pXLZsNXWZw+k8n6mP7ndsSa3UX514QsXAW7oovEoYQDIDIE6To6CzdB1LbVPH+TwVa6M+LtPPck1QrzA71X22gbo5fHz1urq7fqx4oMp0OB3bXbke1JVhEYEAyQyAeEyL9tBtOog4pIzzeSrWUj31Z4cPg0yPqXd4Jyd67vbq7bJpc7fwluNdF2i49qSDu/tKxZ5v6gCSGQA/TAxqqpt6qDqRSBXn81SsmXrqPFVzuPQU9QjTcqoH765+Kow8YRyv7o6bNuepo8pcTirCzz2ronS/AQXJDIC4T4SO061qRhxSZZFG6lq/bYitqbrqQtVwuPRL6hWey8l+fLCGql3EF12j0erjt7mCVdc5GqCt6fDOVmqAhvt9ygqQzAC5nMjUV5mKiEOqLNfNGhKWuLWpRuqiy7WFw6Vf1aAwMaf7cwddq10c2tsgx8S5ti5RT9Wl4zt7WxeENwgDSGYARDsNKNTN2oo4pMhK3el5noo10OW60mVi+b4GeO7XFps+na9z1U9NIr7sAg3SzY5rsxqpi65weROI/7NOt6hnWEEgQDIDIJrhv7lu0zHEIUVW6zbP81Ssjq7QVZFvFfzDnV+gB0lkfqyHGuqiUocLf6ie4e+O972LSlXIXMTZLBXl5meeIJkBEO2wn6cLNFx1iERqrNUY9XNcjF1DZ7uuXZinUs/tp2PUsztqiFq4FeA1FYdnHe+/jfpEvhEC/qsS9AAbNoNkBkB2x5o9dIf2Jw6pUa4H1T985Naequuv6hX5h02/9I56hMdzumf/QUO0h3sxJqlHeN8xCgUq0z48Flx9qUvDI4QBJDMAsjPx7K3uyicSaalQTVDfMN3t8tX0F/WJ0V54z6p7bp5KHquDJNfrPvUN89xiEVSo0sg3QsDPjdWlYQFhAMkMgMwO8ntotPYmDqkxRd399g+yoE4q1a4xjMpV4b2c6te7aaA6xWwUXqPR6u03mbV8nau+2paHhKMF6hLuIwwgmQGQucH9Kg3gYMzUcD5PxQo0LLaJcbkeVPfwRU706+3Ux+lo0t+2TNdpaPjeLTY1dZm6u2xJgf+YpAtzoyeCZAZAtod13smkifN5Klagwdov5jFaqZtUFr5Lda+uo6vVzeVEn033uQbobsdNmxuom9OpR/jBt+oebicMIJkBUJXhnHcyaeJ8noodrFIdmZBYLdYw3ej3ZiCr9VBd56g0IadEfag+rm22qUp0vjbj4eGG9zMgmQFQhYF8H92jtsQhFWaor+ukcH8N1O8TFrO56qv707Vps22ms9VfTRNV6BdVHF52jFlrDdYfeYS4WajLwhjCAJIZABUdwKurRN1j+j09KuZj9deDfpNy20MD9MeEPunfV0/Pz/IyXBMnarB2T2TRH1XPMMMxcodqmA7kUeLmEV0UviEMIJkBsOlDd2vdp98RhxSYr+G6Lax2a0k7qnviP9OZqu7JP5ncDtRQHZbgGyjXBHULnzpGsIOuZdNmN9/owvAoYQDJDIBNGbKDLtdQ1SASibdQwz3XfdgO6hXb3bIqaoquDu8mtk+3Uv9UnG7vvDWD5etc9dc2PFqcjNOF4VvCAJIZAL8+XDfTaB1BHBJvsW7SdWGpWztqrKvUWZunKKLlmqDi8EnievT26p2qJeyLNUwjwiq3eNbSpeqlOjxiXHymc8KzhAEkMwA2PlAX6nbOVki8FRrp+vt1Q3VN6Za2zsc5VrgmGqhbylLKH8zXQN3luApsK/XWxawo9Am+blI3vw9nAZIZIM5jRGON0knEIeFW6171CV+7taI6ulg9VC/FEXY+znGTayLtxz7OUN8wzjG+LTUgFZ/uJdEH+kt4kzCAZAbAz4fm43SXmhCHRFure9Tf70wGq6VLVaz6ORBp5+Mcf7Mmquk89dW2qa+HV1QcXnCM84G6Ru148Lg86wZrYLoRkPGrAAAgAElEQVS2TUfS5RECwHXqU8fu0b9IZRJtne7WLsHteDnb3K7UJypzSGVm6Xzdq/JIr7mdRuldOzmWvTlYoT7QqIhTmfUarQJNivhmD9JzNt529Yp1mKrDdKrm8PiJXL766jnbkUAAACTZfjbLkGTlNtZvQidZvhXZfJc7/8yKrJokWSsb63D9V+3ImPXmQ+wFhzhMtj1/vP6B9lzkV19ro2xb5/b/FY8hB0vtLEZwAMj1RCZYZ1vNmJhok21vxxaUZ4U22+W+v7Fi+9nSdpeJtNlk2ysmvbm1S0I31Q7/r3IU2LuRl2KFlZnjSi2rZcW2lIeRg7FWn5EcAHI3ldnenmUsTHgis59rKtzB3nG574VWbDU3WKYChxKtt7G2k3Nf3sFG2brI73yGFVrYYIr7F/vcpVU47txm29ooW8tDKXKfGuuWACBHU5lTbBHjYIK95PuJkxXYG06flvzqb/CWZ4X2ceSlWm2jbGunmmhkZbYq8jue959P/DZSqppWbN9GXqq5VmSOZ+pYS5e3Y7lurfWzzRjTASC3EpktbAQjYIK9ah1c2087lw+6zJZb2aZ8VGLVrci+jrx0y6zMIj5M0WpZsS2J/E4XWbFtwjlC1sDK7PvIS/e+uW6ZbAe6rFvKda94vx0FAEQ52O5rMxn7Euv9DX/aE1nrOcimuNz3ahtlFdhxz2q7rGL4xoqtekQ1kW9F9mXkd7jCyqwCp9fY9i4fwL1oh7g+Yzs4rSTLZd/Z6YzuAJALiUywLraGcS+hZtqfzHEze9vH/uVy32vsVmtaifJuZ7c7rGKYaZ2ynW5anp1hHzl8znO7bVeJ0u7h0G7KbYzt7NhXqttl9g2PrIjdYbUY5QEg3alMI5vEeJdQn/36GoWst53dbayVO9z3ehtblUmp7eZS7tfsqCzWhc96pcnWtgplPtjh46s1FXubl/F6qs0eZ5GbYXsw0gNAelOZw5xOA0EmPl7y3KepucunQmblNjETUxPbz/7tMvn/XRbqwudeXrJDM1D2Dg4fuC533rSZPc6i9r11ZrQHgDQmMsE683lZIi3ctMXWWWs527tNxjKaDFiBvemQjI3N5KdOtqvLW6YPMreg3qpZkX3h0odqOPYh9jiL2jjPBBYAkI3BdGubzPiWQN9aSdT7Y/2s3TSxGx02/f0hkTkg43eTZ2e6bNo8wrbKSF3c5pBUfmJnZnqVltWyEocd2ObYn1w3zjjCpvFAi9CHticjPwCkJ5U50uG3UGTi8xjHs62tgfVz+t7/FWuftbvy2QFsuZVZ3SqU2mftRRYPobSGLps2v2cnOPao4HICEp+bAQASnshsZv1cVjugar/mj7JtHFtNbZcDD83M3s3+GSFOZ7MsqNynTk5n5kSw0sR2cFmJlZWVTBWozc72HQ+4yEyoyDbiAIA4pjJN7FnGs4Sp5DbEGZzqd7dFLnf+np0S1YdAtrWNdFhDVsFPnSzPzrbPHFrgSNs6onrY256M/P7W24O2o2MPa2y3sCVAZGZ7Jq8AgKoOmoc7fFCDqlhn93qeY201rLN95TTl+HPUJ+hYC3vIYTn9G3b0JpbvBHsv8tKV28NRn85iBQ6rSTK0kqnS99zK/snjLiKr7EJmAwCQxESG3cuSJkPbEFe6xeTbXxyOYTQzm+t3go61dtlnarLt8xvlOsCeiWO5sva0KrTZLp/S1XXscQfZyzz2InI/h2kCQNJSmTo2jvErUXy/5M+zQpvlct/OJ+hIkh1iLzqkrmNtl42Up6XLBsyui+PdtmZY4LlpswUrtE94+EViurViZgAAyUllWtl0xq4EedEOc32H18HedrnvRdbPc+Ppn0XB4zjHDZxPb01dTvX51Iqi/shvg7XgszXDJ/YXv02bbQsrZkuASCyxTswOACAZqcxZtoJxKzGyuA3xJrWWAqfTL5ZZWbz2GbJqVmSfu3zq9OOuYVbfymxlbr2b2EA9NLIyh7ONXrOjHO+5oY1gS4BI3oeOsHzmCAAQ70Smho1gxEqMCLYh/tXW0s5pr7sVNsIax7L/1HTZknqhFVt9K7bFLill3RjWQzMbZesjj8Zk29vxnndzWb2Ve57z3PQeaRYIAZCR4bC5JohtKJPhA/XVI8Hc2spBKpXHb9GrNUqDw9cx7kUN1VOXKOp3Feu1WeQ1casGhYWxrYd9Vaao31qW6wH1CZ+53fNRGq69hez6XKeFlwgDSGaAOA7+7TVGjYhDAsxRfz0Uyt1ayt4aII/F3mt1j0rDvAT0pR00QGcpL7UtsFwPqk/4NPb1cIyGRD65X62bNTgscrrjPJ2lUjUVsvsk6hJuJAwgmQHiNuwXaaT4Gjj+5ula3RZWu7WTVuqhPztM08s1Qb3C7AT1qFbqr8JUtsEp6hbeSkgtBHXSELWI+LLLdbMGhWVO91xTl6mn6grZ9LAuCCsJA0hmgLgM+JtrlP5CHGJvoYZrRFjl1k6aqafOj/xzJsn0mHqHdxLYsw5UmQ5PVRt8Td3DMwmrhXydqwHaOuLLfqH+ujusc7rnRirRxaomZM9bOtnvk0KQzAD4/8PeDnpE+xCHmFusm3RdWOrWSpqqqy6Ux65VU9Q9vJHg/lWg4dozFW1wpko03m+dVpVqoZYudXhb4Roxa6kBKX03GBcLdWrSUnuQzABpTGWO0UNqQBxibbluVln4zq2NNFIXXa4tHC79knqF5xLfx/LUUUO1Y6Jv4nMN8HvPkMF2fEXkCflrKg7Put1ze13DlgBZtE69w1DCAJIZwG9wD+qmQQ6fDWHTrdSdnrt3WQNdritdvr+fqpIwJTV9rbrO0UA1TmThl+k6DQ3fp6IemmuAzox81jBFXbw+k7Q8ddQ1asajNGseUFE6egdIZoDkDeu1NFqcaBxnq3W7Boev3FpIHV2pq1TP4dJvqSQ8lroet6WKdblqJqrQ32ukysLiVNXD/hqqIyK+6Hrdp75eO/FZTV2tbqrNIzVLXlGn8AVhAMkMEPXwtp3+wUqZGFunh9UvfOzWPmrobIdF05I0Q2V6wG/j6SzHdSv1TszC7HJNUHH4JJX1UKBhkX9+tUaj1TsscLpjtgTIpi/VMbxCGEAyA0Q5sB2sR1wmqti0SeTD6hfmuLWO6ipSTzVxuPRH6q8H05rI/BTf3TRIp8R+5HpUvcL0FNdCns7UgMg/v/pWZbrJ66Mka61rdBwP2KxYrYvCPYQBJDNAVEPa6brLZTk3NsUUdQ1vO07xOjqcyyFJ8zXc8wSdiOO8n8p0VGyLN1XF4fkcqAWflUyumylYew3XXjxms+JGXRXWEwYAyPZQtpmVGeJqsu3r2DbyrNBmutz3Aiu2nEuvrcDeiGEbnG45tZ2v1bZiWxp5lGdYoQXHfv4pD9useNzqMctA5fBmBtjUYayuHtYfiEMsPave4SW3lhF0kgaojcOlF2uYRoYVOdkf83S6BsZo0+a56qP70/6Z3wbqYVv107mRryd5Ud281llYLV2tbqrFYzfj3tMfw6eEASQzQLYGsBb6h1oThxh6VYPCRMeWUaDB2s/hws4n6MSiV+brXPXXNu4FWaxhGhFW5Ww97KaB6uSwafPV4V23FK6vzmdr/oxbpI7JPx0LJDNAPAfrozRWDYlD7LyjEtdE5nCVqp3DhVdqpIaFRTQAyeroal3tuHXuCo3QsLAk5+vhIA3VoRFfdJ3uUf/wudMd/07XRr5Ndfqt1oXhXsIAAJketC6wNXzQHDsz7FRz/DnG9renXO57ld1o29Arf1YXjW2klTvURbndZk2I/0/10MHej7wOVthg29Ltjk+2WTyKM26o5dGbUBE0GODXB6tg/XSH8olErMzVhWobxgZzahWtbaym6ujIL1yucdo9XO53GGhM7aI9Xb4zCNpLuxH+n8IxUXvoVEV7uk5N9dBHVmybu9zx39VaF2ohdZ9R3TSJzQAAIFOT1i1sHD+Txcx8+5tVd2wTLW2MrXe47/X2gO1Mn/xFfextTzi3yH9aG+rh/9XI5tbVFkVeC5/aX7x+z7eGdiNv7zPsbWtKX8Km/64EYGNDVCP93WVFBDZmoYbrRq9j8yTbQb10nstJ4K4n6MS2h+6gXrFYhl2uCeoePqZGfqqZOrpa3SI/kWu6+oVxTne8q0pVSM1n0Jc6IbxJGLAp+MwM2Njg1Fqvk8rEyLfqpR3DULcTwLezWzRbRS6pzBq9rbk0gZ/VR2O7SbNVFIsdpfJUqA/sWmOTkB+FZaGfdtWEiC+7u8baM7a/yx3PCqfqaL1L3WdMEz1rxxEGbFL/IwTABqdKBRqnLYlDTKzQSA0N37q1hobqqsvlezTlct2sQWEZjUGyWrpUPVU3dgWjjv6vjmrqMnV3eoZO0ZXhfZe7ztOZGio26MiU9eocbiYMIJkBKjMkna9bWfQfE2s0Wn39lrxbHV2sHorHctQFGqSbw7qc7ptxOVtm43V0ra4Pa3K6jvLUUcPU3LEI63S3+oUvnVLtrg6f2KXXjboy9w6jBckMULWhKKhM3YhDTBKZOzUofOHWFmqrs7rE7A3dTPXSI177uLlPkk/XQO0Y+4LOUi9NyNE6CjpZg9QyBkVZoet1TVjqEoVmKtNpzLAyZJz+krtH0oJkBqj4IFRd9+gM4hAD5ZqgnmGOY0s4J7ZvAF5X9/B0zvXNAg3V7xJT3NfVI/w75+rI4+jMX7NI12iEz0TY9tN1rLrMkKk6MXxDGEAyA2zK8FNb43UMcfCvCI1XSZjpdvl8nas+2i7WMZqi4tzZ68f2U5mOSlyxc6uOdle/WO7nNVeDdFdY7xCRoE4amoA3iUnwsY4PHxIGkMwAvzX0bKd/aQ/i4J7ITFRJcNsVyDbTWerr+r3/pirXQ+oTPkl9g9hNg3RKQkerco1RSfo3bbbmGqgzYrw/6lvqHp5yicwWulLdVYcHe5UtVIcwlTCAZAb4tUFndz2uHYiDs5fUI7zg1gaCOmlgos50X6t7PLdHyHqNbKXeuthlO2zqaFPrqKG6qrM2T8CzpTi85BKhRirRJbHYRDzZVuq0MIkwgGQG2Nhwc6AmqhFxcPWKenuuBEnYmoz/s0IjNdhnoXNW66O2LlGvlPymvUIjNSQsSV0d1dKlsdnrbxOKq/HqFWa7XLqVhusPPOSraL0uDrcTBpDMABsaaE7Wg2yl6eo9DfQ6u1uSrJ0G6bAEx2+hhuuGsDo1PbK6ztFANU5VG1+ka1JVR/k6V/3UJGHFdnxPZgW6Xm142FcxIR0Q+hEGkMwA//10vEw3xPhr7/Sbrn4a77eRrR2k0gQuLv+lzzRYdyb/RAbLU8fULpt2W4ye4ToK6qRB2iWhxXd7l2n5Ojd1SXr07taFuX3aFkhmgP8elIeomDi4ma1+GuM3Abd9NVDHpiieb6p7mJzoHvlHDVbrVLf5t9QjPJnoOipQmfZJeC18rYG6Pax1iF599dHFqs7Dvwom6ExOngHJDPDDsLKZRul84uDkMw3UvX6/sFkbDdSJKXwKTlH38EYi+2M7lemQyC/7icNboKfVPbyeyDraR2UqSElPmaPeGuvxTth20TCdxBBQBc/rxPAdYcAP+LQGuZzK1NAYUhknC9RdLcNdXqmMNbdRelsnpfIHnQK9bmMtYZ8AWSsbqxciT2VeV/uwk47WWxFf9yi9ZpMtYesnrJmN0mupSWWknTVGr1n76C8cZoeTdVTkrS5NDtNLtj1hwI89ihAgZ1OZunpURxIHBws1TDeHlX5TMpXo7IRv9/vb1uoODUzGhsC2g/rrrMi3rp2l3v9Zq2V5+rMGRH660Frdrf7hy0TU0TYq0V+Vn8q+8qS6h7cdYpqnc1SauC0U4mOujg6zCANIZpC7qUxjPZ7IbXiTbomu0/VhmVu9N1FPFbl8r/6ydteWEV9zha7XNfHetNkaqocuifyUki81QHf9fMWE1dBF6hX5Bu0rNELD4r1ps9VVF12p2il+LpXrYZV4HEBrtVWsq1SToaFSvtGxgfdbAHI0lWluswxRW2+3WAPHWm9kw2yFy52/bEdJ1sCuse8jv/YCu8JqxLQf1rSe9l3kEfnOelmtjU3bbaAtj7xEC+2q2NZRdetsCxzq6K3Ir7nabjCXs8Zse3vAyhkgKtlS2jGjAZCLqczuNo8xIHIzzfGjPqttxQ7TZjOz96zQfnoHbk1tlK2NvAxzrchidv64VbMi+9xhwjrKGv9m0ltmqyIv2bwY1lGeFdocrzqyAns38msvszKr6xLrfe05BolKWWHHMasBkGupzMG2mOd/xMptqLltRWq1rLstcrnvD6yT/eJjXmtt/3AoyzsWm/PHLVihzXR4Mzjamm1iCXe2MQ6/lb9nJ8ToSfkHe8e3jqyaXWhfRF6GL+xvVs2pV3zMYFGp9Pc0ZjYAcimVOcKW8uyP/COa493qu7oVOUyHzMw+/bVf2u1Ae9ahTC/boTHog4fYCw73Ptn2qmA529hYh3K+YofHoI72t6fjUUdW04rtW4f3yIUWXJ5XnZ3eICfbOitidgMgV1KZDg5rFnLdO7aDU23nW5HTB4Vzrch+c98n+6O97/CObIK1dOyBe9sTSUri7Gib5lDeR213xzpqaRMc3kq9bIdttESN7HqHD/+m+qSV1thutXUMHBV+snVjhgMgF1KZU20Nz/yI/dvqudR1nhU6bfKwwIptiwqUMvoPS9bbWGvuUCc72CiHSdqMqv3GbsGlJa23sbajQx1t57KmaxPqyLZ3aT2TbW+nhHIig0eFlRk79AJIeSpzLr92Re5hj5UyFqzQprvc7yLrvrF9sjZa2s2ti8OKnhU2xCLcKNoa2022OvK7nGfnZ2JRveXbxfZl5KVfacOi3P3PtrQhDrv9zbcLNnWFiu1pjzuklfdu6kqrDNdHMTucVditxlHwAFKcylzKwBC5sR67M9kJ9qbL3S61/pV9C+U0jVxkXS2C812sjvWzZZHf3WLrtqlvyDbpLmpbiS2J/C6+3fT3fFW6u82tq0NKvbjid2dH2muRl3OVXWsNHZ5lZ/EtQYXdE7c9AQEgc79xIWqPR39yhrVzWVZvtspG2dZVLPtWNsLhA595VpTNnZss34oc3mmsthFWPwt309DKHFbdzc9yHfl87LjaRtlWlSxxB4cP/5ZZmdWJ/Il2vMNaoaQb89vrFQEgeanMQJ7vkXvFIj7T3Q522X/JbLXdZE0ydA8tbbzDG8QP7MQsTZL/7DBJXmd3WNMstrPmdp+tj/yuZtgp2VkPYCfaBw51dFfV6sjy7SKHJLkCn8RlsH5WM5xU0Hi/gwAAIBtDQbDrebZHbq5tE2kt/84mudznWrsz09/T2wH2jMOdvJTpc7TtWIcz3M0esVYRtLc97DGXHwgyvLuWtbOXHO4jQ3u1WW0rcdhof7qdFPEYdgafSFfYxOi/CwCA7KUyN/Ncj9z3Ue4AZLu7vM0wW28P2i5Zuqfj7G2HO/qntclQ+X1OKXnODoqw3R1urzjc42O2R4bK38b+6VD+F+zgjNbCVjbC4c1FxlP/37jLqxlUKuxJq8kMCEA6UpmRPNMdXB5ZDTdz2a7VLOtbtlqwQpvjkKCNtZ2qWPLdbKzLp3KFDk+YAnsn8jstt7HWoorlburSb6Znp46ctvyebHtG2NJGMaxU2PPRr3ECAN7KpMMT0ez1b01thNPi2Mm2XyR3mG9F9lXkd7faRlnjKvxOHv0mBnOtyGsHI8uzQvsk8jteU/kNJ6yByyYG87JbR9baxrqk/hGdBWT59jxDS4W9FuXW5gCQjUnGXTzLHXyXqcXwv1q7W7slMs9F/IFJXRvgsK3xd9azoh9p2JY22GF76QV2pffX8baFFdviyO98iZVU+EyjmtbTvou8pAvt6ki2AC+waZHf20obmo198zZwd9vZQoaXSqQz9ZkNAUhqKrOZjeY57uLSrNdtA+vncN6Hmdmr1sGlNTeyMofU7Rsr3tQ9gay6FdnXkZdwhZVFefDnr0agvpXZSodUrnhTUzmrZkX2ebrryIIV2uzI73FxRGcBncTwUglveZwQBACZSGXu5xnuYlp2P/exutbXKZF5x/4YzedzG7nznW2Mw0qUmdbpt+7aNrNzba7Dh1a3RvEOsEJ11NTudFi7MdtO+806CtbJZkZesrU2yraNvBby7VKHxHqunZv9Tx3tHoaYSo1KWzIrApC8VOY+nt9O2mexXmtaZ4cVJGZmH/utyfhZBNo4rAswe82O+pUyFTjsu1ZuY7O1j1yV66ily/YH7/3a0no72F5waDeTra1bLdSyYocfPaZnexMKa+CQpqXBm6ydAZCsVKaajeHZ7eTprNVqDbvM4Yg8M7NP7Jyoj8n71Uh4rAswe9z22kBZ2tmLDmWZEs32C1Woo4NcFms/ZftsoCx72eMOZXnGDnCvha1tpK2J/M6fz+724HYmw0wlf5Lh7QyABL2VeYjntptDspSeXmCfudzP53Zx/E6StmCnOawLWG8P/P+dm6y1yyklb9rvE/IkOsHec3hjNcZ2/n9l2MketPWRl+JtOy42teDzceYj1jKLvX8qA02lvGr1mCEBSMIEItjtPLPdvJiFGs2zQodv/c3MFkazqLeSccm3Ivsi8pissVG2jdspJZ/F42O/CrXdj1zqqIlkDV02jZgbvzqyNjbRIfUfa82ydD+HMdRU0jR2NkuvQAiQnlRGd+h84uCmY3gkw/V5sgaotcOdfKdrNSIsi3l7r60r1UV1I77sMv1LJ2rziK/6jQbq9rAmcc+kGrpYPdUo4ssu16M6UVEfGLhQg3RrWB3Levi9yrR3xBddqREaGpZk4W6e0DEMN5UyVceEpYSBZAaIcypzsy4iDm7mq3lYn8H6PE4DtY/DfSzXjRoevk1Iq99KvXSRqqe6ZS3Ttbo2LE/sk6meuuoK1Up1Ha3Q9bomztNEy9OfVKodI77sIg3WzZlO8OxwPcuAU0mv6FjSGZIZIL6D1Q3qTBQcDQk9M1aXR6hUhzjcwyrdqrLwTcJafnMN1BnKS2WrWqNRKk1ajWygjpqoj85XfirraK3u1IDwVQJqobr+pt7aKuLLfqYSPRjKM3onL+sgoXJe0rHJ/WkEJDNIdypzjboQBVctw8yM1OQBKlWBy5TsLpWGzxPa/vfUEB2XshZVrjEqCR+n5hm1i0pVmLIx1zROvcPsBBW4rrroqsjfk72r7uHxDN7Fn/UAQ06lPa0TwveEgWQGiNsAVapeRMHVO2GvDNRja/VVJ4enUrkmqGeYk/BecJCG6tDUtKgpKg5vpu5Jta/K1D5FddQjTEtgLTRSF12hGhFf9mUVhwxtkmI1ND/ylVhp8pT+GM/VXaisPEKAxE8Q+pDKuPtnlWtxZ/sfvevwy7VprFqHU5OeykjhFR2uTpqZgtb0utqHo9OXykhhWijQMUrDnb2pY8LRSUxlpLAwdFdbjZNFetmD9byNs10zcgerNYZBpwp+rwfjdHoYSGZAKtNF/YmCu4lVqsNgl+sdnerwPJqovcNp4cOUTJUtTFAbFemLBN/ELBXqgPB0ertKeEr76gx9lOBb+EhnaN/wVKJrYXY4VQfqmWgvqk56326xbTLwd41j0KmSjrrHmP+m6blKCJDoVKZIt9GK3S1Rw8rvZGaba4xOdCj1FJWEqansFTV1uYqVvBOvv1R/3RXW5cSTK18Xqre2TlzBE7pJ9kbr4TgN0Z4RX3SFrtPQsKJK5c7TfDVh6KmSO3RhMMJAMgN4D0Sn6wHeLsbAY+GEStfhFprosIrgJfUOz6a6bzRQD10a+XkwVUmIh+mGsDKnnl+1dZW6RH4eTOUlfJPsjaYFf9YANY/4sh+pQ5hRpXLfrXMZeqrohnAlQUgHJoJI7iDUQffSgmPh9Sr82VsiT2Xe0PGhXbpTGSksDl21q+7R+gQUdrWuU4swOLdSGSksDwPUQjcqCe851ugm7Rz6p29T21Ae7ldLXaWFkV62hV6wA6r0N0xh4KmyK6yUIKSkHxMCJDSVOUqPJeh353QrDOMrWYtn6v5IS/qB+ujvufRpgbXWYP0xxgUs1/3qE+bm9LNsRw3U6TH+YSZlm2RvpBbqqZuuUM0IL7lcBeHVSpd3G33J0JMBvcJggkAyA/gMPAdqsmoTh5jYvXIfTFgtzdR2kZVyjvrrocweXpeQ3nKIhrocQvrbJqlHeJ8OFOuTgp5Uj/BWjtTCtuqr8xTdPldfar/Kn21ln6oZPScDLg03E4Sk4yMdJHHI2UP/IpWJjTWq7LbGF0SWysxVkVqFB3IxlZHCS6GdTtQHMSvWyzosdCCV+bGO3gl/0JF6NWbFel3tw7G5kspI4Ytwodrokcg2bW6i26vwp9+g32TEjXY6QSCZAaJOZXbVU6pPHGJjVlhbyT9ZFEn5vlJn7RruyI1dsjY6Tfun9tR5mheT4kzXyeGQ8AKd52d19KwOitFJQbN1aro3yd5ILcwMHXWwnovocn+wUyr9Z9+mz2RoHnyvHUsYSGaAKFOZppqcwA1N02x+pZPS3bNetkXqrhbhRk57lsL6cI92VVctdm8v52uP8Cg1soE6+uGkoAvdTwr6UhepdRiXqxvXhqnhCJ2g9yK5WIlV9nP/OfSYDMnXBDuYMJDMAFGlMg30hHYgDrGypJJ/7ogsl2up+munMDTX9sj61UnaqjBcLTREXjFZrG7aNdwd1lMXG62jdeF27aIe+s6pAEvVW7uE2yr9vjUt9fCY9tI5yv7WFHvpyEr+yY/oLRlTU5OsLWEgmQGiSGVqaqJaE4eYWVrJP5fN9zIrNUw7hX5hKdXzi0nad+qr610uXa4SDQ/fUwe/WUcrNVxD5fNeZLiGVe1Ax9TUQnm4V7upS9bfZZ5WyT83lzrKoPp6wnYkDCQzQLZTmWr6H/EqOH4q+2amaZbKs1o3qkUoDouomg30omCnabp6OY03N2ua/Z5a+M066qj3NcRpt9EB+sBONXY6/SGhWRWuVQuVZfVdZmWPHF4kzq/PpG31lEVOHjsAACAASURBVPEJO8kMkN0BXndW+qGPbFpWyT9XKyulWa4jQufwFdWywV50tF7XGO3sWITf6UmbYvtSFxutoyP0isZrN8ci7KL/0WvWnrr4MaH5LvTQrrpT2dpCZFur1K6OYW2lf0jChu2sJ6weYSCZAbJnqM4mCPGcfVV2jpCV0tTWv22IbUm1/KKa9rHJekr7xKAo7fWa/Y/tQp38oo72tH/pGR0Qg6Lsqyn2pP2OOvnxYfV5+Kv2ULa2rajsx9N8Dphpe2mibUEYSGaA7AzyV6krUcAmqanu+si62OaE4qf+s7ON0esqiM/cUKfqA7vFmlA3P9VRc7tfb8bq4Mzfa5o9ZC2omx8b7YxwsgqykkBsVck/t45aybhD9ZBtRhhIZoDMD/NnaThRQAU00DWaZecyKEm2jd2s6TpNcVsFka+LNNtKrS51ZFvZDZqpM2M3Igedrul2EysJJMmq2QW6Nyufx1b27ySZyYaTdCNBIJkBMj2EHKu7xHJUVNT2ulvv2B9zuu/UtYGao4uVH9MC1lIvfWRXWo0crqPaVqI56qzqMS1gdV2qOdbP6uR0Twp2st7VHdouK3/98kr/IIBsuNi6EwSSGSCTg8jvNI5HNiqptf5hL1q7nOw5NewKfaTeWdpoIXMa6TrNtL9YDo5Glm8Xa7YGKO5vp2qrrz6yy6y6cpIdppf1iFpl7QKV3a68Jo/4LBlsZxIEkhkgU4NIM01SbeKAKjhEL9g/LafOJ7I8O0szdb0aJaTAzXSv3rbjc6qOftgk+2Ztk5ACb6UbNcP+nGtJp7W1SXpOB8aycCQz2RJ0lxUQBpIZIBPDSF1NFEuEUXUd9K6NtZ1ypN8U6A3dp2YJK3ZbTbKX7bCcqSPvTbIrYyc9oHetMGdGoO1tlN5SfJNs1gRmT3U9YnsTBpIZoKoDSXU9orbEARl61hVqho2yxinvNfvb05qsvRJa/IP0nE22PVJeR21srCbHYpPsymitsfZS+j/dtAZWplkqImHIWXX0mDUjDCQzQFWGkqA7xbFtyKTqKtJHVpbWpczW0sZqqo5M+G0U6C0ba81TWkfNbJTeUdLfbRysF2yytUnt6FPTivWRisX27rmtiR63BoSBZAaovME6iyAg42qrWB9akVVL2fSrqd2h91WYin3/8lSo6TbU6qesjra2kZqtopSMuwV6y25L30lBlm9/0xyViYN3IbXSo5xYRjIDVHZA+avYGhHZsq1G6QMrtJRs+G31rUyzdEGqPojZQt30kRWn5TRuq2XFmqVLUrUzYzVdqDlWZima9lsHfaBbWamJn/wve2ceJ1dVre1nhXQCSZhCgkwhCZ3uzPOcQBJCNygyql1MAgradVGvoKJdIlcZvNJ9r4h6naoVFXCs/oTrBb6rdjOTiZBA5nQ6TRgVCKMkARLo9f2Rxk8xCUlO9a5zqt7nP/2FXqfedWrv9dbee+3juNl1NYTMjBB7MaGczA+kguhSKsmxyOcm/rvSw2tppY79ijBHB1NPW/JX0bzMa2mnnmK8HrQXdbR7XTH8eu0z/UH+hwoNjuIfqOFqiSAzI8SeTinjydFdOoguZzJ3+f/62MR+U/bxi2knS/8iztGRZFnuZyQ2R938PFrJ8r4izlFf6mn1C5PctNnH+x94kJkaFMUOuNIvkAgyM0LsyaRyBP8T+2v+RPHwfpb6L3xwAr8pZ7KCn3BU0KAd/JJqbg/8UYdzm8/34xKYo/ezlF8Q+u36b6r5DR405tH8nGV+SiLnnGP8lzzMSRoMxU4wflwqTeNlZoTIx7SyH7cGLs+ERsHzaPWsH5ag78l0v69LbyTfMS1Mto9ai53GdO4LHHs693uzJ6jltE/2u/hfQq/7LWS2nWktdg6jaQocexS3+4JkFX1+iNezmnNVC4ld0oPbvFIyyMwIsTsTi/FTpkoHEZwyalnv9Z6AUw0+wnPMJ3TJuJgTrNqWbv8fttDmUM2ywM9QxZJkXH3qlZ5jEaFPZK0hZdPt/s4crbIUxzIv8DNMS85NQd67swFzTw2A4j3py/96f8kgMyPEe/N1zpYIokD07jzKHOPSxgd4luXBbylpJcVUu/sf/09rYQIpNgSesbZffRrjEyje37/DquBNsp8izWh711qMzeM4UrQFN52PeC7eWze9zGtZTz0HauATu8kx/M5lfGVmhHiP6eUCrpAKoqD0o55Wr43jUWY/pCA3km/kMkZZk+3gBIZ1WBPDSPN80Cfq0bmKFsOrT72P19HOZwM3MHmJDJXWaG/vIEduTYwkzV+Cm861no3nL9luXsNqsiRoY6mIBcfxc7VplpkRYlcTzLE0SgURAwaSZbFXx+rb0duv5LHgN5K/whUMsu/YWzv/J7bVGhnKdWwJ+mR9qKPV/8VjdGuL7+tf4HHqCWuyNvMNjrEGe2MXOdpmjVTwb/w1uOls9S/F7aYgP5El5BiigU7sBWfzFYkgMyPEziaYQfxOO5dFbJjAn/xBj0WjVi/zWtq4NvAtJVtpZKhdZ7thUuwVu4JBNLA16BMezg9Z5xfE4ZdS7+Y1rOKbHBI07Fs0UmlfsVd3I0eb7esMpoE3gj7hwTTE6aYgn+Qt/JHxGuDEXnONnyURZGaE2NEUcyB3cqh0ELFiJg/4b72gV+i5+VmsJhv4RvK3+TkVlrY92D5mGy3DGP5P4IbAg7ip8Fef+qksI0fYxgROEyMtbX/egxy9ZBmGcTMdQZ80JjcFeYX/loc4QQObiIRxY3LvJpOZEaLrJpl9+BUjpIPYDTYHnrZSrPIfFKpps1exmN8E3xBzO+Ps4/bkXsjVajVM457AzzuZu/wPXqBf232GP8D/MCpw2LuZailbtxc5esIuZBx3Bn7eAt8U5If5D1hFCp13ENHpze/V10xmRoh38w1OlghitzibNM8FjVjGJbR7vR8UuPwa5TmamRhY30XMsdNsZQT/95DNpZqlgZ/7JJZ4zgPbPh/mOR7k2MCfdRUpO8EWR8jRCjuFGdwf+LkLdFOQ9/E6WrmEGJ2vEglnILepr5nMjBB/P9V8hC9KBbGbbLNGhpAJfJS5V2fT5kDH732gZ1kWvAHzWlJMtzxchmktTCLF+qBPb9SwOtzVp36UZ1kRvAHzk6QZa3m4DNMW2GyqWR74HQt8U9DfGjAn4P4okShm8iOJIDMjxDuTzURu1tK/2KMybJM1MJQfsC1o2L7Us8bP7+qmzX6Yf582agOPzU9x8c4aMO9VjrY3BP5s4KbNZdTS5ld1ddNm7+v/wTpqAzdgfp7PUrHjBsx7bTon8AmeDlxz1LDav+Vd3irBu/n5rCNL2DuJ3maTxuiS4GP+GYkgMyME4O/jNvaTDmKPy7Bn7dNU0Bj4KPMgbmaFd9mKSeeGmE8F3hDzEhmG2k/zVyR35mir/RfHkOHVoJ+mD19jQ9etonkPv5T1fDHwuLWZBirtvyzP/eLsbbuRctJsDPppevI5Hu/am4K8ioe5mUGBB6YWJvKQxucS4QZXOwmZGSG8jBwDpIPYy0LsCUszljsChx1Bzuf7rPx/GwqyIWYLDZRbg73eRTnabA2U08CbQT/VIZ1Xn+b5elHv5jW08m0ODvppttHIEMtYF5nCzpuCGng96Kfq07l1swtOHvgUv5vm4A2YFzLHqm2ZRuaSoTvBz+kJmRkRP77HLIkgIhViK+1UqlkSOOx07vNmH5PXInlN8A0xHTQx0jL2Shfn6EXLUEkjbwf9dEeTZVk+V9G8ikfIBf6t32lihKXt2S7O0cuWoYJG3gr66fpTz9r83hTkQz3HQo4PPCKsIcWMfJw3E4miL7f7gZJBZkaUMP4ZaqWCyEMh1sJkzqE9cNgqlviP/cg8fBNO5hFylAcukm9lpKXs8UA5etLSTOKPgXM0kpzf5ZPzINcsn08zYwI//5+YaCkL1EjBnrE0Y/jvwJ8xjzcF+ZHeyMrgTRme4iJG5++8mUgUw7jJdepXZkaUrJWZw7ekgshTGeb2G4bzmcBNm7vzCdq83iNsOvJpfi93Bi+S72OGfdjWBs7So/Z+5gY/UTCXRZ7zygg5Gu13cB/TAz/3w1TZSfZI4BytsTML0LQ5DzcF+UF+Hev4ZOCmDC/xRSrtZ/Y2olQ5nSskgsyMKE0rczi/Utd/kdcybJt9n/Lgx83369z5vxfHwX2o55jP7MBCrSZlc2xhgbJ0j02lmhVhg1LDKs/6EXuRowGe5RE+GFimx7mQKXZXgXK0vWnzo4HDRrgpyHt4La1k6BX0ibefN/umvaHRt8S5xnVTnsyMKEErU0aOw6WDyHsZ9s5x87DlxcHU0+a1vge/CfuRni3Ihpg0Y/JxS0mkLLUwjgv5c9Cg3amlbc+uPvW+Xs86atkn6JO+QIZhdnNhNy1ZCxNJ8Vhw07nHNwV5N69hLVkODfqsgc6biYTU0b/wcskgMyNKjW8HvzNblI6hedEyDA1+3PxIsqzwmt3ZPe0Hez1twW8peZEMlfm8pSRCjjrsZirIELYU3IOrT72X19FOHfsGfcJNnb3l3oxFjpoYTjrw1s0yalnv9b6bPf28iqXkGBxYnBbGhTtvJhLAwdzqvSSDzIwoIfxcPiUVRJcWYk9amjGEXoEYRo4FPmeXb//2DTF1BbilpNwa4rQhxrZ0rqKFbQjct3MVbRerLd69s0n2QUGfbGtnA+a/xihHW62RIWQI+0y9d69ps0/ze2lmbGBRFjDLqm0FQvw9Y/ixRJCZEaVjZfSVF2EKsdWWYiYPBA47lXu82cft8N3ffktJlv5Bn2gbjVR03S0lkXL0UmfT5rANgY/avoq2kxHqVFaRDbwNtoMmhlvanothjjYV5KagftSzbuem04cX7LzZDHsAIf6Zc/2zEkFmRpSGlTmIW9FirAhViM23WcGPm29v2pzzY9717hfqlpKRlra/xDhHT1ua0TQR9ozIcHK+4N1Xn/pMf5D/oTKwBC1MtJQ9FuMcvdC5dbMjaNid3BTkR3mWFaV53kzEmut9tkSQmRHFb2WMn6JjciJsIVaI4+bdqGGNZ73zULJP9/sKcEtJC5MtZW0JyNFaSzGd0FcOTvv7q099pOd4kJmBn+Eh5lq1PZqAHD1haaYSusPaSHL+oP/tjGWBmjLE6LyZiDHd+W0+bh4TMjMi3lzJmRJBBC/Dth83vyLwcfMe1LLOr/ApfgfzmRX4Qy/lRKu2JQnK0iKbw+msChy2iqV+o8/wX7KcmsCx1/Ahm2r3JChHD1sVJ7E0cNiZ3O+/9Qrv5RnaC3De7OscE6/zZiK2vI+c69IJmRlRzPhJXCUVRIHKsC12HUO4PnDT5gP5dxYFv6WknXOYZM0JzNL/MJaP82TQoPtwEfM4N/Bc+AyfZIzdlsAc/YlJnEt72KCkWMUGrgvclGEbP2SI/VucmjKImDODeokgMyOK18ocxs/1tomClmEv2uVUBG/aHJYXyDDSflPYW0oi5Oht+zkVpHm+iHP0Mhkq7Cf2VkJz5PZrhpMm7EmsssA3yWw/b/Ype1Yjp9gjPucfkggyM6I4rUx3chwmHUTBC7HCHDcPw+b43FISKUdbrZFyMrxWhDnaSiNDrcFeT3iOtlkjFWR4tUgHinkcl4zzZiJ+Xw5ufHf7FyEzI4qDr3OcRBAxmWvWWIoZwY+bdy3baKQ8XreURMrROw2BtxZRjjpoYpilbWOR5GhzZ46K7TTJKlJ2rM3TSCn2koO41feTDDIzosjwD/BFqSBiVYgttDlUs6w4vmDxvaUkUo42WqaIVtFaGG8p21BkOXqxs2lzsWzdfJI0Y9WAWURkLP8pEWRmRHFZmaO4We+ZiGEh1sIEUiS9vNx+S0l7keZonaUK0BA43yxktlXb8iLN0ZOWZgzJNwAvqAGzyBuf9vMkgsyMKB4r051f0086iFiWYR3WxLAEHzdfzAlWbY8UeZYWWxXVwRsC54s1pGy63V/kOVptKWbyQGI/QJGcNxMx4kc+TCLIzIhi4TqOlQgixmVYUo+bt5Jiqt1dIllqYRIp1ifssZ8izehS2bRk820W1axI3INvo5EhxXPeTMSEPuS8l2SQmRFFgH+QL0gFEfsybJM1MJxGktIsdyOXMcqazEsoR25NjCBNUlrlvlSKm5ashXFcyJ+TM0XRxAhLqwGz6AJG8x2JIDMjkm9lBnAzJh1EIsqwZyzNaG6N/XHzV7iCQfadpN5SEilH2xsCXxX7VbQtfKNUb423DruZCq7glQQ87B+ZaClbjxBdwyf8XIkgMyOSbWW6cRN9pYNIUCG21j7MNO6J7QNuv6XkOttSwjnaZFczOMYNgd+ikQr7ir1awjnaYtdRTgNxvk3nYars/cV+3kwUnKxXSgSZGZFkruR4iSASV4g9ZHOpJn5Fzju3lDyvHMW4IXAL4y1tf1aO7CXLUBnTrZuPcyFT7C5lSXQ5ffil95AMMjMiofgUrpQKIqGF2Pbj5nFqd9zChOK7pSRSjp60NGNj1RB4PsdZta1Ubv6Wo6ctHbubgl4gwzC7uZTOm4mCMomrJYLMjEimlTmQ31ImHURiy7AOa2I4aeJwEeVC5li1LVNW/ilLq2LTEHgVKZtpDyon/5SjtZZiBvfF4mE2qQGzKABf8mqJIDMjksgPGSQRRMLLsG3WyBAyFLJl61pSzLD7lI2dZqnwDYF1a/x75WihzaGawtrxrWrALApWZ9/ih0kGmRmRMPwizpEKoijKsE3WwFB+yLYCBH+TT5RaA+a9zFILE/higTYzXUWFbo3frRxN5CKeKkjwDm6h0tL2nPIgCsL7uNHV2VVmRiTKygzlu1JBFFEZ9qx9ipHkghfLPbmMD0j/3RhzevBpvlSgNvCXcpnvpxzsxvfobVZRiFNf/5fxdoE9oQyIAnIyl0kEmRmRnLKijJvpLR1EkRVibXYWY7gjcNhR3O4LfJb038WIY17Dar5N/wI9wME00Oa13l252GWeKj3HQkK/yw8x1z5oy6W/KDjX+QSJIDMjkkI9UySCKEpDs9JO5USWBg47jfv8Nh8u/XdYIp/MI+QoL/BjHEmWZX6G8rGTLB3hP2IVNYHXztbyYabZPdJfxIKe/Nr1Q6/MjEjEpDVLS6miqA1NM5NI0RY47Bms9JwPlv7/MNpM8bu5k7ExeZwR3OYLfY7y8q4s9fE61pIm7MrVM6QZbbfqvJmIEZVcLxFkZkT8p60DuUVvlChyO+PWxEjS/CXwSF3DWs96f2UAwId6joWxu5Z3Kvd4s49Tfjqz1MNraaee/YOGfY2rqbBGe0sZEDEj7adIBJkZEXd+wNESQZSAodlmjVSQ4dWgYXtQS6vXlfpxcz/Ss6wMvmlpd6liief8mJI3Mt28hrVkOTRo2O0NmK+y1zVKiVjyU3+fRJCZEXGevD7MuVJBlIyh2WwNlNPAG0HDHkx9KR839/39KtqoJc6fvxs1rPGsH1q63w6vYik5wm6M7KCJYZa25zU6idjSn6xEkJkR8Z28jqRRKogSMzQvWoahNBL2lpEjybLCa0rt3oLOTUtfIwkrUz2opd3rff/S+1b4NL+X5uBnmVqYYCnbgBDx5nS/SCLIzIh4Tl/Gz+grHUQJGponLc2ng4cdRo55flzJjDD7+MW0kyVJZ4b6UMfa0lpF85H+exYwO3DYhzjWqm2ZRiORCL6tbagyMyKefJZqiSBKllcKEnU695fGcXOvYik/4agEPvoRZFlVGqtofpRnWcZpBQh9vc3TICQSw/7c4vtIBpkZEbdJbDjXSQUhCkDRHzf36X4fzYxJ8EeoJMcin1vUc0Bfr2cdtahEE+K9mcGXJILMjIjXNFbGL9hPOghRoDG8htX+LT+kCMeW0X4H84PfGt8VTOYu/78+thhfQO/lX6adOs0CQuw2V/l4iSAzI+LEFUyQCEIUkJ58jnb/SjHdL+0D/SYe5YNFlKUPsNRv8UFFZWS6e5o2vsFB+hIKsQf04BbvKRlkZkRcJrOxXCEVhCg4B/J1NnhdMUyQfojXs5YLim5+6sZHWefZYrlpwqt4hB9xhL58QuwxI7laIsjMiHhMZt25kR7SQYhY0J961voFST5u7r28jnbq2LdIc1TW2bT5gISP/TP8AZoZpS+dEHvJF32mRJCZEXHgSiZKBCFixCBuSupxcy/zS2inngODht3Ebwl7Y3xv6mj1T3lZQo3MOP8D8zhWXzYhItXfP/Z9JYPMjCj0lKYtZkLEkcnc5c2eqLNsbl7DKn7AYUHDbqORSjubChp5K2jkw/g+bV7rCZuD/WjP8jAn6UsmRGSGa6uZzIwo9KTWnZ9SJh2EiCVVPOw5H5KQ0aSKxeSoCBuUJkZY2v4C9oylGU0THvQJBpJlmZ+SmDG/nxowC5FXLnetcMrMiILyVXUxEyLGGDWs9qwfFu/H9FF+O83BN6y2MNlStv7v5FprKaZzb+DnGMXt3uyx367rvTvPMqkDkxD5rMF/4mpqLjMjCja1jSMjFYSIOWXUst7r/cB4Pp4P9CzLCL02sZJTrdqW7MD/LbLjqebRwM9TxeI4r6J5mdeynnoO0BdKiDwzVFvNZGZEwSY3btQWMyESQW/qaI9f02bv5/W0Uht4FnqCNGPtjp3/A2thIikeC/pUsV1Fc/MaVpPlMH2RhOgSvqCtZjIzojDookwhksQh1LPaz4nLcXM/wK/l8eCblp7j01RYo3W8h7PosCZG8HleDPp0ZdTS5lf5/jGyMu9nKTmG6AskRBfW4T/WVjOZGRF+ghvBl6WCEJGYz6/oCBrxGH7Fw35iwcePnn4Z7VxJ76Bh/8pXGWI/sG2798/tTbuBcv6dzUGfsg9fY73/q8fg9i6f4nfzv4wLHPYNDQ2i5BjGVRJBZkaEneK6kdUhUCEi8qydxxiaAkcdzx/9wcJtavBuXsNqbqBf0LDbGzBfa5v27D+zV+1KBtPAm0Gf9lC+S5vXegF7hnml51jI8YHDLuYE/ldDgyhBPu+6s09mRgTlEl2WJkQ+sFWW4lgeDBx2Jg/47V5ZgBK5iiXkOCZsUJoYbml7bi9ztNEyDOOWwE2bjybLMq8piJHp799hFTVY0LDrSDHV7taoIEqS7tzoOocsMyOCTXRH8HWpIETeDM08O47TWBc47Cms8qwfEXDkmOJ30xx801ILEy1l7RFz9LhdwBTuCvzsI8n5vLCraN7H62jns3QP+kk3chkjrclc44EoWcZyqUSQmRGh+AEHSQQh8mpobmckaf4cNGh3amnzeg/wffZhhdq0ZNX2SJ5y9LBVUc3SwJ9hRrhVNO/htbRTT9gGBJtooNy+Y29pHBAlztVeLhFkZkSI6e4sTpcKQuTdzrxljVSQ4ZWgYXt1Nm3etwvHjCM9y4rgm5Zau2LTkrUwiRTrA78cAVbRvJvXsJYshwb9ZFtppNwy9ppGACHoxY/dJIPMjOhqK3Mg35IKQnSRodliDZTTELifU1/qWdc1x839YK+njdoCbFoa1TWblsytiRGkeTboJ+riVTSvYik5Bgf9TB00MczS9ry++UJ0cjwXSASZGdHV3MAREkGILjQ0L1mGShp5O2jYAWRZkd/j5t7DL6WdOsLenxBg05Jts0aGkOHVoJ+si1bRfJrfSzNjA7/oLUywlG3QN16If+Bb/j6JIDMjuhCfy8ekghBdbmiesjTjuTNw2OHk/D6fnpexort/gsf4NgcH/QRvcD2Dwmxass3WQCX/xdagn7Av9az1C/J19amP9N+zgNmB37R5HGvVtkzfdCF28B3/tkSQmRFdZ2V68D20m1OIMIZmhZ3CdO4PHHYW873Zx0QcK6pYyo85MuiTd9DESLvcXgyYo+fts1QEX0UbyE35WEXzozzLMk4L/IatIcVxNk/fcCF2wtl+mkSQmRFdxZcYLhGECFgsL7TZfIg1gcNWscR/7HtpRXy2L6CZ0YGf+XbGWsoeK0COnrQ0k/hD4LAjyPm9Pm2vjcwh/k3aqCXstZxPcRGj1YBZiPfgu95bIsjMiC7AB5KRCkIEL5ZvYxQpHg8atDuf4DHPev89HCVGeI57mRZYokUcb6fZygLm6FH7ADODX306mwV7s4rmvbyO9XyBfYM+7UtkGGo/s7f1nRbiPRjIlRJBZkZ0Bd9DvxQIUYhSucOaGEqajUHD9qCWVq/z3Ty+7wM8y3JC31i/lhTT7d4YZGm+HUc1KwKHreIRz/mg3TYy3b2WNuoD3xW2hQbKrcFe17dZiN3i8qibfWVmhPjnKfDDnCIVhChYqbzVGhlKA2HLwYOpp81r/T0aK/shXs+64JuWniYdr01L1sI4Lgx89Wk3aljl9b4brRa8ikfIBu5I2cEtVFjGXtG3WIjdpjvf040zMjMiv1amF9dLBSEKXCq/bBkqaCTsTelHbm/avLOJ1Xt7He3UBd609DIZKq0xbrfGW4fdXMCrT3exiuYz/AGaGRVYkBbG2QX2Z317hdhDjuOjEkFmRuSTaxkoEYSIQbH8jKUZTRNhVyOGkWOBz/mnArmsc9PSgUGfZivfjfOmpb9dfRp+FW3djlfRfKTnmMexgYWYzyyrthX61gqxV3zTD5YIMjMiT/go/lUqCBGbYnmtpZjOvYHDTuUeb/ZxfxsXzGtYTZbDgz5FB00MtUvt5ZjnqDBXnx71z6tofrRnWRb8LNMqUjbTHtC3VYi95lD+XSLIzIj8WBkjS5l0ECJWxfIiO55qHg0ctoolnvNjwKtYTI4hgeO3MN5S9nhCcvR0AVfRZkPBzjI9SZqx1qRvqRARSfs0iSAzI/LBx5ghEYSIYbHcwkQ+xpOB54saVvlimpkY+OPezwyrtuUJy9EaSzGL0FdETuVe/71/nQ3U0TNo5I1cSoU1qgGzEHkZb7/n+0gGmRkREd9fy5xCxLZU7rCbqCDN80HD7sukwB90NSmbbQsSmqUH7ViqWRY47Gl8hf2DRtxMAxX2Xduqb6YQeWIil0gEmRkRlasC74gXQuxZqbzVGqnkG2wp0g/4BBcyOumb1y0WtgAAIABJREFUlqyFiVzEU0X7Gm7j+5Rbxl7VN1KIvHKtHyoRZGZEBHy4jv4LkYBS+VX7CoNooNh+E3+JDMPsZusoghy9bT9jSPBVtCATBU2MsM/Yc/omCpF3DtL+GJkZEY1v6ei/EAkpljdapgDHzbuOd26Nf6OIcrTVGiknw2tF9OK1MMlStl7fQCG6iIt8ikSQmRF7iZ/J+6WCEAkqltdZiqncnfgP8haNxXprvG2yBsr5Lm8VwYd5mCqrtqX65gnRpVX6t3d2abGQmRG7tjL7cr1UECJxxfJiO4Fqklxg3sFISxfzrfG20S5lVMJX0R4nzVS7S984Ibqc6ZwnEWRmxN7wJQZLBCESWSy3MIkU7Ql89HkcZ6fauhLIUWuCV9FeIMMwayyGs0xCJIL/9AMkgsyM2EN8AF+SCkIktlR2a2I4aZ5N0EOvImXH2oMllKUkrqJt6jzL9Ka+ZUIE4zAyEkFmRuwp36S3RBAi0aXyNmukkmvYlICHfYzzGFOKt8ZbC5M5nw2JeNg3uYHBlrG/6tslRGA+70MkgsyM2AN8OjVSQYgiKJVfs68xmAbi/Dv6i2QYYb8q1U1L1mG/YGjsV9E6aGKEfd5e0LdKiALQU+eYZWbEnlgZ45uoc4YQxVIsv2AZhtJIHM3CZm1ags5VtCFkiOuaRwsTLWWP6dskRME4zT8gEWRmxO5yDjMkghBFVSw/YWkm0xyrh9rG93Rr/N/laLM1UMn32RazB1vALKu2R5UhIQrM9d5dIsjMiN3A9+UbUkGIIiyWl9qJVPNwPAYamhhh/6pb49+Vo+fsM1TEaBVtLSlm2gPKjBAxYDi1EkFmRuwOn2egRBCiSIvlFqaQoq3Aj6Fb43eVoycszVgK3wzhGdKMtiZz5USImHCVHygRZGbEe+CHUicVhCjiUtmtiZGk+UuBHkC3xu9OllZaimOZV7AHeJkMFdZobykXQsSI/mrRLDMj3ptr0MVMIt58wgdIhIil8jZrpIKvFuC4+VZ+iTYt7V6W5jGH3xcg8OudTRleVw6EiB2X+tESQWZG7AIfzsVSQcScj7Des36ohIhYKm+2azmGBt4IGrYHN7Dea30fZeA9x+MqlnB64KDbGzBn7GXpL0Qs2Y9/lwgyM2JX3IA6ZYj404Na2r3e95cUEQ3Ni5ahkkbeDhp2AFmWu+6y2pWRmeb30cyYwGFbGG8pe1z6CxFjzvPJEkFmRuxs+jyRk6SCSAh9qGONf1KNKiMbmqcszUT+N3DYEeT8Xp8m/XcwEo/y21nArMBh72e6Vdty6R8xe+ZnMVo6iK4ctPlPiSAzI3YyBHOdVBCJ4kgaWek1riteo86Ny+xkZgQ/yzKbBd7sY6T/343DAzzLo5wSOOxqUjbbFkr/yPmrYjG/ob+UEF07dvrpEkFmRuyIs5kgEUTiGEqOhX68hIhsaBbYLKpZEThsFY94zgdJf/C+Xs86agl7nugp0oyxJukfOX+j/HaamSglRAD+w8skgsyMePcwXMY1UkEklCnc7XfqF/48GJoWJlDLnwPPQDWs9no/qKRH4N7+FR6jjn2Dhn2Bz1Fhjfa23v2I+Rviv2F58BU1UbpUkpYIMjPi3dQyRCKIBHMyj3jOyyVERDvzlv2YCjK8EjTsftTxmNf5fiVZCJd5LW18nbCX4W2hgSH2bXtTb33E/PXzelZyFtruKkLyVbXAkZkR/zgY9+ZKqSASP5LVsMpv8H6SIqKh2WINlNMYOOzB1LPOLyqtps1unmIVWQ4PGnYbP6TcMvaq3vaI+TvAr2EDdfSUFiIw/blUIsjMiL/ncxwmEUQR0JPLaPcrvbekiGhoXuLnBQh7FDey3M8omVL4BB7it1QED3yKfcqe1VseMXs9/FLW82/0kRaiIFzuh0gEmRnxzpDcjy9KBVE0HMC1PO51rt9Kk8kIbvOFPqfox91RnqOFSQUJ/qJes4jZ6+Y1rObb6lsmCsiBZCSCzIx4h69wgEQQRUU/6mn1Wtfolkymco83+7iiLYUHepZl6NrQpOaviofJoRN6otB8xgdIBJkZAfhALpEKoggZSJZFfoKESChVLPGcH1N0I24/r6eVWs28Cc3fFL+bZsZLCRED9uWrEkFmRgB8TUcXRdEyiRb/g6vwSOrcVMNq/1bxtHTQcfGE52+Y/46F6FYrER8+5kMlgsyMBuchnC8VRFFzEks852o9nkx68jk2eL0nfiusl3kt63RcPLH5O9KzrOBDasAsYkV3rpUIMjPiKrpLBFHkGDWs9qyrZ18y6UMd7Ulu6eDdvIY1ZHmfkpnI/PXxOtZQq9lSxJCP+FSJIDNT2kN0JWdLBVESlFHLeq/3AyVFIklwSwcdF0/0LNnDa2mnHl1QKOKJaW1GZqbUuYZ9JIIoGXpTxzr/jPeQFIkkgS0dfJrfq+PiiTUy+/jHWU+WQ6WFiDHVPlsiyMyU7kA9Uq1BRclxKP9Fm9e6bHwymUSLN/vERIywQz3HfFRmJHWGrGIJP0Wtb0X8+bokkJkpXa5V7kVJcjRZlrmsfFKpYnHcWzr4kZ5lJTU6Lp5QI7N9RW2slBCJ4Njiv2ZYZkbseLAezxlSQZQsI8n5g36shEgk77R0ODyWY+v+fhVtOi6e2LlxuFbUROLQ2ozMTIlyjX4zFCXOTO73nFdIiERSRi1tcWvp0Hlc/GvspwQl0sgc5VlWaEVNJG8287kyM6L0huwpnCIVRMlj1LDKf6CmzXniNV4PGq83dbT5Z+PR0sH38YtpJ0t/vQiJnBX7+jdpo1ZtcUQiuVpmRpQe10gCIQAo4xLW+7XJv5YxBrRSyY28HTRmf77DWv9ooZs2+xms4CccFTRoBzfxrF67PGSvl3+Zdr7AvtJCJJRjvVpmRpTWwD2Tk6SCEH+jN1eywetcpUxE7Gn7BCNpwoOGHcwtrChcSwef7vdxG8MDh21hon2MTXrrImavm19AG9/gIGkhEk2Jr83IzJQeumJJiHfTl3rWqWlzHgxNq6WYxj2Bw44g5/P9uOCl8AjPMZ9ZgcMu4nirtkf1tkXOXxWPchNHSAmReKb7iTIzopQG7+OlghA7YABZlqtpcx4MzUM2l2pCF9vTud+bfXSwsXSAZ1ke/L6utaSYbvfqLYucvxl+P82MlhKiSCjptRmZmVJD52WE2DkjyPm9Pk1CRDY0LUzkQp4IHLaKpd7oR3Z5IdzPbyjAcfGn+QSjrMlc71fE/I31/8s8jpMSooiY5u+XmRGlMYSfwnSpIMQumc2CkL/wF62d6bCbqSTNc0HDdueTrPN6P7jLRtFeXsd6LqNn0M/1Mhkq7UZ7W29WxPwd7VmW8AEpIYqOr8rMiFIYxK2UX3Uh9oAqHvWcD5IQEQ3NVmtkCBn+GjRsL+po9zrP+30vXua1rKeesPfbbKWRodZgr+uNipi/Q7yeVjVgFkXKdC/Z1UaZmVLiQ0yWCELs5thYwyqvd3U5impoNlkD5TTwZtCwB3e2dOiet0LYvIZVZDk86OfooImhlraNepMi5q+319FOnRowiyLmCpkZUexDeTeukgoi4XQEjbb9F/7L1bQ5sqF5wTKMDt60+SiyLPPT8zJ+VrGYHBWBhftvRlvKHtcbFDF7Zf5p2oOvqAkRmvf7RJkZUdyczSiJIBLO+dwQ+Bf+vvwn6/zjatoc2dC0WYqp3B047Aj+2+f5sZFK4Yn+J5oJXSQ8wAw701brzYloZMzPZjXf433SQpQAX5aZEcU8oO/Dv0kFkXhetM9TQWPge+YH8FNWeo2bEhDR0Cy2E6hmaeCwM3jAm33cXo2cAz3LQ4S+XXsNKZtlC/TGRJ75qljMrxkiJUSJ8CEfKTMjipcUwySCKIqC+ClLM547A4cdRo4HfKb0j5y/FiZzLo8FDlvFEv+5H71HhfBh/n3aqA08Tz7JxxhlTXpTIhuZid5cgBW1t6S8KOQAy5dkZkSxDurdSvdYmCjK8XqFncJ07g8cdiYPerOPlf4Rs9dhv2YYaZ4NPNtdSJtnfbe2G3kfr6OVT1EW9BlfIsNQu8k69JZEnPO2r6hVBQ67klTwUUmIf+QcHywzI4qTj+i8jCi6knihzaaa5YHDVrHUc6U4WeQ5e9s6mza/GjRsD2pZ7/W+/y4L4XcaMB8Q9Nm20EC5NdgbejsiGpl+nQ2YQ6+opRmrFTVRcMq4XGZGFOPQbnxFKoiiLIlbGE+KxwOPmjWs9awfKv0jZm9zZ9PmsOV7n85baHZ46aV38xrWkA18XPwtGqmwjL2ityLibNenswFz2CtNXyBDpTVqRU3Egov9CJkZUXycyRiJIIq0IO6wJkaQ4eWgYXtQS6tnvJcyEDF/L1qGkfwqcNPt/tSz/J9bOvjJPEKO8rD1N/+HkZa2P+ttiChkT7+MDcFX1F7jKgZbg72pDIiY0JPPysyIYhvgTedlRJEXxK93/sIf9ob0g7guv9cylmz+HrPzGEPoDTqV5HjIT/jbSDnF7+bO4D/8zGeW1dg6vQUR57luXsMqbqBf0LDbaKTSrrZNyoCIFZd4id2pJDNT/JzGRIkgir4gftkyVPLTwE2bjyTLiuCNe4sxf6ssxQksDhx2Ei3+Rx/vw/1WFnJ84OiP8gGbaQ8q+5GtTCFW1Dr4FcMsbc9KfxE7DuDjMjOimAZ546tSQZRIQfy0XcwYfh847DAulvZ5yd/dTCVF6FWKE3mYFZxJ2FuENvBRJtoflPU88K0CrKj9kUl2nj0m8UVMuay09gzIzBQ7H2SCRBAlVBCvtjOYiX7tTmb23JoYxSX8JfA8uE/QeBu5lGH2Sx0XzxNHBo63mBPs/faIhBcxZiAfkZkRxUNGEoiSK4nn23FU86iUSGT2ttmPGEKG4uzstZkGKuy7tlWZTiSPcyFT7W4JIWJPSTVolpkpanwOurFclGZJ3MJEUmgbSDKzt6UgTZu7mm00MsQy9qoynEg2kmGY3WwuKUQCmOhzZGZEcfBlSSBKtiDusCaGk+Z5aZHI/L1kGSpoDNzSoatwmhih4+KJZVPnlaZqwCySwxdkZkQxzJ7j1GVJlHhBvNUaKSfDa9Iikfl72tKMJvm3qrcw2VK2XhlNJFs7V9Q0iohk8UEfITMjks+VgfvzCBHHgniTNVDOd3lLWiQyf2ssxXTuT+wHeJgqq7YlymQi6aCJ4Za25ySFSN7gyWUyMyLh+DDOlApCANhGu5RR/A7tdk9m/hbabM5kTeIefD1nM8XuUgYTyp2Ms5QaMIvEcr6/T2ZGJJs6ZVeIvyuIW+0jTEV9iJKav/9mFCk2JOaBXyDDKPutjosnlIeYa6fYCgkhEsy+pGVmRILxAZwrFYR4V0G82E6gGt0QkczsdVgTw0izMfaPquPiyaaVFNPsHgkhEs+/eA+ZGZFcvkgPiSDEDkri7U2b26VEIrO3vaXD1bwe20d8pwHzX5WtRPIMaUZZk1bURFFwOB+WmREJxftxsVQQYicFsVsTI7gsAb/wix3l7zW7ikp+EsOmzR38gkodF08sL5OhwhpNzUJE8fCvMjMiqXyGXhJBiF0UxFvtOwwmg34/T2b+nrZPMpKmWLV0aGGSnW+PKzuJZCuNDLUGe11SiKJiuk+WmREJxPfjU1JBiPcsiDdbA0P5AdsKEPxg30cZiJi/VksxMyZNmxcxx6pNp7GSydv8lCGWNq3VimLkMzIzIolcQH+JIMRuFcTP2qcZwW+D/8J/PCv8DOkfOX8LbDanUNieU2v5MNPtPmUjKl7FhAKE/T1j7GJ7SvqLIuUsP1RmRiRtOuhWOtckCZGXgni9nc0Y7ggcdji3+SI/XvpHzt+djCNFYW4DeYY0o+1WHRePPHON8hzNDAwcdiFz7AxbLf1FEdOTWpkZkTROZ5hEEGIPC+KVdirVhL6nfQp3e7OPk/4Rs9dhTQwnTdiD95toYLiOi+fByAz0LMuoCRx2DSnTipooBS7xMpkZkSy+IAmE2KuSuIXJpFgfOGwVSzznx0j/iNnbao0MCdbSYSuNlFvGXpPyEY1MP6+nldrA1cjTpBltTdJflARH8CGZGZGkiWEaM6WCEHtZEG9v2vyZwL/wd6OG1f4tP0QZiJi/TdbAMH7UxS0d3uZnDLG0PS/FI85X+/vVbKCOnkHDvsTlVFijva0MiJKhyJsAyMwUG1+UBEJEKoi32fcpJ8OrQcP25HM87vW+vzIQMX9/sUuooJGOLgrQwkS7SMfFIxuZMq9lHV+lT9CwW2ig3K63N5QBUVIcW9zbmWVmimt6KOd0qSBE5IJ4szVQwXfZGjRsH+po9X8p9t3NAfL3hKWZxl15/8PzONaqbZkUjjhTdfPzaCXLYUHDvkUjFZaxV5QBUYJ8QmZGJIVL0d0VQuSnIN5ol1JBY+B75g/nh6zzC9yUgYj5W2xVVLM0b39wLSmOs3lSNrKVqWIxv2Bw4LAtTLC0/Vn6ixLlo95bZkYkYYrYnwulghB5LIiftDRjCX1MeBA3schPkP6R89fCpLy0dOg8Lq4GzJFnqcl+F83Bb5OZzyyrthXSX5QwB3KWzIxIAp/kAIkgRJ4L4lWWYiYPBg47mRZv9gnSP2L2trd0SPPsXv+Jl8hQqQbMeTAylZ5jEXMDh11NymbaA9JflDxpmRkR/4liHz4tFYTokpJ4PrOoYV3gsFUs9l+qaXPk7G2zRiq4ir1ZV/kPyq3BXpeKEeenIzzLKmoIu33ycc5XA2YhOpni42VmRNw5DRU9QnRVQez2fxhJmrB77rtxLms964cpAxHzt8muZm/WVq7WcfHIRqaP17GWWroHDfsiGYbbL6xDGRCik6Jdm5GZKR4ulQRCdGlB/JY1UkGGsOVtGbWs93rXJlKRPCPTw2tpp56wLcc300C5NagBsxD/wHnFOo/IzBTLlDGW2VJBiC43NFusgSHcwJtBw/amjjb/jPdQBkRiZqV9/GO0keXQoGG38UOGWMZeVQaEeBd9OEdmRsQZrcsIEcrQvGifL0DT5kP5L9q81tV+XSTBylSxhJ9xdNigNDHSPmXPSn8hdshFMjMivtNG/2J120LE1NA8ZWlGB2/afDRZlnmN9BexnpGm+r00MzZw2BYmW8rapL8QO2WKjy3GjyUzUxyk2VciCBHY0KyxFLNZEDjsSHLe4pOkv4ilkRnh/83C4Nuel3KiVdsS6S/Ee/AxmRkRz8mjO7VSQYiCGJr7bQZfDR72BB7y33qF9BexmosG+I0s5/TAYds5h0nWLP2F2A3OK8azlzIzxcBpDJAIQhSMdQWIaaRY5Vk/XPKLWBiZvl5PKxcR/kzXFfYbc2VAiN2iP6fKzIg4cokkEKIEeadp80GSQhTUyPTyOtqpYz9pIUTs+bjMjIjfNFLBCVJBiBKlF3W0e53r1JwozAzUzWtYRT2y1EIkg/d70e3mkZlJPp/GJIIQJUxf6lmnps2iAFamikfJMUhKCJEY9uF8mRkRr6mkFxdKBSFKngFkWeonSwgRbPaZ7QtoZrSUECJhfNyL7EdwmZmkc54W94UQAIzhTp/vsySE6HIjM8Jz3Ms0KSFEAhlSbN9dmZmkk5YEQoi/MZ37vNnHSAjRZUZmgGdZjq5uFSK5FNlGM5mZZE8q05koFYQQ/0AVj3jOB0kIkfc55xCvZx216HyWEEnmLO8pMyPigtZlhBA7GtlrWO3XqWmzyKOR6e1X8hh1qHOeEEmnL0V1wlJmJslTy4Fa6BdC7IT9yPCY17nu/hDRZ5syr6WNazlAWghRFHxUZkbEg/PpJRGEEDvl4M6mzd0lhdhrI2NewyqyHC4thCgaTvFDZGZEHLhYEggh3oOjyLLCa1z3UYm9sTJVLCZHhZQQoqjoUUx7e2RmkjvFTGGcVBBC7AbDyLHA50gIsUezzCjP0aw2M0IUJUXU0UxmJrl8UhIIkViWsTBwxKnc4//jIyW92C0jU+6/LkADZpfyQgRiupfLzIjCTjR9OEsqCJFY2m061awIHPVUlnvOj5H8YpfzSz+vZxVnE3Zr4lOkuUPqCxEI4xyZGVFYzmN/iSBEomeSFsaR4vHAY34Nazzrh0p/sUMj09vraKeOsLdQvESGSmvkLWVAiGCcKzMjCos2mQmRfDvTYU2MJMMrQcP2oJZ2r3f9ICL+0ciUeS3rqQ/cgHkLDZRbg72hDAgRlOE+SmZGFG7KGacjmUIUiaHZYg2U803ClnJ9qGOtmjaLv80q3fw8WslyWNCw2/gRQyxjrygDQhSAs2VmROH4uCQQoogMzUv2RSoIvcnmCLKsVNNmAV7Fw/yCwYHD3sEou8T+Iv2FKJSZKY7xX2YmidNOj+I5tCWE6DQ0T1ua0TQF7uc0lByLfK70L+EZZbLfRTPjA4edx3F2qq2T/kIUkPLi2OcjM5NETqG/RBCiCA3NWksxnfsCh53MXd7s46V/CRqZoZ5jEaHN7CpSdqw9KP2FKDhFsdFMZiaJXCgJhChaQ7PI5lDNssBhq1jiueK5dUDshpHp799hJTWBGzA/SZqx1iT9hYgFZ3kROAGZmeRNQIfyAakgRFEbmhYmchFPhQ1KDav9265131KYRw7yb/A4nyVsA4jn+VcqrNHeVgaEiAlHMVNmRoTno5RJBCGK3M68bT9jCGmeDxq2B5eywUO35hVhjUwPr6WVL9MraNjNNFBh37OtyoAQseIjMjMiPBdIAiFKwtBstUaGUs+WoGF7U8dtUr9oOZs2soS9NHUr/8Vgy9hfJb8QsePM5Hc0k5lJGD6BsVJBiJIxNK/YlxnEdwM3bd5Pyhctl3N02EmLJkbYZ22jpBcilgxgssyMCIsO/wtRaoZmo13KqOBNm4WITguTLGXtEkKIGPNhmRkREC/TDTNClKShabUU07lXSojE8BBzrdqWSgghZGZkZsT/50TdMCNEyRqaRXY81TwiJUTsWUeKaXaPhBAiAZR7wg8wyMwki/MkgRAlbWhamEgKbdsR8WUjlzHSmkzbIoVICglfm5GZSRDem1OlghAlbmfcmhhOmuekhYgdm2ig3L5jb0kKIWRmZGbEP3MmfSSCEMK2WSOVXMtmaSFiwxtczyDL2GuSQoiEMcKHycyIMHxUEgghOg3NX+2rDKKBN6WFKDgdNDHCLrcXJYUQieQMmRkRAD+UE6SCEOLvDM0LlmEojXRIC1FAWphgKdsgIYRILIk+xiAzkxzOobtEEEK8y9A8YWnGcoeUEAVhIXOs2pZJCCESzTQ/TGZGdD3qZCaE2LGhWWmnUs0SKSGCsoYUM+w+CSFE4unGyTIzoovxCiZLBSHETg1NC5M5R02bRSCe4iJGqwGzEEVDgjeaycwkhbMkgRBil3bG7TcMJ81fpIXoUl4iw1D7mb0tKYQoGk70XjIzomv5iCQQQrynodnetPlrhG+PO8w/7z2VgXB4Dwqh9xauo9wa7HVlQIiiohfHy8yIrpy0hjJWKgghdsvQbLJrGEwDbwQN24frWe+1vo8yEGBOMK9hFQMCh+3gFirsCntFGRCiCEnsRjOZmWSgTWZCiD0xNC92Nm0OuxHoKLKs8Brp38VWpoqHyTEkcNgWxtkF9mfpL0SRcpqbzIzoOrTJTAixp4bmSUsziT8EDjucnD/gM6R/FxmZyX4XzUwIHPZeplm1rZD+QhQxhwcfWWRmSmjyGspoqSCE2AtD86h9gJk8EDjssczzZtfm2HzPBYP8ZhYxN3DYVaTseFsk/YUoet4vMyO6irMlgRBirw3NfJtFNaF/Va9iqed8sPTPk5Hp7/W0cj5ht4E8SZqx1iT9hZCZkZkRUdAOdCFENEPTwjguJOx5h27UsNazfqj0j2hk+ngd7dTRI2jYF8kw1BrVgFmIkmG695WZEV0xjY1gpFQQQkS0Mx12MxV8hVeDhu1BLa2eSe79BQWfAXr659hAPfsHDbuJaxhsDfaGMiBECbEPJ8jMiK7gw5JACJEXQ7PFvsExNBD2jpCDuI51XuvdlYE9NDLdvIbVfIt+QcNuo5EK+5q9pgwIUXIkcqOZzEz8OUMSCNHJ6b6/RIhoaF6yDMO4KXDT5iPJssI/lNTGnwWxMh/kUXIcEzYov2a4pe1Z6S9EaZqZJI7SMjNxn84GMl4qCNHJJWzwOt9XQkQ0NE/axxhN6GPdw/gdi3yu9N+NkX+K38MdwftYtjDJzrV26S9EyXJEEvvnyszEnTPRL5lC/H8OoZ5W3TOfB0OzxlJM577AYSdzlze7fqLZlZEZ5jkWMidw2IepsmpbKv2FKHE+IDMj8s3pkkCId3E0WRb7SRIisqFZaHM4g9WBw1bxsN/ig6T/DozMUf5jVlAT+EesNs5iit0l/SPnbzZDpYJIOAk8NSMzE++B8RCOlQpC7IDx/MHnub4f0Q3N7xlNig2BZ56Pss6zfpj0/7vx/mCvZx2fIGyjhBfIMNpy5spAxPyN8Bz3cqSUEAlnhveWmRH55HTU/0eInQ65PODNPkpCRLQzHdbEMNJsDBq2jFrWe70foAyA9/BaWqljv6BhN9FAuTXYm8pAxPwN8CzLdSecKAp6MFNmRuSTMyWBELukikc860dIiIiGZqs1Us7VgZs296aOdq/zniVdCHfzGlrJ0j9o2K00MsQy9le9/RHz19frWUctOscnioXE3TUjMxPnIbIPVVJBiPegO7W0eb0fJCkiGprX7CoqaOStoGH7dbZ0KNHZyKt4hByDggbtoInhlrbn9NZHzF4vr6OdOtRhURQTias9ZWbizIkaIIXYLXpRx3r/fGn/wp8XQ/OMpRnDnYHDDiTLYq8uuVL4OJ9HM2MCh72TcZayx/S2R8xemf8L66lHP6OIYmOc90vWA8vMxJmTJYEQu80hXE+rX+ga1aIamjX8ewHCTuBP3uyTSqYUHuW3cz8zggc+106xFXrLI2bPvIZV/JDDpYUoQrpxvMyMyNNgmcRe30IUlIH8nJWuY7hJpYqHPOcVRT+6H+VZHuWUggRfp9cscv5m8gA5KqSEKFoSdmpGZia+TEKqNKOyAAAgAElEQVSHmoXYc4aT8wU+S0IkEqOGVZ71ov3F2/t6PW06Lp7Y/I30HA8mr9uTEDIzohBok5kQe8s07vPbfLiESCRl1NLm1xZf02bv5VfwmI6LJzZ/x/gv1YBZlARDfLDMjMgHp0gCISJwBis9l6wBWfyN3lzJBq/zoin7vbvX0sa/c6CSm8j8HeL1rOZcVU2iRDhLZkZEHzgPY6JUECLi+FbDWs96f0mRSPpSzzqv9SLYkOVVPEJWW4cTmr3enQ2Y1S1RlA4fl5kR0TkZkwhCRKYHtbT7Vb6fpEgkA8iyPNktHXyGP0Azo5TMRGavzGtZT71W1ESJUemTZWZEVD4oCYTIE/vzNdq81rtLikQygpzPT2ZLBx/pOeZxrJKYyOyZ17CaLIdJC1GCXCgzI6INoWXJu39ViFhzJFmW+5kSIqFM5z6/NVktHXyw/0LHxRM8D5/IEnIMkRKiRDnbe8jMiCjM4ACJIESeGc6tvsiPlxAJ5UxWes4HJaIQ3n5c/DzNsQk1MpO8hT8yXkqIEuYQTpSZEVGolgRCdAlTuNubfZyESCTdqKE17i0d/nZcXA2Yk2lkBvrNPJS0ezaE6AI+LDMjonCSJBCiy6hiief8GAmRSHpQS6vXxbOlg5d5LW06Lp5YI9PP62nlfDXgEQI4IykbzWRm4jicHsIEqSBEl458NazxrL9PUiSSg6mPX0uHvx0XP1wJSuTM20cNmIX4Bw5irsyM2FuqlBchupztv/B/xXtLirzwJh40XsxaOng1D+u4eGKNTE+/jA3U67SqEP9AQjaaqWiOIydKAiGCcCBfp83/xcskRWRWMIk/BY45nFvj0LTZJ3ozfwq+ov4nNuq1y0P2uvn5tHID/aSFEO/ijGRcaSAzIzMjRGlzOD9klde4dslHxJbaSVTxcOCw07nP7/DRBSuFh/hvWBy8mf7DVNlJvKq3LnL+TuYRbmaglBBiB/TjOJkZsTdD60iOkgpCBKWCHA+5+hdFNzR3MYUUbYHDfpBHPeflwUfrfl7PSs4KfFz8CdJMtbv0tkXO3xS/mzsZIyWE2MXoKjMj9gK1ZRaiEEyixf/gulkiqp1xa2Ikn+IvgeeyGlb5tzzYViE/wK/h8eDHxZ/lU1RYo3XoTYuYv2H+OxaiW6eE2DUny8yIvWGuJBCiQJzEEs+5DnFHNTTb7IcMIcMrQcP25HNs8Hrv8kPcXua1rOPfCNs8YhMNDLUf2ja9YRHzd6RnWcGH1IBZiPdkePg1b5mZ5A+y+yRjf6IQxVqHU8Nqz/phkiKikFusgXIaeCNo2D7U0e513mXrJW5ewxqyhG3rvY1GhljG/qo3K2L++ngda6ilu7QQYrf4gMyM2FPGcZBEEKKglFHLeq93XXwY1dC8ZBkqaeTtoGH7UU+r13oXzG9exRJyhP2lsoMmhlvantMbFTF7PbyWdurZX1oIsdskYKOZzEzc0A5eIeJA767+hb9kDM1TlmY0TYHDDiTLMj8lr6XwZL+bZkKfqmphkqWsXW9SxOx18xrWkuVQaSHEntWl3ktmRsjMCJFMDqGedV7r+0iKiIZmjaWYzv2Bw47idm/2iXkphYd6jkXBx+eHmGvV9ojeoMj5q2IpOQZLCSH2mH3jf5ZbZiZeA253jpUKQuyUz9IU+J75o8myzGskfWRDs9BmU83ywGGrWOw5r4g0Lh/pWVZSE/i4eCspptk9enMiz6vT/F6aGSslhNhLYt+eWWYmXkzgAIkgxE5ZZymmEbrAG0nO7/LJkj+yoWlhAp/g6bBBqWGVf8/37sD+Qf4N1gU/Lv4MtYyyJnO9MxGNzEj/PQuYLSWEiMD7ZWbEnqBNZkK8V236kM3lAzwaOOxcFnnOK6V/xOy9bTdSSR0vBw1bxqdZv1eGZBVfJux+8Vf4MpX2Y3tLb0tEIzPAf8oyTpMSQkRkkMd8i6bMTLyYIwmE2I2S+A9M5KNsCBuUGlb6D/1w6R9RyNftPyingdeDhu2zV9vEwnaXfINvUm71tkVvSUQj09f/k3V8nLDn3Z7hk8FPhgkRgpj/1C4zE6fhtxvTpYIQu1UQd9gvGUqaZ4OGLeNfWO/1rgbqUfP3smWooBGtP7xDB02MsC/aS5Ii4kzay+to53L2DRr2Na6mwn6iN1oUJXNkZsTuMhrdayHE7hfE26yRIWQIe5Fgr86mzfsqAxHz94ylGRW8pUM8aWGCpWyDhIhoZLp5DauoD7yitpVGyu0qe10ZEEXKCTIzYndRJzMh9rQg3tx5z/ybQcP2VdPmPOWvtSAtHeLFQuZYtS3T2xDZylTxKDkGBQ3aQRPDLG0bpb8oYo6I1hNSZqaUmCkJhNiLgvgFyzCURjqChh1AlhVq2pyH/D1kc6mmNG9TWUOKGXaf3oLIRma6308zowOHbWG8VtRESRDrUzMyM3FihiQQYi8L4icszWSaA4cdTs7vZ5L0j5y/FiZxAY+X1Id+ko8zWg2Y82BkxvidzOe4wGEfZKZV23LpL2RmZGbEO8PxUQyUCkJEKIiX2olU83DgsMdxubTPQ/Y67BaG8TleKImP+xKXM9R+bm8r85G5gkc4OXDMlZxmx9l8iS9Khjlu8X04mZn4oBMzQkQviVuYQoo2KZHI7L1p32Zw8JYOodlCA+V2vb2hjOeFsYErmadJM85ul/CipDiMYTIz4r3RiRkh8lEQuzUxkjR/kRaJzN+mgrR0CEUHt1BhGXtFmU4kL5Gh0hq1oiZKkLkyM+K90YkZIfJVEG+zRir4tyL/hb948/eCZRjFb4usabPzO0bYBfZnZTiRbOE6yq1BDZhFiTJHZka81yy3b/AuLEIUd0G82b7OMTSgzTzJzN96O5sx3FE0H2g+s+0j1qrMJpLtK2pXaEVNlDAx/sldZiYuTKBMIgiR54L4RctQSSPaFJLM/K20U6lmSeI/yGpSNtMeUEYTSgvjtKImSp4j/CiZGbFrpkgCIbqkIH7K0oyhSUokNH8tTE50S4cnSTPG9P4llfnMsmpbISGEYJrMjNg1kyWBEF1WEK+2FDPQL+PJzF5yWzq8SIahOi6eWLSiJsTfM1VmRsjMCFHIkniBzaIaXXGXzOxtb+mQ4dXEPPJmGii3BjVgTihPaUVNiHehlRmxK/wghkgFIbq8JG5hPKkSu2e+eLK3ubNpc/ztwTYaqbCMvaqsJZIX1YBZiB0wyWN6ultmJh5MwSSCEAEK4g5rYiiX8bK0SGT+4t/SwWlipKVN9xwlE62oCbEz9mWMzIzYOdpkJkS4gnirfYdyGtB9EcnMX5xbOrQw2VLWpiwlEq2oCbFrYrrRTGYmHkyUBEIELYhftgxD+amaNic0f6stxRwWxuqhlnCiVdsSZSeROL9lhFbUhNglMW0BIDMTD8ZLAiGCF8RP2cWM4fcFCd5T+kfO333M4MOsjcXDrOccJluzspJQWphsZ9t6CSHELtHKjNgZfhADpYIQBSmIV9sZzOTB4IE/6M0+SfpHzJ7brYymlmcK+hjP8RlG2G/MlZGIc2EFQwsQdqlW1ITYTYb4ITIzYseM1/F/IQpYEs+346hmWeCwVTzkOa+Q/hGz95b9mGMK1tJhMw1U2vdtmzIR0cj093pWMCJw2CdIa0VNiN0fcOO50UxmJg6MkwRCFHiEbmECKR4LPC3UsMqzfrj0jyhkYVo6bKORcsvYX5WBiEamj9fRTl3gzZcvdF5p2qEMCLHbyMyInTBGEghR8IK4w5oYyeW8GDRsGbW0+bV+gDIQMX8vW4bKYC0dOvgFQy1tz0n5iEamp3+ODdSzf9Cwr/E1BluDvakMCLFHTJGZETtGx/+FiEdB/IZdzyAyvBY0bG+u5DGv832VgYj5e9ouZhRNdPXplRYm2fm2QYpHNDLdvIbVfIt+QcNuo5FKu8Y2KQNC7DETZGbEjobzHgyXCkLEpiDe1HnP/NagYQ+hnnVe6/soAxHzt9ZSTOfeLguwmBOs2h6R0pHnviqWkOOYsEFpYril7VnpL8RecagfJjMj/pmR9JAIQsSqIN5oGUYH+IX/HxlAluVeI/0j52+RHU81j+b9D7eSYqrdLYUje4opfjfNwc+LtjDJUtYu/YWIQAzPecvMFJ5RkkCIGBbE6yzFNO4JHHYEOb/Xp0r/yPlrYSIf44m8/cE/k2aUNakBc2QjM9xvZRHHBw77EHOt2pZKfyFkZkRXFC9CiHgWxA/ZXKoJXQDNZqE3+2jpHzF7HXYTlaSJfkh/Ew0Ms0Z7S6pGNDJHepblnBk47DpSTLN7pL8QMjNCZkaI0iuJW5hEitBbU6p41HM+SPpHzN5Wa2QIGfa+ffLWzgbMr0nNiEbmYK+njVq6Bw27kQyjtaImRN6IYdMqmRmZGSHErgtityZGcCkbA4/ONazy6/wgZSBi/jZZA8P40V6dgLqJCkvb81IxopHZz79EO3XsFzTsq3yFwdZgW/8fe3cen0dZ7n/8e3WlG9DSstOFdKEtpRS6QNlpoqK4QnJEAUGPiQsCipIIyqZAgrKD/p64gh6PPIGDCoLHhBZKV7rQ0r1pKKvIjnQBWtrr9wfFw07zJLnvmWc+7z95kd4z1z2Zub+ZmWuYAaDdDPXehBm8/RS/g4ZQBSDxC+JNdp2GtOkv/IXoqRq1eLX3YAbaOH9P2ddVyENi37DHqF4br3JvNGCuU9+gw25SvYbbZbaBGQDaOTmMJszg7fYTrViBdCyIN2xr2hz2Q3v9tjVt7sIMIIVRplQPKq/BQQfduq0BM3fUgI6QuMZVhJnYeMgMSFOgec5qNEL12hp02L2V0xIvd2MGkKIgc4jfp0YdEHjYJh1sFfYw9Qc6CHdm8A58MBNIW6B51Ko0Vg2Bh91Pec32o6g/UhFkRnpes3Vk4GHn6hgrs0XUHyDMgDAD4IMCzVKrUJkWBB52ku71P/to6o9EB5lB/lstVejPv67QZ+0Qu5f6Ax2Mx8zwDsMpAZDSQNOkCapQc+BhP6WHPO80DkEyg0w/r9VKfSnw6uJJVekA+xP1BwLY0/sRZvB/p31TCVUAUhtn3Bo0WlcFP2+Xa7n/JGmXE2T+itbLz9PDqtYOQYd9UdUaxidNgYAS9nwAYSZyulVPigCkOtBs1gMRht1B31WL1zhnECQjyHT1r6lZl2qn4EN/3a6wV5gBgDCDOIZSAgAF2lmXq9m/StNmRA4y5uVaqp9rjzjDMwMAYQaEGQDptKfqtZSmzYgYZQ7TdOV5/xPIkGGEGRBmALSfEcprrh9DIRA8yIz2vGbocCoBZOyqQ5gBYQZAu5qgqd7o4ygEggWZgZ7T4uANmAHEN9B7EGZAmAHQ3kq1wPNOh0R0fJDZxWu1WpXqTC2ADOqUrF68hJm4+FYEgPZjKtcyv9r7Uwp0WJDp7RdqrarVnVoAmZWoB80IMzEvCTtHaGIJoLh119la67W+I6VAu1+1unqlmnWR+lALINMS1fKDMBPTPpQAQAforWq1eLXzt3O0X5AxL9dy5bQ7tQAIM4QZvGEgJQDQQfqrVqu80jnLoz2iTKnmK897ngAIM3gr7swA6EiDlNNcL6UQaFOQmeD3qFEHUQkAhBm8HXdmAHS08Wr0Rj+YQqCgIDPYb9ZcHUslALxF/yS9l0mYiYk7MwBCKNU8z/swCoFWBZkBXquVOkVGLQC8w2DCDAgzQJY165Gg473RtPkG343SY7uCzE7+YxowA3hf+xJmIEl7UwIgo5ZohM7Ws0HH7Kpvao1f7LTVxQcHme7+ba3R+eoVdNiX9UP9neoDhBnCTJrsQQmArLJNdq2GqEYvBx22ty7QWq/2HZgBvGeQ6eTlWq6rFPbDq5tUr+H2Y21gBoCUSNBn3wkz8S4ZO6onVQAyHWg2WJ1KVKfXgg67y7amzZ2ZAbzjulSqBcoH/ovrVjVopFXZ09QfIMwQZtKFZ9cByJ6zGo1QvbYGHXagclrs5dQf/w4yE32aGnVg4GGbdLBV2MPUH0gZHjODxFeUAWwLNI9alcbqzsDDjlbeZ/rh1B++n+c1R0cHHvYBHWtltoj6Ayk0xBPT55AwE8+ulADAvwPNUvukPqIFgYedrOne4MOpf4aDzN7+Sy1VeeAGzCv1OR1i06g/kFI7aE/CDHj9H8DbA02jJqhCzWEH1Yla5jnfk/pnMMj09Vqt1lcU9v2pJ1WlMXa7OTMApNhQwgx4ZwbAO5OFW4NGq0pPBR22iyrV7LW+MzOQoSDTzSu1StXqEXTYdbpYw6zeXmcGgJQbQZgBj5kBeK9As9nqNVwXal3QYXuqWmv8OzRtzkSQ6exfUYtyGhB02Ff0Ew22i+wVZgAgzBBmisEulADA+wSa9XaJhqhOrwY+K12pZq8UTZuLO8qUaqF+GfizzVvVoNF2rr1A/YEikZi3LQkz8fBAB4APCjTPW41G6b8CN23eWzndSvWL1uE+S406IPCof9YYq7C1lB8oItyZgfpSAgAfEmjW2skao4bAw/JGX/G6RocGHnGOjrLP2HJKDxSZId6NMEOYAYAPDzTLrUKH6X4qgdRZoQo71KZTCKAIddEQwkzW8ZgZgO0NNLPsSJVpCZVAajyhKo2xBgoBFK2EPGhGmInETTtSBQCtCDRNOlBf0j+oBBLvBdVomNXbFkoBEGYIM8VqR/oFAWhlnNlqN2uYavQStUBibVSdSqzOXqUUQJFLSD8zwkwsPGQGoJBAs9HqNFRXiaUikud15TTMaoy4DWQBd2Yyrg8lAFBgoHneztEw1YuHeJAkTRpnXzMehASygjszGdeDEgBoQ6B5wqoiNG0G3tssHWFltpRCABmymyfiOSPCTCw9KQGANgaaFVahQ0XjW8S1TBV2mM2gEEDmJOLeDGGGMAMgzYFmjh2lMj1EJRDFY6rSWBowAxmViLdmCDOx8JgZgPYKNE0apwqtpRII6nnVaAQNmIEM485MpnFnBkD7xZmt1qD9VKVnqQWC2EADZgDcmSHMAED7BZpNVq8SXaxXqAU61GbVa6jV2L8oBUCYIcxk1w6UAEC7B5p1dpGG65cRmjbv6ye6MQPhuKlLjGH1R420KvsnMwBAwzwBSYIwE0tXSgCgQwLNE/ZVjdHtgYftpwbN8WOof6BMcYzmaHDwYRs13k6yFuoPQJLUQ3sTZrKrMyUA0GGBZoV9TpM0LfCwEzXVG/0g6t/BQWa05zVVEwMPO1+l9hFbSP0BvMUgwkx2UXkAHRtoHrBjVaZFgYct1XzP+1Dq30FBZqDntFjlgYd9VFWaZPdQfwCEGVB5AOECTZMOVoUeDjuoyrXcc7479W/nILOL12qVKgPf2X9uWwPmrcwAgHcZzJI6w2sMSgC0Gt9nav2pZqs1aJS+o+eDDttVlVrtF3pvZqCdgkxvv0BrVR24eczL+qEGW529xgwAeE/cmckw3pkBWu8Wz/mulKHVgeY1u1qDVaN1QYfto4u01qu9OzPQxiDT1Su1WherT9BhN6tew+3HtoEZAECYAZUH2kM3VarFa70PpWh1oFlvdSpRncL+jb2/arXaK50/3xQaZMzLtUw57RF02K1q0EirsqeZAQCEGbzPyoISAAXprWqt9ErvQilafdp51mp0gBrkQYcdqJwe8I9Q/wKiTJnmKa9hgYe9S+OsggbMBcxXJ/WiCshamIn/hTHCTCxbKAFQsD2V01Iv5yONBQSa1VahSQrdl+og/a/P8MOpfysWxvv7Hfq7Dg487AM61j5hD1H/AmasVPM1iTogY7orerMXwkwsmygB0CYjlNdcP5ZCFBBo5lmpyhT6iyGHabrnfRj1345l8SDPabGODzzsKlXoEJtG/QuYsYk+VY0aRyWQQdEfNCPMxLKZEqBIdI0Y6CfoHr/LxzIJBQSaJk3QFyM0bV7mP/M9qP8HLIt38xvUrMrA1+cnVan9rcGcGWj1jO3nt2mOjqESyKjBhBnCDJBuOxf4c+3VI+k4Peh5L2EiWp0sttoftJ+q9M/A4ffrWuO1vjMz8B7L4l5erdX6ZsF/IijMOtVppP3CXmcGWj1je3lOS/Q53oNFhnFnhjADZDTMPNN+q3KVa7lf4wOYjFaXbrPVa7gu1vqgw/ZUtZr92zRtftuyuJufqbWq1Y5Bh31VP9Vgq7F1zECrZ2xnv1yrVSmakYAwQ5ghzAAZDDPt+4BTN52ltV7rOzIhrQ406+wiDYnQtPkqNdO0eduy2Lxcy3WtwgbyrWrQKPuevcAMFBA9K7VKNepJLUCYIcwQZoB061vgzy1r9y3ppWqt9m94Vyal1YHmOavRaP134KbN+yinB/0TmV8Yf0wLlVfoRyX/rDFWYWs5+ls9X539dK1RTu31Ad9CH+/jDwFIhsGEmax6lRKgSBT6t+TZHRLpd9ONWu7/QdPmAgJNi31B4/X3wMOO0Z1+nx+a2YXxRJ+qu3Vg4GFn6HD7jC3nqC9gxj6lxfq19mnHf7Kg9we9C4+3ISG4M5NZPJ+MYjGksAeFbIMe6KAtGqo/ap6XMjUFzMpC+6hKNT/wsEdqlv+Pj8zcsni4N0TogrVMn7IjbCZHewEzdpjP0J81OhHrgR2YDyREL+9PmCHMAGnWTQML/Mk/dOBWHaxGb/SDmZ4CAs09OjPCsJ/VQ/4L3yszy+I9/P9pmU4M3gXrXI21OzjKC5ix0f5nzdBhHfBPF/b+YA/mBIkR+d4MYYYwA7TV/gX+3H938OOWpZrnf/ShTFBKdNF/qtlrvW+x76jv5JdqjaqiPCY01bZwqLV6xvbxX2uxPtUh//hz9nxBP9efeUFiDCbMEGaAdCvw/oe9qPoO3jLTf2i55/hIY2r0ULVavNqL9q/O3s0rtVrn0QUrNTPWz2u1Sqd32Ov2Uwv8uT2ZGyQGd2Yy6mVKgKIxvuCfvDTA9026qlKr/RKaNqdGX9VqtX+l+Jo2eyf/kprbsQsWOnrGenqNWlTdoY903Vngz+3G/CAxIj8gTJiJhTszKB6TC1122jP6YZAt7K0fao2f5d2YrJTYW7/UQ/6ZoloYH6/F+m3Bb5gh9Hx18a9qtS4v+Eta2+c53V7gT3IkITl2J8xkkr2qTVQBRaJvGxrLXqu/BdrKAbpGq/xk56yXFqN0u8/yI4piYXyoT9cdBb9dhtDzZf45LVF9gL83X2WF3p0eyTyBMEOYie15SoCicWzBsd71Ja0Jtp2D9Tst9OOYsNQ4VNP9Dk91CPCRfrtm6QgmMzUzdpRm6TbtF2CoNbq+DWEfIMwQZiJ7hhKgaHyy8B+1ZzRFjwbc1rG6y6f5JCYtNY7XYv+tD0rjpvve/kst0WeYxNTM2AH+V92rQ4IM9po+X+h9Ge/MnRkQZggz8T1LCVA0JnsbXmm2xzRFq4Ju79Ga7bf6CCYuJTrpS1rlV/ouqVoW9/U6rdZX1JkJTMmMDfKb9aA+Hmo4nWELCv7pA9SLGUNi9I37RiphJh7uzKB4dNan2/Lj1qKJBb8GW+CQOkFLPee0N02L7vqOWvw8T8USznv4uWrRuXzYMDVBpr9frVU6JdiqyPVN+2Ubfv4w5gwJYnG76xFm4uHODIrJqW08E76sE3RG4N+KLqpUs1/uOzN9KbGTLlWzf827JnpZ3Nm/rNWqU18mLCVBppf/QC06W92DDfm6vmY/b9O/cDjzhkSJ+qAZYSYe7sygmBze1oe2zO1GDVFN4G8w9VRNcX+ksejsoZ9rtZ/qltCFcakW6lfam4lKSZDp6pVq1o8U8jtUz+o4q2/bVusjzB0IM4SZ+Lgzg+JyWtv/CdtgdRqun2lz0C3vp1qt8tOddxvSYrBu0lw/Nmmb5Yf7TDXqACYoJUHGvELLlNMeQYedrrHW1MZ/40ju+4EwQ5hJgn9QAhSVSu/ZHv+MPW3f1CjdIg+69fvo11rsn2IaC7Y18HgTdI//zcclZmG8v/9F92syB0JqoswUPaBbNCzooOt0po61p9r879AfD4QZwkwiPEYJUFT66Uvt9U/ZGvu8Jqgp8B6M1p99hvNibWEW6uNaHHjMj2q+/5fvG31ZPNB/o0VtaVBekGV6icOuwBkb5/+rJo0PPOyfNMquty1t3vpuqmAOkTA0AMioRykBisy3vUv7/WO2wMpUpgWB9+EwzfA/+2gms4AZu1sH6RQ9Evga9gWt8Ova0hq8jQvLXfynWqXTAjdgflxf1lg9x1FXwIzt63/Q/ODvnCzTJ+2z9kS7/Fuf0q7MIxKGOzMZvfC/rBepAorKMJ3Szr8lTZqgz2tN4P34lBb7r30fJrTV87XVfq8ROjvwIrubvqU1fqH3Dr4s7unf1xqdox2CDvuCvqfh9pu2/4U/g0FmV79eK3RS4LXP4/qyxtqd7fbvfZWZBGGGMJMUj1MCFJkL2/vDWeZ2i0apSk8F3Y/OOl1rPOf8/bP1M7bJro3Qla6PLtIjXu3Bmut6Jz9VzbpMYRt7b1SdSuyn9ipHWqtnrJdXq1lnKOzH/V5QjUa0Z/T0USplNkGYIcwkxSOUAEVmkL7eAcvjzVav4bog8PK4myq1ymvap61BxgLNeqvTiOBd6XZRrZb7F7zDr2tufoKW6yaF/eTq6/qFhluN8aZM62esm39LD6s2aANmaaMuV4nV2Svt+q/+gJUbCDOEmeSgBQCKz8XeIa8B2nr7kYbqWm0Kujc763I1+1fb812gzASaf0bpSrev/kvz/aMdujA+WrN1q0YE3S/X7RpjlfYkR1arS9fJv6AVui7weyavq17D7Lz2jp4+nJf/kUi9wj/oS5hJhocpAYrOTrq8w5bHz9rZGqHfB24CvKfqtcRPSOpHGhMdaNbY5zUxeFe6cfqb3+MTOmRhPNbv0jRNCrxH0zXZPmcrOaIKmLGPaL7+S2E73rlu0/5WZR3xAYbLxPewkEwR780QZmJaTQlQhE7ryL+L2yN2isaoIfA+7adbk/iRxlQEmvlRutIdqwf8Dh/erivUfTynBTou8J4sV4UdZXM4kgqYsfHepP9V6G8RzdJRdqKt6pA9OlonMK8gzB3mKSkAACAASURBVBBmkmQFJUAxrl5V7zt16ADLrULHaG7g/Zqge/wuH8sEFzBjTZqgk9QSeNjjtdR/7u3ydXfv79dojSoD/1X8UX1JY6yBI6iAGRvmt+gBTQk87GJ93A6z+zton7roamYWiRWxYQ5hJqZHRUcaFKOBuqbDl8f36lCdoNAP3hynhf47H8wUt3q+3P6okTpDTwcdtqu+pmb/cdvCtffyH6pFZwXugvWcvqMRdrNt5ehp9Yzt7j/TMlUo7KOhj+gUHWR3d+AI5+pAZheJ1Zcwk83L+5bg388AwjjNTw+wPP4fjVZF8I80nqzVnvPdmORWz9hmu1ElqtG/gg7bS+frYa/2wr4F09Ur1axLgnfBqtMwu9pe46hpdZDp7dVapa+ra9Bhn1eNRtrvOzJ6+lhdyPyCMEOYSR5e6ESxutED/A3RtlqDRuv7Ctustqsqtdp/GLN3S2oDzQar0zBdF7grXT/VamVBj4gtUk57BN3Wzfp/GkoD5oKW+939bK0N3oB5vX6kfa2uY7/94z10c+B7g0Dr7BxvaMIMYQboCD10mw8IsjzeaLUq0U8DP7S5oy5Rs3/DuzLVrZ6xZ+0s7af/CtyVblBB17vBYVfjatD+9nV7iqOk1aXr5Kdola5W/8DR82caahdYx38DK6cDmGUkGndmMmsZJUDR2ld3hPrgpL1g39Nw/UZbgu7h7rpRy/0/RNPm1s/YWjtZB+tvVOItpmqSVRhdLguJMh/Xg7pZgwJHz1s0yr5pAd4D82/oFGYZCcedmcxaSAlQxCbplnCfm7TH7csaq78E3seh+qNuYKoLmrFFdpyO1QNUQtKD+phNsXkUogDj/V79Nfh9iyZNsM9bkPde/aMd31IFIMygUGv0MkVAETteN4eLM5Its0/rcM0MvJe7MNEFz9g0HaLyjH9z62F9UePtfzkaCvQ9HRV4xAX6iJVZoG8n+UTdKh5nRfLxmFlmL+RbtYgqoKidpD+Efa/EZtrh+jSPcKbmLOh2q0bra8rmeyLP6EyNtD/QgDk11ujzmmCNoYbzUbpTtBpBGnBnJsN40AzFrlx57xF4gfwXjdXpeozipyTQvG45DdX5gZs2x7ZeF2uoXW+bOAJS4ml9U6PsFvNgUWZ/TdMACo9U4M4MYQYoYp/R1NDfZbEt9luN0Hf1POVPSaDZaJepRFcpG99W2awbNNQusnXMfEq8rAs01H5mm8MN6QdqWsyvqgOtwp0ZwgxQ1A7RHN8/+PL4VbtSQ3W5NjIBKQk0z9s5Gq6bVNwPXbn+WyPtWyG6YKFdbNK1Gmo/svVBD5My3Ru40TTQFjsU+GliwkwRWCE+jYYsGKwH/KwIy+OX7DwN1nV6nSlISaB5zE7T/moo2h1s0gT7grUw06mJng0aZWfbs4GH/bL+qp0oP1Il2oNmhJnYF+6tmk0VkAk9dI3f5BFeZbVn7Sztr9vkTEJKzosrrEJHFuG5cb7KwnXBQju4W+OsInT09K5+tX5FBzOkTrQHzQgz8c2gBMiMU7XIKzzCRyZtlZ2oQ3UvU5CaQHO/TdZntaJodmiNPq+J1sTMpsZcHWMft8Whh/W9da/OpvwgzBBm0uR+SoAMKdEtesCnRFkez7Vj9HEtZhJSE2j+pDH6Tz2R+h35Z+guWGijVTpRh9q94Qf2T2ihJjMBSCUeM8uwB/QqRUCmjFeTN/pBUZbHd2ucKsQbC2mJM1vsVypRlZ5N7S6sV51GhO2ChTb5h6q0v90WPnr6jp7THbRiRmpxZybDF+vXNJ8qIHNKNc//4CURfuPcGjRKZ6V4eZy1c+Qmq9cIXaFXUrfpm3SthliNvcwspsRLOk/DrN4iNAzxUi1WpYxJQGpxZybTplMCZFAnnaTlfr1H+I6CbbLrVKJLtJ5pSEmgedGqNVy/0pbUbPJW/V4j7Gx7jtlLiVd1pUrscovQyt338D+oUYOZBKQad2Yy7e+UABnVTWeoxS/yPhGWx+vsQg3VjeLxn7QEmifsPzVGf0rFxt6tg+wUe4RZS4kt+o2G23fthQhBppufpZU6iUkAYYYwk2azxEMIyK7eulBr/FveLcLy+Gk7QyP1xwhNmyf68Ux9ATO2wj6ryQlvmxKpC1ZR6B5l1L9orH3ZHo8QZDr5SVqua7QjU48i0Iswk+XL82bdQxWQabvqOjV7pXeO8PvXYifpgOAfadxbd/hsP5KpL2DGZtuRKtOiRG7cKlXE6YKVfr6/5/Xx4MPO0dH2aVsWZY9LNU9/UAlzjyKxA2Em2/6XEiDzBiqnxV4eZXm81Cp0uGYGHvYQ3eeNfgBTX8CMNelgVejhRG3Uszpb+1sDDZgLWNYP8pwWK/Rv/0pVaLLdF2WPx3uTGnUQc48i0oMwk213UQJA0mjlfaYfHmV5PFNHqELNgYct1YOe9yFMfavna6s1aKSq9HQiNme96lRi18bogpX6INPfa7VKlYHXI0+oSmPiRE8f7DfrAU1h7kGYIcwU02X58SL6zjXQNpM13fM+PMLvoVuDRusb+mfgs3C5lvkV3pepb/WMvdG0+TJtjLoZr+pKDbYaW8eMtHpZ38cv1lpVB35X5gV9L1oD5t39Z1qtU2jBDMIMYab4cG8G+PcaVeVa5jnfM8LQm+3nKlGN/hX4EvA9PeoXeQ8mv9Uz9i87X4NVp01Rht+qBo2279rzzESrl/VdvVKrdYF6Bx12o+pUYj+1CB+r9t5erVX6uroy+yDMEGaK0V8pAfAWXVSpZq/1CK0ebaPVqUR1Crvc6aML1eyV3oXJb/WMPWs1GqOG4F3pmnSQVdjDzECrl/Xm5VqhnHaPED1r7KUIe9zNK7VGtfQtQxGjAUDm3a+XKALwNj1VrRav9ggnSHveajRc9YE/0riXclrq5c4jKK2fsdVWoUmaGmzAuTrGymjAXNDCvlTzlQ/exatJB1pFjG//eKdt0W035h5FjTszmb8Qv86nM4H30E+1Wh2pafPjVhWhafMI5TXHj2HqC5ixeTZFZVrY4QOtpAFzwQv7CX5PhC5es3WkldmSSNFtgfLal7kHYYYwU/x40Ax4b/sopyWRmjYvt4oIH2mcqKne6OOY+gJmrEnjVaE1HTbAk/G6YKU+yAz3vObq2MDDLleFTbYoH1r1iT5VjTqQuQdhhjCTDXcFfqAFSJORysf6yOS2jzQ+FHjYUs33vPNBvdbPl1uDRqmqA7rSvaiaWF2wUh9kBnitlqg8cBevx1WlA6whyh6P8LzmiHusIMwQZjJ0AX5OD1AF4ANE/MikNWmcKvRI4PNzuVZ4znnSvvXztdnqNVQ1ernd/slNuk4lVmevUN1WL+t7e7VaVK1uQYd9XjUabvUW4c+EvpfntDR4dAMIM4iOB82AD/PGRyYHR1geb7UGjdDZejHosF1VqTVe6/RAav2MbdjWle61Nv9TW9WgEXaWvUhVW72s7+aValGt+gQddoPqVGJ1URow9/GL1KxK0ZcQWdM9VvMawgxhBkiXTirXKs/5gAjL4012rUpUp7B/ne+9ratbdya/1TP2nNVohOq1tQ3/SJPGxemClfog82YXr12DDrtZ9RpmNfavCHv8RnS7UHwxCpk84cZqzkyYSdJRsEiPUQVgO3RTpVZ5dYyPTNqL25o2h31vor9qtcornXN262fsUavS2AK70s3RUVZmD1HFAhb2Mbp4uRo02qrsqUjRbaVyGsDcI7MixXgujMlyNyUAtlNf1cb6yKQ9YVURPtI4SDkt9uOZ+gJmbKlVaHMBPzjFplO9Ahb2k3xahC5eTZpgFdYcKbo9qLyGMPcgzBBmso4HzYDW2OuNps0xntO1lVahQ3Vv4GH31x3e6Acz9UhskNnP85qtowMPu1QVVmYLouzxIX6fGnUAc4/M4zEzSGrSRooAtMp+ymuOHx1jaJtrx6hMiwIPW6p5nvdhTD0SF2T28lyEBsyPqkpjIzVgHul5zdaRzD0g7sxAkuyV4H/nBYrBRE3zO3z/KL+1TRqv0wO/72Yq1zK/gabNSFCQ6et1Ebp4Pa0zNMzqbWuEPR7ov9ESlTP3wDY9CTOQpLsoAVCQ47XY875v+IFti/1Ww1SlZ4IO21XfVIvX+k5MPaIHmW5eqVU6N/DfZTeoTsPtRtscYY/7ea1W6TR1ZvaBf4v0+0CYSZo7KAFQ8Pks2kcmbZPVq0Q1Whd02F7bmjbvwOQjWpDp5OVaFbyL12bVq8Rq7OUIe9xz20dA+b0DEpEqCDMJY49pKVUACtZt20cm+0T47V2/7SONm4IOu8u2ps38hRgxoswbXbwGhx1UDRppVfZ0hP3t4pVqVq12Zu6Bd18GCTN4Ax3NgLbprWqt8irvGuFM/qzV6ADdGrhp80DltMCPY+oRdGF/hM+M0MXrbo2zCmuJsL/mJ2qpctqTuQeSlCoIM8lzDyUA2mwP/T+t9lOjNG1eZeWapKmBhx2ru3ymH8HUI8jCfqTnNV2TAw87T1Ps47Y4yh5P1nQ1aARzD7z/5Y8wgzfM1GsUAWgHg3WT5vqUKGf0eTZFZVoYeNjJmu6NPoapR4cu6/fe1oA5rFWq0CSbGmWPR3teM3U4cw8QZrA9R8JGzaEKQDuZoCZv9IOi/C43abwqtCbwsKVa5Dc7D8KgY5b1/bxWzaoM3LXoWZ2t/a3BPMIeD/ScFtOAGUhuqiDMJNFUSgC06/J+vud9aIQ449agUarSPwOf109Rs9c6ryijfZf1cbp4rVedSuxaez3CHu/itVoVPLoBacWdGfwbb80A7X2CLddyz/nuEYbebPUaqhqFbSHbc1vT5h5MPtplWR+ni9embQ2Y10XY4140YAbSkSoIM0k0V+soAtDOum5r2rxjhECzYVvT5rDvw/VTrVbTtBntsLAv1YPBu3htVYP2syp7JsL+dvVKrVGt+CQt0KqLHWEGbx4Lr2sGVQA6wJsfmewe4ff6OavRcNVrS9Bh91ZOS7zcjclHgQv7yX6/GrV/4GGbdJBV2NoI+2teruXKaXfmHiDMoHDTKAHQQfqrVsv8pChNmx+zKk3U3wMPO1J53e+HMfVo9cJ+rN8doYvXLB1hZZEaMJdpvvIaytwD6UkVhJlkop8Z0JFK9Act8Sj9iWyhfVSHa2bgYQ/TDG/0sUw9tntZP9BzWqCPBR52pSp0uEV5OsHHe5P+roOYe6DQCxxhBv9ngV6nCECHGq28z/AoX46wmTpCFWoOPGypFnrehzD1+NBlfZwuXk+oSmMiNWAe5DnN1RTmHkhfqiDMJDPabtQSqgB0uMM03fM+LMLvuFuDRqtKTwU+45drped8V6Ye77usj9PF6wXVaLjVR2nA3H9bdGNFBLTx0kaYwVvNpQRAkFNvuZZ5zveIMPSbTZtfCjpsN1WqxWu9D5OPdy3ru25rwBy2i9dG1anE6uyVCHvce1t0687sA2lNFYQZwgyQdW82bY7wkUnbuK1p86tBh+2tarX4Wd6Fyce/l/Xm5VqmnMIG+61q0GirsZci7PGbDZh3ZPaB9rmkEWZAmAFiefMjkxE+kGcvRGnaPEDXaClNm7FtYV+qecor9COXTTrQKuyRCPvbycu1QjntxtwDhBl0jFWBvxcOoJ9qtdJP8QjnRXvcqjROfw087AjlNduPZuozHmQO9kY16uDAw96nQ63Morwf6h/Xg8qrhLkHiiFVEGaSGm63aiVVAIIbpJujNW1eYsdrsqYHHnaSpnmjj2PqMxpkBnlOD6g08LDLVWFHW5SPEPhEn6q/6gDmHmh3kTrxEmaSizADxDFKeZ/lR0YJNLPtKJXpocDDlmqB552/U2ctyMTp4vW4qnSANUTZ4xGe1xwdw9wDHWITYQZvt4oSANEcqvu80aP89daaNE4VeiTsoCrXCs/57kx9RoJMryhdvJ7f1oB5S4Q93stzWqpy8ZYYQJhBINyZAeIq1YOe98ER4sxWa9AIVenZoMO+2dWN3k7FHmS6eqVagnfxerMB86sR9ri3V2uFKkX/PoAwA8IMkCGdVK7lkZo2b7J6jdBPFPbbG71UrdU6lakv3mPaT9aq4F28NuvnKrEa+1eEILODf1ePqlZ8WQko0jDD7dbE8u5az1+RgER4QbW6IcYn/STfWxfpNHVOfI3m24SEn1M3qWvrw51tTPAeNWtoq3/oSe0VejPVoB9Yc5QKddapulj7cAoDgjjIHowxLHdmEste0+NUAUiEfrpCq/zLHiFS2BP2nzpAf2IS0C5CR5l7NNH+I1KU+ZQW69dEGSAYHjPDuzxDCYDE2Ee/ivWRSVtun9UhupdJQKosVYWV2vwoQeYQv1d/1mgmAQjoNcIM3uk5SgAkyn7xPjJpc+0YlWkRk4BUeFRVGhupAfNIz2uWjmISgMC4MwPCDJACb3xk8sAogaZJB6tCDzMJSPi1q0YjrN62Rggye3tOS2jADBBmkAzPUgIgkd74yOS+EeLMVmvQSFXpaSYBibRhWwPmCI+beD+v1WpVpqBdBkCYIcxkxPOUAEioTts+MrlrhECzyeo1VDVaxzQgUTarXkOtxl6OEGR6bvsIaA+mASDMIDl4zAxIsm6qVIvXeoTvV9h6q1OJ6mJdOoB3pgk1aKRV2T8jDN3JT1WzarUz0wAQZpAs6ykBkHC9Va0Wr/ZuEQLNs1ajEfqdnGlAZE0abxXWEiVFlWqRbtKeTAIQmWszYQbvtIUSACkwQLVaEqlp8yN2qibpHiYB0czTFCuzhVHWTpN9uho1hkkAEmCzRfrTGmGGMAOg7YYrr7l+bIyhbZ6VqkwLmQQEt1oVmmRTowSZUZ7XTB3BJAAJEe2xZ8IMALSPCbrH7/KxUQJNkyboizRtRkD/0Nc02hpi/C3WB/vvtETlTAJAmCHMJBtdWYC0OU4Pet5LIsSZrfYH7acq/ZNJQIdbrzrtZzl7PUKQ2cVrtUIns34BCDOEmeTbgRIAqWMq13K/1gdEGHqz1Wu4Lo7SPKSP8+eXbHhVV2mw1ViE1uDe23+oh1XN1RFIoNdiDUyYSbKelABIpW46Uy1+gfeOEGjW2UUq0Q3B/0Y2Qs3+n96FyQ+0rO/kX9TuwYfdops0ws6xCF9B867+DTXrEu3I7AOJtIEwg3cbQAmA1Oqji7XWq717hEDzjH1Lw1QfuInIXvqFlsbp6pa5KFOqefq9QoflJo230+yxCPtrXq5lujFCfAOwvf5FmAFhBig2/VWrVV7pEc609phVaawaAg87QnnN8WOY+g5c2E/we9SogwIPO1fHWJktihbd8hrG3AOJti7WwIQZwgyAjjRIOT3gZTGGtmVWoSmaF3jYiZrqdzrf/uiIZf1wb9BchW4BvlyfsUPs3ih7fLD/XY06mLkHCDOEmXQuggAUg4P1d2/0KAsym2oT9SmtDjzsJ7TI874vU9+Oy/oBXqslOlFhH+N7QlUaa3+OsseDPKcHVMbcA6nwMmEG7zaEEgBFo1TzPO9RHpWxOzRaVfpH4KtLuVZ4zndj6tthWd/bq9WianULOuyLqtFwq4/SgLm/12qVKlmlAIQZwkx6L159tAtVAIqIqVzL/EaP8BKzvW71Gq4fBH5Bs5sqtdrP915MfhuuBd39O3pEteoTdNhXVKcSq7NXYlz9/GKtVbW6M/tAivCYGd5lJCUAik5XfUNrvNZ3ihBoNtil2ld1ejXosDvqx3okTle3Iggynbxcy3Vl4D9tbVWDRlmNvRhhj7t6pZp1gXoz+wBhhjCTdgdQAqAo9VK1WrzaI3z4z16wGg0P3rQ5Yle3VEeZUi1QXqHfPGrSOKuwRyLsr3m5VignHk0E0ojHzPAuYykBULR2Ua1We6V3jhBoHrcqjQnetHmQcprrU5j67VzYT/JpatSBgYedrSOtzB6KGN1KmHuAMEOYKRYHUgKgqO2jnBb4cTGGthVWoSM1O/Cw49Xkf/NxTP2HLOtH+u2ao6MDD7tEx9tkuz9idOPIANKMx8zwjlN7d42nCkDRG6u7fJYfESXQ3G+TVabQf4X/qBZ43ocy9e9z7t/Lc3pInwk87OOq0jj7a5Q9HuF5zQ4e3QC0N+7M4B0O0g4UAciEQzXdG+N8ZNKaNE4VeiTsoCrXcs/F6OqW8CDT12vVrEp1CTrsC9saMG+JsMcD/FotVXngb+cA6AjcmcE7TKYEQIaUaqHnfM8IcWarNWiUqhW2c1VXVWq1X+j0rHpzWd/Dz1WLqtUj6LAb9GMNsTp7NcIe7+yX6RGdGTi6ASi6MMNfQ5J6YWsSL8oCWbNR16vWXopyzumrap0ZeCktPa+f6Bp7LcgeblLXVv9QL9sYYMs66QRdocGBa79Zv9FF9lSUo62bTtOPtCu/8kAR2d2eJszg/070O+rZwF96BpAML+gKXRfjU4WS76UL9OXgfyl/TJfqVx3/kFNSw4yX6srgrfhdt+p8a45ylHXSCarTEH7VgSLTM86Vi8fMkuojRBkgo/pta9oc4eEbe3Jb02YPOuxA5bTYy7M42X6I36fG4FFmpo6wikhRplQLlSfKAEXn9VhRhjCTVJ+gBECG7a2clni5R7h3biutQodoWuBhRyvvM/zwTAWZkZ7XbB0ZeNilqrDDbWaUPZ7k96qRb6gBRenleEMTZpJ4ieukj1EFIOP2U173+2ExhrYH7FgdryWBhz1M0/0WH5aJs/xA/62WKvTdqBZ9QQdYQ5Q9HuV/0hwdxS82QJghzGTBeNGyFIB0mGZ4o0f5S7b9VQeqQg+HHVQVWuY536Oog0w/r9UqfSnw9fc51Wi0/bd5hD3e23NarE/zCw0UsWcIM3ir4ykBgG1KtcB/7ftEiDNvNG3+jp4LOmxXVarZf+Q7FmWQ6enn6WFVB/6O2DpdpCFWF6Zr3Lui2xURvp0DILTn4g1NmEnexc70BaoA4N8663St8ZxHaGRrr9nVGqKawA8Q9NIPtNarvag+HexdvFLNulQ7BR12s+o13C629VGiW7Va9D0+AQ1kAHdm8BZHqYQiAHibbqpUi9d6nwiBZr3VqUR1Cvt3/Te7unUukijzSS1TTmE/i+pq0Cirsn9G2N9OXq5lqtXO/PIChBnCTNacRgkAvIfeqtaKSE2bn7MajVC9tgYddh/l9FD6mzb7ZL9ff9HwwMM2abxV2Jooe1yqRcoH/wwogHieJczgzUtAb51AFQC8j72U09JITZsftSpN0j2Bhx2lvM/yI1J7Th/tec1U6KbT8zTFymxhlD0+1KerUWP4ZQUIM4SZbKpQb4oA4AOMUF5z/ZgYQ9t8K1WZQi+SD9V0b/TULY99oOe0OHgD5tWq0CSbGmWPR3les3QEv6QAYYYwk12nUwIAH2qCpnqjj4sSaJo0XhUK/fhSqRZ53genJsjs4rVapUqFfefnWdVojDVEacC8j+f0kMr55QQIM4GvSlQ/UZe/YVrFnADY3lOGbtX3rSXK0F11ui4O/k2sjbpetfZSQVu8SV1b/UO9bGMBI/XSGfp+4K5l0nrdqEttXZzopu/pLLqWARk2xB4hzECSX6HvUQUArfCafq5LLUqHf++tc3SOQndYe0GX6wZ7NZlhxruqUj/UbsGPght1mT0f5SjopW/re9qRX0Ug0/rEaABPmElelOmjx2hjCaDV1utGXWYvxxg60t/kn9CP9Gt7PVlhxk0n6jINDVyLrbpNNfZwlNnvqtN1kfbgVxDIuI3WK97gvDOTJF8hygAoQG9Vq8WrvXv4oe35bU2btwQddm/ltCROV7f3XdiXap7ywaNMkw62ihhRxs3LtUw5ogyAmG/MEGYSxDvrDKoAoED9VatVXukRzur2mFVprBoCD7uf8prtRyXi/D3em9SogwMPO1fHWJktirLHh+l+5TWMXzwAhBm86XMqoQgA2mCQclrsx8cY2pZZhQ7TjMDDTtK93uhjowaZQZ7TXE0JPOxKVehQuzfKHu/vec3QYfzCAdjmGcIMJOnblABAm+2vO7zRD44xtM2yI1SmpYGHLdVCz/uQKMv6/tsaMIe9lj6pqmgNmAdF+XYOgGTjzgwkn6xDqQKAdlrez/O8R3kEyJo0TlX6R+ArWblWes53DXrW7u3ValG1wr6p9KJqNMzqW9f8INXRDQBhhjCTCtyXAdCOmULlWuY5j/Bytr1u9RqmGr0UdNhuqlSL13qQRtHe1Su1RrWBGxJv0nUqsTp7JUKQ6RUlugEgzBBm0sGH6rNUAUC76qpKrfaLvU/4oW2j1WmortJrQYftrWqt8K96lw49X3fyU7RaucDfktmiX6rEzrIXI1yhuvmZWhs8ugFIj+diDk6YSYYL1JkiAOiA5f0FWuvVHuHb7Pa8naOhwZs276V6Le24ps1eqvm6WYMDF7NJB9lX7YkIQca8XMt1rQbwywTgfT1JmMk4H6qTqAKADrLLtqbNEf5kYk9YlcYEb9o8QnnN8WPa/Vw90aeqUeMC781sHWVl9lCUq1Op5itPp00AH+KJmIMTZpLgQnWhCAA60EDltNij9KCyFVahQzU98LATNdUbvd2Ch4/wvObomMB7sVwVNtmmx5g3n+D3qFEH8csD4EM9HnNwo/6x+TAtJ8wACGKWqm1GnKG9VFfqgMCDbtVt+r61SJJvUtdW/3wv2yj5XrpAXw5+nn5cP9avbEuUuRquH+tEVggAtss6i/pGHXdm4ruIKAMgkMm63xt9TIyhrUnjVKG1ga9x5VrhOS/4ZX3v7dVaocrA5+kXVKPhVh8jyvgAr9USlRNlAGynx+IOz8kqMh+pJbz8DyCo1/UrXWL/iDG099AZ+r76Bh72Zf2koAd6f6hvq1/gbd2ga/QT+1eU2dlJ5+ps9eRXBEAr/N0+SpjJcpj5b32eKgAIbqOuV629FGNo76NzdK56MAnvslm/0UX2VJRZ6abT9CPtyiQAaKVf2ldjDs9jZnGjzChVUAUAEfRUtVq82iNECltnF2mY6vU60/DWC4IaNNqqYkQZ7+TlWqEcUQZAAZ6IOzxhJq5LmAEA0fRTrVb6lzzCecietCodOUk7ewAAIABJREFUoNvlTIMkaaomWYU1R0lRx2ux8tqXSQBAmEHrLiCT9DmqACCqgfqtlkZr2vw5HaJpmZ+DZaqwKTYvznXIp+kO7c8vAoCCRW4AQJiJ6ae8swQgAUYq77P9qCiB5gE7VmV6MMOLgCqNtYYYQ/t+ntdsHc0vAIA2iXxnhsV0NP4Z3U4VACRIk86J9KX5TjpBl2fuS/PP6ae6xl6LUvE4384BUIx2tHWEmSxGmc56SKOoA4BE2arbVG1rYwztXXW6LtFuGan0Bt2gy+zlKJXuq2qdSTc5AO3iJesbdwN4zCyWrxJlACROJ5Vrped8QPihbbPVa6hq9HLRV3mz6jXUamJEGe/mZ6lF1UQZAO3k8dgbwJ2ZKLy3VmsP6gAgodbpKtXZK1HOj/31XZ2t7sV6+tetOs/WRBm6k07QFRrM4Q2gHd1tH4+7AdyZieMcogyABOujC9XslR7hnQp7zmo0QvXaWoR1bdJ4q4gUZUr1oPJEGQDtLPqdGcJMjEvKrvoOVQCQcHspp6Ve7hHu4NujVqVJuqeo6jlPU6zMFka56hzq96lRB3BQA2h3T8TeAMJMDBdpR4oAIAVGKK85fkyMoW2+lapMC4qijo/oS5pkU6MEmVGe1ywdycEMoENwZyZ7fJS+ShUApMZETfU7fUyUQNOkCfqCWlJdv6f0dQ23m80jXG8G+U1aonIOYgDFG2ZoABD+4vI3fZQqAEiZrbpNNfZwlLNmV52ui1L5puF63ahL43yBwfvpXJ2lHTh0AXSowfYoYSZbUebT+hNVAJBKm/RbXWBPRzl39tIZ+r52olrbVa2e+pZqtDOHLIAO9pp62RbCTJaiTDct0XDqACC11uvGaB973EXfS8m9Bu5jAciGFRb9u4m8MxPWt4kyAFKtt6rV4tUe4Tsw9vy2ps1bEl6jJh1sFZGizCe1TDmiDIBAmuNvAmEm5EVmN32fKgBIvf6q1Sqv9AhXEHvMqjRWDYmtzVwdY2W2KMo15jCfob9oGAcogGDWxN8EwkxItal63hsA3t8g5TTXp8QY2pZZhQ7TjMTVZKUqdKjdGyXIjPa8ZugwDkwAQSWg2yRhJtyl5iCdShUAFJHxavJGPyhKoJllR6hMSxJTiydVpTHWEKUB80DPaTENmAFEkIA7MzQACHWxMU3X4dQBQPGd3nSrzrMoFzTvpJN1ufaMXIEXVafr7JUoFeiv7+psdecwBBDFvraWMJOVq/3J+h1VAFCkNus3utD+GeXsGrcN8Sb9Vj+wZ6PseS+dofO0I4cfgGhnwJ4WvSULYSbUJWel9qYOAIrYel2pKyN9IHIXfV/fDN60eYt+q4vsiSh73E1V+oF25bADENFqGxF/I3hnJozziTIAilxvXai10Zo2f1fDAjdtbtJB9p8xooybl2uZriPKAIisOQkbQZgJceEZqu9QBQAZsItqtdorvXOEQPOEVWmMGhTiFfw5OsrK7KEoV5RSzVdeQznYAES3JgkbQZgJ4TpezgSQGQOV02KP0lvLVliFJuu+Dh1khSrsUJseJchM8CY16iAOMgCEGcJMuIvPCTqOKgDIlNHK+wyP0sHR5tjRKtPiDvnHH3+jAXOUa8lgv1lzNYWDCwBh5m1nfeahgy8/PbVMg6kDgEy6U+fY6ijn3k46QXUa0o7/5Au6Qtfaq1H2ZoDOoQEzgMQZZnxnJgNh5jJ9nyoAyKzX9WtdbP+Icv7tptP0o3Z5TX6jrletvRRlL3rrmzpffTiUACTu/N7TNhNmij3KDNVS/pYGIOPSHQVix7FLtBuHEIAEarbhSdgM3pnpWDcQZQBkXk9Vq9m/HaVp83qr00j9Qq8XlibUoNFWFSPKeCc/VauVI8oASKiWZGwGYaYjL0Wf00epAgBI6q+r1BypafOTVqn9C2jaPFNHWkWkd35KtUA3aRAHDoDEWkaYKfYo00NXUgUA+Ld9lNOSSE2bV1mFDtG0VlykK+xwmxHl6jHRp6lRB3LAACDMEGZi+gFdzADgHUYq77P9yCiB5gE7VmV68EP/x8dUpbGRGjDv53nN0dEcKAAIM9t5bmcmOuiCNExLeF8GAN7H7TrfVkQ5O3fSF3XJ+/6x6Rn9WDnbFGXL9taFOk1dODgApGGpqx1tPWGmmGf4b7wvAwAfYIt+o4vtiShn6O46Xd/QmHf85w26Uj+1dVG2qK+qdaZ6cFgASIm1tm8yNoQw0zGXpc/pNqoAAB/iFV2vWnsx0pl6nD6pyRqmvvqXluvv+p29EGU7euhbqlFfDgcAKXKnfZIwU7xRpqeW8b4MAGyXF1Wn6+yVjF4vOukEXcEVA0DqXG7nJWNDaADQEXj1HwC2V1/VqtkrPYPvinipHlSeKwaAFFqWlA3hzkz7X5yGaimv/gNAK63UBbrVPCu764eoTkcy7QBSapwtSsaGcGem/V1HlAGAVttPec32ozMRZEZ6XrOJMgBSa4tWJWVTCDPtfYk6UcdRBQAoyCRN80Yv6s9F+j6e0xKVM9kAUmxNct50JMy070Wqp35CFQCgDUq1wPO+bzHumvfzWq1WpTozzQBSbWlyNoUw075+yIucANDmK1O5VnjOdy2qINPTq9Wiau3ABAMgzBBmknmpGqZvUwUAaAfdVKkWr/U+RXF16OKValatdmZiARSFZcnZFMJMe+LVfwBoP71VrRav9m4pjzKlelA57cmEAiDMtD9aM7ff5apCt1AFAGh3q/WDtDZt9smq0+FMIYCiskm9bXNSNoY7M+11weqpK6gCAHSA4cprrh+buuvCaM9rJlEGQNFZlZwoQ5hpPxdqEEUAgA4yQff43elp2uxD/Pd6iAbMAIrSsiRtDGGmfS5bw3UWVQCADvUxLfS8D038FWEXr9VyfZErLIAi9SBhpvjw6j8AdDxTuZZ7zndPbJDpRQNmAEVvQbIuDGj7xes/9EeqAADBbNANusxeTti1oKtO18XanekBUNwLX/W3FwgzxTSjvbVSe1EHAAjqOf1U19hrCbkSmE7UZRrKtAAoei2WqHMdj5m13QVEGQAIrr9qtdorvXMCokyp5itPlAGQCQuStTmEmbZewkbpbKoAAFEMVE6LPWrPMB/vTWrUQUwGAMIMYSaNrldXigAA0YxW3mf4YVGCzCDPaa6mMAkACDOx8M5M2y5kJ+kPVAEA4p+OdavOt+aAA/bXd3U2nSwBZO5sm6jX/wkzbZvNPlrB+zIAkBCb9RtdZE8FOPv31jd1nnak5AAyJ2Gv//OYWdtcSJQBgMToqko1+4+8Q0OGd/eztVa1RBkAmbQwaRtEmCn8gjZSZ1IFAEiUXvqB1nq1d8hHK72Tl2uZrlZ/Cg0go+YTZorHVbz6DwAJ1K9jmjZva8BcQoEBEGaSg3dmCr2ofVb/QxUAIMEe0vftrnY65x+iWh1FSQFkfQGsXexFwkwxzGQPLdMQ6gAACTdD1+tPtqlNZ/z99WN9mlICQPJe/+cxs0KdS5QBgBQ4XLfoMb/MCzpnu/kUv1MPEWUAQFLivjEjcWemID5IK9SDOgBAamzVfN2pO+3B7T7T76fP62TekAGAt6i2KwgzxRBmbtUJVAEAUuhxTdWDWqTF9tJ7nt87aagm6hAdp30pFgC8Q6ndQ5hJf5QpVSNVAICUW6t/6nk9rxe0STuol3ZSH+2tYepOaQDgvRfByXv9nzDT+lnsooUaQx0AAACQKatsv+RtFA0AWutMogwAAAAyZ2YSN4ow0yq+my6gCgAAAMicWYSZ9KvTThQBAAAAmZPIOzO8M9MKPl5ziX8AAADInOc1wDx5m8XSfPujTCfdSL0AAACQQbOTGGUIM63xFU2kCAAAAMigmcncLMLMdvK+upQqAAAAIJNmJXOzCDPb6xINoAgAAADIoM2an8wNowHAdvHRWqQu1AEAAAAZNNcOSeaGcWdm+9xAlAEAAEBGzUzqhhFmtoN/XkdTBQAAAGTUrKRuGI+ZfXiU6anlGkQdAAAAkFF72lPJ3DDuzHy484kyAAAAyKyHkxplCDMfykv0HaoAAACAzJqZ3E0jzHyYa7QDRQAAAEBmzUruphFmPpB/RMdTBQAAAGRYgu/M0ADgg6JMNy3VMOoAAACAzHpZ/WxLUjeOOzMf5GyiDAAAADLt/uRGGcLMB/DddB5VAAAAQKZNS/LGEWbeX512oggAAADItKlJ3jjemXkffrAeIOoBAAAg017QANua3M1juf7eUcZ0I7UBAABAxk1LcpQhzLyfUzWJIgAAACDjpiZ783jM7D14H63UntQBAAAAGTfSViZ587gz817OJ8oAAAAg855KdpQhzLwHL9HZVAEAAACZd0/SN5Aw825XqztFAAAAQOZNS/oG8s7MO3ipGqkCAAAAoCH2CGEmTVGmix7U/tQBAAAAmfewlSR9E3nM7O2+RZQBAAAAlPi2zISZd/BddQFVAAAAAAgz6XOpdqYIAAAAgDz5r//zzsxb52uc5qkzdQAAAAC0zFLw+gV3Zt6MMqZriDIAAACApFQ8ZEaY+T+f15EUAQAAAJCkNDxkxmNm23gPrdRA6gAAAABIel0D7KXkbyZ3Zt5wHlEGAAAA2GZmGqIMYUaS5AP1HaoAAAAAbHN3OjaTMCNJV6snRQAAAADSFWZ4Z0Z+rO6hCgAAAMA2T2igeRo2NPN3ZryzruZ4BQAAAP7t7nREGcKM9HUdwPEKAAAA/F+YScuGZvwxM++n1dqF4xUAAADYZrMG2L/SsalZvzNzCVEGAAAAeIsZaYkyGQ8zPkpVHK0AAADAW9ydnk3N9p2Zq9SFoxUAAAB4i7vSs6kZfmfGP6U/c6wCAAAAb/G4DUzPxmb2zox30084VgEAAIC3uStNG5vdx8zO0nCOVQAAAOBt7k7Txmb0MTPfVau1E8cqAAAA8Bab1N/WpWdzs3pn5lKiDAAAAPAO09MUZTIaZvxAnc6RCgAAALzD3ena3GzemblGnTlSAQAAAMJMyviJOorjFAAAAHiHZltBmEl2lOmuyzlOAQAAgHe5LW0bnL07M+doKMcpAAAA8C63p22DM9aa2XfTau3IcQoAAAC8w5Paxzxdm5y1OzNXEGUAAACA9/CntEWZjIUZP0gnc5QCAAAA7+H29G1yhh4zc9N0Hc5RCgAAALzLS9rVNqdto7N0Z+YkogwAAADwnv6SviiToTDjPXQZxygAAADwnm5P40Zn585MtQZxjAIAAADvYaMaCTOJ5XvruxyjAAAAwHv6m20gzCTXFerFMQoAAAC8p9vTudmZ6Gbmh2pm1j4PCgAAAGynzdrNXkzjhmfgzox30jVEGQAAAOB93JvOKJONx8xO1USOUAAAAOB93J7WDS/6OxbeW6u0J0coAAAA8N4LZg20J9K56cV/Z+Y8ogwAAADwvuamNcoUfZjxwfo2xycAAADwvv4nvZte7HdmrtAOHJ8AAADA+3A1EGaSOTOH6kSOTwAAAOB9zbJHCDNJjDJGS2YAAADgA/0xzRtfzHdmTqYlMwAAAPABtqT5IbMibs3sPbRSAzk+AQAAgPfVZGVp3vzivTNzLlEGAAAA+EB/TPfmF+mdGd9Lq9SLoxMAAAB4X5u1u72Q5h0o1jszlxFlAAAAgA/0t3RHmSINMz5OJ3NsAgAAAB/olrTvQFE+Zub36UiOTQAAAOADvKrd7OV070IR3pnxE4kyAAAAwIf4S9qjTBGGGe+myzkyAQAAgA9xS/p3ofjuzJytoRyZAAAAwAdap7sJMwnjA3QeRyYAAADwIW63VwgzSfMj7cSRCQAAAHyIPxbDThRVNzMfpcXqwpEJAAAAfKAXtIdtSv9uFNedmauIMgAAAMCHurUYokxRhRn/hD7KcQkAAAB8qN8Vx24UzWNm3kWLNJrjEgAAAPgQa1ViXgw7Ujx3Zr5OlAEAAAC2w2+KI8oUzZ0Z76vV6s9xCQAAAHzY0lkltrY4dqVY7sxcQJQBAAAAtsO0YokyRRJmvERf56gEAAAAtsNNxbMrRfGYmf9Zn+KoBAAAAD7UBu1u64tlZ4rgzowfQ5QBAAAAtku+eKJMEYQZ76SfcEwCAAAA2+WmYtqZ9N+Z+bIO5pgEAAAAtsMjup8wkxjeW5dwTAIAAADb5SbbSphJjvO0B8ckAAAAsB1cvyuuHUp1NzPfRyvVk6MSAAAA2A732dHFtUPpvjPzE6IMAAAAsJ1uKrYdSvGdGT9Es4rjOzkAAABAh9ugPWxdce1Sau/MuOmnRBkAAABgO91WbFEmzY+ZfUGHcUQCAAAA2+mm4tullN7b8B5aqYEckQAAAMB2eUQlxdWWWUrvnZnvEmUAAACA7fbL4osyKb0z47upWX04IgEAAIDt8roG2T+Kb7fSeWemligDAAAAbLe/FGOUSeWdGT9QC1L+fRwAAAAgpI/a3wkzyQgzTZrC8QgAAABsp7UaWoxvzKTwMTP/HFEGAAAAaIVfFGeUSd2dGe+mpRrG8QgAAABspyJ9+V9K352ZM4kyAAAAQCv8qVijTMruzHg/NasfxyMAAACw3T5ijcW6a+m6M/NjogwAAADQCg/rnuLduRSFGR+pr3I0AgAAAK1QX6wv/0upeszM79bHOBoBAACA7bZJA+3p4t291NyZ8eOIMgAAAECr/KmYo0xqwox31hUciwDw/9u783C76vre499fCCQECCAgM0UI8yTghFYvONbWqdprrVVsK2qvPmq1ijj0XplEZNA6IaigIirI4FxQISLIFEQZVJIQhgAZgEBCxpOTnHX/kFpRkpy9z87a67vX6/WXj+iTnM/aT1jv/NbeGwA6ctZg/3hZTmb+Nfb3WgQAgA7Miqlipu+qLeKjXosAANCRMwf5zf9pYiY+GFt7LQIAQAeG4iuD/iMmiJlq13iX1yIAAHTk/PKgmOm/E2Oi1yIAAHTks4P/Izb+e2aqg+PGTF/tCQAADXBNec7g/5DNz4RTpQwAAHToM234IRt+MlO9Ki7xSgQAgI7MiV3L8OD/mI0+9ajGx4leiQAA0KHPtyFlmv6Y2dtiX69EAADoyFB8qR0/aINjptos/sMrEQAAOvSNMl/M9NsHY1uvRAAA6NDn2/KDNvYDAKodY0ZM8koEAICOXFWe15YftbknMydJGQAA6Nhn2vOjNvRkpnpq/NL3ywAAQIfuj6e045PMIpp7MnOKlAEAgI59rj0p09CTmepl8X2vQwAA6NBQ7FIeaM+P28Dzj2qD+LjXIQAAdOzrbUqZZj5m9pbYz+sQAAA69pl2/biNe8ys2jRmxnZehwAA0KEry+Ht+oGbdzJztJQBAIAufKptP3DDTmaqHWJGbOJ1CAAAHZoR+5SRdv3ITTuZOUHKAABAF05tW8o07GSmOjBuig28DgEAoEMPxK5ledt+6GadzJwiZQAAoAufbl/KNOpkpnpp/MirEAAAOrYsdikL2vdjN+ZkptogTvYqBACALnypjSnTpMfM/jkO8CoEAICOrY5Pt/MHb8hjZtUmMTO29zoEAICOfav8Qzt/8KaczLxfygAAQFdObesP3oiTmWrbmBmbeRUCAEDHrigvaOuP3oyTmROkDAAAdOWU9v7oDTiZqfaJW2K8VyEAAHTs1jioVG394ZtwMnO6lAEAgK6c0t6UacDJTHVEXOE1CAAAXbg/disr2/vj9/lkphrX3s9eAACAMfpkm1Om7ycz1T/H2V6DAADQhUdjl7KozQP09WSmmhTHeQ0CAEBXzmh3yvT7MbN/j528BgEAoAsr4j/bPkEfY6Z6crzPaxAAALpyZpkrZvrnuJjsNQgAAF1YGacboW8xU+0dbzY/AAB05ewy2wh9+zSz6nvxcvMDAEAXhmOvcpcZ+nQyUx0aLzM+AAB05TwpE9G3k5nqh/HXxgcAgC6sjv3KdDP06WSmOiReanoAAOjKt6VMH2Mmju7fe3UAACC1Kj5mhN/rQ1RU28S9McH0AADQhUvKq43we/04mTlKygAAQJdOMsF/68fJzB2xu+EBAKALlxbvPv+D2k9mqqdJGQAA6NKJJuhjzMRrjA4AAF2ZWq42gpgBAIB8nMs8Ts3vman2iBlGBwCALlxXDjPCH6v7ZOYIkwMAQFeOM0F/Y+b5JgcAgC5Mi0uN0N+YeZ7JAQCgCx8qlREer9b3zFQ7xn0mBwCAjl1dnmuEP1XvyczBBgcAgC58xARiBgAA8vlJudII/Y6Z/QwOAAAd+38m6H/M7G5wAADo0A/LtUZ4IvV+AMBDsZXJAQCgk5voeGaZZoYnUuPJTLWZlAEAgA59R8o0IGZiJ3MDAEBHqjjWCE2IGecyAADQmQvKzUZoQsxsbW4AAOjAaucyTYmZJ5kbAAA68M3yOyM0I2Y2MTcAAIza6jjBCE2JmQnmBgCAUftqmW6EpsTMRuYGAIBRGo4TjdCcmBlvbgAAGKUvlTuN0JyYWWluAAAYlaVxvBGaFDNLzA0AAKNyWplrBDEDAADZPBSnGUHMAABAPseXR40gZgAAIJu740wjNC1m1CUAAKzbR8qQEUaj1PdLVTvGfQYHAIC1ujkOKSNmGI06T2bmxFKDAwDAWh0tZRoYM6WKWQYHAIC1+Fn5sREaGDMRMdPgAACwRlW8zwhiBgAA8jm//NIITY2Z3xkcAADWYDj+wwjNjZlfGBwAANbgzHKHETpR6v3lqtmxs9EBAODPLIkpZb4ZOjGu5l/vapMDAMATOFXKND1mrjI5AAD8mQfjdCM0PWZ+bnIAAPgzx5bFRuhU3e+ZKTErnmJ2AAD4I7fHgWXYDJ2q+WSmVHG+0QEA4HHeK2USxEyEmAEAgMe5vPyXEbpR6v8lq9/EvoYHAICIiFgdB5dbzdCNcX34NS8wOwAAPOaLUqZb/TiZmRLT+xJRAADQNItiz/KAGbrTh6god8T3DQ8AABFxopQZQ1n04xetnuv7ZgAAIO6KfcqQGbrVl8e9ylVxnekBAGi990uZdDETEaebHgCAlrs2LjbCWJT+/LLVBvG72MP8AAC01kg8q0wzw1j06WSmrI6jjQ8AQIt9XcqMuSr690tXP44XuQAAALTS8ti7zDbD2PTz+17eH6tdAAAAWulkKTN2pZ+/eHVWvMUlAACgde6PvcpSM+SOmSfHb2JrFwEAgJb5p/JVI4xdPx8zi/JAvM0lAACgZW6Mc42QPmYiysWhSQEAaJMq3llGzNCTmuj7tdw0fhVTXAgAAFri7PJmIwxIzERUz4up/T4hAgCAWiyMvct8M/RGAyKi/DyOcSEAAGiFj0qZHpZEM34b1ZnxVhcDAIAB95s4uAybYdBiZsO4LI5wOQAAGGjPL1ON0DsNea9KGY6/i5kuBwAAA+xbUqbHFdGc30q1Z0yNHVwSAAAG0tLYu9xnhl5q0KeIlRlxeLi8AAAMphOlTM8Lolm/nWrXmBq7uiwAAAyYO2L/MmSG3mrY97uUu+PwuMtlAQBgwLxbygx8zESUe+KIuMWFAQBggHy//MgI66EdmvibqjaNr8XfujgAAAyEoTig+OTe9WBcE39TZUm8Jo6NyuUBAGAAfELKrKduaO5vrfqHOCs2dYkAAEhtduxTlplhfRjX3N9a+WYcEFe6RAAApPZeKdPCmIkod8fz4+jwuQ8AAGT1k3KREdZbLzT/t1jtH1+JQ10qAADSWREHer/M+jOu+b/Fcls8I14bs10sAACS+biUWa+lkOU3Wk2Kd8aHYzOXDACAJGbGgWWFGcTM74Nmh/i/8aaY6LIBAJDAC8vlRhAzfxw028S/xDtjR5cOAIBGO6+8wQhi5s+DZkK8Pt4VT3X5AABoqIWxd5lvBjGzpqR5Srw2jox9XUQAABrn7eUMI4iZdSXN/vHaeHEcEhu6mAAANMT18ewyYgYxM7qkmRTPjOfGc+Iwn3cGAECfrYpnlF+ZQcx0njXbx+6xe0yJ3WObx/6ribHxWv8vE2LSGv7JRrHJGv7JhrGpFw8AAE/oU+U9RhAzGWNqzZkzfo2nRhvE5DX8k3Gx+RP8t3vG5ywNANBQ98W+ZbEZ6jDeBD2uw+F4ZI3/8MEeBdMiOwMANNa/SZm6jDNBxmIyAQBAQ11aLjKCmEHMAABkszzeYQQxg6sGAJDP8eVOI7gtZm2czAAANNH0ON0IYgYAALIZiaPKkBnEDK4aAEA2XyhXG8FtMeviMTMAgKaZEx82gphBzAAA5PP2stAIYgYxAwCQzbfKd40gZhAzAADZLIh/M4KYQcwAAOTz3jLfCGIGMQMAkM0Vca4RxAxiBgAgm2XxllKZQcwgZgAAsvlQudMIYgYxAwCQzQ3xWSOIGcQMAEA2q+JtZbUZxAyuGgBANh8rvzaC22I642QGAKD/psdJRhAziBkAgGxG4qiywgxiBjEDAJDN58vVRhAzAACQzez4kBHEDK4aAEA2VbytLDaD22K64TEzAIB++lK51AhiBjEDAJDN/XG0EcQMYgYAIJsqjioLzSBmEDMAANl80SNmYgYxAwCQz/3xASOIGcQMAEA2VbzZI2ZiBjEDAJDPWeUyI4gZxAwAQDb3xPuNIGZw1QAAsvFFmW6L6QknMwAAdTvTI2ZiBjEDAJDPPb4oU8wgZgAA8qnirR4xEzOIGQCAfL5QfmwEMYOYAQDI5m5flClmEDMAAPn4FDMxg5gBAEjJI2ZiBjEDAJDQnT7FTMwgZgAA8lkV/1iWmEHMIGYAALI5qVxnBDGDmAEAyOZXcYIRxAxiBgAgmxVxZFlpBjGDmAEAyOYD5TYjiBnEDABANpfHZ4wgZnDVAACyWRT/UiozuC1mfXAyAwCwPr2jzDaCmEHMAABkc0k5zwhiBjEDAJDN3HiLEcQMYgYAIJsqjioLzCBmEDMAANmcUX5kBDGDmAEAyGZWfMAIYgYxAwCQzap4Q1liBjGDmAEAyOZj5TojiBnEDABANtPiBCOIGcQMAEA2S+ONZdgMYgYxAwCQzTvLdCOIGcQMAEA2F5VzjCBmEDMAANncF281gpjBVQMAyGYkjiwPm8FtMXVl6gquAAAeZklEQVRxMgMA0CsfK1ONIGYQMwAA2dwYxxlBzCBmAACyWRL/6AOZxQxiBgAgn7eXGUYQM4gZAIBsLiznGkHMIGYAALK51wcyixnEDABAPiPxxvKIGcQMYgYAIJvjy5VGEDOIGQCAbG6IE40gZhAzAADZLIrX+UBmMYOYAQDI5+3lLiOIGcQMAEA2l5ZvGEHMIGYAALIZincZQcwgZgAA8jmpzDSCmMFVAwDIZlacbAS3xfSXkxkAgG68u6wwgphBzAAAZPOd8kMjiBkAAMhmRbzHCGIGVw0AIJ/Tyt1GcFtM/3nMDACgM/PjE0YQM4gZAIB8PlgeNYKYQcwAAGTz6/iqEcQMYgYAIJ/3lxEjiBnEDABANheXnxpBzCBmAACyGY5jjCBmEDMAAPl8scw0gphBzAAAZLM0jjeCmEHMAADk88kyzwhiBlcNACCbh+JUI7gtplmczAAAjMaJZZERxAwAAGRzT5xhBDGDqwYAkM9xZcgIbotpGo+ZAQCsy6w41whiBjEDAJDP8WXYCGIGMQMAkM0dcZ4RxAxiBgAgn2PLKiOIGcQMAEA2M+JbRhAziBkAgHw+6lxGzCBmAADyuSMuMIKYQcwAAORzYlltBDGDmAEAyObe+IYRxAxiBgAgn5PLSiOIGcQMAEA28+NsI4gZXDUAgHxOK8uN4LaYJnMyAwDwRB6OLxhBzCBmAADy+VxZbAQxg5gBAMhmKD5vBDGDmAEAyOdrZZ4RxAxiBgAgmyo+ZQQxg5gBAMjnB+W3RhAziBkAgHxOM4GYQcwAAORzY7nSCGIGMQMAkM8nTSBmEDMAAPnMjQuNIGYQMwAA+ZxRVhpBzCBmAACyWRlfNIKYQcwAAORzvi/LFDO4agAAGX3WBG6LycPJDADAf7uu3GAEMQMAAPk4lxEzuGoAAAk9FBcZwW0xmXjMDADg984pK4wgZhAzAADZVPElI4gZxAwAQD6XlxlGEDOIGQCAfM40gZhBzAAA5DMvvmsEMYOYAQDI58tl2AhiBjEDAJBNFV82gphBzAAA5DO13GUEMYOYAQDI52wTIGbEDABAPoviEiMgZlw1AIB8vlGWGQG3xRk5mQEA2u4cEyBmxAwAQD63lWlGQMwAAJCPN/8jZlw1AICEVsU3jYDb4qw8ZgYAtNlPyjwjIGbEDABAPl83AWJGzAAA5LM0vmcExIyYAQDI56KyxAiIGTEDAJCPh8wQM2IGACChOXGFERAzYgYAIJ9vldVGQMyIGQCAfC4wAWJGzAAA5HNv3GAExIyYAQDI59ulMgJixlUDAMjnQhPgtjg7JzMAQBvdF9cZATEjZgAA8rnQQ2aIGTEDAJAyZkyAmBEzAAD5zI1rjYCYETMAAPl8u4wYATEjZgAA8vGQGWJGzAAAJDQvrjECYkbMAADkc2FZbQTEjJgBAEgYMyZAzIgZAIB85sfVRkDMuGoAAPlc5CEz3BYDAJDRJSZAzLhqAAD5LImrjIDbYlcNACCfy8qQEXBbPCh8AAAA0CY/NAFixlUDAMinisuMgNviweFkBgBojxvLHCMgZlw1AIB8PGSG2+KB4mQGABAzIGbEDABAgz0QNxkBMeOqAQDk84MyYgTcFg8SJzMAQFt4yAy3xYOlWhibWwEAaIHh2KYsMgNr4mRGggIANNXPpQxiRswAAGTkITPEjKsGAJDSD0yA2+JB42QGAGiDWWWmERAzYgYAIB8PmSFmXDUAgJR+agLWzt/xJ1StjA2tAAAMuNWxdVloBtbG3/FLUACAJpomZRAzYgYAIKMrTICYcdUAAMQMA8nf8SdUVTYAAAbcUGxZlpuBtfN3/PlSRoACAIPvGimDmHHNAAAy8pAZbowHkpMZAGDwXW4C3BgPoGrDWGkFAGCgLY6tyrAZWBcnM64ZAEDT/FzK4MZ4MDlNAwAGnXfMIGZcMwCAlLxjBjfGA8rJDAAw2BbErUZAzIgZAIB8rigjRkDMuGYAAAljxgS4MR5UTmYAgMF2pQkQM64ZAEA+C+J2I+DGeFA5mQEABtk1pTICYsY1AwBIGDMmwI3x4HIyAwCIGRAzYgYAoFGG40YjIGZcMwCAfG4qy4yAG+PB5WQGABhcvzABYsY1AwDIyDtmcGM80JzMAACD6zoTIGZcMwCAfO4q9xsBN8aDzMkMADCovGMGMSNmAABS8o4ZxIxrBgAgZnBjTPM4mQEABtOjcZsREDOuGQBAPteV1UbAjfFgczIDAAwmD5khZsQMAEBK15sAMeOaAQBk9EsT4MZ40DmZAQAG0ezyoBEQM64ZAEA+zmVwY9wCTmYAgEF0kwkQM64ZAEBGTmZwY9wCTmYAgEH0KxMgZsQMAEA+95V5RkDMuGYAAPl4yAw3xq3gZAYAEDMgZlwzAAAxgxtj6uJkBgAYPD6YGTEjZgAAErrf2/8RM64ZAEBGHjLDjXFLOJkBAMQMiBnXDABAzODGmLo4mQEABo23/yNmxAwAQELzylwjIGZcMwCAfG41AW6M28LJDAAwWG4zAWLGNQMAyOg3JsCNcVs4mQEABouTGcSMawYAkFAVvzUCbozbwskMADBI7imLjYCYcc0AAPLxkBlujFvEyQwAIGZAzIgZAIA+81lmiBnXDAAgJSczuDFuESczAMDgWBW3GwEx45oBAORzR1lhBNwYt4eTGQBgcHjIDDEjZgAAUvL2f8SMawYAkJKTGdwYt4qTGQBAzICYETMAAH00FHcYATHjmgEA5DOzrDICboxdMwCAhDFjAtwYt4vHzAAAMQNiRswAAIgZxAyuGQBAZ2aYADfG7eJkBgAYFE5mEDOuGQBAQktinhFwY9wuTmYAgMEws1RGQMy4ZgAACWPGBLgxbhsnMwDAYPD2f8SMmAEASMnJDGLGNQMAEDO4MSYDJzMAgJgBMeOaAQD0ySPlISPgxrhtnMwAAIPAuQxiRswAAKTks8wQM64ZAEBKTmZwY9xCTmYAgEFwhwkQM64ZAEBGd5oAN8bt42QGABgE95gAMeOaAQDkszLmGwE3xu3jZAYAyO+eMmIExIyYAQBIGDMmQMy4ZgAAYgY3xiThZAYAEDMgZlwzAAAxgxtj6uJkBgAQMyBmxAwAQF/cbQLEjJgBAMhndcwxAmLGNQMAyOf+MmwE3Bi3kZMZACA775hBzLhmAAAp3W0C3Bi3k5MZACA7JzOIGdcMAEDM4MaYPJzMAABiBsSMmAEA6IPZJkDMuGYAABndbwLcGLeTkxkAILfFZYkREDOuGQBAPnNMgBvjtnIyAwDkNtcEiBnXDABAzODGmESczAAAYgbEjJgBABAziBlcMwAAMYMbY9bCyQwAkJtPM0PMuGYAACk5mcGNcWs5mQEAxAyIGTEDAFCz5WWRERAzrhkAQD7eMYMb4xZzMgMAZOYhM8SMawYAIGZwY0wuTmYAADEDYsY1AwAQM7gxpi5OZgCAzOaZADEjZgAAMppvAsSMawYAkNECE+DGuL2czAAAmT1kAsSMawYAIGZwY0wqTmYAgLyGY7EREDOuGQBAPg+Vygi4MW4vJzMAQOKYMQFiRswAAGTks8wQM64ZAEBKTmZwY9xqTmYAADEDYsY1AwColcfMcGPcak5mAAAxA2JGzAAA1MpjZogZ1wwAQMzgxphsnMwAAHl5zAwx45oBAKTkZAY3xq3mZAYAEDMgZlwzAIAaDcdiI+DGuM2czAAAWT1SKiMgZsQMAEA+j5oAMeOaAQBktMgEuDFuNyczAEBWTmYQM64ZAICYATfG+TiZAQDEDIgZMQMAUCPvmUHMuGYAACk5mcGNccs5mQEAsvKVmYgZ1wwAICUnM7gxbjknMwBAVt4zg5hxzQAAUnIygxvjlnMyAwCIGRAzYgYAQMwgZnDNAADWzntmcGPcck5mAICsnMwgZsQMAEBKvmcGMQMAQEIrypAREDPtVpkAAEjJuQxiBgCAlJaZADHTdk5mAICclpsAMSNmAADEDIgZMQMAIGYQM9RjtQkAADEDYiajlSYAAFLyAQCIGTFjAgAgJScziJnW82VTAICYATGTkpMZAEDMgJhJaYUJAAAxA2Imo4dNAACk5AMAEDOtt8AEAEBKTmYQM2LGBACAmAExI2YAAMQMYgYxAwAgZhAzrNl9JgAAxAyImYzuNgEAkJJPM0PMtF1ZEIutAAAk5NvyEDPEPSYAABJaaQLEDHeZAABIaJUJEDNMNwEAIGZAzGR0mwkAADEDYiajW00AACQ0bALEDL+N1UYAANJxMoOYoayIO6wAAIgZxAwZ3WgCAEDMIGbI6FoTAABiBjFDRteYAAAQM4gZMrollhgBABAziBnSKavjBisAAGIGMUNGV5oAABAziBkyutQEAICYod2KCXKqxsW82MYOAEAiE8pKI9BLTmayVuhIXG4FACAVJzOIGR5zmQkAgERGyogR6C2PmaVVbR1zY7wdAIAkVpYJRqC3nMzk7dCHfKIZAJDIahMgZvgfF5oAAEjDE0F4UfE/qm1ijgfNAIAkhspEI9BbTmYyl+iDcZUVAAAQM2T0NRMAAEl4IggvKv5YtUnMicl2AAASGC4bGYHecjKTu0WXxvlWAABy3LiYADHD433ZBAAAKGRSqm6JA6wAADTe6uJTWOkxJzP5/acJAIAE/CU6XlT8qWpC3BPb2gEAaPpNS/HX6PSYl1T+Hh2KM60AAEAL74RNkF/15LgnfKMuAND0G093nvSYk5lB+IPhAV+eCQA0XyVm6PV9sAkG4o+GXWJm+BoqAKDZxpXKCPT0JWWCgWjS2fEVKwAATb9lMQFeUjwBZzMAQONtUEaMQC85mRmUKp0d51gBAHDnSavugU0wKKrtYkZsZgcAoLE2KsNGQB/zRF06Lz5hBQCgwcabgB7fAZtgcFQbx+/iL+wAADTUFmWREeglJzODVKbL4yNWAAAaa0MTIGZYs/NiqhEAgIbyyauIGdasVPF/YsgOAEAjOZlBzLDWnJkep1gBAGgkJzOIGdbhhLjdCABAAzmZQcywdmUo/jV8uy4A0DxOZhAzrDNnroxPWgEAEDOIGTL6cNxiBACgYTxmhphh3cpQvClW2gEAaBQnM4gZRpUzv44PWwEAEDOIGTI6LS42AgDQIB4zQ8wwOqWKN8csOwAAYgYxQ76cWRivjuV2AAAawmNmiBk6yJlb4h1WAADEDGKGjDlzTpxiBQCgETxmhpihQ8fEd4wAADSAkxnEDJ0pI/H6mGYHAKDvJpoAMUOnObM8XhV32QEA6LNJJkDM0HnOzIkXxVw7AAB9tbEJEDN0kzOz4iXxiB0AgD5yMoOYocucuTVeEcvsAAD0zSYmQMzQbc5cHS+JxXYAAPrEyQxihjHlzEvjUTsAAGIGMUO+nPlFvMB7ZwAAMYOYIWPO3BgviQfsAADUzntmEDOMOWemxWExww4AQM18NDNihh7kzJ3x7LjWDgBArTxmhpihJzmzIF4cP7IDAFAjj5khZuhRziyJl8WxUVkCAKiJkxl6fUdrgnar/j7O9gcLAFCLJWUzIyBm6GXOHBoXxy52AADWu5EYXzwVQg95zEzP/jIOjAvsAADUcOc5wQiIGXqbM4vK38ebYrklAID1zMPtiBnWQ9B8Lf4yptsBAFivfJ4ZYob1kjM3xcFxWqy2BAAgZhAzZMuZ5eV98ZdxuyUAgPVksgkQM6y/oLkuDomTY9gSAMB6sIUJEDOsz5xZXo6J/eIySwAAPedkBjHDeg+ameWv4hUx2xIAQE9tbgLEDHUEzfdjnzgmFlkCABAziBmy5cyycnLsHifHClsAAD3hMTPEDDUGzYJyTOwXZ/tIAACgB5zMIGaoOWjuLG+OKfHpWGYLAEDMIGbIFjSzy7tjt/h4LLAFACBmEDNkC5r55YOxY7w2rrEFACBmEDNkC5qh8u3ynDgsvhqLrQEAiBn6em9qArpTTYyXx5HxVzHeFgDAKM0sexoBMUNTkmaHeHW8Mv5XbGgLAGCd5pftjICYoVlJs0X8dbwqXhBPsgUAsBYrysZGQMzQxKQZF/vEc+KF8WLPwwIAazCxDBkBMUNzo2bDODCeHk+Lp8e+3lEDADzOtuUBIyBmyJA1k2Kf2Cv2jb1i79gtJlkEAFpvzzLTCIgZ8qXNFrFj7BTbx7axZUyOybHZGvJmcmxQ429rXM0PxU2oOeo29eEMADTKM8o0I9ArHgKivnJeGAvjN3ZocG6Oj80e+4+bxfiYHBvE5jEutogJsXlsHpvHljE5No/NY+vY/g//SwDozFYmQMwAvc/NVfHIY//xkXWGz8TYJraNJ8c2sUvsFDvHLrGLwAFAzCBmgOaHz4q4N+79k8DZInaJPWLP2CP2ij1jaysBIGYQM0COwFkYC+OWP6TNk2LvOCgOioPigNjEOgA8xl92IWaAxqfNw3FNXBMRUY2LKfHUeGY8Kw6NCZYBaDknM/TyfsMEQF2qjeLQeFYcFofHNtYAaKnzy+uMgJgBMmfNbvHCeGG8uOYPxgag/y4vLzQCYgbInzQbxWHx8nhlTLEFQGv8uhxsBMQMMDhRs1u8PP53HBbjbAEw8O4rOxsBMQMMWtLsFK+JN4W/rwMYbMvLJCMgZoDBTJqnxhvjdbGDJQAG1iZlmREQM8CgBs24eH68O/7Gn1AAA2mXcq8R6A1PqAONU0bKT8vLY684OR62BsDA8bWZiBlg4JNmZjkm/iL+Pe63BcBA8bWZiBmgFUGzpJweu8Wb4nZbAIgZEDNAtqBZWb4W+8fr4w5bAAwEj5khZoBWBc3q8s3YN94W82wBkJ6TGcQM0LqgGS5nxR5xbCyxBUBq25gAMQO0MWiWlI/GnnGuJQAS29YEiBmgrUEztxwZz/eRAABpbWcCxAzQ5qCZGofE8TFsCQAxQ6vvCEwAZFUdGOfGgXYASGZxmWwEesPJDJBWuSWeGSfHiCUAUtms2sQIiBlAzqwox8RLY74lAFLxoBliBiAiovw4Dolf2AEgke1NgJgB+H3OzInD42Q7AKThZAYxA/CHnFlVjok3xHJLAKTgm2YQMwCPC5rz4oh4wA4ACTiZQcwA/EnOXB+HxQw7AIgZxAxAvpy5M57twwAAxAxiBiBjziyIl8TP7AAgZhAzAPlyZmn8TfzUDgBihhb8W98EwOCpNo7vxovsANBQwzGxjJiBsXMyAwygsjxeGT+xA0BDbRhPMgJiBmDNOfOquNYOAA3lQTPEDMBacmZZvCKm2wGgkXY0AWIGYG0581C8KO61A0AD7WQCxAzA2nPm3nhlLLUDQOPsbALEDMC6cuZXcWRUdgBoGCcziBmAUeTMxXGyFQAaxskMYgZgVD4cPzQCQKM4maEnfGkm0ALVlnFT7GoHgMZYXCYbgbFzMgO0QHkk3hCr7ADQGJtVmxsBMQMwupz5RZxoBYAG8aAZYgZg1I6LnxkBoDF8BABiBmC0ykj8UzxqBwAxg5gByJcz98SHrADQEB4zQ8wAdOSMuNoIAGIGMQOQThmJo2KFHQAawGNmiBmADnNmepxkBQAxw4D8e90EQLtUG8VtsYcdAPpsadnUCIyVkxmgZcrK+IAVAPpuk2oLIyBmADrNmUtiqhUA+m4XEyBmADr3nlhtBIA+29UEiBmAjpWb4xwrAPTZbiZAzAB04/gYMgJAX+1qAsQMQBfK7PiyFQD6yskMY//3uQmAdqq2j1mxsR0A+ua2coARGBsnM0BLlblxlhUA+ugplb9WZ6z/NjcB0FbVdnFXTLQDQN9sV+YbgbFwMgO0VpkXX7cCQB89xQSIGYBunRojRgAQM4gZgHTK9PiRFQDEDGIGIKPTTAAgZhAzAAmVn8VNVgDoE980g5gBGJMzTQDQJ05mGCMfzQy0XLVp3B+T7QDQB6tiUhk2A91zMgO0XFkS37QCQF+Mj52MgJgBGIszTADQJx40Q8wAjEW5OW6wAkBf7G4CxAzA2JxrAoC+mGICxAzA2Jwf3oAK0A97mgAxAzAm5cH4iRUAxAxiBiCj80wA0AdTqg2MQPd8zwxARFSTYn5sageA2u1e7jQC3XIyAxARZVl8zwoAfbCXCRAzAGP1HRMA9MEeJkDMAIzVf8UKIwDUzkcAIGYAxqosiZ9aAUDMIGYAMvKgGYCYIRWfZgbwmGrrmBc+IhSgXiOxaVluBrrjZAbgMeWhmGYFgNrvRqcYATEDMHY/NgFA7TxohpgB6IHLTAAgZhAzABldHw8bAUDMIGYA0imrY6oVAMQMYgYgIw+aAdRtLxMgZgB64QoTANRsq+rJRkDMAIxZmRX3WgGgZvuZADED0AtXmwCgZvubADED0AtXmQCgZk5mEDMAPfFzEwCIGXIoJgD4Y1WJeeGtqAB1eqQ8yQh0w8kMwOOUKq6zAkCttqx2MAJiBqAXbjABQM32NQFiBqAXrjcBQM28awYxA9AT02LECABiBjEDkE5ZFDOsACBmEDMAGXnQDKBe+1c+YxcxA9ATPgIAoF6TYycjIGYAesGHMwPUzeeZIWYAeuKWWGoEgFp51wxiBqAXyqr4pRUAxAxiBiAjHwEAUK8DTYCYAegN75oBqNf+1YZGQMwA9MK1JgCo1cTYywiIGYAeKHNjthUAavVUEyBmAHrDg2YA9TrIBIgZADEDkJGTGcQMgJgBSOlgE9CpYgKAJ1JNiEUxwQ4ANdq53GcEOuFkBuAJlaH4tRUAauVBM8QMQI940AygXh40Q8wA9Mj1JgColc8zQ8wA9IgvzgSol8fM6JAPAABYo2pubGcFgPr+2I0tyyIzMHpOZgDWzLtmAOpU4kAjIGYAesO7ZgDq5UEzxAxAjziZARAziBmAlKbFKiMA1OgQEyBmAHqiLI3brABQo/2rSUZAzAD0hgfNAOo03oNmiBkAMQOQ0zNMgJgBEDMAGT3dBIgZgN6YEQuMACBmEDMA6ZQqbrACQI2mVFsZATED0Bu+OBOgTiUONQJiBqA3vGsGoF4eNEPMAPTI9TFiBAAxg5gBSKcsjNutAFCjZ5oAMQPQKx40A6jTdtVORkDMAPSGjwAAqJcHzRAzAD3iZAZAzCBmAFK6LR41AkCNnmECxAxAT5SRuNEKADV6WlWMgJgB6I1rTQBQo81jHyMgZgB6w0cAANTrOSZAzAD0ho8AABAziBmAjMqDMcsKAGIGMQOQkbMZgDpNqbY3AmIGoDe8awagXoeZADED0Bs+zwygXh40Q8wA9MjNscwIAGIGMQOQThmOm6wAUKNDqklGQMwA9IaPAACo04bxNCMgZgB6w0cAANTLg2aIGYAeucYEAGKGZikmABid6t7YyQoAtXkkti4jZmBtnMwAjJZ3zQDUacvY2wiIGQAxA5CRB80QMwBiBiCl55qAtfOeGYBRqibGotjIDgC1mVN2NAJr42QGYJTKirjZCgA12qGaYgTEDEBveNAMoF5HmAAxA9AbvjgTQMzQIN4zAzBq1W4xywoANZof25fKDKyJkxmAUSt3xnwrANRoW981g5gB6BUPmgHUy4NmiBkAMQMgZhAzAG3m88wAao6Zyv0qYgagJ66PVUYAqNFWsZ8REDMAPVCWxm+tAFArD5ohZgB6xINmAGIGMQMgZgBYp8OrDYyAmAEQMwD5bBEHGQExA9ALt8cjRgCo1YtMwBMbbwKATpSquiCeZgeAGu1sAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGHj/HxlhAYihavZWAAAAAElFTkSuQmCC"
+# Base64 PNG images, loaded from assets.py on first access
+_ASSETS = ('MAIN_MENU_ICON_B64', 'CHECK')
 
-CHECK = b"iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAABGdBTUEAALGPC/xhBQAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAABmJLR0QA/wD/AP+gvaeTAABMJ0lEQVR42u3deXxU5bkH8N9zziQDQQKCSxdFVNpqF6vibYuiTjKTmQTEqjVxgyQDKLVarN5aW29tY/faRWutLSJkAZSbWDeEZCYzybhrW9RueuuKS7VuLEFCljnnuX9IrbWAQGY5y+/7Tz+3l2bm/N53zvO875w5ByAiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIqL3EkZA5HzT2mtHB7ds3j8A+YAlup8JHa+Q8dj2nwZ0vALlAMYBKBVgjA2MEUgpoOMEMP75txQYCyDwnpfICrD5Xf/GBmQToIMC9CuwBcAQgE0C9NmQjQLdiG3/aatuMGC+blvyytbyMa89WNexlaNGxAaAiHYi2hbdb9jGgabIAapykAAHKuwDFMaBAt0PwAcB7OWyw3oLwCsKeU1gvwjBi1DjJRF93lJ9aZRtvtA5t/N1jj4RGwAiT6tZWrPvsOgnbEOnAHKoKKYAeiiAKXh7Re5HfQCeEcHTqvo0YDxjGPL0cCDw18zZq97grCFiA0DkGtNXzNw7mM0eCcXHBfikrXq4iHwCwD5MZ7e8AeAvCjwhIn8RG49nMfBYJp7ZyGiI2AAQFVXVkqoP2QE5GrYcpQaOFMVRAA5mMnk9ZT0L6KMCeQzQR00TjyTmJF5hLkRsAIjyYuqiqSXlwYlHGCLTBZiqiqkAPs5kHOEVAGtFZS0MvW/L6PL7eREiERsAoj0yfcXMvUuHhqeLyIkATgBwJIASJuMKw6J4BCL3qth3W/bQffzqgIgNANF2hdpDewW2BsM2JCyqJwL4JN710zlyNRvAnwC9RxWpgImeZH1yC2MhNgBEPhVZGjkEhhFRyCwAVQCCTMUXsgp5GKKrVDXV25B8BAJlLMQGgMijom3RMbbKNFWdBcgpACYxFQLwqgiSti2rjKFsMrUgtYmREBsAIvcX/U9mVWbC1hoRORb8Hp92bhjAfQC6bGB1b2Pir4yE2AAQuafoH5xVqRNFA4DDmQiNwOOi0gEz+7+p+tQTjIPYABA5TKi5erJp6OdVpVagxzERylczYNm4uXde198YB7EBICqSSFtkkqp56raifyznMxW6GRBYK7rj3U8xDmIDQJRn0bbofpYas6F6JoD/YiJUZCqK39nASjtYupzPMCA2AEQ51NTUZNx38IOVAOpV9XRARjMVcqAhEdxh27ps4phxazrqOixGQmwAiPZAbFnsg8M26kXlPEAPYSLkIi+JYgVM6/pUfeoFxkFsAIh2fbV/nipOAX+2R+5mAehVlRvsyQO3ZSoyWUZCbACI3iXSFpmktjkPwFwABzAR8qAXRWVptkRuzMzufIlxEBsA8nfhb605CrAvVsVZAAJMhHzABrBG1Ph+Kt75EOMgNgDkHwqJtMXCqrgIwEkMhHz8Ubgfil9MHDP2Vl40SGwAyLNqrq0JDpfbZyhwGYCPMxGid07ET6vguv7R5Tc8WNexlYkQGwDyRuFfWrPvoGnPFcVCAB9iIkQ79Jqo/DobLLmO9xQgNgDkWpGlkUNUjK9BUM/f7hPtln4AzZbKTzPxrnWMg9gAkCtEl0YPtAx8FZAFAIJMhGiPDYtgpSH67WR98jnGQWwAyJmFvy26n23JJSq4CMAoJkKUM0OAtBiWdWX3vO6XGQexASBHCN00a5/A4NBXVXQht/qJ8qof0BstDfwwE1/zD8ZBbACoKGI3xiZYpixU0YsBlDMRooLZIorrBkoDP77vnNUbGAexAaCCiCyKjNOgeQmAr7DwExXVRgBXlwaMazpnd/YxDmIDQHnR1NRk3Df5wdkK/ATAfkyEyDHehOC7E0aXX8cbChEbAMqpcGusAoprABzBNIgc6wkx5OJUfVeCURAbABqR0LLYlICNH6iilmkQucZdYlsXpeamnmUUxAaAdku0LTrGtoxLVfQy8Cd9RG40BOhvSgPmFbw+gNgA0Pt61/f8PwbwASZC5HqvCLRp77JxS3h9ALEBoO2KtFVPV1t/AeBopkHkOb8XNRbyEcTEBoD+VfgXRcZp0PgOIBcCMJgIkWcpIItLA3IpvxYgNgA+F26NngSV6wEcyDSIfONlUflyKt51K6NgA0B+K/yLw/tLaeAnqpjDNIh86y7Dshfw+QJsAMgnKpura0X01wAmMg0i39so0MtSDcnFECjjYANAHhRZGjlEDXMRgAjTIKJ3U9W7xQicl25Y8yTTYANAHhHqDQXMF4IXQPF9AGOYCBHtoA3YqiJXThxd/lP+ZJANALm9+DdXTzZFlwGYzjSIaJcKg+LhbACzM3MSTzMN7+JPvjws0hKrN0X/xOJPRLu1DyD4rGlhbaQleh7T4A4AuanwL4qMs0eZ14vibKZBRCMsE7cEsrogMT+xnlmwASAH2/bUvjYABzANIsqRFwzDqO+u77ybUbABIIcJ9YYCgXWjvqmi3wRgMhEiyjEb0OsmlI27tKOuY4hxsAEgB4g2Rw+zRFaA9/AnovyXjT9AjHP4c0H340WALhdpiZ5niaxl8SeiwtBjoNbaypZYnFlwB4CKINQcGmVK6XWAzGMaRFSUAiJYtmV0+YIH6zq2Mg02AFQA0aXRAy1Dfgvgv5gGERXZo5bKaZl41zpG4S78CsBlwq2xCsuQP7D4E5FDHGWK/iHcHK1iFO7Cq8XdQiGVh8QuE0ULgLEMhIgcpAwiZx/6+Y8Y9UfNvieTyfChQi7ArwBc4LglJ48dZQ42A/gC0yAih5eVVTKYnZNakNrELNgA0Ahs+4nfrQAOZxpE5BJP2sBpvY2JvzIK5+I1AA4WaYnVWSK/Z/EnIpf5qAE8GGmuPo1RsAGg3RRujV2kwM0A9mIaRORCY1X0lkhzdROjcCZ+BeAwod5QwFxXeh1EFjANIvJIpVm6ceCNL65dsHaYYbABoO3YdrHf/wKoYRpE5DHdMmjV8uJANgD0HpWtJ31YdPguAEcyDSLyIgX+YhjWzFR96gWmwQaAAIRbq4+A6mrwEb5E5H2vqI2TeuYmHmEUxcWLAIss0lYdg+p9LP5E5BMfFAN3h1ujJzEKNgD+Lf4t0fPU1rvAO/sRkb/sBZXbwy2xCxhF8fBWwMWgkPAh0asA+SGbMCLy8QJ0xiGfn1L63B3P9DAONgD+KP6t0WsAuYRhEJHvCY4/+JQp+zccOaeTzxAodPRUMLXtteaG/r7FCsSZBhHRv62OllsHDcUzFZkss+AOgNeKf+n6/s03AziHaRAR/cd69AhjY+BjE2aMv+OVu16xmQd3ADyh5tqa4FC5vRLAKUyDiGinVls6eHomnhlgFGwAXC3aFh1j2XIbgCqmQUS0SzJW2eCsTF3mLUbBBsCVIosi43SUuQaKY5kGEdFuuU8GrZN46+D84U/Q8mT6ipl7a9BMsvgTEe3ZaVSDZk/opln7MAruALhG6KZZ+xhDQ70CfJJpEBGNyJ8g2cp0Q/pNRsEdAEeLLIqMM4eGO1n8iYhy4ghoIDV9xcy9GQUbAMeatWhWmQbNVYAewzSIiHLmyOBwdnWoPbQXo2AD4Di17bWl/cGh3wI4nmkQEeXcNLM/eFuoOTSKUeQGbwSUA1MXTS1RNW8FMINpEBHlzSGmBI7Yu2b8b3mzIO4AOGHlb44PTmwDwEdbEhHlmQInjw/uc3OoNxRgGmwAijkTZX3/pkWAnMkwiIgK5gvmulE3NjU1sYaxAShO8a9sjf0KkHkMg4iowEQb7pv84C8YxJ7jNQB7KHxI9CqBXMQkiIiK5jOHnjKl5Nnbn+lhFHvQQzGC3RdpiZ6nkEVMgojICZVMLkg3dF3PINgA5FVFc/UMQ/QOALwAhYjIGSxVPbUnnlzFKNgA5EXl0tjRYuBuALwZBRGRs2w21D6hO979GKNgA5Db4t960odFhx8CcADTICJypJdNWz+XnJt8kVG8P/4KYBfULK8pFx1ew+JPRORoH8oasiayKDKOUbABGLGpi6aWDGXtWwAcwTSIiJxNgE9q0FzJGwWxARix8aUTfwmgikkQEblGtfl86W8Yw87xPgA7EW6OXQGRS5kEEZHr9gKOPuSUKVufu/2Z+5nFDhJiBNsXaYnVKbCSGRERuZatIqf3NHTdxijYAOySaHP0MEvkYQDlTIOIyNXegm18Nj2383FG8e94DcB7HLfk5LGWyK0s/kREnrAXTPvWmuU1PKezAdgJhQQDgy0ADmcYRESeObd/bGjYboNy1/vdeBHgu4Qnx64Q4EtMgojIYwSHHfrYR7Y8e8fTDzCMf0ZCAIBIayyiii42RUREnmUp7Bk9jd1JRsEGAABQeeOMgyRg/QHAPkyDiMjT3rRUjsnEu9b5PQjfXwMQag6NMgLWb1n8iYh8YaIpeuu09trRbAB8LiDB6xWYys8EEZFvHFXWv/kaNgA+FmmJnqdAnJ8FInIfvRaQy5nDHud3Xrg12uDnBHx7DUBoWWyKaeFRAHvxg0BELjtzL03XJ+ZDoOGW2JUAvsVQ9sgWiHl0umHNk9wB8Impi6aWmBZWsPgTkfsWrtJ6/HPTzoVAASDdmPg2FD9gMHtkDNReMXXR1BI2AD4xPrjP9wB8hnOfiFy18Bd0TBgzdl5TU5P97v8+HU/8D4CrmNAedVTHjB+1zxW+nE9+O+DKlugJAukBf+9PRK5a+ONWe9LgGZmKTHb7/wASboleBxHezGz32aISTsW7MtwB8KhQc2i8QJax+BORy3QGNxln77D4v72c03Rj8kKoLmJcu18LVbRt+oqZe7MB8CgTwd8AmMS5TkRuIZCkpYOndS7sHNyFf6zHP3/sl0SwjMnttgNHZbOL/DW3fCLSHJ2rIks4x4nILRRIby0rn/VgXcfW3fnf1bbXmhv6+5YpcBZT3O3UZ6cbkyvYAHil+C+NHKKG+RiAsZzcROSO4i/322UD1Zm6zFt78r+vba813+zvu0mAOqa5WzZZKkf64VbBnv8KINQbCkDMm1j8ichFHhy0Smv2tPgDQEddhzWxrHwOgNWMc7eMMwTLa9trPX+tmOcbAOOF4H+r4LOc00TkEo8NlgRm3j/vzs0j/UMddR1DE8rKTxPRNYx11wn0uA39mxZ6/zg9LNoWPdiy5c8AxnBKE5EL/AmSrUw3pN/M5R+d1l47uqy/bzWACka8y/rFtj6Vmpt6ljsAbqMQy5YbWPyJyCXLsb9hOBvNdfEHgAfrOraWDZaeBOAeBr3LytQMLIZ6d6Hs2Qagsi02D0CEc5iIXOCpgIGK9LnpV/P1AqsWrOovDRizAPyOce/qQlIrK1tis73bc3pQqHnGBwJiPa7A3pzBROTws/DzOmye2DN/zfOFeLnIosg4DQZSgB7D8HfJm6ahH0/WJ1/jDoALmGJdx+JPRC7woilaUajiDwCpBalNlg5UAXiU8e+SiVmVq714YJ5rAMKt0ZMAfIFzloicTf+uMCqS9cnnCv3KmXhmY6ltxAA8znF4f6I4u6Kl+mTPHZeXDqZmeU35UNb+K4ADOGWJyMFeE8MKpepTTxR1wbQ4vL+WBDICHMYheV8vDFjBT+bi55ncAciDoWHrKhZ/InL0uh943QYqi138ASB9bvpVO2BUAfIsR+Z9TRplDnyPOwAOFGmrnq623gMfPuKYiFxjvW2hsnde4o9OelPb7plyN4ADOUQ7ZduGHttbn3yYOwAO0dTUZKiNq1n8icjBNkGl2mnFHwCS9cnnLBOVAF7mMO28Zpq2/KqpqckTtdMTB3HfQQ/O409aiMjBtkAxKx3v+r1T32BmTuJpiFkB4BUO144pMPW+yQ964t4Arl8xH7fk5LGjzMEnAXyAU5OIHKhfVGam4l0ZN7zZSPOMT6lYPQD24dDt0KulAeOjnbM7+7gDUESjzaFvsfgTkUMNqujpbin+AJCKr/mzbSECYD2Hb4f2H87aX+MOQBFVttQcKrD/CiDI+UhEDjMkwGmpxoQrH8cbaa05CmqneVO1HRrYdofA59x6AK7eATBg/5zFn4gcaNiG1Lq1+ANAqqHzURWZCWAzh3O7Rlm2cRV3AIqx+l8arRRD0pyDROQwFlRnp+PJlV44mIqWquMMGF0A9uLQbmchahih7vrOu7kDUCC17bWmGLiGU4+IHMYGtMErxR8Aehu77xfBqQAGOLzbGXDbvqa2vdZkA1Ag6/v7vgjIpzj1iMhBVKDnpxuTK7x2YKmGREoMOQXAIIf5Pxy5YUvfXDe+cdd9BRBqDo03JfgU+BMVInJQ8YfI+emGrkVePshwc/QUiLQDKOGQ/5vXBqzgFLc9J8B1OwCmEbyExZ+InFX99WteL/4AkI4nbxfgLABZjvq/2W+0OXQRdwDy2X22hidCA88CKOd8IyJHnERVv5GKJ3/kp2OOtMTqFLgJgMkZ8I5NgyWBg+87Z/UG7gDk44NmBy5l8Sci56yg5Aq/FX8ASDUm2lVlPgCbs+Ad44LZ7MXcAciD0E2z9jGHhp4FMJbzjIgccPb8broh8S0/RxBuqZ4H6GLwQWz/9FapbRzSObfzde4A5PKNDg1fzuJPRA5ZOV3j9+IPAOnGriWAfIUz4h17DYv939wByKHYstgHsxaeBlDG+UVExaQiv+xp6FrIJP4l0hK9WCE/ZxIAgC0Yzh6aPjf9KncAciCb1W+y+BORA5ZMS3vquy5iEP8u1Zi8WkWbmAQAYIyWlFzmhjfq+AYg0haZBJF5nFNEVOSlf+vxz007FwJlGP+ppyF5pQDfZxKAQM8PLa85gA3ASD9ztnkF+MAfIirmCV3QYU0emN/U1MSr3ne6E5D4pih+zCQwyszaX3d+o+Jg2x73+wR41ykiKt5p8hbroIGzMhUZ3vxml1ZtkEhr7FoFLvR5EoOaNT/WM3/N89wB2KPuRL/G4k9ERdRV2iezWfx378SdakgsFOA3Pk8iiBJn/yLAsTsANUtr9h0yrOcBGc1PFBEV/uQoyawOfD4Tz/ApeHu4E1DZFlskinN9nEI/JDsp3ZB+kzsAu2FY9AIWfyIqTu1CekvZ2FNY/Ee2EzBxdPn5KrjJxymUAYEF3AHYDaHm0ChTgusA7M9PEREV+Kz4gDV6MJapy7zFMEautr3WXL+lbwUEZ/g0glctHZzsxGbSkTsApjGqgcWfiIqw9n9oIBusZvHPnY66Dmvj0BtzBLjTpxHsH0Dp2U58Y85rABQCVd5og4gK7bHBkpIZbnumuxusXbB2eO+y8loAq/14/LbIpU1NTY6rt457Q5G22MkADudHhogK6E+QbMRNj3J14U7AUH9ZeS1Eevx27AIcdvdBD1WzAXi/DQDFf/OjQkQFPDv/zVIz5tQrtb3kwbqOrWUDJbNU9W6/HbthOK+2OeoiwKq2qmNs2/g9PyZEVCBPBUycmJiTeIVRFE60LTrGsqUTwPF+Om61MbVnbuIR7gBsh2Ubl/KjQUQFWv48r1mzisW/8JL1yS0yaM0C4KsFnxhyCXcAtiPSFpmktvkMgAA/HkSU9+I/bJ7o5Nu0+kG4NTwRGugBcIRPDnnYChiHZGZ3vsQdgHdRNeez+BNRAc42f1c1wiz+xZduSL9ZahsRAH/1ySGXmFl7rlPejCMagNr2WhOKBn4ciCjPXoNtRnsaO59hFM7QObfzddPQSgBP+OSQ59e215psALZZv3VTDYBJ/CgQUd7W/cDrpqHh9NzOx5mGsyTrk69ZASMKwA+N2YHrt/RVsQHYRlTO5UeAiPJoo0JrkvXJvzAKZ8rM7nzJtLUCwDrPN6OGMx6QVPSLAEPNMz5givUC+NhfIsqPTVCpSse7+BNjFwgti00xLc0A8mEPH2Y2YGJSsX+BUvQdAEOy81j8iShPtkAxi8XfRTsBcxJPG6oVALz888xA1sKcotffYr54U1OTIZB5nPJElI/ir9AZ6XjiXkbhLt3x7qdE5WyPH+Z8aHF34YvaANwz+f4IgIM53YkoxwZVtLanMXkPo3CfUHNoPER/6vHD/EikpfpE3zYAApMX/xFRrg1B9PSehmQno3CfmuU15aYEEwpM9fqx2oYWtQYWbfshdNOsfcyhoZcABDnliShHhm3I6b2NXXcyCvfZ9oyANQBO8MkhD1qlpQdkzl71hq92AMzh4XoWfyLKoSxEz2bxd6dZi2aVZS2s9lHxB4BgYHDwrGK9ePG+AlCcxSlPRDliQySebkjewijcp7a9trQ/OHSLiJzot2NXQ84s1msX5SuAyNLIIWqYT8NhjyMmIneeQwX6xVRj8gZG4c7iv76/77cATvLr/NWseXAxnk1RlB0ANQJnsPgTUS5OJxC5kMXftcXffLO/b5mPiz8AiASs04vxwkX6CkDrOPWJaMRnTpXL0g1d1zMJdxb/Df19ywRgPShSBgVvAMKtMz4K4EiONxGNrPjrN1Lxrp8wCfdpamoy1vdvalHwWrBtPlPZUnOo93cAbOsMjjURjaj4Q65IxZM/YhIupJB7D3rgekBmM4x3T2q74F8DFLwBUOF2DxGNqPj/NNXY9T0m4c7iH26JXgeRBQzjPfNaC18bC3ohXrQ5epgl8gSHmoj28IR1TaoxcTGTcKdwa/QqqFzKJHawIlf7o93x7qc8uQNgwziTQ0xEe7R4FPkli7+Li39L9Acs/jtniRR0F8Ao7AdYaznERLQHS/+lPfVdFzEIt678Y98B5BtM4v2muUcbgGhb9JMAPs4hJqLd1HL8c9POhUAZhSuL/+VQXMEkdskRFUuqP+a5BsC2fH2jByLaszXRLdZBg+c2NTXZzMJ9KptjX4Hi+0xiN4pyADO91wAA1RxaItpVKrjVOmjgrExFJss0XFj8W2MXiuDnTGJ3J74WrFYWpAGoWV5TLiLHcmSJaBd1BTcZZ7P4u7T4t8TiovgFeMv3PXFCqD20l2cagOFhjQAo4bgS0S7otnTw1M6FnYOMwn0iLbF6AW5EMZ82625Bc2tpyDMNgG0ot/+JaFfcaxp6aiaeGWAU7hNujZ6uwBIW/xFSKUjNDBTiRUQR44gS0c5PFHjAGj04I12X2cIw3KeytfpUqN5cqLricTM8sQOw7ed/kzieRLSTJc9DA9lgdaYu8xazcOHKvzlWLSz+uXTwtgfnubsBsC2jhmNJRDvxWCArM++fd+dmRuHG4h+tguA2AEGmkUtW3mtn3hsANfjzPyLaoT9BspHE/MR6RuE+kbbq6RC5DcAoppHr4pn/2pnXn2hE26JjLFveZGdIRNs5+/zNss1QJr7mHwzDfSqXRo8VQxIA9mIaeTFQNlg6cdWCVf2u3AGwVSIs/kS0HU8ZWbuSxd+dKtqinxVDOln882rUllGDJ+bzBfLbAEDCHEMieo8XNGtWdc/rfplRuE9Vc9WRhi1rAJQzjfwSzW8NNfL75vVEDiERvcuLpqGhnvlrnmcU7hNpnvEpW4wUgAlMoyAtQF5raN6uAZi+YubeweHsG+ANIYgIAKB/V5gn9jR2PsMs3KdiSfXHDFMzAD7ANArGKg0YEzpnd/a5agegZNg6nsWfiLZ5DbYZZfF3p9Cy2BTD1B4W/4Izh4btvD1Hx8jfH9YTOHZEBOAN09Bwem7n44zCfSJtkUmmhW4AH2IaRSD5q6X5vGsTGwAiWm+oXZWs7/4Lo3Bn8VfbvBvAZKZRrAYgf9cB5GUHYFp77WgAR3LkiHytDyrV3fHuxxiF+4QXh/e3bTPB4l9kiqk119bk5ef0eWkAyrb0HQM+/pfIz7YodFY63vV7RuE+0bbofigJ9AhwGNMouuDwWBzlmgZART/LMSPyrX5ROamnMXkPo3Cf0E2z9snakgbwcabhDDbsz+Xj7+blGgCB8VlAOWpE/jOkoqenGxMZRuE+kUWRcRga6lLgk0zDOSRPi+o8/QpAP8chI/Jf8YfoF3oakp2Mwn1qlteUa9BMKjCVaTiuBchLTc15AxBbFvsggAM4YES+MiyCunRD8i5G4T6h9tBeQ5bdCeAzTMORJocXh/d3fAOQtZXdI5G/WFCtTzUk7mAU7jOtvXa02R+8E4pjmYZzaal5tOMbANhyFIeKyDdsiDSm48mVjMJ9attrS8ds3XQLgAqm4WyC3NfW3F8EKHpUHh8xQEQOWpQI9PxUQ2I5o3Bn8V/f3/dbQGYwDTc0ALm/t07udwBEjuZQEXm/+EPkwlRj8gZG4crib77Z37cMwElMwzWfuJzvAOS0AZi+YubeUEziSBF5fDWiclm6oet6JuHO4r+hv2+ZAHVMw031H4dGFkXGObYBGDVkfRrc/yfyustS8a6fMAb3aWpqMtb3b2pR4Cym4b6+G6MDn3JsA2AbyptHEHl7GfKtdGPiKgbhyrGTew964HpAZjMMlw6h4hOObQCgvHUkkYf9LB1PfJcxuLP4h1ui10FkAcNw8zjaOa2xOW0ABLntTojIGQS4Jt2Y+CqTcKdwa+xHEPkSk3B9H+fgHQA+PILIi8X/ulRj4mIm4dLi3xL9AYCvMQlPfBaduQMQbYvuB2AfDhGRp844S6evm3YRg3Br8Y9dCcg3mIRnfDB2Y2yC4xoAhXk4x4bIQ1Raj39u2rlNTU02w3Bj8a/+BoBvMQlvGQrYOau1OWsALLU/wqEh8szS/xZr8sB8Fn+XFv/W2EWA/oBJeI8hMsVxDQAgh3JoiDyx9L/NOmjgrExFJsss3KeyNTYfiquZhGeb85zV2pw1AKKYwoEhcr2u0j6Txd+txb8lFhfFIvCGbN4t/zmstTl8GJCyASByt25LB0/tXJgZZBTuE2mJ1StwI/LxjBdyDAWc+BUA+BUAkXvdZxp6aiaeGWAU7hNujZ6uwBIWf1/I2fV2OZks234COJbjQuRK95qGVifrk1sYhQtX/s3Vp0HlZuTj8e7kRONz9VPAnDQACuUTAIlcSBQPD1jBmSz+Li3+bdUxFb2Jxd9fbNPOSc3NSQNgW3IAh8SX+kXxMGNwafEH1mYxWH3/vDs3Mw33qWypiqqtdwAIMg1/sSAHOqYBgBjcAfCfIVuldsuY8goAvYzDdf6kko1l4pmNjMKVK//pAuNWFn+fNu8iztkBEOBADom/ij9Ev9Ab71rzYF3H1rLB0pMA3MNYXLP0/5ulZizdkH6TYbhPuLV6mtraCWAM0/DpR1jhnB0Am9cA+GvlD6lNNyTv+ud/sWrBqv7SgDELwO8Yj+M9ZWTtykx8zT8YhftULo0dLaqrAezFNPzLNhzUAADyYQ6JLwxD9Yzexq473/v/6Jzd2TdYEqgG8Chjcuy64VkrYFR2z+t+mVm4tPgbSCuwN9Pw/Q5ATq67y9FXAPoBDonnWVCtT8eTt+/oH9x3zuoNgyWBMJsAR3rRNOxIZnbnS4zCfSLNMz4lBhIAxjMNApCTmpurm0bsz/HwePGHNqTjyZXv9w/vO2f1hlLbiAF4nLE5xqumajRZn3yOUbhPuHXGR1WsJPi4dfqX/RzRAMxaNKsM/D7Ky2xVxNONyRW7+j/onNv5OoazlQr8H+MrutdgG5XJeJJj4UKhZbEpUKs3Vys+8ozxoebQqKI3AIOjB7n69y4V6Pk98cSy3f0fps9Nv2oHjCpAnmWMRfOGaWg4PbeTuzEuFGmLTDItdAP4ENOg9yrV0n2L3gDYlskGwLvF/4JUY/KGPf0DmdmdL4mRrQCwjnEW3EYbWp2sT/6FUbhw5b+85gC1A70AJjMN2u4JOqAjrr0jbwBg7cuh8Gzx//VI/1CqPvWCoXYUwCuMtWA2QSXa25hcyyjcp2pJ1YcCWbsX0EOYBu2IpVL8HQDAmMih8BZRuSwXxf+fuuPdT0HMEAD+9jz/+hV6cjre9XtG4T41S2v2tU2jO5ePfCWvnqcx4gcC5aAB0PEcCk8t/b+einf9JNd/N92w5klRMwqAd5/LY/GH4KSexiTvyuhC01fM3HvIsBMAPs40aBdagBHXXmPkf2Dkb4KcMp/wPz0NiR/n68+n4mv+bKgdAbCeYefckIqenm5I8LkMLhRZFBkXHLaSAI5iGrRLi7UcLL5HvgMgOo5D4YXaL1ekGxI/yPfrdMe7H1MbVQA2MvXcFX+IfqGnIdnJKNynZnlNuQbNJKDHMA3a9eJtFL8BUN6Zyv3FX+XKVGPX9wr1ej1zE4+orTMBvMX0R8wSYM67n81A7jFr0ayyoay9CsBnmAa5bwcA3AFw+Sz6QSre1VTol+2Zm3wAgpMB3cpB2PPirypnpRoT7YzCncW/Pzi0GsAJTIP2wIifCTHiBkBg8JGUrq39cnU6nvifYr1+uiHRC8XnAQxwNHabDZHGnnhXB6Nwn9r22tKtowY7AISYBu2hsqI3AAot4zi4svr/oqex65Jiv410PNkNxakABjkou9O7yZfSDV3LGYU7i//6/s23qMoMpkF7fBJQLX4DIMBoDoXLJo5gcboxcbFT3k86nuhSkbMADHN0dqn4X5hu6FrEKFxZ/M03+/uWATqLadCIaq/IiGtvLi4C5A6Au+rHkp76xAII1Envqqeh6zaIng0gyzHayYde5bJ0Q9f1TMKlxX9rX5sAdUyDnFB7c/AzQDYArikeQPPx6449z2nF/52dgIbkLQLMA2BztLY7gpfn4yZNlH9NTU3Ghq19zaI4m2lQbs7n4oAGQPkVgDvaRWmdvm7a/KamJkcX11Rjok0UX3y7waV3+Xa6seuHjMGVSzW5d/IDN6hiDsOgHE4sBzQAQCkHwunnH7RbkwccX/zfaQLiicUqWMgm4B0/SzcmvsMY3Fn8w62xXwIyj2FQjpU4oQEwOQ5OJrfYBw2ek6nIuOq79Z6GxHWquMT3owdck25MfJXz2J3CrbEfAbiASVAeBNgA0I4XH4JbNw6+frbbiv87TUA8cQ0A3xY/Aa5LNSQu4Ux2afFvjn0fwNeYBOXJiGsvGwDv6gxuMs5eu2Ctq39al25M/AyC7/qw+DdPXzftIqdesEk7F2muboLgciZBeVzisQGg7eoq7TNO7VzY6Ymb66QbEt8C1E8XwLW54YJN2sHKv7X6EhX9NpOgPC8T+BUAvXflKElLBz1T/P+1E5C8HKI++Amc3GIdNDiPxd+txT92EVR/xiSoAByxA0DOkdpSNvaUTDzjyXvrp+uTl0HVwzfB0dusgwbOcus1G35X2RqbD8XVTILcIhcNgMUYHeE+q2zw1AfrOrz7dD2BphuTFwJygwePrqu0z2Txd2vxb4nFRbEIgDANKpAR1142AN4ojA9YZYM1mbrMWz44Vj1+3efOB9RLD8Lp9uLXNr4p/s2xOQLcCO6oUkHpiBcLbADc78GBbLDaF8V/m6amJntC2bhGAW72wOHcZxp6qle/tvG6SEvsCyJYyuJPRVgNcQfA5x4ZLAnMvH/enZv9duAddR3WhsE3GqC4w72f37d3bpL1yS2cyu4Tbo6eom83oQGmQUXABsDHHgtkUXXfOas3+DWAtQvWDk8YU14H4C7X1X7Fw6WmUeOnnRtPrfzbqmMQWYkc3I6VaA854iuAIY5DUYp/ODE/sd7vQXTUdQxZOlgLIOWehT/WZjFY3Tm7s49T2X0qW6qiauvtAIJMg4poxDd5y8XjgLdyHApJ/2yVllax+P9LJp4ZKBss/TyAjBvGTyUby8QzGzlyrlz5TxcYtwIYxTSoyEuJ/uI3AIp+DkTBlo5/szQQzZy96g2G8e9WLVjVbxp6EoB7nD5+6Yb0mxwx9wm3Vk9TW9cAGMM0qOhLCWjxGwABG4ACeTJgoCITX/MPRrF9yfrkltKAMQvA7x349p4ysnYlx8+lK//WmqNEdTWAsUyDnLGeQPEbAAW/AihI8bDsisScxCuMYuc6Z3f2WToYFWCtg97WC5o1q7rndb/MEXKfiiWxT6vaKQX2ZhrkmB0A1RHX3hzsAAh3APLb5j3P4rF7MvHMxmxpabUCf3HA23nRNDTUM3/N8xwZF678m2d8yjCRAjCBaZCjSoM44BoAW5Q/Y8qfdSLWCSwee9AEnL3qDVvNKgj+VsS38bJlojJZn3yOI+LC4t8WOVzF6gawD9MgB7YAI75/SC6uAdjIgcjPylFsK5yqT73AKPZ0J2DNPxQlYQDPFOHlX4NtVGXmJJ7mSLhPaFlsitpmCsD+TIOcSEVHfA+Ykf8KwGYDkIeh/bvCqEjNTT3LLEamp+Guv5u2VgAo5Cr8DdPQcHpu5+McAVeu/CeZFroBfIhpkGPX/9AR195c3AdgE4cip14Vw67qaex8hlHkRnJu8kXNmhUQFOKrlI02tDpZn/wLk3fhyn95zQFqB3oBTGYa5PAWwAENQA7eBL3jNRsIp+pTTzCKHO8EzF/zvGHbVQDyeTFlnwpivY3JtUzcfcKLw/sbWbsb0EOYBrEB2KUNgJFvQxCgwOumoeHexsRfmUZ+dMe7n7ItqQSQj9/i9yt0Vk9D4ndM2n1qltbsi5JAjwCHMQ1yRc1QFP8aAFt1A4dixN4UkQi3jfOvd17X32wL1QByeSvlfsMwZvQ0Ju9hwi5c+beGJw4ZVhrAx5kGuWcDwC7+DoCaeI0jMSIbDcOuTjd0/YlRFKoJSPzRUDucoyZgSEVP767vvJvJuk9kUWQctKQLkE8xDXIVS14tfgNgGa9yJPbYJhXEuuu7/8AoCqs73v2YqDETwOYRFX/V03sakp1M1H1qlteUa9BMAnoM0yC3sUuNES++R9wADI4ZywZgz/TZhsb4nXHxpOKdD6mt1QD25GZWlgBzeuLJVUzSfWYtmlU2OGzdCeAzTINcSEevx+tFbwAerOvYOsJVlB9tMQzj5N765MOMorh65iYfMCCnALt1X21LIXNSjYl2Jug+09prR/cHh+4SkROZBrmRABs7F3YOFr0B2PZmuAuw6/pF5SR+Z+wc3Y1daYWeAmBgF/65DZHGnsaum5mc+9S215aO2brpFgAVTINcu/yX3Fx7l5MGQPPzsypPFn8ITkrFuzKMwmE7AY3dSRtyBoDhnX7uVM9NN3QtZ2LuLP7r+/t+qyozmAa5uwPIzaLbyNG7eYkj8r6GbJXadEOil1E4U29j152iciaA7HY/ciIXpuLJpUzKlcXfXL+lrw3ASUyD3E9edE4DIHiRA7Lz4g/RL/TGu9YwCmdLxbtuVZWzt9MEfD3d0HU9E3Jn8X9za18bBGcwDfIGOycPicvNNQA2G4CdGLYhtemG5F2Mwh164l0dEJ0PwN42wy9PNyauYjIupJD1/X2/EcXZDIM8s/4HnLMDoGADsMNsVM7pbey6k0m4S7oh2QqRL0HxrXRj1w+ZiDuLf7g1dgOA+QyDPLX+V+Tka/dAjorcCyIclO23WHpmqDd0W6Yik2UYbmsCuhYxBVcX/1+y+JMndwAMIydPNs3JDkAQBncAdjRQitPM50ubm5qaDKZBVBjhlthPAVzAJMiLBgOmc74C6Jzb+TqAPg7LDtuA2fdOfnAJmwCiAhT/5tj3IbiESZAnqwmw4b5zVufkIXy5LEjPcGh2qvHeyQ/cAAW/LCHKk8rW6LchuJxJkFcp8FSu/lbOGgARPM2hed+U5oVbo9cwB6I8rPxbqy8RlSYmQZ5uAHJYa3PWANgQ7gDsWhOwsLKl+ufMgSiHxb+leiFUf8YkyPMVJIe77Tn8CkDZAOzyAOrF4ZbYlUyCKCfFfx6g1zAJ8skegAMbANUnOTC75Vvh1hi/qyQaefFf/PbCiMgH5d9y4DUAdmnwcQ7N7o4kvl/ZGruMQRDtvkhLrA7QRSz+5Ccltvxfrv5WTj84lS2x1wTYl0O0u32AXtrTmPwpkyDa5eL/BQVWIkc3MyNyiZfTjYkPO24H4O1KptwF2KMuTK6qbI59kUkQvb9wc/QUBW5m8ScfymmNzWkDIMBfOT57Fp0Iro80x85lFEQ7VtlSFYXISgAlTIN8R3NbY3O7AyDCHYARpKeCX4dboucwCqL/FGmNRQTGHQCCTIP8uVJUB+8AqHAHYGRMQFoizdWnMQqidxX/5uqQKu4AMIppkG8ZhnMbgCwGHgOgHKURCajoyoqW6pMZBREQbq2epqJ3AihjGuRj9tbh0j86tgHIxDMbAazjOI1YiQHtiLTEZjIK8vXKv7XmKFFdDWAs0yCfe/r+eXdudmwDAAAqeJTjlBOlCu2oXBqtZBTkRxVLYp9WtVMK7M00yO8UeCzXfzPnDYChwgYgZ2S0GLKqqq3mRGZBfhJtjh5mmEgAmMA0iABDNee1NQ/Pp1c2ALlVZtv26nBz7HhGQX4Qbp3xUUukB8D+TIPonzsA4vwdANPEIxyqnBsDwZ0VLdGpjIK8LLQsNgVq9QL4INMgepds1vk7AIk5iVcAvMDRyrnxBiRVuTR2NKMgL4q0RSaZFroBfIhpEL2bPJs+N/2q4xsAAFDgIQ5YfpoAGOiqaIl9glGQp1b+y2sOUDvQC2Ay0yB6T00VzUtNzUsDICIPc8jy1AcC+xpAT6QtcjjTIC8ILw7vb2btJKCHMA2i7Zz3NT81NS8NgK0WG4D82k9tMxlZGuEJk1ytZmnNvigJpAGwoSXywg6A6vBaAEMctrw6QA2zN9RcPZlRkBuFmkPjhwy7CwC/0iLasYGJo8sfc00DkIlnBpCHmxbQf5gUEO2uWlLFi6bIdcXflGAaAC9qJdrZghqytqOuIy8LaiNfb1og93DoCjE5MMU2jUxsWYw/myJXiLZFx5gSXMXiT7QLtVT17nz97bw1ALbabAAK5yPDFnrCi8O8cQo52qxFs8qyFlYDmM40iHahATDzt5jOWwNgDNn3ALA4fAWaJMBhKA0kwq3hiUyDnGhae+3o/lHDq0SEt7Ym2jXZrcOlD7iuAUgtSG0C8GeOXwEpPg0NdE9fMZMPTyFHqW2vLS3r7+uAKh9uRbTrHsn1EwAL0gBsq0j8GqDwjgoOZ1cft+RkPj6VHGHqoqklG/r7OgDw8dZEuyHf19LltQGwYaQ5hEUxLWgOdYbaQ3sxCiryyt8cX7rPMgVOZhpEu7mEVs1rDc1rA1Bi2GkAgxzGYnSOepzZH7wt1BwaxTSoWMX/za19bRCcwTSIdrv8by0bKnXvDkCyPrlFgfs4kEUTCcioO2qurQkyCirsuQvy5ta+X4vibIZBtEfLuMyqBav6XdsAvL0SRScHspjnYY0Oldsrpy6aWsI0qFDFP9Iau14U5zIMoj2snap5r515bwBsoItDWXSnjBu1z8pQbyjAKCjfxT/cGvulAl9kGEQjWTxr3mtn3huA3sbEXyF4nsNZ7G4SpxnPB1fUtteaTIPyJdIS+yGAC5gE0Yg81x3vfsr1DcDbqwJJcDyd0FGibn1/341NTU0G06A8FP/vqeAyJkE04nP16kK8TkEKgQq/BnCQxnsnP3ADFMIoKFcqW6PfVuB/mARRThSkZhakARjMlqbAxwM7qb+cF26NXsMcKDcr/+jFotLEJIhyVDLLBu8uxAsVpAHYdivDBziujmoCFla2VP+cOdBIhFuqFyqE84goV2dmyN2ZusxbnmkAAH4N4MyJphdHmqu5cqM9Lf7zAL2GSRDlkl2wWlm4BkBxFwfWeVT02+HW2OVMgnZHpDk6F9DFAK8lIcrtOTmwulCvVdAPb7gl9hcAn+AQO3HS4es9DYkfMwl63+LfEqtT4CYA/EkpUW49mm5MHO25HYBt2jm+ziSKH4ZbYvz9Nr3Pyr/6NAVWsPgT5eM8rAWtkQVtAGxL/pdD7Ny5B+CXlc0x3sGNtivcHD1FRVcC4B0lifIgG5BbPNsA9M7r+huAP3GYndsEiOD6SHOM93Cnf1PZUhWFyEoAfKYEUX5Ov3/IzEk87dkGYNs6k7sADp+FKvh1pDnGp7gRACDSGosIjDsA8KmSRHmisAteGwveAIhlreRQO56pgrZwa5TPcfe5ipaq41RxG4BRTIMof/XfVuOWQr9owRuA1NzUswAe4Xg7vwmAyrKKluqTGYU/hVurpxkwOgHsxTSI8lr/H87Eu9Z5vgHYhl8DuEOJAe2ItMRmMgp/ibTWHCWqqwGMZRpEeS7/WpwL5IvSAIhhrQSgHHZXKFVoR+XSaCWj8IeKJbFPq9rdCuzNNIjyX/8N07rVNw1Aqj71AoDfc9zdQkaLIauq2mpOZBbeFm2OHmaYSACYyDSICuL+bTXRHw0AAKjiZo67q5TZtn1nRVv0s4zCu8XfEskA2J9pEBWoFhbxl3FFawDEyC4DMMjhd5Vyw5ZEVVvVMYzCW0LLYlMsQYrFn6igBkqGcZPvGoB0Q/pNBe7g+LvOONs2uiuXxo5mFN4QaYtMMi10A/JhpkFU0PX/LYn5ifW+awAAwBAs5gRwpfEw0FXREuODndy+8l9ec4DagV4Ak5kGUYHLP4pbA6XIRy+R1tiTCkzhVHClV8WwKlL1qScYhftE26L7WbZkABzONIgK7sl0Q+IwSPF+EVfUHQAIVCFLOQ9ca3+1zWRkaeQQRuEuNUtr9rVs6WHxJypS+VO5sZjFv/gNAABLjWYAw5wOrnWAGmZvqLl6MqNwh1BzaPyQYXcB4Fc4RMUxnIWxrNhvougNQCa+5h8AVnM+uNqkgGh31ZKqDzEKZ4ssiowzJZgEwIs4iYq3/r9jW+3zdwMAALYKLwZ0OQWm2KbRG1sW+yDTcKZoW3SMBs1VAP6LaRAV83xpOaLmOaIBOPH5z3VB8Dynhet9dNhCT3hxmL8ld5hZi2aVWbbcBeB4pkFUVC9OLBufZgOwTVNTky22tHBeuJ8Ah6E0kIjdGJvANJxhWnvt6P5Rw6sAhJgGUdGX/4s76josNgDvfiNqLwGQ5ezwxAT/dDaArsiiyDiGUVw119YEy7b03QZVPsyJqPiG1ShxzC/fHNMAJOcmX1RBO+eHZ/yXBs3O45aczMfJFsnURVNLhsvtdghiTIOo+ESwsqfhrr+zAdjewjGLq8DHBHvJtKA51BlqD+3FKAqrtr3WHB+c2KbAyUyDyDEl92pHvRsnvZneeYk/Ashwknio44UeZ/YHbws1h0YxjcIV//X9m1sBOZNpEDlGd6qh81E2ADstGPgZ54nnRAIy6o6aa2uCjCLPFPLm1r5fA3oOwyByUG0zxHG1TRyXkkLCrbE/g3cp86LbNw6+Ubd2wVre+TFPn53K1tivBDifYRA56aOJv/Q0JI4o9q1/Hb8D8HZAcjWnjCedMj64z82h3lCAUeRepLX6KhZ/Igeu/kV/6rTi78wGAEBpnywH8AqnjSd9wXg+uKK2vdZkFLlT2Vr9Q4V+lUkQOc7LE0aPu9mJb8yRDUDnws5BgVzPeePRbhioW9/fd2NTU5PBNHKw8m+JfU9Uv84kiJxHBdd21HUMsQHYDWZWrwewhdPHsxrvnfzADVAHXofiIuGW2LcU+B8mQeRIm217cJFT35xjG4DE/MR6AC2cP57eC5gXbo1ewxz2dOUfvRjAlUyCyKGrf8iNmXhmIxuAPWCp/BTAEKeRp5uAhZHm2I+Yw26u/FtjFynk50yCyLEGArbt6AvaHd0AZOJd6wRYynnk8S5ZcFmkubqJSeziyr85OhcK/lKGyNlnthuSc5MvsgEYyfrQsr8L6FZOJq83AfrtypYov8t+35V/tEFFFgO8doLIyat/ldKrnP4mHd8AdM/rfhnAYs4n7xPI9ypbY5cxie2rbK6uhcoSN3xuiXx+LrvOSQ/9cW0DAACWBn4IoJ/TygcfHMUPwy2xC5jEv4s0V58mojcB4P0TiJxti2HYP3HDG3VFA5CJr/kH7wvgo+YZ+GVlc+yLjGLbyr81WqNvF3/eQZHI6RS/SNYnX2MDkEPZ0pIfA9jM2eWPJkAE11e2xub7vvi3VEVF5VYAfJASkfNtCljueaCdaxqAzNmr3hDgWs4vHzUBit9EmmNn+zWAqpbqsMC4AwAfpUzkhsW/6NXb7mHDBiDnuwA6+FMBNnCa+YapgrZwa/QMvx14RUvVcTb0dhZ/ItfYaNtDv3DTG3ZVA5CJZzYqcA3nmb+aAKgsq2yOzvLLAUeaaz5nwOgEsBeHn8gt5Con3/XP9Q0AAJQGjGsAvMbJ5islItJR2VIV9fqBVrVVHaNidwEYy2Enco1/WGUDv3Tbm3ZdA9A5u7NPoFdwvvlOUCC3Vy6NVnr1AMOt1UfYttEFYByHm8g9FLg8U5d5iw1AAUxfd+yNAqzltPMbGS2GrKpqqznRa0dWsaT6Y1BNApjIcSZylUdPWDet1ZVnVNeeMFuqjjNg3AveEtWP+mxDo731yYe9cDBVzVUfscW4G8AHObRErlv+n5COJ+5141t37S1Fexu77wdwK2efL5UbtiSq2qqOcfuBVN444yDbMLpZ/IlcuYK+2a3F39UNAACYhl4KYIDT0JfG2bbRXbk0drRbDyC6NHqgBKxeKA7icBK5bum/1c6a33DzEbi6AUjWJ5+Dgs9E96/xMNBV0RL7hOtW/q0nfdgypBfAwRxGIheu/tW4qmf+mufZABSRNWbwhwBe5nT06YcQ2NcA0pG2yOGuWfm3RfcTHe4GcChHkMiVXjJMdzzwx9MNQKYu8xZEL+d89LX91TaTkaWRQ5z+RmuW1uxr2dID4HAOG5E7KeRryfrkFg8soLwxGuHW2EMAPsOp6WsvWConZuJd65z45kLNofGmBNMAjuZQEbnWg+mGxHEQKHcAnNHGqKhxEQCbc9PXJgVEu6uWVH3IicU/IMEUiz+Rq1mGYS/0QvH3TgMAIBXvfAjArzk//U2BKbZp9MaWxRzzs7poW3SMKcE7FZjKESJy8/lFru2u7/6DV47H8NLgDFjBbwB4kdPU9z46bKEnvDi8f7HfyKxFs8osW+4CcDyHhcjFBM/bZQPf8tIheaoBuH/enZtVdAFnKglwGEoDidiNsQnFeg/T2mtH948aXgUgxBEhcvk5RWSBG+/375sGAAB6GpKdgK7kdCUoPp0NIDV9xcy9C/3Ste21pWX9fR1QreRAELm9+GNZqr4r4bXjMrw4WFZp8MsKvM5pSwCOCg5nVx+35OSCPV536qKpJRv6+zoAzGT8RK73Roll/LcXD8yTDUDm7FVvQOVrnLe0zbSgOdQZag/tVYCVvzk+OLFNgZMZO5EHVv+KizrndnpyQenpJ+lFWqoTCo1yCtM2KUsHZ2Ximbw8P6K2vdZc37+5FdBzGDWRJ3SmGxMzvHpwhpdHLqtYAOAtzmH6Z09oInh7zbU1wZz/ZYW8ubXv1yz+RJ6xxTT0Ai8foKcbgG13hGviPKZ3CGJD5fbKqYumluSy+Fe2xn4linMZMJFnThaXJ+uTz7EBcLEJZeXXQPAAJzO9yynjgvssr22vNXPxxyrbqn8hwPmMlcgz7jl+3eeu8/56yAeibdGDLVseA1DOeU3/WrijfWJZ+dkddR3WHhf/1uofiurXmSaRZ2zSrPlptz/qlzsA2yTrk8+p4kLOa3pP91u3vr/vxqampj36HFS2RL/L4k/ktYWBnO+H4u+bBgAAeuKJZSq4idOb3qPx3skP3ADdvd2wcHPsCoF8k/EReUpbT2PXzX45WMNPI2sMWF8CsI5znN6zFzAv3BK7epdX/s2xr0DwHeZG5CnPlQaML/uqJvrpYFMLUpvEkDkALM51+vceABeFm2M/e79/FmmOflkEVzMwIk/JQuScztmdfX46aNNvo/zsbU+/cOgpU0oBnMA5T+9pAqYd+vmPyLN3PJ3ZQfGfqyK/hk8uniXyCxX9Tk9DYrnfjtvw42BnDxpsAvQhTnvazong2+HW2OXv/e/DrdEGFVnM4k/kOb/fNPDmD/x44L5sADIVmazCnA1gM+c+/WcXgO9XtsYu++f/WdlcXQuVG/36eSHysLcMtc9Zu2DtsB8P3termcqWWFyApfwM0PbaABUshMqbAm0DEGAkRJ77mM9ONyZX+PXofb+dGW6JLQYwnx8EIiJf+VW6MeHr+8P4fkuztM+4EMDv+VkgIvLNyv+hCWXll/g9BV7QBCC6NHpg1pC1AuzLNIiIPO1VlZKpPQ13/d3vQfCiJgDJuckXRXAGgCzTICLyrKxhGGew+LMB+DfphkQvgP9hEkRE3qSKS7vrO+9mEm/jVwD/NjsgkbbY/6qilmEQEXnqBL8y3Zg8izlwB2BH7ZBmRw/OBfA4wyAi8sraDv83YI06j0mwAdipTF3mLYh5KoBNTIOIyPU2B1RPvX/enbzxGxuA95duWPOkqMwFYDMNIiLXslX1nGQ8+X+M4j+ZjGD7nr3j6ScO/fyhQxCJMA0iIhcS+WpPY6KVQewgHkawc+Hm6K8g8iUmQUTkqvJ2Q7qxawFz2DF+BfA+JowZtxCQVUyCiMg1Oq2DBi5gDNwBGLHjlpw8dpQ5eA+AI5kGEZGjPWKVDZ6Yqcu8xSi4AzBi98+7c7Nh2TMBvMg0iIicSv9uBYzPs/izAcip7nndL5uGzgB/HkhE5ESbIcaMzOzOlxgFG4CcS9Yn/wLFmeAzA4iInGRYYZ+ebuj6E6NgA5A36XiiSwXnMwkiImdQxcKexu4kk9g9vA/AHnju9mceOeTzU0ohOJ5pEBEVj6hcmY4nfsok2AAUrgm445meQ06ZMhbAsUyDiKgoa/9r0/HE15nDHjZPjGAkcw8Sbq3+DaB8yAQRUWGLV3OqITEPAmUae4bXAIxsBurx6z53vgA3MwwiooKtvpZPXzdtPos/dwCKrra91lzfv3kloKczDSKivLrdOmiwNlOR4a+xuANQfB11HdaEsrHnAOhkGkREedNd2mecyeLPHQDHmbVoVtmW0sE1InIi0yAiymm1esAUjSbrk1sYBhsAR6pZXlM+lLVTAP6LaRAR5cTvBqxg5P55d25mFGwAHC3cGp4IDfQAOIJpEBGNqEr9MTCMysT8xHqGwQbAFaavmLl3cHh4DSCfYxpERHtUoNaqZGPphvSbTCP3eBFgntx3zuoNVtlQFUR6mAYR0W67tyRgVLL4swFwpUxd5q2ygZJZAuE9qomIdl2vVTY4o3N2Zx+jYAPgWqsWrOrfu2zsLBXcyjSIiN6PrLJ0cEamLvMWs8hz0oygMN6+WVDfUgD1TIOIaLsF6eYNg280rF2wdphpcAfAM96+WVD5XAA3Mg0iov8o/zdMXzdtNos/dwC8SyGVrdU/E+jFDIOICADwq3RD4su8tz93ALzecmlPY9clAnyfYRCR70+JKlemGxMXsvhzB8BXIs3RuSryGwAlTIOIfCarii/3xBO/YRRsAHwp3BytgkgHgHFMg4h8YrOKntHTkOQD1NgA+Fu0LfpJy5bVACYxDSLyNv27oXpSd7z7MWbBBoAAVC2p+pBtGqsAHM00iMij/mQFjJmZ2Z0vMYri40WADtE9r/tlq2zwRAB3MQ0i8t7CH4nSgHE8iz8bANqOTF3mrQll5acA+BXTICLP1H7BYmvy4Em8ta+z8CsAhwq3xi6C4uds0ojI1bVf5TupeFcTo2ADQLuhsrX6VFFtAVDONIjIZTap6pyeeHIVo2ADQHugqrnqI5YYtwrwSaZBRK5Y9gP/ZxjWaan61BNMw7m4vexw3fHup+yywWkKtDMNInJB+V8ZMPQYFn/uAFAORVqi5ynkOvDOgUTkPFkVfLOnIfFjRsEGgPKgsiV6gkD+F8AHmAYROWLND7xuQs7qbuxKMw02AJTPJqD1pA+LDt0CyOeYBhEVuYz8QYzsF1L1qReYhbvwGgAX6mm46++lfWYI0GuZBhEVsfjfMKFs7HEs/twBoCIIt0YboHIdgL2YBhEVSB+gX0o3JlcwCjYAVESh5urJhmC5QI9jGkSU16KheDgbwOzMnMTTTIMNADmhCegNBQLrRn1TRb8JwGQiRJRjWVH8bMPQG1esXbB2mHGwASCHiTTXfE7FXg7gUKZBRDmqFM/Dxpx0PHEvw/AOXgToMal450OlAeNoESxjGkQ04tov6LDswSNZ/LkDQC5S2Vxda4guUmBvpkFEu6kPIhekG7qWMwo2AORCkbbIJLXNZQBOYBpEtGv0IbHtc1JzU88yC+/iVwAel6pPvXD8umkVAl0A4C0mQkQ70a+Cr08oGzedxZ87AOQhoebqySb0NxDEmAYRvUenZs3ze+aveZ5RsAEgj6psrq6F6K8E2JdpEPm+CGwA9OupxuQNTMNf+BWAD/XEuzpKsjgMEH7gifxc/AUdJbbxMRZ/7gCQH3cDWqM1Avk1FAcxDSLfWCeGfDFV35VgFNwBIL/uBjQkO8sGSj8uih8DsJgIkafZgNwwYAWPYPEn7gDQOyraop81bLkWwGeYBpHnPGgY9sLu+u4/MApiA0D/SSGVLdWni+hPAUxiIESu/1D/XSCXpxoSyyBQ5kH/xK8A6L0tofbEuzrKBksPF5UrAd3KUIhcWfi3iuLHA9aow1ONiTYWf+IOAO2W0PKaAwKW/QNVzOZ8IXKNuyyVL2fiXesYBbEBoBF5+/oAXAPI55gGkWM9AsVX+OAe2hX8CoB2SW998uHj1x17nAANAP7BRIgc5Q0IvjKhrPwzLP7EHQDKm1B7aC9ja/ACQ3EZnzRIVFTrReWXGMpenVqQ2sQ4iA0AFcRxS04eGwwMfkkU3wAwjokQFcxbovhVFoM/ysQzGxkHsQGgogi3hieKXfJlFb0YQDkTIcqbLYAuMQ18P1mffI1xEBsAcoTQTbP2CQwOfVVFFwIymokQ5cwgIK2WGt/OxNfwGhxiA0DOFG2L7mdbcokKLgIwiokQ7bEhQFoMy7qye173y4yD2ACQK0TaIpNsDXxVVOcCGMNEiHbZWwLcaNj68+Tc5IuMg9gAkCvVLK8pH7LsOBRfBXAAEyHaoVdF5Tempdcm5ifWMw5iA0CeUNteW7qhv+9MG7hUgE8yEaJ3PAnB9ZY9uCgTzwwwDmIDQJ4VaauerrZeBmAm5yH5lULuh9o/7mlM3sV79RMbAPKViiWxT5sB/LcqzgRQwkTIB4ZFcLsN/LSnIfE7xkFsAMjXQstrDjAsa56ozAUfQ0zePNs+DxtL1ChZ2tNw198ZCLEBIHqXpqYm476DH6wEcJ4qTuGuALmcBaBXVW6YOGbsrR11HRYjITYARO8jvDi8P0oDZ6piPi8aJJd5SgVLZCjbkj43/SrjIDYARHuooiU61YBxHqCzAZQxEXKgQRHcCeCGVH0izYv6iA0AUQ7FboxNyAZkNkTPgGIa5zAVma2QByG6cigQWHHfOas3MBJiA0CUZ6HlNQeYlv0FVakV6LGcz1RAj4tKBzTblpqbepZxEBsAoiKJtEUmqZqnshmgfBf9bECXZ+YknmYcxAaAyGEqb5xxkJRYp2xrBo5jIjTSoq+GcVO6Yc2TjIPYABC5RMWS6o8ZAcyEag2A4wEEmQrtxACAewXaKap3dce7n2IkxAaAyOWmtdeOHrO17zjYiKjgZACHMxUC8Bwg3apIBUsk0Tm7s4+REBsAIg+LLI0cAsOIQCSiihoAezEVP9CtgNyvgpSqpnobk2uZCbEBIPKpWYtmlW0ZNXii2BKByAmAHgXAZDKekAXwKIB7oEj1jym/+8G6jq2MhdgAENF/OG7JyWODgYHpgHGCQE+AYip4/YBbDChkrajeDeDeATt4//3z7tzMWIjYABDttlBvKCDPBz9mQo+DyHR9uyE4nJ8hR3gFwFoV3GeI3J+1Bv6QiWcGGAsRGwCivAgvDu+vpebRAjlKgCOhOEqBQ/m5yhsF8LQIHlOVR6H6KLLZR3mvfSI2AERFV7O8pnzY1iNU8QkFPgHVjwvwCQAfYDq7var/K6CPQ4zHRfDXrcOlf+RWPhEbACJXid0YmzAUsA8XNT8CsQ8VYAoghwowRYG9fRrLegDPCPC0DX1GBE+rhaeGgiVP8J76RGwAiPzRHAgOFEMnicgkURyoIgcAehAE+0LxAQDjXHZYGxX4hwCvA/KCCl4U4EXAfgEwXhgMmC+yyBOxASCi91FzbU1w6wTsW2JnP5C1zP1M6HgV7K3Q8QaM8QodL4JxqhgPICBAuQ0EBVIG6BgBSv/5txQYDWDUe15iQICt7/o3Q4BsUWi/AQwq0AcgK4KNqtgkkI027I0ixgaxdaMF2QixX9WA+ero9Xi9c2HnIEeNiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiNzm/wEKk9dAT9vCwgAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAyMi0wMy0xOFQwMjowNDoyMCswMDowMF69b5sAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMjItMDMtMThUMDI6MDQ6MjArMDA6MDAv4NcnAAAAAElFTkSuQmCC"
+
+def __getattr__(name):
+    if (name in _ASSETS):
+        import assets
+        return getattr(assets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,131 @@
+""" Bulk generation of exercise banks on a process pool, without duplicates.
+
+Usage: python corpus.py bank.jsonl --count N [--difficulty 1 2 3] [--workers N] [--seed N]
+                         [--format jsonl|bank]
+
+Each task generates a chunk of exercises with its own random.Random, seeded from --seed
+and the task number, so a run is reproducible for a given seed and chunk size. Exercises
+are deduplicated by fingerprint.fingerprint, so no two are equivalent up to a renaming of
+variables, and written as JSON lines:
+
+    {"formula": ..., "english": ..., "difficulty": ..., "num_vars": ..., "models": ...,
+     "fingerprint": "k:hex"}
+
+where models is the number of valuations that make the formula true. Exercises with
+more than fingerprint.max_vars variables have a null fingerprint; they are deduplicated
+by logical equivalence with a BDD, without renaming.
+
+With --format bank, the formulas and English sentences are written instead as a
+postfix.Bank, which is read back zero-copy through mmap.
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count as counter
+from typing import Iterator, Sequence
+
+from bdd import BDD
+from exercise import Exercise
+from fingerprint import fingerprint, max_vars
+from postfix import write_bank
+from syntax import Formula
+
+
+def generate_chunk(seed: str, difficulty: int, size: int) -> list[dict]:
+    """ Generate @size exercises of a difficulty from an RNG seeded with @seed """
+    rng = random.Random(seed)
+    records = []
+    for _ in range(size):
+        exercise = Exercise(difficulty, rng=rng)
+        num_vars = len(exercise.formula.variables())
+        key = None
+        if (num_vars <= max_vars):
+            k, table = fingerprint(exercise.formula)
+            key = f"{k}:{table:x}"
+        records.append({'formula': str(exercise.formula), 'english': str(exercise),
+                        'difficulty': difficulty, 'num_vars': num_vars, 'models': exercise.models(),
+                        'fingerprint': key})
+    return records
+
+
+def generate_corpus(count: int, difficulties: Sequence[int] = (1, 2, 3), workers: int = None,
+                    seed: int = 0, chunk_size: int = 256) -> Iterator[dict]:
+    """ Yield up to @count exercises with distinct fingerprints, spread over the difficulties.
+
+    Stops early once a full round of chunks for every difficulty finds nothing new, since
+    small difficulties only have a few distinct formulas.
+    """
+    workers = workers or os.cpu_count()
+    seen = set()
+    # Exercises too large to fingerprint are told apart by their node in one BDD, which is
+    # the same for logically equivalent formulas
+    manager = BDD()
+    produced = 0
+    tasks = counter()
+    # Difficulties that still produce new exercises, and how many chunks in a row did not
+    stale = {difficulty: 0 for difficulty in difficulties}
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        while produced < count and stale:
+            while len(pending) < 4 * workers:
+                task = next(tasks)
+                difficulty = list(stale)[task % len(stale)]
+                pending.append((difficulty, pool.submit(generate_chunk, f"{seed}/{task}",
+                                                        difficulty, chunk_size)))
+            difficulty, future = pending.popleft()
+            new = 0
+            for record in future.result():
+                key = record['fingerprint']
+                if (key is None):
+                    key = manager.from_formula(Formula.parse(record['formula']))
+                if (produced < count and key not in seen):
+                    seen.add(key)
+                    produced += 1
+                    new += 1
+                    yield record
+            if (difficulty in stale):
+                stale[difficulty] = 0 if new else stale[difficulty] + 1
+                if (stale[difficulty] > 4 * workers):
+                    del stale[difficulty]
+        for _, future in pending:
+            future.cancel()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a bank of distinct exercises")
+    parser.add_argument('output', help="File to write, '-' for stdout (JSON lines only)")
+    parser.add_argument('--count', type=int, required=True, help="Number of exercises")
+    parser.add_argument('--difficulty', type=int, nargs='+', default=[1, 2, 3])
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=256, help="Exercises per task")
+    parser.add_argument('--format', choices=['jsonl', 'bank'], default='jsonl',
+                        help="JSON lines, or a postfix.Bank of formulas with their English sentences")
+    args = parser.parse_args(argv)
+    if (args.format == 'bank' and args.output == '-'):
+        parser.error("a bank must be written to a file")
+
+    start = time.perf_counter()
+    records = generate_corpus(args.count, args.difficulty, args.workers, args.seed, args.chunk_size)
+    if (args.format == 'bank'):
+        written = write_bank(args.output, ((Formula.parse(record['formula']), record['english'])
+                                           for record in records), capacity=args.count)
+    else:
+        written = 0
+        sink = contextlib.nullcontext(sys.stdout) if args.output == '-' else open(args.output, 'w')
+        with sink as outfile:
+            for record in records:
+                outfile.write(json.dumps(record) + '\n')
+                written += 1
+    elapsed = time.perf_counter() - start
+    print(f"{written} exercises in {elapsed:.2f}s ({written / elapsed:.0f}/s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+""" Model counting (#SAT), tautology and contradiction checks
+
+count_models() works bottom-up over the formula: the operands of a connective that share
+no variables are independent, so its count follows from theirs (formulas made by
+Formula.generate_formula are counted this way entirely). Each maximal subformula whose
+operands share variables is counted from its truth table if it has at most table_vars
+variables, and otherwise from its node in a BDD shared by the subformulas of the formula.
+Formulas with at most table_vars variables in all are counted from their truth table.
+
+is_tautology() and is_contradiction() use the counts when the formula decomposes
+completely, and the truth table or the SAT solver otherwise.
+"""
+from typing import Callable, Optional, Sequence
+
+from bdd import BDD
+from sat import Solver, tseitin
+from semantics import truth_table
+from syntax import Connective, Formula
+
+# Up to about this many variables a truth table is as fast as a BDD, and its time does
+# not depend on the shape of the formula
+table_vars = 18
+
+def _combine(node: Formula, left: int, right: int, l: int, r: int) -> int:
+    """ Return the models of a node over its variables from the counts of its children,
+    over their @l and @r variables, which they do not share
+    """
+    n = l + r
+    if (node.val == Connective.NOT):
+        return (1 << l) - left
+    # Models of the negations of the children
+    not_left, not_right = (1 << l) - left, (1 << r) - right
+    match node.val:
+        case Connective.AND:
+            return left * right
+        case Connective.OR:
+            return (1 << n) - not_left * not_right
+        case Connective.IMPLIES:
+            return (1 << n) - left * not_right
+        case Connective.IFF:
+            return left * right + not_left * not_right
+
+
+def _decomposed_count(formula: Formula, count_rest: Callable[[Formula], Optional[int]]) -> Optional[int]:
+    """ Count the models of a formula over its variables, combining the counts of operands
+    that share no variables.
+
+    The maximal subformulas whose operands do share variables are counted by
+    @count_rest, once each; if it returns None, so does this function.
+    """
+    # Number of parents of each node: the variable set of a child with a single parent is
+    # extended in place by its parent, merging the smaller set into the larger
+    parents: dict[int, int] = {}
+    for node in formula.postorder():
+        for child in (node.left, node.right):
+            if (child is not None):
+                parents[id(child)] = parents.get(id(child), 0) + 1
+
+    def owned(child: Formula, variables: set) -> set:
+        return variables if parents[id(child)] == 1 else set(variables)
+
+    # First pass, bottom-up: (whether the operands share variables, number of variables,
+    # variables) for each node; the set may grow later, the number is the node's own
+    def scan(node: Formula, left: Optional[tuple], right: Optional[tuple]) -> tuple[bool, int, set]:
+        if (node.left is None):
+            variables = {node.val} if node.is_var else set()
+            return False, len(variables), variables
+        if (node.right is None):
+            return False, left[1], owned(node.left, left[2])
+        shared = not left[2].isdisjoint(right[2])
+        big, small = (left, right) if left[1] >= right[1] else (right, left)
+        variables = owned(node.left if big is left else node.right, big[2])
+        variables.update(small[2])
+        return shared, len(variables), variables
+
+    scanned = {}
+    formula.fold(scan, scanned)
+
+    # Second pass, top-down: nodes below a node whose operands share variables are left to
+    # count_rest; the others are counted from their children, which share no variables
+    order, stack = [], [formula]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if (isinstance(node.val, Connective) and not scanned[id(node)][0]):
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+    counts: dict[int, int] = {}
+    for node in reversed(order):
+        if (not isinstance(node.val, Connective)):
+            count = 0 if node.val == 'F' else 1
+        elif (scanned[id(node)][0]):
+            count = count_rest(node)
+            if (count is None):
+                return None
+        elif (node.val == Connective.NOT):
+            count = (1 << scanned[id(node.left)][1]) - counts[id(node.left)]
+        else:
+            count = _combine(node, counts[id(node.left)], counts[id(node.right)],
+                             scanned[id(node.left)][1], scanned[id(node.right)][1])
+        counts[id(node)] = count
+    return counts[id(formula)]
+
+
+def _subformula_counter(formula: Formula) -> Callable[[Formula], int]:
+    """ Return a function counting subformulas of @formula over their own variables, by
+    truth table up to table_vars variables and with a BDD shared between them above
+    """
+    manager = BDD(formula.sorted_variables())
+
+    def count(subformula: Formula) -> int:
+        vars = subformula.sorted_variables()
+        if (len(vars) <= table_vars):
+            return truth_table(subformula, vars).bit_count()
+        return manager.count(manager.from_formula(subformula), vars)
+
+    return count
+
+
+def count_models(formula: Formula, vars: Optional[Sequence[str]] = None) -> int:
+    """ Return the number of valuations of @vars (the formula's variables by default)
+    under which the formula is true
+    """
+    vars = formula.sorted_variables() if vars is None else tuple(vars)
+    missing = formula.variables() - set(vars)
+    if (missing):
+        raise Exception(f"No valuation for {min(missing)} in {list(vars)}")
+    extra = len(vars) - len(formula.variables())
+    if (len(vars) <= table_vars):
+        return truth_table(formula, vars).bit_count()
+    return _decomposed_count(formula, _subformula_counter(formula)) << extra
+
+
+def _satisfiable(formula: Formula) -> bool:
+    solver = Solver()
+    return solver.add_clause([tseitin(formula, solver, {})]) and solver.solve()
+
+
+def is_contradiction(formula: Formula) -> bool:
+    """ Return True if no valuation makes the formula true """
+    count = _decomposed_count(formula, lambda subformula: None)
+    if (count is not None):
+        return count == 0
+    if (len(formula.variables()) <= table_vars):
+        return truth_table(formula, formula.sorted_variables()) == 0
+    return not _satisfiable(formula)
+
+
+def is_tautology(formula: Formula) -> bool:
+    """ Return True if every valuation makes the formula true """
+    n = len(formula.variables())
+    count = _decomposed_count(formula, lambda subformula: None)
+    if (count is not None):
+        return count == 1 << n
+    if (n <= table_vars):
+        return truth_table(formula, formula.sorted_variables()) == (1 << (1 << n)) - 1
+    return not _satisfiable(Formula(Connective.NOT, formula))
@@ -1,6 +1,20 @@
 from syntax import Formula, Connective
-from semantics import truth_values, all_valuations
+from semantics import (Cancelled, evaluate, gray_truth_values, row_valuation, truth_table,
+                       truth_table_blocks, Valuation)
+from sat import find_difference
+from normal_forms import minimal_dnf
+from counting import count_models
+from typing import Optional
+from queue import Empty, Full, Queue
 import random
+import threading
+import time
+
+import instrument
+
+# Shared by all exercises, so creating one allocates nothing for instrumentation
+_generate_timer = instrument.timed('exercise.generate')
+_load_timer = instrument.timed('exercise.load')
 
 
 class Proposition:
@@ -16,60 +30,221 @@ class Proposition:
 
 class Exercise:
 
+    # Answers to exercises with more variables than this are checked with the SAT solver
+    sat_threshold = 16
+    # Truth-table backend for smaller exercises: 'bitwise' (2**block_bits rows at a time)
+    # or 'gray' (row by row in Gray-code order); both stop at the first difference
+    engine = 'bitwise'
+    block_bits = 12
+    # Minimal DNFs are shown as a short solution for exercises with at most this many variables
+    short_solution_vars = 6
+
     nouns = ['Water', 'Bread', 'Pizza', 'Celery', 'Pasta', "Soda", 'Cheese', 'Milk', 'Chocolate',
              'Tea', 'Coffee', 'Sugar', 'Salt']
     adjs = ['Red', 'Green', 'Blue', 'Yellow', 'Orange', 'Purple', 'Violet', 'Hot',
             'Cold', 'Warm', 'Tasty', 'Bland', 'Spicy', 'Sour', "Sweet", "Salty", "Mild"]
 
-    def __init__(self, difficulty=2, formula_str=None, english_repr=None) -> None:
+    def __init__(self, difficulty=2, formula_str=None, english_repr=None, rng: random.Random = None) -> None:
 
-        self.formula = Formula.generate_formula(
-            difficulty) if formula_str is None else Formula.parse(formula_str)
-        self.english_repr = english_repr
-        if (english_repr is None):
-            self.var_map = self._generate_mapping()
+        with (_generate_timer if formula_str is None else _load_timer):
+            self.formula = Formula.generate_formula(
+                difficulty, rng) if formula_str is None else Formula.parse(formula_str)
+            self.english_repr = english_repr
+            # Saved exercises carry their own English sentence and have no var_map
+            self.var_map = self._generate_mapping(rng) if english_repr is None else None
+        # Packed truth table of self.formula, computed on first use by solution_table()
+        self._solution_table = None
+        # English rendering, computed on first use by __str__
+        self._english = None
+        # Minimal DNF, computed on first use by short_solution()
+        self._short_solution = None
+        # Number of valuations that make the formula true, computed on first use by models()
+        self._models = None
 
     def __str__(self):
         if (self.english_repr is not None):
             return self.english_repr
-        parsed_formula = self._parse_formula(self.formula)
+        if (self._english is None):
+            parsed_formula = self._parse_formula(self.formula)
+
+            if (parsed_formula[0] == '(' and parsed_formula[-1] == ')'):
+                parsed_formula = parsed_formula[1:-1]
+            self._english = parsed_formula
+        return self._english
+
+    def prepare(self) -> 'Exercise':
+        """ Render the English sentence and compute the solution truth table and short
+        solution ahead of use
+        """
+        str(self)
+        self.solution_table()
+        self.short_solution()
+        return self
 
-        if (parsed_formula[0] == '(' and parsed_formula[-1] == ')'):
-            parsed_formula = parsed_formula[1:-1]
-        return parsed_formula
+    def short_solution(self) -> Optional[Formula]:
+        """ Return a minimal DNF of the formula if it is shorter than the formula, else None.
+        Only computed for exercises with at most short_solution_vars variables
+        """
+        if (self._short_solution is None):
+            short = None
+            if (len(self.formula.variables()) <= Exercise.short_solution_vars):
+                short = minimal_dnf(self.formula)
+                if (len(str(short)) >= len(str(self.formula))):
+                    short = None
+            # False marks "computed, nothing shorter"
+            self._short_solution = short or False
+        return self._short_solution or None
+
+    def models(self) -> int:
+        """ Return the number of valuations of the formula's variables that make it true """
+        if (self._models is None):
+            self._models = count_models(self.formula)
+        return self._models
 
     def _parse_formula(self, formula: Formula) -> str:
-        if isinstance(formula.val, Connective):
-            l = self._parse_formula(formula.left)
-            if formula.val == Connective.NOT:
-                return f"({l} is false)"
-            r = self._parse_formula(formula.right)
-            match formula.val:
-                case Connective.AND:
-                    return f"({l} and {r})"
-                case Connective.OR:
-                    return f"({l} or {r})"
-                case Connective.IMPLIES:
-                    return f"(If {l}, then {r})"
-                case Connective.IFF:
-                    return f"({l} if and only if {r})"
-        elif formula.val is not None:
-            return f"'{str(self.var_map[formula.val])}'"
-        else:
-            return
+        return "".join(formula.walk(self._english_parts))
+
+    def _english_parts(self, formula: Formula) -> tuple:
+        match formula.val:
+            case Connective.NOT:
+                return ("(", formula.left, " is false)")
+            case Connective.AND:
+                return ("(", formula.left, " and ", formula.right, ")")
+            case Connective.OR:
+                return ("(", formula.left, " or ", formula.right, ")")
+            case Connective.IMPLIES:
+                return ("(If ", formula.left, ", then ", formula.right, ")")
+            case Connective.IFF:
+                return ("(", formula.left, " if and only if ", formula.right, ")")
+        return (f"'{str(self.var_map[formula.val])}'",)
 
-    def _generate_mapping(self,):
-        vars = self.formula.variables()
+    def _generate_mapping(self, rng: random.Random = None):
+        rng = random if rng is None else rng
+        vars = self.formula.sorted_variables()
         var_map = {}
-        for var, noun, adj in zip(vars, random.sample(Exercise.nouns, len(vars)),
-                                  random.sample(Exercise.adjs, len(vars))):
-            var_map[var] = Proposition(noun, adj)
+        if (len(vars) <= min(len(Exercise.nouns), len(Exercise.adjs))):
+            for var, noun, adj in zip(vars, rng.sample(Exercise.nouns, len(vars)),
+                                      rng.sample(Exercise.adjs, len(vars))):
+                var_map[var] = Proposition(noun, adj)
+            return var_map
+        # Too many variables for distinct nouns and adjectives: use distinct (noun, adjective)
+        # pairs, numbering the nouns once those run out too
+        pairs = len(Exercise.nouns) * len(Exercise.adjs)
+        order = rng.sample(range(pairs), min(pairs, len(vars)))
+        for i, var in enumerate(vars):
+            noun, adj = divmod(order[i % pairs], len(Exercise.adjs))
+            number = f" {i // pairs + 1}" if len(vars) > pairs else ""
+            var_map[var] = Proposition(Exercise.nouns[noun] + number, Exercise.adjs[adj])
         return var_map
 
-    def check_answer(self, answer: str) -> bool:
-        """ Check that the formula str is logically equivalent to self.formula under all valuations """
-        formula = Formula.parse(answer)
-        valuations = list(all_valuations(self.formula.variables()))
-        if (truth_values(formula, valuations) == truth_values(self.formula, valuations)):
-            return True
-        return False
+    def solution_table(self) -> int:
+        """ Return the packed truth table of self.formula over its sorted variables """
+        if (self._solution_table is None):
+            # The exercise formula is graded repeatedly, so compile it once
+            self.formula.compile()
+            self._solution_table = truth_table(self.formula, self.formula.sorted_variables())
+        return self._solution_table
+
+    def check_answer(self, answer: str, cancel: threading.Event = None) -> bool:
+        """ Check that the formula str is logically equivalent to self.formula under all valuations.
+        Raise Cancelled if @cancel is set before the check finishes.
+        """
+        return self.counterexample(answer, cancel) is None
+
+    def counterexample(self, answer: str, cancel: threading.Event = None) -> Optional[Valuation]:
+        """ Return a valuation under which the formula str and self.formula differ,
+        or None if they are logically equivalent.
+
+        Exercises with at most sat_threshold variables are compared by truth table using
+        the backend named by Exercise.engine, larger ones with the SAT solver.
+        Long checks poll @cancel and raise Cancelled once it is set.
+        """
+        if (not instrument.enabled):
+            return self._counterexample(answer, cancel)
+        start = time.perf_counter()
+        try:
+            return self._counterexample(answer, cancel)
+        finally:
+            instrument.observe(f'check_answer.{len(self.formula.variables())}_vars',
+                               time.perf_counter() - start)
+
+    def _counterexample(self, answer: str, cancel: threading.Event = None) -> Optional[Valuation]:
+        # Answers may only use the exercise's variables
+        formula = Formula.parse(answer, self.formula.variables())
+        vars = self.formula.sorted_variables()
+        if (len(vars) > Exercise.sat_threshold):
+            return find_difference(formula, self.formula, vars,
+                                   None if cancel is None else cancel.is_set)
+        if (Exercise.engine == 'gray'):
+            rows = zip(gray_truth_values(formula, vars), gray_truth_values(self.formula, vars))
+            for step, ((row, value), (_, expected)) in enumerate(rows):
+                if (value != expected):
+                    return row_valuation(vars, row)
+                if (cancel is not None and step % 4096 == 0 and cancel.is_set()):
+                    raise Cancelled("Answer check cancelled")
+            return None
+        # Compare 2**block_bits rows at a time, so a wrong answer stops at the first block
+        # that differs from the solution
+        solution = self.solution_table()
+        if (len(vars) <= Exercise.block_bits):
+            blocks = [(0, 1 << len(vars), truth_table(formula, vars))]
+        else:
+            blocks = truth_table_blocks(formula, vars, block_bits=Exercise.block_bits)
+        for first, rows, column in blocks:
+            difference = column ^ ((solution >> first) & ((1 << rows) - 1))
+            if (difference):
+                return row_valuation(vars, first + (difference & -difference).bit_length() - 1)
+            if (cancel is not None and cancel.is_set()):
+                raise Cancelled("Answer check cancelled")
+        return None
+
+    def explain(self, answer: str, valuation: Valuation) -> str:
+        """ Describe how the answer differs from the sentence under a valuation returned by
+        counterexample(), in terms of the exercise's propositions when it has a var_map
+        """
+        described = []
+        for var in self.formula.sorted_variables():
+            value = valuation[var]
+            if (self.var_map is not None):
+                proposition = self.var_map[var]
+                described.append(f"{proposition.noun} is {'' if value else 'not '}{proposition.adjective}")
+            else:
+                described.append(f"{var} is {'true' if value else 'false'}")
+        if (len(described) > 1):
+            described[-2:] = [f"{described[-2]} and {described[-1]}"]
+        answer_value = evaluate(Formula.parse(answer, self.formula.variables()), valuation)
+        return (f"When {', '.join(described)}, your answer is {'true' if answer_value else 'false'} "
+                f"but the sentence is {'false' if answer_value else 'true'}")
+
+
+class ExercisePool:
+    """ Bounded queues of prepared Exercises per difficulty, refilled by background threads """
+
+    def __init__(self, difficulties=(1, 2, 3), size: int = 15) -> None:
+        self.queues = {difficulty: Queue(maxsize=size) for difficulty in difficulties}
+        self._stop = threading.Event()
+        for difficulty, queue in self.queues.items():
+            threading.Thread(target=self._fill, args=(difficulty, queue),
+                             name=f"ExercisePool-{difficulty}", daemon=True).start()
+
+    def _fill(self, difficulty: int, queue: Queue) -> None:
+        while not self._stop.is_set():
+            exercise = Exercise(difficulty).prepare()
+            # Block while the queue is full, waking up regularly to notice close()
+            while not self._stop.is_set():
+                try:
+                    queue.put(exercise, timeout=0.5)
+                    break
+                except Full:
+                    continue
+
+    def get(self, difficulty: int) -> Exercise:
+        """ Return a prepared exercise, generating one directly if none is ready """
+        try:
+            return self.queues[difficulty].get_nowait()
+        except (Empty, KeyError):
+            return Exercise(difficulty).prepare()
+
+    def close(self) -> None:
+        """ Stop the background threads """
+        self._stop.set()
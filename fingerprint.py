@@ -0,0 +1,225 @@
+""" Canonical truth-table fingerprints of formulas, invariant under renaming of variables
+
+Two formulas have the same fingerprint iff they are logically equivalent up to a
+permutation of their variables (for example (p&q) and (r&p)). Variables the formula
+does not depend on (such as q in (p|(q&~q))) are left out first.
+
+The fingerprint is (k, table) where k is the number of variables the formula depends on
+and table is the smallest packed truth table (see semantics.truth_table) over all orders
+of those variables. Orders are only tried among variables that no order-independent
+signature tells apart, and variables that can be swapped without changing the table
+are never reordered. If more than max_orders orders remain, ties are broken by name,
+and then renamed copies of a formula may get different fingerprints.
+
+Truth tables have 2**n rows, so formulas with more than max_vars variables have no
+fingerprint; FingerprintIndex keys them by their node in a shared BDD instead.
+"""
+from functools import lru_cache
+from itertools import product
+from math import factorial, prod
+from typing import Hashable, Optional
+
+from bdd import BDD
+from semantics import evaluate_columns, variable_masks
+from syntax import Formula
+
+Fingerprint = tuple[int, int]
+TableKey = tuple[tuple[str, ...], int]
+
+max_orders = 720
+max_vars = 16
+
+
+def _check_size(formula: Formula) -> None:
+    if (len(formula.variables()) > max_vars):
+        raise Exception(f"Too many variables to fingerprint ({len(formula.variables())} > {max_vars})")
+
+
+def support(formula: Formula) -> tuple[str, ...]:
+    """ Return the sorted variables whose value can change the value of the formula.
+    Raise an Exception if it has more than max_vars variables
+    """
+    _check_size(formula)
+    vars = formula.sorted_variables()
+    masks = variable_masks(vars)
+    all_rows = (1 << (1 << len(vars))) - 1
+    table = evaluate_columns(formula, masks, all_rows)
+    relevant = []
+    for i, var in enumerate(vars):
+        # Rows where var is true are 2**(n-1-i) rows after the matching rows where it is false
+        shift = 1 << (len(vars) - 1 - i)
+        if (((table & masks[var]) >> shift) != (table & ~masks[var] & all_rows)):
+            relevant.append(var)
+    return tuple(relevant)
+
+
+def _table(formula: Formula, order, irrelevant) -> int:
+    masks = variable_masks(order)
+    masks.update(dict.fromkeys(irrelevant, 0))
+    return evaluate_columns(formula, masks, (1 << (1 << len(order))) - 1)
+
+
+def _signatures(table: int, vars: tuple[str, ...]) -> dict[str, tuple]:
+    """ Return a value per variable that does not depend on the variable order: how many true
+    rows have the variable true, how many rows change value when it is flipped, refined
+    twice with the same for the variables it is paired with
+    """
+    masks = variable_masks(vars)
+    all_rows = (1 << (1 << len(vars))) - 1
+    signatures = {}
+    for i, var in enumerate(vars):
+        shift = 1 << (len(vars) - 1 - i)
+        mask = masks[var]
+        flipped = ((table & mask) >> shift) | ((table & ~mask & all_rows) << shift)
+        signatures[var] = ((table & mask).bit_count(), (table ^ flipped).bit_count())
+    for _ in range(2):
+        signatures = {var: (signatures[var],
+                            tuple(sorted((signatures[other], (table & masks[var] & masks[other]).bit_count())
+                                         for other in vars if other != var)))
+                      for var in vars}
+    return signatures
+
+
+def _symmetric(table: int, masks: dict[str, int], shifts: dict[str, int], var: str, other: str) -> bool:
+    """ Return True if swapping two variables leaves the table unchanged """
+    if (shifts[var] < shifts[other]):
+        var, other = other, var
+    only_var = table & masks[var] & ~masks[other]
+    return only_var >> (shifts[var] - shifts[other]) == table & masks[other] & ~masks[var]
+
+
+def _arrangements(classes: list[list[str]]):
+    """ Yield each distinct order of the variables of a group, treating the variables of
+    each class as interchangeable (they are filled in in name order)
+    """
+    counts = [len(members) for members in classes]
+    total = sum(counts)
+    labels: list[int] = []
+
+    def arrange():
+        if (len(labels) == total):
+            used = [0] * len(classes)
+            order = []
+            for label in labels:
+                order.append(classes[label][used[label]])
+                used[label] += 1
+            yield order
+            return
+        for label, count in enumerate(counts):
+            if (count):
+                counts[label] -= 1
+                labels.append(label)
+                yield from arrange()
+                labels.pop()
+                counts[label] += 1
+    return arrange()
+
+
+def fingerprint(formula: Formula) -> Fingerprint:
+    """ Return the canonical (number of variables, truth table) of the formula.
+    Raise an Exception if it has more than max_vars variables
+    """
+    return keys(formula)[0]
+
+
+def table_key(formula: Formula) -> TableKey:
+    """ Return (relevant variables, truth table over them): equal iff the formulas are
+    logically equivalent, with the same variable names.
+    Raise an Exception if the formula has more than max_vars variables
+    """
+    return keys(formula)[1]
+
+
+@lru_cache(maxsize=256)
+def keys(formula: Formula) -> tuple[Fingerprint, TableKey]:
+    """ Return (fingerprint, table_key) of the formula, sharing the work of the two.
+    Cached, so looking up a formula and then adding it to an index computes them once
+    """
+    # The formula is folded once per order tried, so cache its node order
+    formula.postorder()
+    vars = support(formula)
+    irrelevant = formula.variables() - set(vars)
+    table = _table(formula, vars, irrelevant)
+    signatures = _signatures(table, vars)
+    # Only variables with equal signatures need to be permuted, and then only those that
+    # cannot be swapped without changing the table
+    classes: dict[tuple, list[str]] = {}
+    for var in vars:
+        classes.setdefault(signatures[var], []).append(var)
+    masks = variable_masks(vars)
+    shifts = {var: 1 << (len(vars) - 1 - i) for i, var in enumerate(vars)}
+    groups, orders = [], 1
+    for key in sorted(classes):
+        symmetric: list[list[str]] = []
+        for var in classes[key]:
+            for members in symmetric:
+                if (_symmetric(table, masks, shifts, members[0], var)):
+                    members.append(var)
+                    break
+            else:
+                symmetric.append([var])
+        groups.append(symmetric)
+        orders *= factorial(len(classes[key])) // prod(factorial(len(members)) for members in symmetric)
+    if (orders > max_orders):
+        canonical = _table(formula, [var for group in groups for members in group for var in members],
+                           irrelevant)
+    else:
+        canonical = min(_table(formula, [var for part in parts for var in part], irrelevant)
+                        for parts in product(*(_arrangements(group) for group in groups)))
+    return (len(vars), canonical), (vars, table)
+
+
+class FingerprintIndex:
+    """ Ids of formulas by fingerprint and by table_key, updated as formulas are added and removed.
+
+    Formulas with more than max_vars variables are keyed by their node in a BDD shared by
+    the index, which is canonical for logical equivalence, and are only matched with each
+    other. They have no fingerprint, so their duplicates are the formulas equivalent to
+    them with the same variable names.
+    """
+
+    def __init__(self) -> None:
+        self._by_fingerprint: dict[Fingerprint, set[int]] = {}
+        self._by_table: dict[Hashable, set[int]] = {}
+        self._keys: dict[int, tuple] = {}
+        self._bdd = BDD()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self, formula: Formula) -> tuple[Optional[Fingerprint], Hashable]:
+        """ Return (fingerprint, equivalence key) of a formula: keys() for formulas with at
+        most max_vars variables, (None, BDD node) for larger ones
+        """
+        if (len(formula.variables()) > max_vars):
+            return None, self._bdd.from_formula(formula)
+        return keys(formula)
+
+    def add(self, id: int, formula: Formula) -> None:
+        self.remove(id)
+        self._keys[id] = self.keys(formula)
+        fingerprint, key = self._keys[id]
+        if (fingerprint is not None):
+            self._by_fingerprint.setdefault(fingerprint, set()).add(id)
+        self._by_table.setdefault(key, set()).add(id)
+
+    def remove(self, id: int) -> None:
+        keys = self._keys.pop(id, None)
+        if (keys is None):
+            return
+        for index, key in zip((self._by_fingerprint, self._by_table), keys):
+            if (key is not None):
+                index[key].discard(id)
+                if (not index[key]):
+                    del index[key]
+
+    def duplicates(self, formula: Formula) -> set[int]:
+        """ Return the ids of formulas equivalent to @formula up to a renaming of variables """
+        fingerprint, key = self.keys(formula)
+        if (fingerprint is None):
+            return self.equivalent(formula)
+        return set(self._by_fingerprint.get(fingerprint, ()))
+
+    def equivalent(self, formula: Formula) -> set[int]:
+        """ Return the ids of formulas logically equivalent to @formula """
+        return set(self._by_table.get(self.keys(formula)[1], ()))
@@ -0,0 +1,122 @@
+""" Headless batch grading of (exercise formula, answer) submissions.
+
+Usage: python grade.py submissions.jsonl [-o results.jsonl] [--workers N] [--chunk-size N]
+
+Input is JSON lines or CSV (chosen by extension or --format) with "formula" and "answer"
+fields and an optional "id". One JSON result per submission is written in input order,
+and throughput and latency statistics are printed to stderr.
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator
+
+from exercise import Exercise
+
+
+@lru_cache(maxsize=4096)
+def _exercise(formula: str) -> Exercise:
+    """ Parse an exercise once per worker process; its truth table is cached on the Exercise """
+    return Exercise(formula_str=formula, english_repr=formula)
+
+
+def grade(submission: dict) -> dict:
+    """ Grade one submission and return its result record """
+    result = {key: submission[key] for key in ('id', 'formula', 'answer') if key in submission}
+    start = time.perf_counter()
+    try:
+        counterexample = _exercise(submission['formula']).counterexample(submission['answer'])
+        result['correct'] = counterexample is None
+        if (counterexample is not None):
+            result['counterexample'] = counterexample
+    except Exception as e:
+        result['correct'] = False
+        result['error'] = str(e)
+    result['latency'] = time.perf_counter() - start
+    return result
+
+
+def grade_chunk(chunk: list[dict]) -> list[dict]:
+    return [grade(submission) for submission in chunk]
+
+
+def read_submissions(path: str, format: str = None) -> Iterator[dict]:
+    """ Stream submissions from a JSON lines or CSV file ('-' for stdin) """
+    format = format or ('csv' if path.endswith('.csv') else 'jsonl')
+    # The standard streams are not ours to close
+    source = contextlib.nullcontext(sys.stdin) if path == '-' else open(path, newline='')
+    with source as infile:
+        if (format == 'csv'):
+            yield from csv.DictReader(infile)
+        else:
+            for line in infile:
+                if (line.strip()):
+                    yield json.loads(line)
+
+
+def grade_stream(submissions: Iterable[dict], workers: int = None,
+                 chunk_size: int = 512) -> Iterator[dict]:
+    """ Grade submissions on a process pool and yield results in input order.
+
+    At most a few chunks per worker are in flight, so memory stays bounded however long
+    the input is.
+    """
+    workers = workers or os.cpu_count()
+    submissions = iter(submissions)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 4 * workers:
+                chunk = list(islice(submissions, chunk_size))
+                if (not chunk):
+                    break
+                pending.append(pool.submit(grade_chunk, chunk))
+            if (not pending):
+                return
+            yield from pending.popleft().result()
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Grade a batch of answers offline")
+    parser.add_argument('input', help="JSON lines or CSV file of submissions, '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="JSON lines file for results")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], help="Input format")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes")
+    parser.add_argument('--chunk-size', type=int, default=512, help="Submissions per task")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    latencies = []
+    correct = 0
+    sink = contextlib.nullcontext(sys.stdout) if args.output == '-' else open(args.output, 'w')
+    with sink as outfile:
+        for result in grade_stream(read_submissions(args.input, args.format),
+                                   args.workers, args.chunk_size):
+            latencies.append(result['latency'])
+            correct += result['correct']
+            outfile.write(json.dumps(result) + '\n')
+    elapsed = time.perf_counter() - start
+
+    if (latencies):
+        latencies.sort()
+        print(f"Graded {len(latencies)} submissions ({correct} correct) in {elapsed:.2f}s, "
+              f"{len(latencies) / elapsed:.0f}/s", file=sys.stderr)
+        print("Latency (ms): " + ", ".join(f"p{int(q * 100)} {percentile(latencies, q) * 1000:.3f}"
+                                           for q in (0.5, 0.9, 0.99)) +
+              f", max {latencies[-1] * 1000:.3f}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
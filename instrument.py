@@ -0,0 +1,147 @@
+""" Opt-in counters and timing histograms for the hot paths of syntax, semantics and exercise.
+
+Instrumented code checks the module-level `enabled` flag before recording anything, so
+the cost while disabled is one attribute lookup per hook:
+
+    import instrument
+    instrument.enable()
+    with instrument.timed('grading'):
+        exercise.check_answer(answer)
+    print(instrument.to_json())
+"""
+import json
+import threading
+import time
+from functools import wraps
+from typing import Callable, Optional
+
+enabled = False
+
+_lock = threading.Lock()
+_counters: dict[str, int] = {}
+_histograms: dict[str, 'Histogram'] = {}
+
+
+class Histogram:
+    """ Count, sum, min and max of observed values, with power-of-two buckets.
+
+    Bucket k holds the values v with 2**(k-1) <= v * 1e6 < 2**k, so for timings the
+    buckets are in microseconds.
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.buckets: dict[int, int] = {}
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        bucket = int(value * 1e6).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {'count': self.count, 'total': self.total, 'mean': self.total / self.count if self.count else 0,
+                'min': self.min, 'max': self.max,
+                'buckets_us': {f"<{1 << k}": n for k, n in sorted(self.buckets.items())}}
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def disable() -> None:
+    enable(False)
+
+
+def reset() -> None:
+    """ Discard all recorded counters and histograms """
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def count(name: str, n: int = 1) -> None:
+    """ Add @n to a counter """
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name: str, value: float) -> None:
+    """ Record a value (usually seconds) in a histogram """
+    with _lock:
+        histogram = _histograms.get(name)
+        if (histogram is None):
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(value)
+
+
+class timed:
+    """ Record the wall-clock time of a block or of each call to a function in a histogram.
+
+    Usable as `with timed('name'):` or as the decorator `@timed('name')`.
+    Nothing is recorded while instrumentation is disabled.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._starts = threading.local()
+
+    def __enter__(self) -> 'timed':
+        if (enabled):
+            self._starts.__dict__.setdefault('stack', []).append(time.perf_counter())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        stack = self._starts.__dict__.get('stack')
+        if (stack):
+            observe(self.name, time.perf_counter() - stack.pop())
+
+    def __call__(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if (not enabled):
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(self.name, time.perf_counter() - start)
+        return wrapper
+
+
+def snapshot() -> dict:
+    """ Return the current counters and histograms as plain data """
+    with _lock:
+        return {'counters': dict(_counters),
+                'histograms': {name: h.to_dict() for name, h in _histograms.items()}}
+
+
+def to_json(path: Optional[str] = None) -> str:
+    """ Return the snapshot as JSON, also writing it to @path if given """
+    document = json.dumps(snapshot(), indent=2)
+    if (path is not None):
+        with open(path, 'w') as outfile:
+            outfile.write(document)
+    return document
+
+
+def profile(func: Callable, *args, sort: str = 'cumulative', limit: int = 25, **kwargs):
+    """ Run func(*args, **kwargs) once under cProfile. Return (result, profile report text) """
+    # Imported here so that importing the core does not load the profiler
+    import cProfile
+    import io
+    import pstats
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats(sort).print_stats(limit)
+    return result, report.getvalue()
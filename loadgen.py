@@ -0,0 +1,127 @@
+""" Load generator for server.py: plays many quiz sessions at once and reports latency.
+
+Usage: python loadgen.py [--host 127.0.0.1] [--port 8765 | --unix PATH] [--sessions 2000]
+                         [--connections 50] [--questions 5] [--difficulty 2] [--seed 0]
+
+Every session is started at once and shares one of the connections with the others.
+Each session asks for its questions in turn and submits a guess built from the
+question's variables, so most answers are wrong and get feedback. Throughput and the
+latency of each operation are printed when all sessions have finished.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from itertools import count as counter
+
+from grade import percentile
+from server import DEFAULT_PORT
+
+
+class Connection:
+    """ A client connection that lets many requests be in flight, matching replies by id """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.ids = counter(1)
+        self.pending: dict[int, asyncio.Future] = {}
+        self.receiver = asyncio.create_task(self._receive())
+
+    async def request(self, **fields) -> dict:
+        request_id = next(self.ids)
+        reply = self.pending[request_id] = asyncio.get_running_loop().create_future()
+        self.writer.write(json.dumps({'id': request_id, **fields}).encode() + b'\n')
+        await self.writer.drain()
+        return await reply
+
+    async def _receive(self) -> None:
+        while line := await self.reader.readline():
+            reply = json.loads(line)
+            self.pending.pop(reply['id']).set_result(reply)
+        for reply in self.pending.values():
+            reply.set_exception(ConnectionError("Server closed the connection"))
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.receiver.cancel()
+
+
+def guess(variables: list[str], rng: random.Random) -> str:
+    """ Return an answer over some of the variables, joined by random connectives """
+    answer = rng.choice(variables)
+    for var in rng.sample(variables, rng.randint(0, len(variables) - 1)):
+        answer = f"({answer} {rng.choice(['&', '|', '->', '<>'])} {var})"
+    return answer
+
+
+async def play(connection: Connection, args, seed: int, latencies: dict[str, list[float]],
+               errors: list[str]) -> None:
+    """ Play one session to the end, recording the latency of each request """
+    rng = random.Random(seed)
+
+    async def timed(op: str, **fields) -> dict:
+        start = time.perf_counter()
+        reply = await connection.request(op=op, **fields)
+        latencies[op].append(time.perf_counter() - start)
+        if ('error' in reply):
+            errors.append(reply['error'])
+        return reply
+
+    reply = await timed('new', difficulty=args.difficulty, questions=args.questions, seed=seed)
+    if ('error' in reply):
+        return
+    session = reply['session']
+    # A failed 'next' ends the session; it is recorded like any other error
+    while not ('error' in (reply := await timed('next', session=session)) or reply.get('done')):
+        await timed('submit', session=session, answer=guess(reply['variables'], rng))
+    await timed('close', session=session)
+
+
+async def run(args) -> None:
+    if (args.unix is not None):
+        streams = [await asyncio.open_unix_connection(args.unix) for _ in range(args.connections)]
+    else:
+        streams = [await asyncio.open_connection(args.host, args.port) for _ in range(args.connections)]
+    connections = [Connection(reader, writer) for reader, writer in streams]
+    latencies = {op: [] for op in ('new', 'next', 'submit', 'close')}
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(play(connections[i % len(connections)], args, args.seed * args.sessions + i,
+                                latencies, errors)
+                           for i in range(args.sessions)))
+    elapsed = time.perf_counter() - start
+    for connection in connections:
+        await connection.close()
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{args.sessions} sessions over {len(connections)} connections: {total} requests in "
+          f"{elapsed:.2f}s, {total / elapsed:.0f}/s, {len(errors)} errors", file=sys.stderr)
+    for op, values in [*latencies.items(), ('all', [v for values in latencies.values() for v in values])]:
+        values.sort()
+        print(f"{op:>6} latency (ms): " + ", ".join(f"p{int(q * 100)} {percentile(values, q) * 1000:.2f}"
+                                                   for q in (0.5, 0.99)) +
+              f", max {values[-1] * 1000:.2f}", file=sys.stderr)
+    if (errors):
+        print(f"First error: {errors[0]}", file=sys.stderr)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Measure the latency of server.py under load")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, help="Connect to a Unix socket at this path instead")
+    parser.add_argument('--sessions', type=int, default=2000, help="Concurrent sessions")
+    parser.add_argument('--connections', type=int, default=50)
+    parser.add_argument('--questions', type=int, default=5, help="Questions per session")
+    parser.add_argument('--difficulty', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+""" Normal forms of formulas: NNF, linear-size CNF with DIMACS export, and minimal DNF
+
+nnf() and the CNF encoding are folds over the formula, so a subformula shared by several
+parents (formulas are hash-consed, see syntax.Formula) is rewritten once, and their size
+stays linear in the number of distinct nodes even for formulas full of <>.
+"""
+from functools import lru_cache
+from itertools import combinations
+from typing import IO, Iterator, Optional, Sequence
+
+from semantics import truth_table
+from syntax import Connective, Formula
+
+TRUE, FALSE = Formula('T'), Formula('F')
+
+
+def _and(left: Formula, right: Formula) -> Formula:
+    if (left is FALSE or right is FALSE):
+        return FALSE
+    if (left is TRUE):
+        return right
+    if (right is TRUE or left is right):
+        return left
+    return Formula(Connective.AND, left, right)
+
+
+def _or(left: Formula, right: Formula) -> Formula:
+    if (left is TRUE or right is TRUE):
+        return TRUE
+    if (left is FALSE):
+        return right
+    if (right is FALSE or left is right):
+        return left
+    return Formula(Connective.OR, left, right)
+
+
+def _nnf_pair(node: Formula, left: tuple, right: tuple) -> tuple[Formula, Formula]:
+    """ Return the NNF of the node and of its negation, given those of its children """
+    match node.val:
+        case Connective.NOT:
+            return left[1], left[0]
+        case Connective.AND:
+            return _and(left[0], right[0]), _or(left[1], right[1])
+        case Connective.OR:
+            return _or(left[0], right[0]), _and(left[1], right[1])
+        case Connective.IMPLIES:
+            return _or(left[1], right[0]), _and(left[0], right[1])
+        case Connective.IFF:
+            return (_or(_and(left[0], right[0]), _and(left[1], right[1])),
+                    _or(_and(left[0], right[1]), _and(left[1], right[0])))
+    if (node is TRUE or node is FALSE):
+        return node, FALSE if node is TRUE else TRUE
+    return node, Formula(Connective.NOT, node)
+
+
+def nnf(formula: Formula) -> Formula:
+    """ Return an equivalent formula in negation normal form: only &, | and negated
+    variables, with constants folded away (the result is T or F if it is constant).
+
+    <> is expanded as (a&b)|(~a&~b); the subformulas a, b, ~a and ~b are each built once
+    and shared, so the result has at most a constant times as many distinct nodes.
+    """
+    return formula.fold(_nnf_pair)[0]
+
+
+class CNF:
+    """ A Plaisted-Greenbaum encoding of a formula as clauses over DIMACS literals.
+
+    The formula is satisfiable iff the clauses are, and models of the clauses restricted
+    to the formula's variables are models of the formula. Only the implication
+    (fresh variable -> subformula) is encoded, as all subformulas of the NNF occur
+    positively, so there are at most two clauses per distinct node.
+    """
+
+    def __init__(self, formula: Formula) -> None:
+        self.root = nnf(formula)
+        # Variables are numbered 1..n in sorted order, then one fresh variable per & and |
+        self.variables = self.root.sorted_variables()
+        self.var_ids = {var: i + 1 for i, var in enumerate(self.variables)}
+        self.num_vars = len(self.variables)
+        self.num_clauses = 1
+        for node in self.root.postorder():
+            if (node.val is Connective.AND):
+                self.num_vars += 1
+                self.num_clauses += 2
+            elif (node.val is Connective.OR):
+                self.num_vars += 1
+                self.num_clauses += 1
+
+    def clauses(self) -> Iterator[list[int]]:
+        """ Yield the clauses; the last one is the unit clause asserting the formula """
+        if (self.root is TRUE or self.root is FALSE):
+            # The empty clause for False; a tautological clause for True
+            yield [] if self.root is FALSE else [1, -1]
+            return
+        literals = {}
+        fresh = len(self.variables)
+        for node in self.root.postorder():
+            if (node.val is Connective.NOT):
+                literals[id(node)] = -self.var_ids[node.left.val]
+            elif (isinstance(node.val, Connective)):
+                fresh += 1
+                a, b = literals[id(node.left)], literals[id(node.right)]
+                if (node.val is Connective.AND):
+                    yield [-fresh, a]
+                    yield [-fresh, b]
+                else:
+                    yield [-fresh, a, b]
+                literals[id(node)] = fresh
+            else:
+                literals[id(node)] = self.var_ids[node.val]
+        yield [literals[id(self.root)]]
+
+    def write_dimacs(self, sink: IO) -> None:
+        """ Stream the clauses to a text sink in DIMACS format, with the variable names as comments """
+        for var, id in self.var_ids.items():
+            sink.write(f"c {id} {var}\n")
+        num_vars = max(1, self.num_vars) if self.root is TRUE else self.num_vars
+        sink.write(f"p cnf {num_vars} {self.num_clauses}\n")
+        for clause in self.clauses():
+            sink.write(" ".join(map(str, clause)) + " 0\n")
+
+
+def write_dimacs(formula: Formula, sink: IO) -> None:
+    CNF(formula).write_dimacs(sink)
+
+
+@lru_cache(maxsize=4096)
+def prime_implicants(n: int, table: int) -> tuple[tuple[int, int], ...]:
+    """ Return the prime implicants of the n-variable function with the packed truth table
+    (bit r set iff row r of all_valuations is true), by Quine-McCluskey.
+
+    An implicant is a (mask, bits) pair: the rows r with r & mask == bits, where bit
+    n-1-i of a row is the value of variable i.
+    """
+    full = (1 << n) - 1
+    current = {(full, r) for r in range(1 << n) if (table >> r) & 1}
+    primes = set()
+    while current:
+        merged = set()
+        combined = set()
+        # Implicants can only merge with ones that have the same mask
+        by_mask: dict[int, list[int]] = {}
+        for mask, bits in current:
+            by_mask.setdefault(mask, []).append(bits)
+        for mask, group in by_mask.items():
+            members = set(group)
+            for bits in group:
+                for i in range(n):
+                    bit = 1 << i
+                    if (mask & bit and not bits & bit and bits | bit in members):
+                        merged.add((mask & ~bit, bits))
+                        combined.add((mask, bits))
+                        combined.add((mask, bits | bit))
+        primes |= current - combined
+        current = merged
+    # Fewest literals first
+    return tuple(sorted(primes, key=lambda implicant: (implicant[0].bit_count(), implicant)))
+
+
+def _rows(n: int, implicant: tuple[int, int]) -> int:
+    """ Return the rows covered by an implicant, packed like a truth table """
+    mask, bits = implicant
+    covered = 0
+    for r in range(1 << n):
+        if (r & mask == bits):
+            covered |= 1 << r
+    return covered
+
+
+@lru_cache(maxsize=4096)
+def minimal_cover(n: int, table: int, max_primes: int = 16) -> tuple[tuple[int, int], ...]:
+    """ Return a set of prime implicants covering the table: as few as possible, and of
+    those, the one with the fewest literals.
+
+    Essential primes are taken first; the rest of the cover is searched exhaustively if
+    at most @max_primes primes remain, and chosen greedily otherwise.
+    """
+    primes = prime_implicants(n, table)
+    rows = {prime: _rows(n, prime) for prime in primes}
+    cover, covered = [], 0
+    for r in range(1 << n):
+        if ((table >> r) & 1):
+            covering = [prime for prime in primes if (rows[prime] >> r) & 1]
+            if (len(covering) == 1 and covering[0] not in cover):
+                cover.append(covering[0])
+                covered |= rows[covering[0]]
+    remaining = [prime for prime in primes if rows[prime] & table & ~covered]
+
+    def cost(implicants) -> tuple[int, int]:
+        return len(implicants), sum(mask.bit_count() for mask, _ in implicants)
+
+    if (covered == table):
+        return tuple(cover)
+    if (len(remaining) <= max_primes):
+        best = None
+        for k in range(1, len(remaining) + 1):
+            for extra in combinations(remaining, k):
+                union = covered
+                for prime in extra:
+                    union |= rows[prime]
+                if (union == table and (best is None or cost(extra) < cost(best))):
+                    best = extra
+            if (best is not None):
+                return tuple(cover) + best
+    while covered != table:
+        prime = max(remaining, key=lambda p: ((rows[p] & ~covered).bit_count(), -p[0].bit_count()))
+        cover.append(prime)
+        covered |= rows[prime]
+    return tuple(cover)
+
+
+def minimal_dnf(formula: Formula, vars: Optional[Sequence[str]] = None) -> Formula:
+    """ Return an equivalent disjunction of conjunctions of literals over @vars (the
+    formula's variables by default) with the fewest terms, T or F if it is constant.
+
+    Exponential in the number of variables; results are cached by truth table.
+    """
+    vars = tuple(formula.sorted_variables() if vars is None else vars)
+    n = len(vars)
+    table = truth_table(formula, vars)
+    if (table == 0):
+        return FALSE
+    if (table == (1 << (1 << n)) - 1):
+        return TRUE
+    terms = []
+    for mask, bits in minimal_cover(n, table):
+        term = None
+        for i, var in enumerate(vars):
+            bit = 1 << (n - 1 - i)
+            if (mask & bit):
+                literal = Formula(var) if bits & bit else Formula(Connective.NOT, Formula(var))
+                term = literal if term is None else Formula(Connective.AND, term, literal)
+        terms.append(term)
+    dnf = terms[0]
+    for term in terms[1:]:
+        dnf = Formula(Connective.OR, dnf, term)
+    return dnf
@@ -0,0 +1,248 @@
+""" Compact postfix encoding of formulas, with a stack-machine evaluator and a binary bank format
+
+A Program is a byte string of opcodes in postfix order. A variable is the VAR opcode
+followed by its index into Program.variables as a varint (one byte below 128).
+
+A bank file stores many programs, each with an optional text such as its English sentence:
+
+    magic b'PLB1' | count (u32) | record offsets (u64), then unused slots | records
+    record: varint #variables, per variable varint length + UTF-8 name,
+            varint code length + code, varint text length + UTF-8 text
+
+Bank opens the file with mmap, and its programs are memoryview slices of the mapping.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, Mapping, Optional, Sequence, Sized, Union
+
+from syntax import Connective, Formula
+
+VAR, TRUE, FALSE, NOT, AND, OR, IMPLIES, IFF = range(8)
+_OPCODES = {Connective.NOT: NOT, Connective.AND: AND, Connective.OR: OR,
+            Connective.IMPLIES: IMPLIES, Connective.IFF: IFF}
+_CONNECTIVES = {op: connective for connective, op in _OPCODES.items()}
+
+MAGIC = b'PLB1'
+
+
+def _put_varint(out: array, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _get_varint(buf, i: int) -> tuple[int, int]:
+    """ Return the varint at buf[i] and the offset after it """
+    n, shift = 0, 0
+    while True:
+        byte = buf[i]
+        i += 1
+        n |= (byte & 0x7F) << shift
+        if (byte < 0x80):
+            return n, i
+        shift += 7
+
+
+class Program:
+    """ A formula as a flat postfix byte program over an indexed list of variables """
+
+    __slots__ = ('code', 'variables')
+
+    def __init__(self, code: Union[bytes, memoryview, array], variables: Sequence[str]) -> None:
+        self.code = code
+        self.variables = tuple(variables)
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    @staticmethod
+    def from_formula(formula: Formula, variables: Optional[Sequence[str]] = None) -> 'Program':
+        """ Encode a formula; variables are numbered in sorted order unless @variables is given """
+        variables = formula.sorted_variables() if variables is None else tuple(variables)
+        index = {var: i for i, var in enumerate(variables)}
+        code = array('B')
+        # Postorder walk; a node is emitted when it is popped the second time
+        stack = [(formula, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if (not isinstance(node.val, Connective)):
+                if (node.val in ['T', 'F']):
+                    code.append(TRUE if node.val == 'T' else FALSE)
+                else:
+                    code.append(VAR)
+                    _put_varint(code, index[node.val])
+            elif (expanded):
+                code.append(_OPCODES[node.val])
+            else:
+                stack.append((node, True))
+                if (node.right is not None):
+                    stack.append((node.right, False))
+                stack.append((node.left, False))
+        return Program(code.tobytes(), variables)
+
+    def to_formula(self) -> Formula:
+        """ Decode the program back into the same Formula """
+        stack = []
+        code, i, n = self.code, 0, len(self.code)
+        while i < n:
+            op = code[i]
+            i += 1
+            if (op == VAR):
+                var, i = _get_varint(code, i)
+                stack.append(Formula(self.variables[var]))
+            elif (op == TRUE or op == FALSE):
+                stack.append(Formula('T' if op == TRUE else 'F'))
+            elif (op == NOT):
+                stack.append(Formula(Connective.NOT, stack.pop()))
+            else:
+                right = stack.pop()
+                stack.append(Formula(_CONNECTIVES[op], stack.pop(), right))
+        return stack[0]
+
+    def run(self, values: Sequence, mask=True):
+        """ Evaluate with values[i] the value of variables[i].
+
+        Values may be booleans, or packed bit-vectors with @mask the int with one bit set
+        per row, as for Formula.compile().
+        """
+        stack = []
+        push, pop = stack.append, stack.pop
+        code, i, n = self.code, 0, len(self.code)
+        while i < n:
+            op = code[i]
+            i += 1
+            if (op == VAR):
+                var = code[i]
+                i += 1
+                if (var >= 0x80):
+                    var, i = _get_varint(code, i - 1)
+                push(values[var])
+            elif (op == NOT):
+                stack[-1] = mask ^ stack[-1]
+            elif (op == TRUE):
+                push(mask)
+            elif (op == FALSE):
+                push(False)
+            else:
+                right = pop()
+                left = stack[-1]
+                if (op == AND):
+                    stack[-1] = left & right
+                elif (op == OR):
+                    stack[-1] = left | right
+                elif (op == IMPLIES):
+                    stack[-1] = (mask ^ left) | right
+                else:
+                    stack[-1] = mask ^ left ^ right
+        return stack[0]
+
+    def evaluate(self, valuation: Mapping[str, bool]) -> bool:
+        """ Evaluate the truth value under a valuation keyed by variable name """
+        missing = [var for var in self.variables if var not in valuation]
+        if (missing):
+            raise Exception(f"No valuation for {missing[0]} in {valuation}")
+        return self.run([valuation[var] for var in self.variables])
+
+    def to_bytes(self, text: str = '') -> bytes:
+        """ Serialize the program (and an optional text) as one bank record """
+        out = array('B')
+        _put_varint(out, len(self.variables))
+        for var in self.variables:
+            name = var.encode()
+            _put_varint(out, len(name))
+            out.frombytes(name)
+        _put_varint(out, len(self.code))
+        out.frombytes(bytes(self.code))
+        encoded = text.encode()
+        _put_varint(out, len(encoded))
+        out.frombytes(encoded)
+        return out.tobytes()
+
+    @staticmethod
+    def from_buffer(buf: memoryview, offset: int = 0) -> tuple['Program', str]:
+        """ Read the record at @offset. The program's code is a slice of @buf, not a copy """
+        num_vars, i = _get_varint(buf, offset)
+        variables = []
+        for _ in range(num_vars):
+            length, i = _get_varint(buf, i)
+            variables.append(str(buf[i:i+length], 'utf-8'))
+            i += length
+        length, i = _get_varint(buf, i)
+        code = buf[i:i+length]
+        i += length
+        length, i = _get_varint(buf, i)
+        return Program(code, variables), str(buf[i:i+length], 'utf-8')
+
+
+def write_bank(path: str, records: Iterable[tuple[Union[Formula, Program], str]],
+               capacity: Optional[int] = None) -> int:
+    """ Write (formula or program, text) records to a bank file. Return the number written.
+
+    Records are encoded and written one at a time behind a placeholder offset table, which
+    is filled in at the end. The table has room for @capacity records, by default
+    len(records); an iterator without a capacity is read into a list first.
+    """
+    if (capacity is None):
+        if (not isinstance(records, Sized)):
+            records = list(records)
+        capacity = len(records)
+    offsets = array('Q')
+    with open(path, 'wb') as outfile:
+        outfile.write(MAGIC + bytes(4 + 8 * capacity))
+        position = outfile.tell()
+        for item, text in records:
+            if (len(offsets) == capacity):
+                raise ValueError(f"More than {capacity} records for {path}")
+            blob = (item if isinstance(item, Program) else Program.from_formula(item)).to_bytes(text)
+            offsets.append(position)
+            outfile.write(blob)
+            position += len(blob)
+        # Slots past the last record stay zero; Bank only reads the first count offsets
+        outfile.seek(len(MAGIC))
+        outfile.write(struct.pack('<I', len(offsets)))
+        if (sys.byteorder != 'little'):
+            offsets.byteswap()
+        outfile.write(offsets.tobytes())
+    return len(offsets)
+
+
+class Bank:
+    """ Read-only, memory-mapped bank of programs with random access by index """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self._mmap)
+        if (bytes(self.buffer[:len(MAGIC)]) != MAGIC):
+            self.close()
+            raise Exception(f"{path} is not a formula bank")
+        (self._count,) = struct.unpack_from('<I', self.buffer, len(MAGIC))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> tuple[Program, str]:
+        if (not 0 <= index < self._count):
+            raise IndexError(index)
+        (offset,) = struct.unpack_from('<Q', self.buffer, len(MAGIC) + 4 + 8 * index)
+        return Program.from_buffer(self.buffer, offset)
+
+    def close(self) -> None:
+        """ Release the bank. If programs read from it are still alive, the mapping is
+        unmapped when the last of them is freed.
+        """
+        self.buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self) -> 'Bank':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,320 @@
+""" A CDCL SAT solver and a Tseitin encoding of formulas into it
+
+Literals follow the DIMACS convention: variable v is the int v > 0 and its negation is -v.
+"""
+import heapq
+from typing import Callable, Iterable, Mapping, Optional, Sequence
+
+from semantics import Cancelled
+from syntax import Connective, Formula
+
+
+def _luby(i: int) -> int:
+    """ Return the i-th term (1-based) of the Luby restart sequence 1,1,2,1,1,2,4,... """
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class Solver:
+    """ Conflict-driven clause learning solver with two watched literals per clause,
+    first-UIP clause learning, VSIDS branching with phase saving and Luby restarts.
+    """
+
+    restart_base = 100
+    activity_decay = 0.95
+
+    def __init__(self, num_vars: int = 0) -> None:
+        self.num_vars = 0
+        # Indexed by variable: 1 true, -1 false, 0 unassigned
+        self.assigns = [0]
+        self.level = [0]
+        self.reason: list[Optional[list[int]]] = [None]
+        self.activity = [0.0]
+        self.polarity = [False]
+        # Clauses watching each literal, keyed by the literal (v and -v for variable v)
+        self.watches: dict[int, list[list[int]]] = {}
+        self.trail: list[int] = []
+        self.trail_lim: list[int] = []
+        self.qhead = 0
+        self.heap: list[tuple[float, int]] = []
+        self.var_inc = 1.0
+        self.ok = True
+        self.conflicts = 0
+        for _ in range(num_vars):
+            self.new_var()
+
+    def new_var(self) -> int:
+        """ Add a fresh variable and return it """
+        self.num_vars += 1
+        v = self.num_vars
+        self.assigns.append(0)
+        self.level.append(0)
+        self.reason.append(None)
+        self.activity.append(0.0)
+        self.polarity.append(False)
+        self.watches[v] = []
+        self.watches[-v] = []
+        heapq.heappush(self.heap, (0.0, v))
+        return v
+
+    def value(self, lit: int) -> int:
+        """ Return 1, -1 or 0 if the literal is true, false or unassigned """
+        v = self.assigns[abs(lit)]
+        return v if lit > 0 else -v
+
+    def add_clause(self, lits: Iterable[int]) -> bool:
+        """ Add a clause at decision level 0. Return False if the solver became unsatisfiable """
+        if (not self.ok):
+            return False
+        if (self.trail_lim):
+            self._backtrack(0)
+        clause = []
+        for lit in set(lits):
+            if (-lit in clause or self.value(lit) == 1):
+                # Tautology or already satisfied
+                return True
+            if (self.value(lit) == 0):
+                clause.append(lit)
+        if (len(clause) == 0):
+            self.ok = False
+        elif (len(clause) == 1):
+            self._enqueue(clause[0], None)
+            self.ok = self._propagate() is None
+        else:
+            self._watch(clause)
+        return self.ok
+
+    def solve(self, should_stop: Optional[Callable[[], bool]] = None) -> Optional[bool]:
+        """ Return True iff the clauses are satisfiable; the model is then available via model().
+
+        @should_stop is polled regularly; if it returns True the search is abandoned and
+        None (unknown) is returned.
+        """
+        if (not self.ok):
+            return False
+        restarts = 0
+        while True:
+            restarts += 1
+            result = self._search(_luby(restarts) * self.restart_base, should_stop)
+            if (result is not None or (should_stop is not None and should_stop())):
+                return result
+
+    def model(self) -> dict[int, bool]:
+        """ Return the satisfying assignment found by the last call to solve() """
+        return {v: self.assigns[v] == 1 for v in range(1, self.num_vars + 1)}
+
+    def _watch(self, clause: list[int]) -> None:
+        self.watches[clause[0]].append(clause)
+        self.watches[clause[1]].append(clause)
+
+    def _enqueue(self, lit: int, reason: Optional[list[int]]) -> None:
+        v = abs(lit)
+        self.assigns[v] = 1 if lit > 0 else -1
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def _propagate(self) -> Optional[list[int]]:
+        """ Run unit propagation. Return a conflicting clause, or None """
+        assigns, watches, trail = self.assigns, self.watches, self.trail
+        while self.qhead < len(trail):
+            false_lit = -trail[self.qhead]
+            self.qhead += 1
+            watchers = watches[false_lit]
+            kept = []
+            for i, clause in enumerate(watchers):
+                if (clause[0] == false_lit):
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if ((assigns[first] if first > 0 else -assigns[-first]) == 1):
+                    kept.append(clause)
+                    continue
+                # Look for a new literal to watch
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if ((assigns[lit] if lit > 0 else -assigns[-lit]) != -1):
+                        clause[1], clause[k] = lit, false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if ((assigns[first] if first > 0 else -assigns[-first]) == -1):
+                        kept.extend(watchers[i + 1:])
+                        watches[false_lit] = kept
+                        return clause
+                    self._enqueue(first, clause)
+            watches[false_lit] = kept
+        return None
+
+    def _analyze(self, conflict: list[int]) -> tuple[list[int], int]:
+        """ Return the first-UIP learnt clause (asserting literal first) and the backjump level """
+        seen = set()
+        learnt = [0]
+        counter = 0
+        lit = 0
+        clause = conflict
+        index = len(self.trail) - 1
+        current = len(self.trail_lim)
+        while True:
+            for q in (clause if lit == 0 else clause[1:]):
+                v = abs(q)
+                if (v not in seen and self.level[v] > 0):
+                    seen.add(v)
+                    self._bump(v)
+                    if (self.level[v] == current):
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            counter -= 1
+            if (counter == 0):
+                break
+            clause = self.reason[abs(lit)]
+        learnt[0] = -lit
+        if (len(learnt) == 1):
+            return learnt, 0
+        # Watch the literal from the highest remaining level second
+        best = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def _bump(self, v: int) -> None:
+        self.activity[v] += self.var_inc
+        if (self.activity[v] > 1e100):
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[u], u) for u in range(1, self.num_vars + 1) if self.assigns[u] == 0]
+            heapq.heapify(self.heap)
+        elif (self.assigns[v] == 0):
+            heapq.heappush(self.heap, (-self.activity[v], v))
+
+    def _backtrack(self, level: int) -> None:
+        if (len(self.trail_lim) <= level):
+            return
+        for lit in self.trail[self.trail_lim[level]:]:
+            v = abs(lit)
+            self.polarity[v] = lit > 0
+            self.assigns[v] = 0
+            self.reason[v] = None
+            heapq.heappush(self.heap, (-self.activity[v], v))
+        del self.trail[self.trail_lim[level]:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _decide(self) -> int:
+        """ Return the unassigned variable with the highest activity, or 0 if all are assigned """
+        while self.heap:
+            activity, v = heapq.heappop(self.heap)
+            # Skip assigned variables and entries made stale by a later bump
+            if (self.assigns[v] == 0 and -activity == self.activity[v]):
+                return v
+        for v in range(1, self.num_vars + 1):
+            if (self.assigns[v] == 0):
+                return v
+        return 0
+
+    def _search(self, conflict_budget: int,
+                should_stop: Optional[Callable[[], bool]] = None) -> Optional[bool]:
+        """ Search until a result is found (True/False), or the budget runs out or
+        @should_stop returns True (None)
+        """
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if (conflict is not None):
+                self.conflicts += 1
+                conflicts += 1
+                if (should_stop is not None and conflicts % 64 == 0 and should_stop()):
+                    self._backtrack(0)
+                    return None
+                if (not self.trail_lim):
+                    self.ok = False
+                    return False
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if (len(learnt) == 1):
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._watch(learnt)
+                    self._enqueue(learnt[0], learnt)
+                self.var_inc /= self.activity_decay
+                continue
+            if (conflicts >= conflict_budget):
+                self._backtrack(0)
+                return None
+            v = self._decide()
+            if (v == 0):
+                return True
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(v if self.polarity[v] else -v, None)
+
+
+def tseitin(formula: Formula, solver: Solver, var_ids: dict[str, int], literals: dict = None) -> int:
+    """ Add clauses defining a fresh literal equivalent to @formula and return that literal.
+
+    Each distinct subformula gets one variable, so the encoding is linear in the size of
+    the formula. @var_ids maps proposition names to solver variables and is extended
+    with any new propositions. Passing the same @literals dict when encoding several
+    formulas gives their common subformulas the same literal.
+    """
+    def encode(node: Formula, a: int, b: int) -> int:
+        if (not isinstance(node.val, Connective)):
+            if (node.val in ['T', 'F']):
+                lit = solver.new_var()
+                solver.add_clause([lit if node.val == 'T' else -lit])
+                return lit
+            if (node.val not in var_ids):
+                var_ids[node.val] = solver.new_var()
+            return var_ids[node.val]
+        if (node.val == Connective.NOT):
+            return -a
+        lit = solver.new_var()
+        match node.val:
+            case Connective.AND:
+                clauses = [[-lit, a], [-lit, b], [lit, -a, -b]]
+            case Connective.OR:
+                clauses = [[lit, -a], [lit, -b], [-lit, a, b]]
+            case Connective.IMPLIES:
+                clauses = [[lit, a], [lit, -b], [-lit, -a, b]]
+            case Connective.IFF:
+                clauses = [[-lit, -a, b], [-lit, a, -b], [lit, a, b], [lit, -a, -b]]
+        for clause in clauses:
+            solver.add_clause(clause)
+        return lit
+
+    return formula.fold(encode, literals)
+
+
+def find_difference(first: Formula, second: Formula, vars: Sequence[str],
+                    should_stop: Optional[Callable[[], bool]] = None) -> Optional[Mapping[str, bool]]:
+    """ Return a valuation of @vars under which the formulas differ, or None if they are equivalent.
+
+    Decided by checking that the negation of (first <> second) is unsatisfiable.
+    Raise Cancelled if @should_stop returns True before the solver finishes.
+    """
+    solver = Solver()
+    var_ids = {var: solver.new_var() for var in vars}
+    # Shared subformulas (the same node, as formulas are hash-consed) are encoded once
+    literals = {}
+    a = tseitin(first, solver, var_ids, literals)
+    b = tseitin(second, solver, var_ids, literals)
+    # first xor second
+    solver.add_clause([a, b])
+    solver.add_clause([-a, -b])
+    satisfiable = solver.solve(should_stop)
+    if (satisfiable is None):
+        raise Cancelled("Equivalence check cancelled")
+    if (not satisfiable):
+        return None
+    model = solver.model()
+    return {var: model[var_ids[var]] for var in vars}
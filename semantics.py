@@ -1,59 +1,310 @@
-
-
 from syntax import *
+import sys
+from heapq import heapify, heappop, heappush
 from itertools import product
-from typing import Iterable, Sequence, Mapping
+from typing import IO, Iterable, Iterator, Optional, Sequence, Mapping
+
+import instrument
+
 # Type Class of valuations
 Valuation = Mapping[str, bool]
 
 
+class Cancelled(Exception):
+    """ Raised when a long-running check is cancelled before it finishes """
+
+
 def evaluate(formula: Formula, valuation: Valuation) -> bool:
     """ 
      Evaluate the truth value of the formula under the provided valuation
        """
-    if (isinstance(formula.val, Connective)):
-        match formula.val:
-            case Connective.NOT:
-                return not evaluate(formula.left, valuation)
-            case Connective.AND:
-                return evaluate(formula.left, valuation) and evaluate(formula.right, valuation)
-            case Connective.OR:
-                return evaluate(formula.left, valuation) or evaluate(formula.right, valuation)
-            case Connective.IMPLIES:
-                return (not evaluate(formula.left, valuation)) or evaluate(formula.right, valuation)
-            case Connective.IFF:
-                return evaluate(formula.left, valuation) == evaluate(formula.right, valuation)
-    if (formula.val in ['T', 'F']):
-        return formula.val == 'T'
-    if (formula.val not in valuation):
-        raise Exception(f"No valuation for {formula.val} in {valuation}")
-    else:
-        return valuation[formula.val]
+    if (instrument.enabled):
+        instrument.count('evaluate.nodes', len(formula.postorder()))
+    # Bottom-up over the distinct nodes; the connectives are compared by identity
+    NOT, AND, OR, IMPLIES = Connective.NOT, Connective.AND, Connective.OR, Connective.IMPLIES
+    values = {}
+    for node in formula.postorder():
+        val = node.val
+        if (val is NOT):
+            value = not values[id(node.left)]
+        elif (val is AND):
+            value = values[id(node.left)] and values[id(node.right)]
+        elif (val is OR):
+            value = values[id(node.left)] or values[id(node.right)]
+        elif (val is IMPLIES):
+            value = (not values[id(node.left)]) or values[id(node.right)]
+        elif (isinstance(val, Connective)):
+            value = values[id(node.left)] == values[id(node.right)]
+        elif (val in ['T', 'F']):
+            value = val == 'T'
+        elif (val not in valuation):
+            raise Exception(f"No valuation for {val} in {valuation}")
+        else:
+            value = valuation[val]
+        values[id(node)] = value
+    return value
 
 
 def all_valuations(vars: Sequence[str]) -> Iterable[Valuation]:
     """ Return all valuations in lexiographical order """
+    if (instrument.enabled):
+        instrument.count('valuations', 1 << len(vars))
     valuations = product([False, True], repeat=len(vars))
     return map(lambda p: dict(zip(vars, p)), valuations)
 
 
 def truth_values(formula: Formula, valuations: Iterable[Valuation]) -> Iterable[bool]:
-    """ Return the truth value of the formula evaluated under each of the supplied valuations """
-    return [evaluate(formula, p) for p in valuations]
+    """ Return the truth value of the formula evaluated under each of the supplied valuations
+
+    Uses the formula's compiled function if it has one, and evaluate otherwise.
+    """
+    if (formula.compiled is None):
+        return [evaluate(formula, p) for p in valuations]
+    compiled = formula.compiled
+    values = []
+    for p in valuations:
+        try:
+            values.append(compiled(*[p[var] for var in compiled.variables]))
+        except KeyError as e:
+            raise Exception(f"No valuation for {e.args[0]} in {p}")
+    return values
+
+
+def variable_masks(vars: Sequence[str]) -> dict[str, int]:
+    """ Return the packed column of each variable over all rows of the truth table.
+
+    Bit r of a column is the value of the variable in row r of all_valuations(vars),
+    so the first variable is the most significant one.
+    """
+    n = len(vars)
+    rows = 1 << n
+    masks = {}
+    for i, var in enumerate(vars):
+        # One period of the column, 2**k rows false then 2**k rows true, doubled until it
+        # spans all rows; each doubling is linear in its length, so this is O(2**n)
+        width = 1 << (n - 1 - i)
+        column = ((1 << width) - 1) << width
+        length = 2 * width
+        while length < rows:
+            column |= column << length
+            length *= 2
+        masks[var] = column
+    return masks
+
+
+def truth_table(formula: Formula, vars: Sequence[str]) -> int:
+    """ Return the truth table of the formula over all_valuations(vars) packed into an int.
+
+    Bit r is set iff the formula is true in row r. The whole table is computed in one pass
+    over the parse tree, with each connective applied to all rows at once. If the formula
+    has been compiled, its compiled function is called on the packed columns instead.
+    """
+    return evaluate_columns(formula, variable_masks(vars), (1 << (1 << len(vars))) - 1)
+
+
+def evaluate_columns(formula: Formula, masks: Mapping[str, int], all_rows: int) -> int:
+    """ Return the packed column of the formula given the packed column of each variable.
+
+    @all_rows has one bit set per row and is used for negation.
+    """
+    if (formula.compiled is not None):
+        missing = [var for var in formula.compiled.variables if var not in masks]
+        if (missing):
+            raise Exception(f"No valuation for {missing[0]} in {list(masks)}")
+        return formula.compiled(*[masks[var] for var in formula.compiled.variables], mask=all_rows)
+
+    def columns(formula: Formula, left: int, right: int) -> int:
+        if (isinstance(formula.val, Connective)):
+            match formula.val:
+                case Connective.NOT:
+                    return all_rows ^ left
+                case Connective.AND:
+                    return left & right
+                case Connective.OR:
+                    return left | right
+                case Connective.IMPLIES:
+                    return (all_rows ^ left) | right
+                case Connective.IFF:
+                    return all_rows ^ left ^ right
+        if (formula.val in ['T', 'F']):
+            return all_rows if formula.val == 'T' else 0
+        if (formula.val not in masks):
+            raise Exception(f"No valuation for {formula.val} in {list(masks)}")
+        return masks[formula.val]
+
+    # Shared subformulas are the same node, so each is computed once
+    return formula.fold(columns)
+
+
+def truth_table_blocks(formula: Formula, vars: Sequence[str], start: int = 0, stop: int = None,
+                       block_bits: int = 12) -> Iterator[tuple[int, int, int]]:
+    """ Yield the truth table over all_valuations(vars) in blocks of at most 2**block_bits rows.
+
+    Each block is a (first row, number of rows, packed column) triple, where bit i of the
+    column is the value of row (first row + i). Only rows in [start, stop) are produced,
+    and memory use depends on the block size only.
+    """
+    n = len(vars)
+    stop = (1 << n) if stop is None else min(stop, 1 << n)
+    low_bits = min(block_bits, n)
+    width = 1 << low_bits
+    # Inside an aligned block only the last low_bits variables change
+    low_masks = variable_masks(vars[n - low_bits:])
+    block_rows = (1 << width) - 1
+    for block_start in range(start - start % width, stop, width):
+        masks = dict(low_masks)
+        for i, var in enumerate(vars[:n - low_bits]):
+            masks[var] = block_rows if (block_start >> (n - 1 - i)) & 1 else 0
+        column = evaluate_columns(formula, masks, block_rows)
+        first, last = max(start, block_start), min(stop, block_start + width)
+        yield first, last - first, (column >> (first - block_start)) & ((1 << (last - first)) - 1)
+
+
+def write_truth_table(formula: Formula, sink: IO, format: str = 'text', vars: Sequence[str] = None,
+                      start: int = 0, stop: int = None, only: Optional[bool] = None,
+                      block_bits: int = 12) -> None:
+    """ Stream the truth table of the formula to a file-like sink.
+
+    @format is 'text' (as printed by print_truth_table), 'csv' or 'markdown', written to a
+    text sink, or 'binary', the packed values with row i at bit i % 8 of byte i // 8,
+    written to a binary sink. Only rows in [start, stop) are written, and if @only is
+    True or False, only the rows where the formula has that value (not for 'binary').
+    """
+    vars = list(formula.sorted_variables() if vars is None else vars)
+    blocks = truth_table_blocks(formula, vars, start, stop, block_bits)
+    if (format == 'binary'):
+        if (only is not None):
+            raise Exception("Row filters are not supported for binary truth tables")
+        pending, pending_bits = 0, 0
+        for _, rows, column in blocks:
+            pending |= column << pending_bits
+            pending_bits += rows
+            whole = pending_bits // 8
+            sink.write((pending & ((1 << (8 * whole)) - 1)).to_bytes(whole, 'little'))
+            pending >>= 8 * whole
+            pending_bits -= 8 * whole
+        if (pending_bits):
+            sink.write(pending.to_bytes(1, 'little'))
+        return
+
+    marks = {'text': ('F', 'T'), 'csv': ('0', '1'), 'markdown': ('F', 'T')}[format]
+    if (format == 'text'):
+        header = "|" + "".join(f" {var} |" for var in vars) + f" {str(formula)}"
+        sink.write(header + "\n" + '-' * len(header) + "\n")
+        cell, end = "| {} ", "| {}\n"
+    elif (format == 'csv'):
+        sink.write(",".join([*vars, f'"{str(formula)}"']) + "\n")
+        cell, end = "{},", "{}\n"
+    else:
+        sink.write("|" + "".join(f" {var} |" for var in vars) + f" `{str(formula)}` |\n")
+        sink.write("|" + "---|" * (len(vars) + 1) + "\n")
+        cell, end = "| {} ", "| {} |\n"
+    n = len(vars)
+    low_bits = min(block_bits, n)
+    # Cells of the variables that change inside a block, one string per row offset
+    low_cells = ["".join(cell.format(marks[(i >> (low_bits - 1 - j)) & 1]) for j in range(low_bits))
+                 for i in range(1 << low_bits)]
+    for first, rows, column in blocks:
+        high = "".join(cell.format(marks[(first >> (n - 1 - j)) & 1]) for j in range(n - low_bits))
+        offset = first % (1 << low_bits)
+        if (only is None):
+            selected = range(rows)
+        else:
+            wanted = column if only else ((1 << rows) - 1) ^ column
+            selected = []
+            while wanted:
+                lowest = wanted & -wanted
+                selected.append(lowest.bit_length() - 1)
+                wanted ^= lowest
+        lines = [high + low_cells[offset + i] + end.format(marks[(column >> i) & 1]) for i in selected]
+        sink.write("".join(lines))
+
+
+def row_valuation(vars: Sequence[str], row: int) -> Valuation:
+    """ Return the valuation in row @row of all_valuations(vars) """
+    return {var: bool((row >> (len(vars) - 1 - i)) & 1) for i, var in enumerate(vars)}
+
+
+def _apply(connective: Connective, left: bool, right: bool) -> bool:
+    match connective:
+        case Connective.NOT:
+            return not left
+        case Connective.AND:
+            return left and right
+        case Connective.OR:
+            return left or right
+        case Connective.IMPLIES:
+            return (not left) or right
+        case Connective.IFF:
+            return left == right
+
+
+def gray_truth_values(formula: Formula, vars: Sequence[str]) -> Iterator[tuple[int, bool]]:
+    """ Yield (row, value) for every row of all_valuations(vars), visiting rows in Gray-code order.
+
+    Consecutive rows differ in one variable, and each node keeps its value from the previous
+    row, so only the nodes above the flipped variable whose inputs changed are recomputed.
+    For a balanced formula that is O(depth) work per row instead of O(size).
+    """
+    # Number the distinct nodes so that children come before their parents
+    index: dict[Formula, int] = {}
+    nodes: list[Formula] = []
+    stack = [formula]
+    while stack:
+        node = stack[-1]
+        if (node in index):
+            stack.pop()
+            continue
+        children = [c for c in (node.left, node.right) if c is not None and c not in index]
+        if (children):
+            stack.extend(children)
+            continue
+        stack.pop()
+        index[node] = len(nodes)
+        nodes.append(node)
+    parents = [[] for _ in nodes]
+    leaves = {}
+    values = []
+    for i, node in enumerate(nodes):
+        if (isinstance(node.val, Connective)):
+            parents[index[node.left]].append(i)
+            if (node.right is not None and node.right is not node.left):
+                parents[index[node.right]].append(i)
+            values.append(_apply(node.val, values[index[node.left]],
+                                 node.right is not None and values[index[node.right]]))
+        elif (node.val in ['T', 'F']):
+            values.append(node.val == 'T')
+        elif (node.val not in vars):
+            raise Exception(f"No valuation for {node.val} in {list(vars)}")
+        else:
+            leaves[node.val] = i
+            values.append(False)
+
+    root, n = len(nodes) - 1, len(vars)
+    yield 0, values[root]
+    for step in range(1, 1 << n):
+        # The lowest set bit of the step is the row bit that flips
+        bit = (step & -step).bit_length() - 1
+        leaf = leaves.get(vars[n - 1 - bit])
+        if (leaf is not None):
+            values[leaf] = not values[leaf]
+            pending = list(parents[leaf])
+            queued = set(pending)
+            heapify(pending)
+            while pending:
+                i = heappop(pending)
+                node = nodes[i]
+                value = _apply(node.val, values[index[node.left]],
+                               node.right is not None and values[index[node.right]])
+                if (value != values[i]):
+                    values[i] = value
+                    for parent in parents[i]:
+                        if (parent not in queued):
+                            queued.add(parent)
+                            heappush(pending, parent)
+        yield step ^ (step >> 1), values[root]
 
 
 def print_truth_table(formula: Formula) -> None:
     """ Print the truth value of the formula under all possible valuations """
-    valuations = all_valuations(formula.variables())
-    header = "|"
-    for var in formula.variables():
-        header += f" {var} |"
-    header += f" {str(formula)}"
-    header += ("\n" + '-' * len(header))
-    print(header)
-    for valuation in valuations:
-        row = "|"
-        for var in valuation:
-            row += f" {'T' if valuation[var] else 'F'} |"
-        row += f" {'T' if evaluate(formula, valuation) else 'F'}"
-        print(row)
+    write_truth_table(formula, sys.stdout)
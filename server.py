@@ -0,0 +1,290 @@
+""" Quiz server for many players at once, speaking newline-delimited JSON over TCP or a Unix socket.
+
+Usage: python server.py [--host 127.0.0.1] [--port 8765 | --unix PATH] [--workers N]
+
+Each request is a JSON object on one line with an "op" and an optional "id", which is
+copied into the reply. Requests on one connection are handled concurrently, so their
+replies may arrive out of order; the server stops reading a connection while
+QuizServer.max_in_flight of its requests are running. The operations are:
+
+    {"op": "new", "difficulty": 2, "questions": 10, "seed": 7}
+        -> {"session": 1}  (seed is optional; the same seed gives the same questions)
+    {"op": "next", "session": 1}
+        -> {"number": 1, "of": 10, "question": "...", "variables": ["p", "q"],
+            "propositions": {"p": "Water is Warm", "q": "Tea is Sour"}}
+        or {"done": true, "score": 20} after the last question
+    {"op": "submit", "session": 1, "answer": "(p -> q)"}
+        -> {"correct": false, "feedback": "When ...", "solution": "...",
+            "short_solution": "...", "score": 0}
+    {"op": "close", "session": 1}  -> {"score": 0}
+
+Failed requests get {"error": message}. A malformed answer or a check that takes longer
+than CHECK_TIME_LIMIT leaves the question open, as in the game; "next" repeats the
+current question until it has been answered. Sessions belong to the connection that
+created them and are dropped when it closes.
+
+Questions are generated and answers checked on a process pool, so the event loop only
+parses and routes requests. A session stores its seed and progress and nothing else:
+each question is regenerated in a worker from the session seed and question number,
+and workers cache recent exercises with their truth tables.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import count as counter
+
+from constants import CHECK_TIME_LIMIT
+from exercise import Exercise
+from semantics import Cancelled
+
+DEFAULT_PORT = 8765
+
+
+@lru_cache(maxsize=4096)
+def _exercise(difficulty: int, seed: str) -> Exercise:
+    """ Generate an exercise once per worker process; any worker generates the same one for a seed """
+    return Exercise(difficulty, rng=random.Random(seed))
+
+
+def question(difficulty: int, seed: str) -> dict:
+    """ Return the question for an exercise """
+    exercise = _exercise(difficulty, seed)
+    return {'question': str(exercise), 'variables': list(exercise.formula.sorted_variables()),
+            'propositions': {var: str(proposition) for var, proposition in exercise.var_map.items()}}
+
+
+class _Deadline:
+    """ Stands in for the cancel event of Exercise.counterexample, set once time runs out """
+
+    __slots__ = ('end',)
+
+    def __init__(self, seconds: float) -> None:
+        self.end = time.monotonic() + seconds
+
+    def is_set(self) -> bool:
+        return time.monotonic() > self.end
+
+
+def check(difficulty: int, seed: str, answer: str, time_limit: float) -> dict:
+    """ Check an answer to an exercise and return the result fields of the reply """
+    exercise = _exercise(difficulty, seed)
+    try:
+        counterexample = exercise.counterexample(answer, _Deadline(time_limit))
+    except Cancelled:
+        return {'error': "Checking took too long, please try again"}
+    except Exception as e:
+        return {'error': f"Answer is not well-formed: {e}"}
+    result = {'correct': counterexample is None}
+    if (counterexample is not None):
+        result['feedback'] = exercise.explain(answer, counterexample)
+    result['solution'] = str(exercise.formula)
+    short = exercise.short_solution()
+    if (short is not None):
+        result['short_solution'] = str(short)
+    return result
+
+
+class RequestError(Exception):
+    """ A request that cannot be served; its message is sent back to the client """
+
+
+class _Session:
+    """ Progress through one quiz; the exercises are regenerated from the seed when needed """
+
+    __slots__ = ('seed', 'difficulty', 'questions', 'number', 'score', 'answered', 'busy')
+
+    def __init__(self, seed: int, difficulty: int, questions: int) -> None:
+        self.seed = seed
+        self.difficulty = difficulty
+        self.questions = questions
+        # The current question (0 before the first) and whether it has been answered
+        self.number = 0
+        self.answered = True
+        self.score = 0
+        # Set while a next or submit request for the session is running
+        self.busy = False
+
+    def exercise_seed(self) -> str:
+        return f"{self.seed}/{self.number}"
+
+
+class QuizServer:
+    """ Serves quiz sessions, running the game logic on an executor """
+
+    max_difficulty = 16
+    max_questions = 1000
+    # Requests of one connection that may run at once; reading stops while this many are
+    max_in_flight = 64
+
+    def __init__(self, executor: Executor, time_limit: float = CHECK_TIME_LIMIT) -> None:
+        self.executor = executor
+        self.time_limit = time_limit
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ Serve one connection until the client closes it """
+        sessions: dict[int, _Session] = {}
+        session_ids = counter(1)
+        tasks = set()
+        in_flight = asyncio.Semaphore(QuizServer.max_in_flight)
+
+        def finished(task: asyncio.Task) -> None:
+            tasks.discard(task)
+            in_flight.release()
+
+        try:
+            while True:
+                await in_flight.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    # Line longer than the stream limit, or the connection was reset
+                    break
+                if (not line):
+                    break
+                if (not line.strip()):
+                    in_flight.release()
+                    continue
+                task = asyncio.create_task(self._respond(line, sessions, session_ids, writer))
+                tasks.add(task)
+                task.add_done_callback(finished)
+            if (tasks):
+                await asyncio.wait(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, line: bytes, sessions: dict[int, _Session], session_ids,
+                       writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            if (not isinstance(request, dict)):
+                raise RequestError("Expected a JSON object")
+            request_id = request.get('id')
+            reply = await self.dispatch(request, sessions, session_ids)
+        except json.JSONDecodeError as e:
+            reply = {'error': f"Invalid JSON: {e}"}
+        except Exception as e:
+            # RequestError, or a failure of the executor
+            reply = {'error': str(e)}
+        if (request_id is not None):
+            reply['id'] = request_id
+        if (not writer.is_closing()):
+            writer.write(json.dumps(reply).encode() + b'\n')
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def dispatch(self, request: dict, sessions: dict[int, _Session], session_ids) -> dict:
+        """ Carry out one request on the sessions of a connection and return the reply """
+        op = request.get('op')
+        if (op == 'new'):
+            difficulty = self._integer(request, 'difficulty', 2, 1, QuizServer.max_difficulty)
+            questions = self._integer(request, 'questions', 10, 1, QuizServer.max_questions)
+            seed = request.get('seed')
+            if (seed is None):
+                seed = random.getrandbits(64)
+            elif (not isinstance(seed, int)):
+                raise RequestError("seed must be an integer")
+            session_id = next(session_ids)
+            sessions[session_id] = _Session(seed, difficulty, questions)
+            return {'session': session_id}
+        if (op not in ('next', 'submit', 'close')):
+            raise RequestError(f"Unknown op {op!r}")
+        session_id = request.get('session')
+        session = sessions.get(session_id) if isinstance(session_id, int) else None
+        if (session is None):
+            raise RequestError(f"No session {request.get('session')!r}")
+        if (op == 'close'):
+            del sessions[session_id]
+            return {'score': session.score}
+        if (session.busy):
+            raise RequestError("The previous request for this session has not finished")
+        session.busy = True
+        try:
+            if (op == 'next'):
+                return await self._next(session)
+            return await self._submit(session, request.get('answer'))
+        finally:
+            session.busy = False
+
+    async def _next(self, session: _Session) -> dict:
+        if (session.answered):
+            if (session.number == session.questions):
+                return {'done': True, 'score': session.score}
+            session.number += 1
+            session.answered = False
+        reply = {'number': session.number, 'of': session.questions}
+        reply.update(await self._run(question, session.difficulty, session.exercise_seed()))
+        return reply
+
+    async def _submit(self, session: _Session, answer) -> dict:
+        if (session.answered):
+            raise RequestError("No open question, send next first")
+        if (not isinstance(answer, str) or not answer.strip()):
+            raise RequestError("Answer is empty")
+        reply = await self._run(check, session.difficulty, session.exercise_seed(), answer,
+                                self.time_limit)
+        if ('error' not in reply):
+            session.answered = True
+            # Scored like the game: 10 points per correct answer
+            session.score += 10 * reply['correct']
+            reply['score'] = session.score
+        return reply
+
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    @staticmethod
+    def _integer(request: dict, key: str, default: int, low: int, high: int) -> int:
+        value = request.get(key, default)
+        if (not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high):
+            raise RequestError(f"{key} must be an integer from {low} to {high}")
+        return value
+
+
+async def serve(host: str = '127.0.0.1', port: int = DEFAULT_PORT, unix: str = None,
+                workers: int = None, time_limit: float = CHECK_TIME_LIMIT) -> None:
+    """ Run the server until cancelled """
+    with ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+        quiz = QuizServer(pool, time_limit)
+        if (unix is not None):
+            server = await asyncio.start_unix_server(quiz.handle, unix)
+        else:
+            server = await asyncio.start_server(quiz.handle, host, port)
+        where = unix if unix is not None else ", ".join(
+            f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+        print(f"Serving quizzes on {where}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the quiz over newline-delimited JSON")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, help="Listen on a Unix socket at this path instead")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes")
+    parser.add_argument('--time-limit', type=float, default=CHECK_TIME_LIMIT,
+                        help="Seconds an answer check may run")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.time_limit))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
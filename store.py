@@ -0,0 +1,194 @@
+""" SQLite-backed bank of saved exercises
+
+Each insert and delete is its own transaction, so the bank is never rewritten as a whole
+and an interrupted write leaves it unchanged. Formulas are stored as text, for people and
+older versions, and as a postfix.Program, which is what the bank decodes them from.
+"""
+import json
+import logging
+import os
+import random
+import sqlite3
+from typing import Optional
+
+from fingerprint import FingerprintIndex
+from postfix import Program
+from syntax import Formula
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS exercises (
+    id INTEGER PRIMARY KEY,
+    english TEXT NOT NULL,
+    formula TEXT NOT NULL,
+    num_vars INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    program BLOB
+);
+CREATE INDEX IF NOT EXISTS exercises_difficulty ON exercises (difficulty, num_vars);
+CREATE INDEX IF NOT EXISTS exercises_num_vars ON exercises (num_vars);
+CREATE TABLE IF NOT EXISTS imports (
+    name TEXT PRIMARY KEY
+);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def _program(formula: Formula) -> bytes:
+    return Program.from_formula(formula).to_bytes()
+
+
+def _formula(program: bytes) -> Formula:
+    return Program.from_buffer(memoryview(program))[0].to_formula()
+
+
+def formula_difficulty(formula: Formula) -> int:
+    """ Return the game difficulty matching a formula; Formula.generate_formula(d) uses d+1 variables """
+    return max(1, len(formula.variables()) - 1)
+
+
+class ExerciseStore:
+    """ Saved exercises of the form {"id": ..., "english": ..., "formula": ...},
+    indexed by difficulty and variable count.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            columns = [row['name'] for row in self.conn.execute("PRAGMA table_info(exercises)")]
+            if ('program' not in columns):
+                self.conn.execute("ALTER TABLE exercises ADD COLUMN program BLOB")
+            # Banks written before programs were stored
+            self.conn.executemany(
+                "UPDATE exercises SET program = ? WHERE id = ?",
+                [(_program(Formula.parse(formula)), id) for id, formula in
+                 self.conn.execute("SELECT id, formula FROM exercises WHERE program IS NULL").fetchall()])
+        # Built from all saved formulas on the first duplicate or equivalence lookup
+        self._index: Optional[FingerprintIndex] = None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM exercises").fetchone()[0]
+
+    def add(self, english: str, formula: str) -> int:
+        """ Save an exercise and return its id. Raise a ParseError if the formula is malformed """
+        parsed = Formula.parse(formula)
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO exercises (english, formula, num_vars, difficulty, program) VALUES (?, ?, ?, ?, ?)",
+                (english, str(parsed), len(parsed.variables()), formula_difficulty(parsed), _program(parsed)))
+        if (self._index is not None):
+            self._index.add(cursor.lastrowid, parsed)
+        return cursor.lastrowid
+
+    def delete(self, id: int) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM exercises WHERE id = ?", (id,))
+        if (self._index is not None):
+            self._index.remove(id)
+
+    def index(self) -> FingerprintIndex:
+        """ Return the fingerprint index of the saved formulas """
+        if (self._index is None):
+            self._index = FingerprintIndex()
+            for id, program in self.conn.execute("SELECT id, program FROM exercises"):
+                self._index.add(id, _formula(program))
+        return self._index
+
+    def duplicates(self, formula: str) -> list[int]:
+        """ Return the ids of saved exercises equivalent to the formula up to a renaming of
+        variables. Raise a ParseError if the formula is malformed
+        """
+        return sorted(self.index().duplicates(Formula.parse(formula)))
+
+    def equivalent(self, formula: str) -> list[int]:
+        """ Return the ids of saved exercises whose formula is logically equivalent to this one """
+        return sorted(self.index().equivalent(Formula.parse(formula)))
+
+    def get(self, id: int) -> Optional[dict]:
+        row = self.conn.execute("SELECT id, english, formula FROM exercises WHERE id = ?",
+                                (id,)).fetchone()
+        return None if row is None else dict(row)
+
+    def ids(self) -> list[int]:
+        """ Return the ids of all saved exercises in insertion order """
+        return [row[0] for row in self.conn.execute("SELECT id FROM exercises ORDER BY id")]
+
+    def sample(self, n: int, difficulty: int = None, num_vars: int = None,
+               exclude: tuple[int, ...] = ()) -> list[dict]:
+        """ Return up to n random exercises, optionally restricted to a difficulty and variable count.
+
+        Only the ids of the matching exercises are read (from an index when filtering by
+        difficulty or variable count); the rows are then fetched for the chosen ids.
+        """
+        conditions, params = [], []
+        if (difficulty is not None):
+            conditions.append("difficulty = ?")
+            params.append(difficulty)
+        if (num_vars is not None):
+            conditions.append("num_vars = ?")
+            params.append(num_vars)
+        if (exclude):
+            conditions.append(f"id NOT IN ({', '.join('?' * len(exclude))})")
+            params.extend(exclude)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        ids = [row[0] for row in self.conn.execute(f"SELECT id FROM exercises {where}", params)]
+        chosen = random.sample(ids, min(n, len(ids)))
+        return [self.get(id) for id in chosen]
+
+    def import_json(self, json_path: str, name: str = None) -> int:
+        """ Import a legacy saved_exercises.json file in one transaction. Return the number imported.
+
+        Exercises whose formula cannot be parsed are skipped and logged. If @name is given,
+        the import is recorded under it in the same transaction, and a file already
+        imported under that name is not imported again.
+        """
+        if (name is not None and self.conn.execute("SELECT 1 FROM imports WHERE name = ?",
+                                                   (name,)).fetchone()):
+            return 0
+        with open(json_path, 'r') as json_file:
+            exercises = json.load(json_file)
+        rows = []
+        for exercise in exercises:
+            try:
+                parsed = Formula.parse(exercise['formula'])
+                rows.append((exercise['english'], str(parsed), len(parsed.variables()),
+                             formula_difficulty(parsed), _program(parsed)))
+            except Exception as e:
+                logger.warning("Skipping saved exercise %r: %s", exercise, e)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO exercises (english, formula, num_vars, difficulty, program) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            if (name is not None):
+                self.conn.execute("INSERT INTO imports (name) VALUES (?)", (name,))
+        # Rebuilt on the next lookup
+        self._index = None
+        return len(rows)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def open_store(directory: str, db_name: str, legacy_json: Optional[str] = None) -> ExerciseStore:
+    """ Open the exercise bank in @directory, importing @legacy_json (then renamed to .bak) if present.
+
+    The import is recorded in the bank, so if the rename is interrupted the file is not
+    imported a second time. The bank is closed if the import or the rename fails.
+    """
+    os.makedirs(directory, exist_ok=True)
+    store = ExerciseStore(os.path.join(directory, db_name))
+    if (legacy_json is not None):
+        json_path = os.path.join(directory, legacy_json)
+        if (os.path.exists(json_path)):
+            try:
+                store.import_json(json_path, name=legacy_json)
+                os.replace(json_path, json_path + '.bak')
+            except BaseException:
+                store.close()
+                raise
+    return store
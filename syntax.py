@@ -1,8 +1,22 @@
+import random
+import re
+import threading
+import time
+import weakref
 from enum import Enum
-from random import choice, randint
-from typing import Iterator
-# Valid proposition variables
+from typing import Any, Callable, Container, Iterable, Iterator, Optional, Union
+
+import instrument
+# Single-letter proposition variables, followed by the constants True and False.
+# Any identifier such as x12 or door_open is also a variable
 prop_letters = [chr(i) for i in range(ord('p'), ord('z')+1)] + ['T', 'F']
+CONSTANTS = frozenset({'T', 'F'})
+
+
+def variable_names(n: int) -> list[str]:
+    """ Return n distinct variable names: the letters p-z, then x11, x12, ... """
+    letters = prop_letters[:-2]
+    return letters[:n] + [f"x{i}" for i in range(len(letters), n)]
 
 
 class Connective(Enum):
@@ -31,44 +45,277 @@ class Connective(Enum):
         return ret
 
 
+class ParseError(Exception):
+    """ Raised when a string is not a well-formed formula.
+
+    @offset is the index of the offending character in the input string.
+    """
+
+    def __init__(self, message: str, offset: int) -> None:
+        super().__init__(f"{message} at position {offset}")
+        self.message = message
+        self.offset = offset
+
+
+_TOKEN_RE = re.compile(r"(->|<>|[&|~()]|[A-Za-z_][A-Za-z0-9_]*)|\s+")
+_BINARY_TOKENS = {c.value: c for c in Connective.get_binary()}
+
+
+def tokenize(string: str) -> list[tuple[str, int]]:
+    """ Split a formula string into a list of (token, offset) pairs, skipping whitespace """
+    tokens = []
+    pos, n = 0, len(string)
+    match = _TOKEN_RE.match
+    while pos < n:
+        m = match(string, pos)
+        if (m is None):
+            raise ParseError(f"Unexpected character {string[pos]!r}", pos)
+        if (m.lastindex):
+            tokens.append((m.group(1), pos))
+        pos = m.end()
+    return tokens
+
+
 class Formula:
-    """ Parse Tree to represent propositional logic formulas """
+    """ Parse Tree to represent propositional logic formulas
+
+    Nodes are immutable and hash-consed: constructing a node with the same value and
+    children as a live node returns that node, so structurally equal formulas are the same
+    object, compare equal in O(1) and can be used as dict keys.
+
+    Derived metadata (size, depth, variables, string form) is cached on the node. Because
+    nodes never change, the caches cannot go stale; any rewriting API must build new nodes.
+    """
+
+    __slots__ = ('val', 'left', 'right', 'is_var', 'compiled', 'size', 'depth',
+                 '_hash', '_variables', '_sorted_variables', '_str', '_postorder', '__weakref__')
+
+    # (val, id(left), id(right)) -> live node. Children are kept alive by their parents,
+    # so their ids cannot be reused while a key mentioning them is present.
+    _nodes = weakref.WeakValueDictionary()
+    _nodes_lock = threading.Lock()
 
-    def __init__(self, val=None, left=None, right=None) -> None:
-        self.left = left
-        self.right = right
+    def __new__(cls, val=None, left=None, right=None) -> 'Formula':
         if Connective.has_value(val):
-            self.val = Connective(val)
-        else:
-            self.val = val
+            val = Connective(val)
+        key = (val, id(left), id(right))
+        node = cls._nodes.get(key)
+        if (node is not None):
+            return node
+        with cls._nodes_lock:
+            node = cls._nodes.get(key)
+            if (node is None):
+                node = object.__new__(cls)
+                object.__setattr__(node, 'val', val)
+                object.__setattr__(node, 'left', left)
+                object.__setattr__(node, 'right', right)
+                # Whether the node is a variable leaf, rather than a connective or constant
+                object.__setattr__(node, 'is_var', isinstance(val, str) and val not in CONSTANTS)
+                # Cached result of compile()
+                object.__setattr__(node, 'compiled', None)
+                # Number of nodes and levels in the tree rooted here
+                object.__setattr__(node, 'size', 1 + sum(c.size for c in (left, right) if c is not None))
+                object.__setattr__(node, 'depth', 1 + max((c.depth for c in (left, right) if c is not None),
+                                                          default=0))
+                # Lazily computed by variables(), sorted_variables(), inorder() and postorder()
+                object.__setattr__(node, '_variables', None)
+                object.__setattr__(node, '_sorted_variables', None)
+                object.__setattr__(node, '_str', None)
+                object.__setattr__(node, '_postorder', None)
+                object.__setattr__(node, '_hash', hash((val, hash(left), hash(right))))
+                cls._nodes[key] = node
+        return node
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Formula nodes are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Formula nodes are immutable")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        return self is other
+
+    def __reduce__(self):
+        # Pickled as its distinct nodes in postorder, each with the positions of its
+        # children, as pickling the children themselves recurses once per level
+        order = (*self._descendants(), self)
+        index = {id(node): i for i, node in enumerate(order)}
+        return (_from_postorder, (tuple((node.val, index.get(id(node.left)), index.get(id(node.right)))
+                                        for node in order),))
+
+    @staticmethod
+    def interned_count() -> int:
+        """ Return the number of distinct live Formula nodes """
+        return len(Formula._nodes)
+
+    def postorder(self) -> tuple['Formula', ...]:
+        """ Return the distinct nodes of the formula, each after its children (so self is last).
+
+        Computed once with an explicit stack, so depth is not limited by the recursion
+        limit, and cached on this node only, as evaluate() walks the same formula for
+        every valuation.
+        """
+        if (self._postorder is None):
+            # Cached without self, which would make the node part of a reference cycle
+            object.__setattr__(self, '_postorder', self._descendants())
+        return (*self._postorder, self)
+
+    def _descendants(self) -> tuple['Formula', ...]:
+        """ Return postorder() without self, from the cache if there is one """
+        if (self._postorder is not None):
+            return self._postorder
+        order = []
+        done = {id(self)}
+        stack = [c for c in (self.right, self.left) if c is not None]
+        while stack:
+            node = stack[-1]
+            if (id(node) in done):
+                stack.pop()
+                continue
+            children = [c for c in (node.left, node.right) if c is not None and id(c) not in done]
+            if (children):
+                stack.extend(children)
+                continue
+            stack.pop()
+            done.add(id(node))
+            order.append(node)
+        return tuple(order)
+
+    def fold(self, combine: Callable[['Formula', Any, Any], Any], results: dict = None) -> Any:
+        """ Compute a value bottom-up over postorder(), without caching the order, so folding
+        many subformulas of one formula in turn takes no extra memory.
+
+        combine(node, left, right) is called once per distinct node, after its children,
+        with their results (None for a missing child), and the result for self is returned.
+        @results maps id(node) to the value of nodes already computed; sharing it between
+        calls reuses the values of common subformulas, as long as the caller keeps the
+        formulas alive.
+        """
+        results = {} if results is None else results
+        get = results.get
+        for node in self._descendants():
+            if (id(node) not in results):
+                results[id(node)] = combine(node, get(id(node.left)), get(id(node.right)))
+        if (id(self) not in results):
+            results[id(self)] = combine(self, get(id(self.left)), get(id(self.right)))
+        return results[id(self)]
+
+    def walk(self, expand: Callable[['Formula'], Iterable[Union['Formula', Any]]]) -> Iterator[Any]:
+        """ Yield a flattened rendering of the tree, top-down with an explicit stack.
+
+        expand(node) returns the items for a node in order; items that are Formulas are
+        expanded in turn and all others are yielded. Shared subformulas are expanded each
+        time they occur, so the output is proportional to the size of the tree.
+        """
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if (isinstance(item, Formula)):
+                stack.extend(reversed(expand(item)))
+            else:
+                yield item
 
     def to_list(self):
-        if (not isinstance(self.val, Connective)):
-            return [self.val]
-        if (self.val == Connective.NOT):
-            return self.left.to_list()+[self.val]
-        else:
-            return self.left.to_list()+[self.val]+self.right.to_list()
+        def expand(node: 'Formula'):
+            if (not isinstance(node.val, Connective)):
+                return (node.val,)
+            if (node.val == Connective.NOT):
+                return (node.left, node.val)
+            return (node.left, node.val, node.right)
+        return list(self.walk(expand))
 
-    def variables(self):
+    def variables(self) -> frozenset[str]:
         """ Return the set of variables """
-        var_set = set()
-        for symbol in self.to_list():
-            if symbol in prop_letters and symbol not in ['T', 'F']:
-                var_set.add(symbol)
-        return var_set
-
-    def inorder(self):
-        if (not isinstance(self.val, Connective)):
-            return str(self.val)
-        if (self.val == Connective.NOT):
-            return f"{repr(self.val)}{self.left.inorder()}"
-        else:
-            return f"({self.left.inorder()}{repr(self.val)}{self.right.inorder()})"
+        if (self._variables is None):
+            var_set = set()
+            seen = set()
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if (node in seen):
+                    continue
+                seen.add(node)
+                if (node.is_var):
+                    var_set.add(node.val)
+                stack.extend(child for child in (node.left, node.right) if child is not None)
+            object.__setattr__(self, '_variables', frozenset(var_set))
+        return self._variables
+
+    def sorted_variables(self) -> tuple[str, ...]:
+        """ Return the variables as a sorted tuple """
+        if (self._sorted_variables is None):
+            object.__setattr__(self, '_sorted_variables', tuple(sorted(self.variables())))
+        return self._sorted_variables
+
+    def inorder(self) -> str:
+        if (self._str is None):
+            object.__setattr__(self, '_str', "".join(self.walk(Formula._inorder_parts)))
+        return self._str
+
+    @staticmethod
+    def _inorder_parts(node: 'Formula') -> tuple:
+        if (node._str is not None):
+            return (node._str,)
+        if (not isinstance(node.val, Connective)):
+            return (str(node.val),)
+        if (node.val == Connective.NOT):
+            return (repr(node.val), node.left)
+        return ('(', node.left, repr(node.val), node.right, ')')
+
+    def compile(self):
+        """ Lower the parse tree to a generated Python function and cache it on the formula.
+
+        The function takes one positional argument per variable, in the order given by its
+        `variables` attribute (sorted). Arguments may be booleans, or packed bit-vectors if
+        the keyword `mask` is set to the int with one bit set per row.
+        """
+        if (self.compiled is not None):
+            return self.compiled
+        vars = self.sorted_variables()
+        args = {var: f"v{i}" for i, var in enumerate(vars)}
+        lines = []
+
+        def emit(formula: 'Formula', l: str, r: str) -> str:
+            if (not isinstance(formula.val, Connective)):
+                if (formula.val in ['T', 'F']):
+                    return '_m' if formula.val == 'T' else 'False'
+                return args[formula.val]
+            match formula.val:
+                case Connective.NOT:
+                    expr = f"_m ^ {l}"
+                case Connective.AND:
+                    expr = f"{l} & {r}"
+                case Connective.OR:
+                    expr = f"{l} | {r}"
+                case Connective.IMPLIES:
+                    expr = f"(_m ^ {l}) | {r}"
+                case Connective.IFF:
+                    expr = f"_m ^ {l} ^ {r}"
+            name = f"t{len(lines)}"
+            lines.append(f"    {name} = {expr}")
+            return name
+
+        # Shared subformulas are emitted once, as fold visits each distinct node once
+        result = self.fold(emit)
+        params = "".join(f"{args[var]}, " for var in vars)
+        source = "\n".join([f"def compiled({params}*, mask=True):", "    _m = mask"]
+                           + lines + [f"    return {result}"])
+        namespace = {}
+        exec(source, namespace)
+        compiled = namespace['compiled']
+        compiled.variables = tuple(vars)
+        compiled.source = source
+        object.__setattr__(self, 'compiled', compiled)
+        return compiled
 
     @staticmethod
     def _parse_prefix(string: str):
         """ Return the proper prefix and remainder of the current string 
+
+        Legacy recursive parser, kept as the baseline for benchmark.py; use Formula.parse.
         """
         if (len(string) == 0):
             return (None, "Error: Zero Length String")
@@ -102,36 +349,118 @@ class Formula:
         else:
             return (None, f"Error in {string}")
 
-    def parse(string: str) -> 'Formula':
-        """ Parse a valid str representation of a formula and return the Formula equivalent """
-        prefix, remainder = Formula._parse_prefix(string)
-        if (len(remainder) == 0):
-            return prefix
-        else:
-            raise Exception("Invalid String")
+    @staticmethod
+    def parse(string: str, variables: Optional[Container[str]] = None) -> 'Formula':
+        """ Parse a valid str representation of a formula and return the Formula equivalent
+
+        Runs in linear time with an explicit stack, so input length and nesting depth are
+        not bounded by the recursion limit. Whitespace between tokens is ignored.
+        Raise a ParseError carrying the offset of the first invalid token, or of the first
+        variable not in @variables if given (no node is built for it).
+        """
+        if (not instrument.enabled):
+            return Formula._parse(string, variables)
+        start = time.perf_counter()
+        try:
+            return Formula._parse(string, variables)
+        finally:
+            instrument.count('parse.chars', len(string))
+            instrument.observe('parse.seconds_per_char', (time.perf_counter() - start) / max(1, len(string)))
 
     @staticmethod
-    def generate_formula(number=3) -> 'Formula':
+    def _parse(string: str, variables: Optional[Container[str]] = None) -> 'Formula':
+        tokens = tokenize(string)
+        # Pending work: a NOT token, an open '(' awaiting its left operand,
+        # or a (connective, left operand) pair awaiting its right operand
+        stack = []
+        pos, end = 0, len(tokens)
+        while True:
+            if (pos == end):
+                raise ParseError("Unexpected end of formula", len(string))
+            token, offset = tokens[pos]
+            pos += 1
+            if (token == '~'):
+                stack.append(Connective.NOT)
+                continue
+            if (token == '('):
+                stack.append(offset)
+                continue
+            if (token in _BINARY_TOKENS or token == ')'):
+                raise ParseError(f"Expected a formula but found {token!r}", offset)
+            if (variables is not None and token not in variables and token not in CONSTANTS):
+                raise ParseError(f"Unknown variable {token!r}", offset)
+            node = Formula(token)
+            # Reduce until the node is the left operand of a binary connective or the whole formula
+            while stack:
+                top = stack.pop()
+                if (top is Connective.NOT):
+                    node = Formula(Connective.NOT, node)
+                elif (isinstance(top, int)):
+                    if (pos == end):
+                        raise ParseError(f"Unclosed '(' opened at position {top}", len(string))
+                    token, offset = tokens[pos]
+                    pos += 1
+                    if (token not in _BINARY_TOKENS):
+                        raise ParseError(f"Expected a binary connective but found {token!r}", offset)
+                    stack.append((_BINARY_TOKENS[token], node))
+                    break
+                else:
+                    connective, left = top
+                    if (pos == end or tokens[pos][0] != ')'):
+                        raise ParseError("Expected ')'", len(string) if pos == end else tokens[pos][1])
+                    pos += 1
+                    node = Formula(connective, left, node)
+            else:
+                if (pos != end):
+                    raise ParseError(f"Unexpected {tokens[pos][0]!r} after formula", tokens[pos][1])
+                return node
+
+    @staticmethod
+    def generate_formula(number=3, rng: random.Random = None) -> 'Formula':
         """ Generate a parse tree containing @number propositions 
         and @(number - 1) connectives (Negation excluded).
+        Random choices come from @rng if given, otherwise from the random module.
         """
-        variables = prop_letters[0:number+1]
-        return Formula._gen_formula(len(variables)-1, iter(variables))
+        variables = variable_names(number+1)
+        return Formula._gen_formula(len(variables)-1, iter(variables), rng=random if rng is None else rng)
 
     @staticmethod
-    def _gen_formula(connectives: int, prop_letters: Iterator, negated=False):
-        if (connectives == 0):
-            return Formula(next(prop_letters))
-        # Before each formula, randomly add a "NOT" connective
-        if (not negated and randint(1, 4) == 1):
-            return Formula(Connective.NOT, Formula._gen_formula(connectives, prop_letters, negated=True))
-        else:
-            connectives -= 1
-            op = choice(Connective.get_binary())
-            num_left = randint(0, connectives)
-            num_right = connectives-num_left
-            return Formula(op, Formula._gen_formula(num_left, prop_letters),
-                           Formula._gen_formula(num_right, prop_letters))
+    def _gen_formula(connectives: int, prop_letters: Iterator, negated=False, rng=random):
+        # Pending work: ('gen', connectives, negated) generates a subformula, ('not',) and
+        # ('binary', op) combine the last results. Subformulas are generated left to right.
+        stack = [('gen', connectives, negated)]
+        results = []
+        while stack:
+            task = stack.pop()
+            if (task[0] == 'not'):
+                results[-1] = Formula(Connective.NOT, results[-1])
+            elif (task[0] == 'binary'):
+                right = results.pop()
+                results[-1] = Formula(task[1], results[-1], right)
+            elif (task[1] == 0):
+                results.append(Formula(next(prop_letters)))
+            # Before each formula, randomly add a "NOT" connective
+            elif (not task[2] and rng.randint(1, 4) == 1):
+                stack.append(('not',))
+                stack.append(('gen', task[1], True))
+            else:
+                connectives = task[1] - 1
+                op = rng.choice(Connective.get_binary())
+                num_left = rng.randint(0, connectives)
+                num_right = connectives-num_left
+                stack.append(('binary', op))
+                stack.append(('gen', num_right, False))
+                stack.append(('gen', num_left, False))
+        return results[0]
 
     def __repr__(self) -> str:
         return self.inorder()
+
+
+def _from_postorder(nodes: tuple[tuple[Any, Optional[int], Optional[int]], ...]) -> Formula:
+    """ Rebuild a pickled Formula from (val, left position, right position) in postorder """
+    built = []
+    for val, left, right in nodes:
+        built.append(Formula(val, None if left is None else built[left],
+                             None if right is None else built[right]))
+    return built[-1]
@@ -0,0 +1,49 @@
+""" Random small formulas for comparing the solvers against evaluate and truth_table """
+import random
+from typing import Iterator
+
+from semantics import all_valuations, evaluate
+from syntax import Connective, Formula
+
+# Letters, longer identifiers and names past the letters, so parsing and encodings see both
+NAMES = ['p', 'q', 'r', 'alpha', 'b_2', 'x11']
+CONNECTIVES = list(Connective)
+
+
+def random_formula(rng: random.Random, size: int, names=NAMES, constants: float = 0.1) -> Formula:
+    """ Return a formula with @size connectives over @names, with T or F at some leaves """
+    if (size == 0):
+        if (rng.random() < constants):
+            return Formula(rng.choice(['T', 'F']))
+        return Formula(rng.choice(names))
+    connective = rng.choice(CONNECTIVES)
+    if (connective == Connective.NOT):
+        return Formula(connective, random_formula(rng, size - 1, names, constants))
+    left = rng.randint(0, size - 1)
+    return Formula(connective, random_formula(rng, left, names, constants),
+                   random_formula(rng, size - 1 - left, names, constants))
+
+
+def random_formulas(seed: int, count: int = 200, max_size: int = 8, names=NAMES) -> Iterator[Formula]:
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield random_formula(rng, rng.randint(0, max_size), rng.sample(names, rng.randint(1, len(names))))
+
+
+def substitute(formula: Formula, leaves: dict[str, str]) -> Formula:
+    """ Return the formula with each variable or constant in @leaves replaced by its value """
+    def rebuild(node: Formula, left: Formula, right: Formula) -> Formula:
+        if (isinstance(node.val, Connective)):
+            return Formula(node.val, left, right)
+        return Formula(leaves.get(node.val, node.val))
+
+    return formula.fold(rebuild)
+
+
+def models(formula: Formula, vars) -> list[dict[str, bool]]:
+    """ Return the satisfying valuations of @vars, by evaluating every row """
+    return [valuation for valuation in all_valuations(vars) if evaluate(formula, valuation)]
+
+
+def variables(*formulas: Formula) -> tuple[str, ...]:
+    return tuple(sorted(frozenset().union(*(formula.variables() for formula in formulas))))
@@ -0,0 +1,41 @@
+from bdd import BDD, dedupe, equivalent
+from semantics import truth_table
+from syntax import Formula
+from formulas import NAMES, models, random_formulas, variables
+
+
+def test_count_and_satisfying():
+    manager = BDD()
+    for formula in random_formulas(6):
+        vars = variables(formula)
+        node = manager.from_formula(formula)
+        expected = models(formula, vars)
+        assert manager.count(node, vars) == len(expected)
+        assert manager.count(node, NAMES) == len(models(formula, NAMES))
+        assert sorted(map(sorted, map(dict.items, manager.satisfying(node, vars)))) == \
+            sorted(map(sorted, map(dict.items, expected)))
+
+
+def test_equivalent():
+    formulas = list(random_formulas(7, max_size=4, names=['p', 'alpha', 'x11']))
+    for first, second in zip(formulas, formulas[1:]):
+        vars = variables(first, second)
+        assert equivalent(first, second) == (truth_table(first, vars) == truth_table(second, vars))
+
+
+def test_canonical_nodes():
+    manager = BDD(NAMES)
+    for formula in random_formulas(8):
+        node = manager.from_formula(formula)
+        assert manager.from_formula(manager.to_formula(node)) == node
+        assert manager.support(node) <= formula.variables()
+    assert manager.from_formula(Formula.parse("(p | ~p)")) == manager.from_formula(Formula('T'))
+    assert manager.from_formula(Formula.parse("(alpha & ~alpha)")) == manager.from_formula(Formula('F'))
+
+
+def test_dedupe():
+    formulas = list(random_formulas(9, max_size=3, names=['p', 'q']))
+    unique = dedupe(formulas)
+    tables = [truth_table(formula, ['p', 'q']) for formula in unique]
+    assert len(set(tables)) == len(tables)
+    assert set(tables) == {truth_table(formula, ['p', 'q']) for formula in formulas}
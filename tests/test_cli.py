@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import benchmark
+import cli
+
+
+def test_parse(capsys):
+    cli.main(['parse', "(alpha -> ~q)"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:3] == ["(alpha->~q)", "variables: alpha, q", "size: 4, depth: 3"]
+
+
+def test_parse_error():
+    with pytest.raises(SystemExit) as error:
+        cli.main(['parse', "(p & )"])
+    assert error.value.code == "Expected a formula but found ')':\n  (p & )\n       ^"
+
+
+def test_eval_and_check(capsys):
+    cli.main(['eval', "(p <> x11)", "p=T", "x11=F"])
+    cli.main(['check', "(p -> q)", "(~p | q)"])
+    assert capsys.readouterr().out == "F\nCorrect\n"
+    with pytest.raises(SystemExit) as error:
+        cli.main(['check', "(p -> q)", "(q -> p)"])
+    assert error.value.code == 1
+    assert capsys.readouterr().out.startswith("Incorrect: When ")
+
+
+def test_table(tmp_path):
+    output = tmp_path / 'table.csv'
+    cli.main(['table', "(p & F)", '--format', 'csv', '-o', str(output), '--only', 'false', '--start', '1'])
+    assert output.read_text() == 'p,"(p&F)"\n1,0\n'
+
+
+def test_core_imports_without_gui():
+    modules = subprocess.run([sys.executable, '-c', "import sys, syntax, semantics, exercise, cli; "
+                              "print(' '.join(sorted(sys.modules)))"],
+                             cwd=os.path.dirname(os.path.abspath(cli.__file__)), capture_output=True, text=True,
+                             check=True).stdout.split()
+    assert not {'PySimpleGUI', 'tkinter', 'assets', 'appdirs'} & set(modules)
+
+
+def test_startup_times_are_results():
+    results = benchmark.bench_startup(runs=1)
+    assert {'startup/import core', 'startup/cli parse'} <= set(results)
+    assert all(0 < seconds < 60 for seconds in results.values())
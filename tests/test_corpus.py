@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+import corpus
+from corpus import generate_corpus
+from fingerprint import fingerprint
+from postfix import Bank
+from syntax import Formula
+
+
+def test_generate_corpus_distinct():
+    records = list(generate_corpus(40, [1, 2], workers=1, seed=3, chunk_size=16))
+    assert 0 < len(records) <= 40
+    keys = [record['fingerprint'] for record in records]
+    assert len(set(keys)) == len(keys)
+    for record in records:
+        k, table = fingerprint(Formula.parse(record['formula']))
+        assert record['fingerprint'] == f"{k}:{table:x}"
+    # Reproducible for a seed and chunk size
+    assert list(generate_corpus(40, [1, 2], workers=1, seed=3, chunk_size=16)) == records
+
+
+def test_main_formats(tmp_path, capsys):
+    jsonl, bank = str(tmp_path / 'bank.jsonl'), str(tmp_path / 'bank.plb')
+    corpus.main([jsonl, '--count', '10', '--difficulty', '2', '--workers', '1'])
+    with open(jsonl) as infile:
+        records = [json.loads(line) for line in infile]
+    corpus.main([bank, '--count', '10', '--difficulty', '2', '--workers', '1', '--format', 'bank'])
+    with Bank(bank) as programs:
+        assert len(programs) == len(records)
+        assert [(str(programs[i][0].to_formula()), programs[i][1]) for i in range(len(programs))] == \
+            [(record['formula'], record['english']) for record in records]
+    capsys.readouterr()
+    corpus.main(['-', '--count', '10', '--difficulty', '2', '--workers', '1'])
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == records
+    with pytest.raises(SystemExit):
+        corpus.main(['-', '--count', '10', '--format', 'bank'])
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+import counting
+from counting import count_models, is_contradiction, is_tautology
+from semantics import truth_table
+from syntax import Connective, Formula
+from formulas import NAMES, random_formula, random_formulas, variables
+
+
+@pytest.fixture(params=[0, 3, counting.table_vars])
+def table_vars(request, monkeypatch):
+    """ Run with the truth-table shortcut off, for small subformulas only, and as shipped """
+    monkeypatch.setattr(counting, 'table_vars', request.param)
+    return request.param
+
+
+def test_count_models(table_vars):
+    for formula in random_formulas(10):
+        vars = variables(formula)
+        table = truth_table(formula, vars)
+        assert count_models(formula) == bin(table).count('1')
+        extra = [name for name in NAMES if name not in vars]
+        assert count_models(formula, vars + tuple(extra)) == bin(table).count('1') << len(extra)
+
+
+def test_tautology_and_contradiction(table_vars):
+    for formula in random_formulas(11):
+        vars = variables(formula)
+        table = truth_table(formula, vars)
+        assert is_tautology(formula) == (table == (1 << (1 << len(vars))) - 1)
+        assert is_contradiction(formula) == (table == 0)
+
+
+def test_decomposed_chain():
+    # Disjoint parts are counted separately, so a long chain needs no search
+    names = [f"v{i}" for i in range(200)]
+    formula = Formula(names[0])
+    for name in names[1:]:
+        formula = Formula(Connective.OR, formula, Formula(Connective.AND, Formula(name), Formula('T')))
+    assert count_models(formula) == (1 << 200) - 1
+    assert not is_tautology(formula)
+    assert is_tautology(Formula(Connective.OR, formula, Formula(Connective.NOT, Formula(names[0]))))
+
+
+def test_shared_variables_above_table_vars(table_vars):
+    # Operands share variables throughout, so most of the count comes from the BDD
+    names = [f"v{i}" for i in range(22)]
+    formula = random_formula(random.Random(12), 250, names=names)
+    vars = formula.sorted_variables()
+    assert len(vars) > 18
+    assert count_models(formula) == truth_table(formula, vars).bit_count()
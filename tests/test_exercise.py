@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from exercise import Exercise
+from semantics import evaluate, truth_table
+from syntax import Formula, ParseError
+from formulas import random_formula, random_formulas
+
+
+@pytest.mark.parametrize('sat_threshold, engine', [(16, 'bitwise'), (16, 'gray'), (0, 'bitwise')])
+def test_counterexample(monkeypatch, sat_threshold, engine):
+    """ The truth-table engines and the SAT solver agree with the truth table """
+    monkeypatch.setattr(Exercise, 'sat_threshold', sat_threshold)
+    monkeypatch.setattr(Exercise, 'engine', engine)
+    rng = random.Random(24)
+    for formula in random_formulas(24, count=100, max_size=6):
+        exercise = Exercise(formula_str=str(formula), english_repr="sentence")
+        vars = formula.sorted_variables()
+        # Answers may only use the exercise's variables, so constant exercises get constant answers
+        guess = random_formula(rng, rng.randint(0, 6), vars, constants=0.1 if vars else 1.0)
+        for answer in (guess, Formula.parse(f"~~{formula}")):
+            counterexample = exercise.counterexample(str(answer))
+            if (truth_table(answer, vars) == truth_table(formula, vars)):
+                assert counterexample is None
+            else:
+                assert evaluate(answer, counterexample) != evaluate(formula, counterexample)
+
+
+def test_unknown_variables():
+    exercise = Exercise(formula_str="(alpha & x11)", english_repr="sentence")
+    with pytest.raises(ParseError):
+        exercise.counterexample("(alpha & beta)")
+    assert exercise.counterexample("(x11 & alpha)") is None
+    assert exercise.counterexample("(x11 | alpha)") in ({'alpha': True, 'x11': False},
+                                                        {'alpha': False, 'x11': True})
@@ -0,0 +1,45 @@
+import threading
+import time
+
+from exercise import Exercise, ExercisePool
+
+
+def _wait(condition, timeout: float = 10) -> bool:
+    end = time.monotonic() + timeout
+    while not condition():
+        if (time.monotonic() > end):
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _prepared(exercise: Exercise) -> bool:
+    return exercise._english is not None and exercise._solution_table is not None \
+        and exercise._short_solution is not None
+
+
+def test_pool_fills_and_serves_prepared_exercises():
+    pool = ExercisePool(difficulties=(1, 2), size=3)
+    try:
+        assert _wait(lambda: all(queue.full() for queue in pool.queues.values()))
+        exercises = [pool.get(1) for _ in range(3)]
+        assert all(_prepared(exercise) for exercise in exercises)
+        assert len({id(exercise) for exercise in exercises}) == 3
+        # The background thread tops the queue up again
+        assert _wait(pool.queues[1].full)
+    finally:
+        pool.close()
+
+
+def test_pool_generates_when_empty():
+    pool = ExercisePool(difficulties=(), size=1)
+    exercise = pool.get(4)
+    assert _prepared(exercise)
+    pool.close()
+
+
+def test_close_stops_threads():
+    pool = ExercisePool(difficulties=(1, 2, 3), size=1)
+    assert _wait(lambda: all(queue.full() for queue in pool.queues.values()))
+    pool.close()
+    assert _wait(lambda: not any(thread.name.startswith('ExercisePool-') for thread in threading.enumerate()))
@@ -0,0 +1,81 @@
+import random
+from itertools import combinations, permutations
+
+import pytest
+
+import fingerprint
+from fingerprint import FingerprintIndex, keys, support
+from semantics import truth_table
+from syntax import Formula
+from formulas import random_formulas, substitute, variables
+
+
+def _relevant(formula: Formula) -> tuple[tuple[str, ...], Formula]:
+    """ Return the support of the formula and the formula with the other variables set to F """
+    vars = support(formula)
+    return vars, substitute(formula, {var: 'F' for var in formula.variables() - set(vars)})
+
+
+def equivalent_up_to_renaming(first: Formula, second: Formula) -> bool:
+    """ Brute force over every renaming of the first formula's relevant variables """
+    (first_vars, first), (second_vars, second) = _relevant(first), _relevant(second)
+    if (len(first_vars) != len(second_vars)):
+        return False
+    table = truth_table(second, second_vars)
+    return any(truth_table(substitute(first, dict(zip(first_vars, order))), second_vars) == table
+               for order in permutations(second_vars))
+
+
+def test_support():
+    for formula in random_formulas(17):
+        vars = variables(formula)
+        relevant = support(formula)
+        for var in vars:
+            tables = [truth_table(substitute(formula, {var: value}), vars) for value in 'FT']
+            assert (var in relevant) == (tables[0] != tables[1])
+
+
+def test_fingerprint_invariant_under_renaming():
+    rng = random.Random(18)
+    for formula in random_formulas(18):
+        vars = variables(formula)
+        names = dict(zip(vars, rng.sample(['p', 'q', 'alpha', 'b_2', 'x11', 'zeta', 'w'], len(vars))))
+        assert keys(substitute(formula, names))[0] == keys(formula)[0]
+
+
+def test_fingerprint_classes():
+    formulas = list(random_formulas(19, count=60, max_size=5, names=['p', 'q', 'alpha']))
+    for first, second in combinations(formulas, 2):
+        assert (keys(first)[0] == keys(second)[0]) == equivalent_up_to_renaming(first, second)
+        vars = variables(first, second)
+        assert (keys(first)[1] == keys(second)[1]) == \
+            (truth_table(first, vars) == truth_table(second, vars))
+
+
+def test_index():
+    index = FingerprintIndex()
+    formulas = list(random_formulas(20, count=60, max_size=4, names=['p', 'q', 'alpha']))
+    for id, formula in enumerate(formulas):
+        index.add(id, formula)
+    index.remove(0)
+    for formula in formulas[:20]:
+        assert index.duplicates(formula) == {id for id, other in enumerate(formulas)
+                                             if id and keys(other)[0] == keys(formula)[0]}
+        assert index.equivalent(formula) == {id for id, other in enumerate(formulas)
+                                             if id and keys(other)[1] == keys(formula)[1]}
+
+
+def test_index_above_max_vars(monkeypatch):
+    monkeypatch.setattr(fingerprint, 'max_vars', 2)
+    index = FingerprintIndex()
+    index.add(1, Formula.parse("((p & q) | alpha)"))
+    index.add(2, Formula.parse("(alpha | (q & p))"))
+    index.add(3, Formula.parse("((p & alpha) | q)"))
+    index.add(4, Formula.parse("(p & q)"))
+    assert index.duplicates(Formula.parse("~(~alpha & ~(p & q))")) == {1, 2}
+    assert index.duplicates(Formula.parse("(q & p)")) == {4}
+    keys.cache_clear()
+    with pytest.raises(Exception):
+        fingerprint.fingerprint(Formula.parse("((p & q) | b_2)"))
+    index.remove(1)
+    assert index.equivalent(Formula.parse("(alpha | (p & q))")) == {2}
@@ -0,0 +1,61 @@
+import io
+import json
+import sys
+
+import grade
+from grade import grade_stream, percentile, read_submissions
+
+SUBMISSIONS = [
+    {'id': 1, 'formula': "(p -> q)", 'answer': "(~p | q)"},
+    {'id': 2, 'formula': "(p -> q)", 'answer': "(q -> p)"},
+    {'id': 3, 'formula': "(alpha & x11)", 'answer': "(alpha &"},
+    {'id': 4, 'formula': "(p <> T)", 'answer': "p"},
+]
+
+
+def test_grade():
+    results = [grade.grade(submission) for submission in SUBMISSIONS]
+    assert [result['correct'] for result in results] == [True, False, False, True]
+    assert 'error' in results[2] and 'error' not in results[1]
+    assert all(result['id'] == submission['id'] for result, submission in zip(results, SUBMISSIONS))
+
+
+def test_grade_stream_keeps_order():
+    submissions = SUBMISSIONS * 25
+    results = list(grade_stream(submissions, workers=2, chunk_size=3))
+    assert [result['id'] for result in results] == [submission['id'] for submission in submissions]
+    assert [result['correct'] for result in results] == [True, False, False, True] * 25
+
+
+def test_read_submissions(tmp_path):
+    jsonl = tmp_path / 'submissions.jsonl'
+    jsonl.write_text("".join(json.dumps(submission) + '\n\n' for submission in SUBMISSIONS))
+    assert list(read_submissions(str(jsonl))) == SUBMISSIONS
+    csv = tmp_path / 'submissions.csv'
+    csv.write_text('id,formula,answer\n7,"(p, q)",p\n8,(p&q),"(q & p)"\n')
+    assert list(read_submissions(str(csv))) == [{'id': '7', 'formula': "(p, q)", 'answer': 'p'},
+                                               {'id': '8', 'formula': "(p&q)", 'answer': "(q & p)"}]
+
+
+def test_main_standard_streams(monkeypatch, capsys):
+    stdin = io.StringIO("".join(json.dumps(submission) + '\n' for submission in SUBMISSIONS))
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    grade.main(['-', '--workers', '1'])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [result['correct'] for result in results] == [True, False, False, True]
+    # Standard streams are left open for the caller
+    assert not stdin.closed and not sys.stdout.closed
+
+
+def test_main_files(tmp_path):
+    source, output = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    source.write_text("".join(json.dumps(submission) + '\n' for submission in SUBMISSIONS))
+    grade.main([str(source), '-o', str(output), '--workers', '1'])
+    assert [json.loads(line)['id'] for line in output.read_text().splitlines()] == [1, 2, 3, 4]
+
+
+def test_percentile():
+    values = [float(i) for i in range(100)]
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile(values, 1.0) == 99
@@ -0,0 +1,92 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import instrument
+from instrument import Histogram
+from semantics import all_valuations
+from syntax import Formula
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_counters_and_histograms(tmp_path):
+    instrument.count('a')
+    instrument.count('a', 4)
+    instrument.observe('h', 0.5)
+    instrument.observe('h', 1.5)
+    data = instrument.snapshot()
+    assert data['counters'] == {'a': 5}
+    assert {key: data['histograms']['h'][key] for key in ('count', 'total', 'mean', 'min', 'max')} == \
+        {'count': 2, 'total': 2.0, 'mean': 1.0, 'min': 0.5, 'max': 1.5}
+    path = str(tmp_path / 'metrics.json')
+    assert json.loads(instrument.to_json(path)) == data
+    with open(path) as infile:
+        assert json.load(infile) == data
+    instrument.reset()
+    assert instrument.snapshot() == {'counters': {}, 'histograms': {}}
+
+
+def test_histogram_buckets():
+    histogram = Histogram()
+    for value in (0.0, 1e-6, 3e-6, 4e-6, 1.0):
+        histogram.observe(value)
+    # Bucket k holds the values with 2**(k-1) <= microseconds < 2**k
+    assert histogram.to_dict()['buckets_us'] == {'<1': 1, '<2': 1, '<4': 1, '<8': 1, f"<{1 << 20}": 1}
+    assert Histogram().to_dict()['mean'] == 0
+
+
+def test_timed():
+    timer = instrument.timed('block')
+
+    @instrument.timed('call')
+    def square(x):
+        return x * x
+
+    with timer:
+        assert square(3) == 9
+    assert instrument.snapshot()['histograms'] == {}
+    instrument.enable()
+    with timer:
+        with timer:
+            square(4)
+    with pytest.raises(ValueError):
+        with timer:
+            raise ValueError
+    histograms = instrument.snapshot()['histograms']
+    assert histograms['block']['count'] == 3 and histograms['call']['count'] == 1
+    assert square.__name__ == 'square'
+
+
+def test_hooks_record_only_when_enabled():
+    formula = Formula.parse("(p & q)")
+    assert instrument.snapshot()['counters'] == {}
+    instrument.enable()
+    Formula.parse("(p | q)")
+    all_valuations(['p', 'q', 'r'])
+    counters = instrument.snapshot()['counters']
+    assert counters['parse.chars'] == 7 and counters['valuations'] == 8
+    assert str(formula) == "(p&q)"
+
+
+def test_profile():
+    result, report = instrument.profile(sorted, [3, 1, 2], reverse=True)
+    assert result == [3, 2, 1]
+    assert "function calls" in report
+
+
+def test_import_does_not_load_profiler():
+    modules = subprocess.run([sys.executable, '-c', "import sys, instrument, syntax, semantics, exercise; "
+                              "print(' '.join(sorted(sys.modules)))"],
+                             cwd=os.path.dirname(os.path.abspath(instrument.__file__)), capture_output=True,
+                             text=True, check=True).stdout.split()
+    assert not {'cProfile', 'pstats'} & set(modules)
@@ -0,0 +1,93 @@
+import io
+import random
+from itertools import combinations
+
+from normal_forms import CNF, _rows, minimal_dnf, nnf, prime_implicants
+from sat import Solver
+from semantics import evaluate, truth_table
+from syntax import Connective, Formula
+from formulas import models, random_formulas, variables
+
+
+def _cover(n: int, implicants) -> int:
+    covered = 0
+    for implicant in implicants:
+        covered |= _rows(n, implicant)
+    return covered
+
+
+def _terms(dnf: Formula) -> int:
+    return _terms(dnf.left) + _terms(dnf.right) if dnf.val == Connective.OR else 1
+
+
+def brute_force_primes(n: int, table: int) -> set[tuple[int, int]]:
+    """ Return every implicant that no implicant with one literal fewer contains """
+    implicants = {(mask, bits) for mask in range(1 << n) for bits in range(1 << n)
+                  if bits & ~mask == 0 and _rows(n, (mask, bits)) & ~table == 0}
+    return {(mask, bits) for mask, bits in implicants
+            if not any(mask & (1 << i) and (mask & ~(1 << i), bits & ~(1 << i)) in implicants
+                       for i in range(n))}
+
+
+def test_prime_implicants():
+    rng = random.Random(12)
+    for n in range(5):
+        for _ in range(40):
+            table = rng.getrandbits(1 << n)
+            primes = prime_implicants(n, table)
+            assert set(primes) == brute_force_primes(n, table)
+            assert _cover(n, primes) == table
+
+
+def test_minimal_dnf():
+    for formula in random_formulas(13):
+        vars = variables(formula)
+        dnf = minimal_dnf(formula, vars)
+        assert truth_table(dnf, vars) == truth_table(formula, vars)
+        assert dnf.variables() <= formula.variables()
+
+
+def test_minimal_dnf_has_fewest_terms():
+    for formula in random_formulas(14, names=['p', 'alpha', 'x11']):
+        vars = variables(formula)
+        n, table = len(vars), truth_table(formula, vars)
+        dnf = minimal_dnf(formula, vars)
+        if (table == 0 or table == (1 << (1 << n)) - 1):
+            assert dnf is Formula('F' if table == 0 else 'T')
+            continue
+        primes = prime_implicants(n, table)
+        fewest = next(k for k in range(1, len(primes) + 1)
+                      if any(_cover(n, cover) == table for cover in combinations(primes, k)))
+        assert _terms(dnf) == fewest
+
+
+def test_nnf():
+    for formula in random_formulas(15):
+        vars = variables(formula)
+        result = nnf(formula)
+        assert truth_table(result, vars) == truth_table(formula, vars)
+        for node in result.postorder():
+            assert node.val not in (Connective.IMPLIES, Connective.IFF)
+            if (node.val == Connective.NOT):
+                assert not isinstance(node.left.val, Connective)
+
+
+def test_cnf_equisatisfiable():
+    for formula in random_formulas(16, count=100):
+        cnf = CNF(formula)
+        clauses = list(cnf.clauses())
+        assert len(clauses) == cnf.num_clauses
+        # A constant formula has a clause over variable 1 even with no variables
+        solver = Solver(max(1, cnf.num_vars))
+        satisfiable = all(solver.add_clause(clause) for clause in clauses) and solver.solve()
+        assert satisfiable == bool(models(formula, variables(formula)))
+        if (satisfiable):
+            # Variables that nnf() folded away can take any value
+            model = solver.model()
+            valuation = {var: model.get(cnf.var_ids.get(var), False) for var in formula.variables()}
+            assert evaluate(formula, valuation)
+        sink = io.StringIO()
+        cnf.write_dimacs(sink)
+        lines = sink.getvalue().splitlines()
+        assert sum(line.startswith('p cnf ') for line in lines) == 1
+        assert len(lines) == len(cnf.var_ids) + 1 + cnf.num_clauses
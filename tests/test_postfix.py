@@ -0,0 +1,66 @@
+import pytest
+
+from postfix import Bank, Program, write_bank
+from semantics import all_valuations, evaluate, truth_table, variable_masks
+from syntax import Connective, Formula
+from formulas import NAMES, random_formulas, variables
+
+
+def test_round_trip():
+    for formula in random_formulas(21):
+        program = Program.from_formula(formula)
+        assert program.variables == formula.sorted_variables()
+        assert program.to_formula() is formula
+        assert Program.from_formula(formula, NAMES).to_formula() is formula
+
+
+def test_run_matches_truth_table():
+    for formula in random_formulas(22):
+        vars = variables(formula)
+        program = Program.from_formula(formula, vars)
+        masks = variable_masks(vars)
+        assert program.run([masks[var] for var in vars], (1 << (1 << len(vars))) - 1) == \
+            truth_table(formula, vars)
+        for valuation in all_valuations(vars):
+            assert bool(program.evaluate(valuation)) == evaluate(formula, valuation)
+
+
+def test_many_variables():
+    # Variable indexes from 128 up take more than one byte
+    names = [f"v{i}" for i in range(300)]
+    formula = Formula(names[0])
+    for name in names[1:]:
+        formula = Formula(Connective.AND, Formula(name), Formula(Connective.NOT, formula))
+    program = Program.from_formula(formula)
+    assert program.to_formula() is formula
+    valuation = {name: i % 3 == 0 for i, name in enumerate(names)}
+    assert bool(program.evaluate(valuation)) == evaluate(formula, valuation)
+
+
+def test_bank(tmp_path):
+    formulas = list(random_formulas(23, count=50))
+    path = str(tmp_path / 'formulas.bank')
+    assert write_bank(path, ((formula, f"text {i} é") for i, formula in enumerate(formulas))) == 50
+    with Bank(path) as bank:
+        assert len(bank) == 50
+        for i in (0, 17, 49):
+            program, text = bank[i]
+            assert text == f"text {i} é"
+            assert program.to_formula() is formulas[i]
+
+
+def test_bank_streamed(tmp_path):
+    formulas = list(random_formulas(24, count=20))
+    path = str(tmp_path / 'formulas.bank')
+    # An iterator is written one record at a time into a table of room for @capacity
+    assert write_bank(path, ((formula, "") for formula in formulas), capacity=30) == 20
+    with Bank(path) as bank:
+        assert len(bank) == 20
+        assert [bank[i][0].to_formula() for i in range(20)] == formulas
+        with pytest.raises(IndexError):
+            bank[20]
+    assert write_bank(path, iter([(Program.from_formula(formulas[0]), "p")])) == 1
+    with Bank(path) as bank:
+        assert bank[0][0].to_formula() is formulas[0] and bank[0][1] == "p"
+    with pytest.raises(ValueError):
+        write_bank(path, ((formula, "") for formula in formulas), capacity=5)
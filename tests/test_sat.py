@@ -0,0 +1,56 @@
+import random
+from itertools import product
+
+from sat import Solver, find_difference, tseitin
+from semantics import evaluate, truth_table
+from syntax import Formula
+from formulas import models, random_formulas, variables
+
+
+def test_random_cnf():
+    rng = random.Random(3)
+    for _ in range(300):
+        num_vars = rng.randint(1, 6)
+        clauses = [[rng.choice([1, -1]) * rng.randint(1, num_vars) for _ in range(rng.randint(1, 3))]
+                   for _ in range(rng.randint(1, 25))]
+        solver = Solver(num_vars)
+        for clause in clauses:
+            solver.add_clause(clause)
+        expected = any(all(any((lit > 0) == bits[abs(lit) - 1] for lit in clause) for clause in clauses)
+                       for bits in product([False, True], repeat=num_vars))
+        assert solver.solve() == expected
+        if (expected):
+            model = solver.model()
+            assert all(any(model[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses)
+
+
+def test_tseitin_models():
+    for formula in random_formulas(4, count=100):
+        vars = variables(formula)
+        solver = Solver()
+        var_ids = {var: solver.new_var() for var in vars}
+        solver.add_clause([tseitin(formula, solver, var_ids)])
+        expected = models(formula, vars)
+        assert solver.solve() == bool(expected)
+        if (expected):
+            model = solver.model()
+            assert evaluate(formula, {var: model[var_ids[var]] for var in vars})
+
+
+def test_find_difference():
+    formulas = list(random_formulas(5, count=120, max_size=5))
+    for first, second in zip(formulas, formulas[1:] + formulas[:1]):
+        vars = variables(first, second)
+        difference = find_difference(first, second, vars)
+        if (truth_table(first, vars) == truth_table(second, vars)):
+            assert difference is None
+        else:
+            assert evaluate(first, difference) != evaluate(second, difference)
+
+
+def test_find_difference_equivalent():
+    for first, second in [("(p -> q)", "(~p | q)"), ("~(alpha & x11)", "(~alpha | ~x11)"),
+                          ("(p | T)", "(q -> q)"), ("(b_2 & F)", "~(p -> p)")]:
+        first, second = Formula.parse(first), Formula.parse(second)
+        assert find_difference(first, second, variables(first, second)) is None
+
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+
+from semantics import (all_valuations, evaluate, row_valuation, truth_table, truth_table_blocks,
+                       truth_values, variable_masks, write_truth_table)
+from syntax import Formula
+from formulas import random_formulas, variables
+
+
+def test_variable_masks():
+    for n in range(7):
+        vars = [f"v{i}" for i in range(n)]
+        masks = variable_masks(vars)
+        for row, valuation in enumerate(all_valuations(vars)):
+            assert valuation == row_valuation(vars, row)
+            assert {var: bool((masks[var] >> row) & 1) for var in vars} == valuation
+
+
+def test_variable_masks_many_rows():
+    vars = [f"v{i}" for i in range(20)]
+    masks = variable_masks(vars)
+    for i, var in enumerate(vars):
+        assert masks[var].bit_count() == 1 << 19
+        assert masks[var].bit_length() == 1 << 20
+        # The column of variable i repeats every 2**(20-i) rows
+        period = 1 << (20 - i)
+        assert masks[var] & ((1 << period) - 1) == ((1 << (period // 2)) - 1) << (period // 2)
+
+
+def test_truth_table_matches_evaluate():
+    for formula in random_formulas(2):
+        vars = variables(formula)
+        table = truth_table(formula, vars)
+        for row, valuation in enumerate(all_valuations(vars)):
+            assert bool((table >> row) & 1) == evaluate(formula, valuation)
+        assert truth_values(formula, all_valuations(vars)) == \
+            [bool((table >> row) & 1) for row in range(1 << len(vars))]
+
+
+def test_truth_table_extra_variables():
+    formula = Formula.parse("(alpha -> T)")
+    assert truth_table(formula, ['alpha', 'x11']) == 0b1111
+    assert truth_table(Formula.parse("(p & F)"), ['p']) == 0
+
+
+def _expected_rows(formula: Formula, vars, marks, start=0, stop=None, only=None) -> list[tuple[list[str], str]]:
+    """ Return the (variable cells, value cell) of the selected rows, by evaluate """
+    rows = []
+    for row, valuation in enumerate(all_valuations(vars)):
+        value = evaluate(formula, valuation)
+        if (start <= row < (stop if stop is not None else 1 << len(vars)) and only in (None, value)):
+            rows.append(([marks[valuation[var]] for var in vars], marks[value]))
+    return rows
+
+
+def test_truth_table_blocks():
+    formula = Formula.parse("((p <> alpha) | (x11 & ~q))")
+    vars = variables(formula)
+    table = truth_table(formula, vars)
+    blocks = list(truth_table_blocks(formula, vars, start=3, stop=13, block_bits=2))
+    assert [(first, rows) for first, rows, _ in blocks] == [(3, 1), (4, 4), (8, 4), (12, 1)]
+    for first, rows, column in blocks:
+        assert column == (table >> first) & ((1 << rows) - 1)
+
+
+@pytest.mark.parametrize('block_bits', [1, 2, 12])
+@pytest.mark.parametrize('start, stop, only', [(0, None, None), (5, 27, None), (0, None, True), (3, 30, False)])
+def test_write_truth_table(block_bits, start, stop, only):
+    formula = Formula.parse("((p <> alpha) | (x11 & ~(q -> T)))")
+    vars = ['alpha', 'b_2', 'p', 'q', 'x11']
+    for format, marks in [('text', 'FT'), ('csv', '01'), ('markdown', 'FT')]:
+        sink = io.StringIO()
+        write_truth_table(formula, sink, format, vars, start, stop, only, block_bits)
+        lines = sink.getvalue().splitlines()
+        expected = _expected_rows(formula, vars, marks, start, stop, only)
+        if (format == 'csv'):
+            assert lines[0] == f'alpha,b_2,p,q,x11,"{formula}"'
+            assert lines[1:] == [",".join(cells + [value]) for cells, value in expected]
+        elif (format == 'text'):
+            assert lines[0] == f"| alpha | b_2 | p | q | x11 | {formula}"
+            assert lines[1] == '-' * len(lines[0])
+            assert lines[2:] == ["".join(f"| {cell} " for cell in cells) + f"| {value}" for cells, value in expected]
+        else:
+            assert lines[:2] == [f"| alpha | b_2 | p | q | x11 | `{formula}` |", "|---|---|---|---|---|---|"]
+            assert lines[2:] == ["".join(f"| {cell} " for cell in cells) + f"| {value} |"
+                                 for cells, value in expected]
+
+
+@pytest.mark.parametrize('start, stop', [(0, None), (3, 13), (8, 16), (0, 1), (5, 40)])
+def test_write_binary_truth_table(start, stop):
+    formula = Formula.parse("((p <> alpha) | (x11 & ~q))")
+    vars = variables(formula)
+    table = truth_table(formula, vars)
+    # Rows past the end of the table are not written
+    stop = 1 << len(vars) if stop is None else min(stop, 1 << len(vars))
+    for block_bits in (2, 3, 12):
+        sink = io.BytesIO()
+        write_truth_table(formula, sink, 'binary', vars, start, stop, block_bits=block_bits)
+        data = sink.getvalue()
+        assert len(data) == (stop - start + 7) // 8
+        assert int.from_bytes(data, 'little') == (table >> start) & ((1 << (stop - start)) - 1)
+    with pytest.raises(Exception):
+        write_truth_table(formula, io.BytesIO(), 'binary', only=True)
+
+
+def test_write_constant_truth_table():
+    sink = io.StringIO()
+    write_truth_table(Formula.parse("(T -> F)"), sink, 'csv')
+    assert sink.getvalue() == '"(T->F)"\n0\n'
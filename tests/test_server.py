@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import loadgen
+import server
+from loadgen import Connection
+from server import QuizServer
+from syntax import Formula
+
+
+def _serve(executor, client):
+    """ Run a QuizServer on a free port and return the result of await client(port) """
+    async def main():
+        quiz = await asyncio.start_server(QuizServer(executor).handle, '127.0.0.1', 0)
+        async with quiz:
+            return await client(quiz.sockets[0].getsockname()[1])
+    return asyncio.run(main())
+
+
+def _connected(requests):
+    """ Return a client that runs await requests(connection) on one connection """
+    async def client(port):
+        connection = Connection(*await asyncio.open_connection('127.0.0.1', port))
+        try:
+            return await requests(connection)
+        finally:
+            await connection.close()
+    return client
+
+
+def test_session():
+    async def requests(connection):
+        session = (await connection.request(op='new', difficulty=2, questions=2, seed=7))['session']
+        first = await connection.request(op='next', session=session)
+        assert (first['number'], first['of']) == (1, 2)
+        assert set(first['variables']) == set(first['propositions'])
+        wrong = await connection.request(op='submit', session=session, answer=f"({first['variables'][0]} & F)")
+        assert not wrong['correct'] and wrong['feedback'] and wrong['score'] == 0
+        second = await connection.request(op='next', session=session)
+        assert second['number'] == 2
+        # The same seed gives the same questions
+        solution = server._exercise(2, "7/2").formula
+        assert second['question'] == server.question(2, "7/2")['question']
+        right = await connection.request(op='submit', session=session, answer=str(solution))
+        assert right['correct'] and right['score'] == 10
+        assert await connection.request(op='next', session=session) == {'id': 6, 'done': True, 'score': 10}
+        assert (await connection.request(op='close', session=session))['score'] == 10
+
+    with ThreadPoolExecutor(2) as executor:
+        _serve(executor, _connected(requests))
+
+
+def test_error_replies():
+    async def requests(connection):
+        errors = [await connection.request(op='fly'),
+                  await connection.request(op='new', difficulty=0),
+                  await connection.request(op='new', seed="seven"),
+                  await connection.request(op='next', session=99)]
+        assert all(set(reply) == {'id', 'error'} for reply in errors)
+        session = (await connection.request(op='new', questions=1, seed=1))['session']
+        assert 'error' in await connection.request(op='submit', session=session, answer="p")
+        question = await connection.request(op='next', session=session)
+        assert 'error' in await connection.request(op='submit', session=session, answer=" ")
+        assert 'error' in await connection.request(op='submit', session=session, answer="(p &")
+        # The question stays open after a malformed answer
+        assert (await connection.request(op='next', session=session))['number'] == question['number']
+        assert (await connection.request(op='close', session=session))['score'] == 0
+
+    async def malformed(port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'{not json\n\n[1]\n{"op": "new", "id": "a"}\n')
+        replies = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        await writer.wait_closed()
+        return replies
+
+    with ThreadPoolExecutor(2) as executor:
+        _serve(executor, _connected(requests))
+        replies = _serve(executor, malformed)
+    assert replies[0]['error'].startswith("Invalid JSON") and 'id' not in replies[0]
+    assert replies[1] == {'error': "Expected a JSON object"}
+    assert replies[2] == {'session': 1, 'id': 'a'}
+
+
+class _GatedExecutor(ThreadPoolExecutor):
+    """ Counts the calls it is given and holds them until the gate opens """
+
+    def __init__(self) -> None:
+        super().__init__(8)
+        self.started = 0
+        self.gate = threading.Event()
+
+    def submit(self, fn, *args):
+        self.started += 1
+        return super().submit(self._gated, fn, *args)
+
+    def _gated(self, fn, *args):
+        self.gate.wait()
+        return fn(*args)
+
+
+def test_in_flight_limit(monkeypatch):
+    monkeypatch.setattr(QuizServer, 'max_in_flight', 2)
+    executor = _GatedExecutor()
+
+    async def requests(connection):
+        sessions = [(await connection.request(op='new', seed=i))['session'] for i in range(5)]
+        replies = asyncio.gather(*(connection.request(op='next', session=session) for session in sessions))
+        await asyncio.sleep(0.2)
+        # The server stopped reading once two requests were running
+        assert executor.started == 2
+        executor.gate.set()
+        assert [reply['number'] for reply in await replies] == [1] * 5
+
+    with executor:
+        _serve(executor, _connected(requests))
+    assert executor.started == 5
+
+
+def test_loadgen(capsys):
+    async def client(port):
+        await loadgen.run(argparse.Namespace(host='127.0.0.1', port=port, unix=None, sessions=20,
+                                             connections=3, questions=2, difficulty=2, seed=0))
+
+    with ThreadPoolExecutor(2) as executor:
+        _serve(executor, client)
+    assert "20 sessions over 3 connections: 140 requests" in capsys.readouterr().err
+
+
+def test_play_records_failed_next():
+    executor = ThreadPoolExecutor(1)
+    executor.shutdown()
+    latencies = {op: [] for op in ('new', 'next', 'submit', 'close')}
+    errors = []
+    args = argparse.Namespace(difficulty=2, questions=3)
+
+    async def requests(connection):
+        await loadgen.play(connection, args, 0, latencies, errors)
+
+    # The executor refuses work, so 'next' fails and the session ends there
+    _serve(executor, _connected(requests))
+    assert [len(latencies[op]) for op in ('new', 'next', 'submit', 'close')] == [1, 1, 0, 1]
+    assert len(errors) == 1
+
+
+def test_guess():
+    rng = random.Random(0)
+    for _ in range(20):
+        assert Formula.parse(loadgen.guess(['p', 'q', 'alpha'], rng)).variables() <= {'p', 'q', 'alpha'}
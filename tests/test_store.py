@@ -0,0 +1,140 @@
+import json
+import logging
+import os
+import sqlite3
+
+import pytest
+
+import fingerprint
+from store import ExerciseStore, open_store
+from syntax import ParseError
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ExerciseStore(str(tmp_path / 'bank.db'))
+    yield store
+    store.close()
+
+
+def test_add_get_delete(store):
+    first = store.add("Tea is Hot and Milk is Cold", "(p & q)")
+    second = store.add("door is open", "( door_open -> ~x11 )")
+    assert len(store) == 2
+    assert store.get(first) == {'id': first, 'english': "Tea is Hot and Milk is Cold", 'formula': "(p&q)"}
+    assert store.get(second)['formula'] == "(door_open->~x11)"
+    with pytest.raises(ParseError):
+        store.add("broken", "(p &")
+    store.delete(first)
+    assert store.get(first) is None
+    assert store.ids() == [second]
+
+
+def test_sample(store):
+    formulas = {1: "p", 2: "(p & q)", 3: "((p & q) | r)"}
+    ids = {num_vars: [store.add(f"sentence {i}", formula) for i in range(5)]
+           for num_vars, formula in formulas.items()}
+    assert {row['id'] for row in store.sample(100)} == {id for group in ids.values() for id in group}
+    assert {row['id'] for row in store.sample(100, num_vars=2)} == set(ids[2])
+    # Difficulty d has d + 1 variables
+    assert {row['id'] for row in store.sample(100, difficulty=2)} == set(ids[3])
+    chosen = store.sample(3, num_vars=3, exclude=tuple(ids[3][:2]))
+    assert len(chosen) == 3 and {row['id'] for row in chosen} == set(ids[3][2:])
+    assert store.sample(2, difficulty=1, num_vars=2)[0]['id'] in ids[2]
+    assert store.sample(5, num_vars=4) == []
+
+
+def test_persistence(tmp_path):
+    path = str(tmp_path / 'bank.db')
+    store = ExerciseStore(path)
+    id = store.add("sentence", "(p | q)")
+    store.close()
+    store = ExerciseStore(path)
+    assert store.get(id)['formula'] == "(p|q)"
+    assert store.equivalent("(q | p)") == [id]
+    store.close()
+
+
+def test_migrates_banks_without_programs(tmp_path):
+    path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE exercises (id INTEGER PRIMARY KEY, english TEXT NOT NULL, formula TEXT NOT NULL, "
+                 "num_vars INTEGER NOT NULL, difficulty INTEGER NOT NULL)")
+    conn.execute("INSERT INTO exercises (english, formula, num_vars, difficulty) VALUES ('s', '(p->q)', 2, 1)")
+    conn.commit()
+    conn.close()
+    store = ExerciseStore(path)
+    assert store.equivalent("(~p | q)") == [1]
+    store.close()
+
+
+def _write_legacy(path, exercises) -> None:
+    with open(path, 'w') as outfile:
+        json.dump(exercises, outfile)
+
+
+def test_import_json_skips_bad_rows(store, tmp_path, caplog):
+    path = str(tmp_path / 'saved_exercises.json')
+    _write_legacy(path, [{'english': "one", 'formula': "(p&q)"}, {'english': "bad", 'formula': "(p&"},
+                         {'english': "two", 'formula': "~r"}, {'formula': "p"}])
+    with caplog.at_level(logging.WARNING, logger='store'):
+        assert store.import_json(path, name='saved_exercises.json') == 2
+    assert len(caplog.records) == 2
+    assert sorted(store.get(id)['english'] for id in store.ids()) == ["one", "two"]
+    # Recorded under its name, so it is not imported twice
+    assert store.import_json(path, name='saved_exercises.json') == 0
+    assert len(store) == 2
+
+
+def test_open_store_imports_once(tmp_path):
+    directory = str(tmp_path / 'data')
+    os.makedirs(directory)
+    legacy = os.path.join(directory, 'saved.json')
+    _write_legacy(legacy, [{'english': "one", 'formula': "(p&q)"}])
+    store = open_store(directory, 'bank.db', 'saved.json')
+    assert len(store) == 1
+    store.close()
+    assert not os.path.exists(legacy) and os.path.exists(legacy + '.bak')
+    # A crash before the rename leaves the file in place; it is still not imported again
+    os.replace(legacy + '.bak', legacy)
+    store = open_store(directory, 'bank.db', 'saved.json')
+    assert len(store) == 1
+    store.close()
+
+
+def test_open_store_unreadable_file(tmp_path):
+    directory = str(tmp_path)
+    with open(os.path.join(directory, 'saved.json'), 'w') as outfile:
+        outfile.write("{not json")
+    with pytest.raises(ValueError):
+        open_store(directory, 'bank.db', 'saved.json')
+    # Nothing was recorded, so a fixed file is imported on the next start
+    _write_legacy(os.path.join(directory, 'saved.json'), [{'english': "one", 'formula': "p"}])
+    store = open_store(directory, 'bank.db', 'saved.json')
+    assert len(store) == 1
+    store.close()
+
+
+def test_duplicates_and_equivalent(store):
+    first = store.add("one", "(p -> q)")
+    second = store.add("two", "(alpha -> x11)")
+    third = store.add("three", "(~q | p)")
+    # Built lazily from the saved programs, then kept up to date
+    assert store.duplicates("(~r | s)") == [first, second, third]
+    assert store.equivalent("(~p | q)") == [first]
+    fourth = store.add("four", "(q | ~p)")
+    assert store.equivalent("(p -> q)") == [first, fourth]
+    store.delete(first)
+    assert store.duplicates("(b_2 -> p)") == [second, third, fourth]
+    with pytest.raises(ParseError):
+        store.duplicates("(p ->")
+
+
+def test_duplicates_above_max_vars(store, monkeypatch):
+    monkeypatch.setattr(fingerprint, 'max_vars', 1)
+    first = store.add("one", "((p & q) | r)")
+    second = store.add("two", "(p & q)")
+    # Told apart by logical equivalence without renaming
+    assert store.duplicates("(r | (q & p))") == [first]
+    assert store.duplicates("(p & r)") == []
+    assert store.equivalent("~(~p | ~q)") == [second]
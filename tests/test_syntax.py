@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from semantics import all_valuations, evaluate, truth_table, variable_masks
+from syntax import Formula, ParseError, tokenize, variable_names
+from formulas import random_formulas, variables
+
+
+def test_compile():
+    for formula in random_formulas(30):
+        vars = variables(formula)
+        compiled = formula.compile()
+        assert compiled.variables == vars
+        assert formula.compile() is compiled
+        for valuation in all_valuations(vars):
+            assert bool(compiled(*[valuation[var] for var in vars])) == evaluate(formula, valuation)
+        masks = variable_masks(vars)
+        all_rows = (1 << (1 << len(vars))) - 1
+        assert compiled(*[masks[var] for var in vars], mask=all_rows) == truth_table(formula, vars)
+
+
+def test_compiled_truth_table():
+    # truth_table calls the compiled function, including over extra variables
+    formula = Formula.parse("((alpha <> x11) -> ~(p | F))")
+    before = truth_table(formula, ['alpha', 'p', 'q', 'x11'])
+    formula.compile()
+    assert truth_table(formula, ['alpha', 'p', 'q', 'x11']) == before
+    assert Formula.parse("T").compile()() is True
+
+
+def test_parse_round_trip():
+    for formula in random_formulas(1):
+        assert Formula.parse(str(formula)) is formula
+
+
+def test_parse_matches_legacy_parser():
+    for formula in random_formulas(31, names=['p', 'q', 'r']):
+        assert Formula._parse_prefix(str(formula)) == (formula, "")
+
+
+def test_parse_ignores_whitespace():
+    formula = Formula.parse("( alpha  ->\t~ ( b_2 <> T ) )")
+    assert str(formula) == "(alpha->~(b_2<>T))"
+    assert tokenize(" (p->q)") == [('(', 1), ('p', 2), ('->', 3), ('q', 5), (')', 6)]
+
+
+@pytest.mark.parametrize('string, offset', [("(p & q", 6), ("(p q)", 3), ("p)", 1), ("(p $ q)", 3),
+                                            ("", 0), ("~", 1), ("(p & )", 5)])
+def test_parse_errors(string, offset):
+    with pytest.raises(ParseError) as error:
+        Formula.parse(string)
+    assert error.value.offset == offset
+
+
+def test_identifier_variables():
+    formula = Formula.parse("((door_open & x12) -> (p | Tea2))")
+    assert formula.sorted_variables() == ('Tea2', 'door_open', 'p', 'x12')
+    assert {node.val for node in formula.postorder() if node.is_var} == formula.variables()
+    assert not Formula.parse("(T | ~F)").variables()
+    assert variable_names(13) == ['p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'x11', 'x12']
+
+
+def test_parse_restricted_variables():
+    assert Formula.parse("(p & T)", {'p'}).variables() == {'p'}
+    with pytest.raises(ParseError) as error:
+        Formula.parse("(p & unknown_name)", {'p', 'q'})
+    assert error.value.offset == 5
+
+
+def test_parse_deep_nesting():
+    depth = 100000
+    formula = Formula.parse("~" * depth + "p")
+    assert formula.depth == depth + 1
+    assert Formula.parse("(" * depth + "p" + "&q)" * depth).depth == depth + 1
+
+
+def test_hash_consing():
+    first, second = Formula.parse("((p & alpha) | ~(p & alpha))"), Formula.parse("(p&alpha)")
+    assert first.left is second and first.right.left is second
+    assert Formula('&', Formula('p'), Formula('alpha')) is second
+    assert {second: 1}[Formula.parse("( p & alpha )")] == 1
+    with pytest.raises(AttributeError):
+        second.val = 'q'
+
+
+def test_pickle():
+    for formula in random_formulas(32, count=50):
+        assert pickle.loads(pickle.dumps(formula)) is formula
+    deep = Formula.parse("~" * 100000 + "(p & x11)")
+    assert pickle.loads(pickle.dumps(deep)) is deep
+    # Shared subformulas are written once
+    shared = Formula.parse("p")
+    for _ in range(60):
+        shared = Formula('<>', shared, shared)
+    assert pickle.loads(pickle.dumps(shared)) is shared